@@ -48,6 +48,13 @@ class AbstractConsumerStage(AbstractStage):
 	#             arbitrary exception triggered by the logic of this stage
 	protected abstract void execute(I element) throws Exception
 
+	# The awaitable counterpart of execute(): passes the next element to:@link AbstractStage#_execute_async()}.
+	async def _invoke_execute_async(self):
+		element = self.get_input_port().receive()
+		if (element is None):
+			return
+		await self._execute_async(element)
+
 	@Override
 	protected <T> InputPort<T> createInputPort(final Class<T> type, final String name):
 		String message = String.format("A subtype of %s cannot have more than one input port. Extend %s instead.",
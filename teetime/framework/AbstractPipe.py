@@ -11,12 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from typing import Generic, TypeVar
 
-import teetime.framework.pipe.AbstractSynchedPipe
-import teetime.framework.pipe.AbstractUnsynchedPipe
-import teetime.framework.pipe.IPipe
-import teetime.framework.scheduling.PipeScheduler
+T = TypeVar("T")
+
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
 
 # Represents an abstract implementation of an:@link teetime.framework.pipe.IPipe}.
 #
@@ -24,87 +24,50 @@ import teetime.framework.scheduling.PipeScheduler
 #
 # @param <T>
 #            the type of the elements which this pipe should transfer.
-public abstract class AbstractPipe<T> implements IPipe<T>:
-
-	protected final AbstractStage cachedTargetStage
-
-	private final OutputPort<? extends T> sourcePort
-	private final InputPort<T> targetPort
+class AbstractPipe(IPipe[T], Generic[T]):
 
-	// FIXME each scheduler should set a default pipe scheduler by its own
-	private PipeScheduler scheduler = new PipeScheduler():
+	_cached_target_stage: "AbstractStage"
 
-		@Override
-		public void onElementAdded(final AbstractSynchedPipe<?> pipe):
-			// do nothing
-		}
+	# FIXME each scheduler should set a default pipe scheduler by its own
+	_scheduler: PipeScheduler = PipeScheduler()
 
-		@Override
-		public void onElementAdded(final AbstractUnsynchedPipe<?> pipe):
-			// do nothing
-		}
+	def __init__(self, source_port: "OutputPort", target_port: "InputPort[T]"):
+		if (source_port is None):
+			raise ValueError("sourcePort may not be null")
+		if (target_port is None):
+			raise ValueError("targetPort may not be null")
 
-		@Override
-		public void onElementNotAdded(final AbstractSynchedPipe<?> pipe):
-			// do nothing
-		}
-	}
+		source_port.set_pipe(self)
+		target_port.set_pipe(self)
 
-	protected AbstractPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		if (sourcePort == null):
-			throw new IllegalArgumentException("sourcePort may not be null")
-		}
-		if (targetPort == null):
-			throw new IllegalArgumentException("targetPort may not be null")
-		}
+		self._source_port = source_port
+		self._target_port = target_port
+		self._cached_target_stage = target_port.get_owning_stage()
 
-		sourcePort.setPipe(this)
-		targetPort.setPipe(this)
+	def get_source_port(self) -> "OutputPort":
+		return self._source_port
 
-		self.sourcePort = sourcePort
-		self.targetPort = targetPort
-		self.cachedTargetStage = targetPort.getOwningStage()
-	}
+	def get_target_port(self) -> "InputPort[T]":
+		return self._target_port
 
-	@Override
-	public final OutputPort<? extends T> getSourcePort():
-		return sourcePort
-	}
-
-	@Override
-	public final InputPort<T> getTargetPort():
-		return targetPort
-	}
-
-	@Override
-	public final boolean hasMore():
-		return !isEmpty()
-	}
+	def has_more(self) -> bool:
+		return not self.is_empty()
 
 	# Performance cache: Avoids the following method chain
 	#
 	# <pre>
-	# self.getTargetPort().getOwningStage()
+	# self.get_target_port().get_owning_stage()
 	# </pre>
-	public AbstractStage getCachedTargetStage():
-		return cachedTargetStage
-	}
-
-	protected PipeScheduler getScheduler():
-		return scheduler
-	}
+	def get_cached_target_stage(self) -> "AbstractStage":
+		return self._cached_target_stage
 
-	@Override
-	public void setScheduler(final PipeScheduler scheduler):
-		if (scheduler == null):
-			throw new IllegalArgumentException("Argument 'scheduler' may not be null")
-		}
-		self.scheduler = scheduler
-	}
+	def get_scheduler(self) -> PipeScheduler:
+		return self._scheduler
 
-	@Override
-	public String toString():
-		return sourcePort.getOwningStage().getId() + " -> " + targetPort.getOwningStage().getId() + " (" + super.toString() + ")"
-	}
+	def set_scheduler(self, scheduler: PipeScheduler):
+		if (scheduler is None):
+			raise ValueError("Argument 'scheduler' may not be null")
+		self._scheduler = scheduler
 
-}
+	def __str__(self) -> str:
+		return self._source_port.get_owning_stage().get_id() + " -> " + self._target_port.get_owning_stage().get_id() + " (" + super().__str__() + ")"
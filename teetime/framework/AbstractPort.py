@@ -30,7 +30,7 @@ class AbstractPort(Generic[T]):
 
 	TERMINATE_ELEMENT = Terminate()
 
-	_pipe: IPipe[T]
+	_pipe: IPipe[T] = None
 	# The type of this port.
 	# <p>
 	# <i>Used to validate the connection between two ports at runtime.</i>
@@ -30,6 +30,8 @@ class AbstractStage(ABC):
 	_exception_listener: AbstractExceptionListener
 	_owning_thread: Thread
 	_is_active: bool
+	_is_process_hosted: bool = False
+	_is_blocking: bool = False
 	_scheduler: TeeTimeScheduler
 
 	_signal_map = dict() # ISignal, Set<InputPort<?>>
@@ -145,6 +147,36 @@ class AbstractStage(ABC):
 	def _execute():
 		pass
 
+	# The awaitable counterpart of:@link #execute_by_framework()}.
+	# It is invoked instead by:@link AsyncioScheduling} if the stage overrides:@link #_execute_async()}.
+	#
+	# @throws TerminateException
+	async def execute_by_framework_async(self):
+		try:
+			await self._invoke_execute_async()
+		except TerminateException as e:
+			raise e
+		except Exception as e:
+			further_execution = self._exception_listener.report_exception(e, self)
+			if (further_execution == FurtherExecution.TERMINATE):
+				raise TerminateException.INSTANCE
+
+	# Invokes:@link #_execute_async()}. Overridden by:@link AbstractConsumerStage} to pass the received element.
+	async def _invoke_execute_async(self):
+		await self._execute_async()
+
+	# Contains the logic of a stage which awaits I/O instead of blocking on it.
+	# Only:@link AsyncioScheduling} invokes it; the other schedulers still invoke:@link #_execute()}.
+	#
+	# @throws Exception
+	#             arbitrary exception triggered by the logic of this stage
+	async def _execute_async(self):
+		raise NotImplementedError()
+
+	# @return <code>true</code> iff this stage overrides:@link #_execute_async()}
+	def is_async(self) -> bool:
+		return type(self)._execute_async is not AbstractStage._execute_async
+
 	// package-private would suffice, but protected is necessary for unit tests
 	def _get_owning_thread():
 		return self._owning_thread
@@ -165,17 +197,36 @@ class AbstractStage(ABC):
 		return self._is_active
 
 	# Declares this stage to be executed by an own thread.
-	def declare_active(self):
+	#
+	# @param process
+	#            if <code>true</code>, the stage (together with its passive successors) is executed by an own worker process instead,
+	#            so that CPU-bound stages are not serialized by the GIL.
+	#            All pipes from and to such a stage are instantiated as:@link InterProcessPipe}s.
+	def declare_active(self, process: bool = False):
 		if (self.get_current_state() == StageState.STARTED):
 			# TODO implement so that active/passive can be changed even at runtime
 			# requires: volatile isActive
 			# requires: to declare further stages active (cascading)
 			raise UnsupportedOperationException("Declaring a stage 'active' at runtime is not yet supported.")
 
+		self._is_process_hosted = process
 		# serves as acknowledgement and thus must be set at the end
 		self._is_active = True
+
+	# @return <code>true</code> iff this stage has been declared to be executed by an own worker process
+	def is_process_hosted(self) -> bool:
+		return self._is_process_hosted
 	}
 
+	# Declares that the logic of this active stage blocks, e.g., on a socket or a file.
+	# :@link AsyncioScheduling} then executes it by an own executor thread instead of on the event loop.
+	# The other schedulers execute each active stage by an own thread anyway and ignore this declaration.
+	def declare_blocking(self, blocking: bool = True):
+		self._is_blocking = blocking
+
+	def is_blocking(self) -> bool:
+		return self._is_blocking
+
 	# Declares this stage to be executed by the thread of its predecessor stage.
 	def declare_passive():
 		# TODO implement so that active/passive can be changed even at runtime
@@ -488,6 +539,27 @@ class AbstractStage(ABC):
 	def _should_be_terminated(self) -> bool:
 		return (self._get_current_state() == StageState.TERMINATING)
 
+	# Resets the state which this stage has acquired during an execution so that it can be executed again
+	# (see:@link CompiledConfiguration}). The ports and their connections are kept.
+	def _reset(self):
+		self._current_state = StageState.CREATED
+		self._signal_map = dict()
+		self._triggered_signal_types = set()
+		self._called_on_starting = False
+		self._called_on_terminating = False
+		self._num_opened_input_ports = len(self.get_input_ports())
+		self._atomic_being_executed = False
+		self._atomic_paused = False
+		self._owning_thread = None
+		self._states = []
+		self._on_reset()
+
+	# Event that is triggered before a stage of a:@link CompiledConfiguration} is executed again.
+	# Stages whose fields must not carry over from one execution to the next (e.g., counters or collected elements) reset them here.
+	# Does nothing by default.
+	def _on_reset(self):
+		pass
+
 	def _remove_dynamic_port(self, output_port: OutputPort):
 		self._output_ports.remove(output_port) # TODO update setIndex IF it is still used
 
@@ -11,36 +11,29 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from collections import deque
 
-import java.util.HashSet
-import java.util.LinkedList
-import java.util.Queue
-import java.util.Set
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
 
-public class BreadthFirstTraverser:
+class BreadthFirstTraverser:
 
-	public void traverse(final AbstractStage startStage, final ITraverserVisitor traverserVisitor):
-		final Set<AbstractStage> visitedStages = new HashSet<AbstractStage>()
-		final Queue<AbstractStage> queue = new LinkedList<>()
+	def traverse(self, start_stage: AbstractStage, traverser_visitor: ITraverserVisitor):
+		visited_stages = set()
+		queue = deque()
 
-		queue.add(startStage)
-		visitedStages.add(startStage)
+		queue.append(start_stage)
+		visited_stages.add(start_stage)
 
-		while (!queue.isEmpty()):
-			AbstractStage stage = queue.remove()
-			traverserVisitor.visit(startStage)
+		while (queue):
+			stage = queue.popleft()
+			traverser_visitor.visit_stage(stage)
 
-			for (OutputPort<?> outputPort : stage.getOutputPorts()):
-				AbstractStage targetStage = outputPort.getPipe().getTargetPort().getOwningStage()
+			for output_port in stage.get_output_ports():
+				target_stage = output_port.get_pipe().get_target_port().get_owning_stage()
 
-				if (!visitedStages.contains(targetStage)):
-					queue.add(targetStage)
-					visitedStages.add(startStage)
-				}
+				if (target_stage not in visited_stages):
+					queue.append(target_stage)
+					visited_stages.add(target_stage)
 
-				traverserVisitor.visit(outputPort)
-			}
-		}
-	}
-}
+				traverser_visitor.visit_port(output_port)
@@ -0,0 +1,228 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.Configuration import Configuration
+from teetime.framework.ConfigurationFacade import ConfigurationFacade
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.InputPort import InputPort
+from teetime.framework.InstantiationPipe import InstantiationPipe
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.StageState import StageState
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.scheduling.globaltaskpool.A2LevelIndexVisitor import A2LevelIndexVisitor
+from teetime.framework.scheduling.pushpullmodel.A1ThreadableStageCollector import A1ThreadableStageCollector
+from teetime.framework.scheduling.pushpullmodel.A2InvalidThreadAssignmentCheck import A2InvalidThreadAssignmentCheck
+from teetime.framework.scheduling.pushpullmodel.IntraStageCollector import IntraStageCollector
+
+T = TypeVar("T", bound=Configuration)
+
+CONFIG_FACADE = ConfigurationFacade.INSTANCE
+STAGE_FACADE = StageFacade.INSTANCE
+
+# Represents a configuration which is analyzed once and then executed arbitrarily often.
+# <p>
+# Upon compilation, the topology of the given configuration is analyzed only once:
+# the stage order, the level indices, the pipe wiring, and the thread assignment.
+# The schedulers use the:@link CompiledConfiguration.Topology} instead of traversing the graph again.
+# </p>
+# <p>
+# The stages, ports, and connections are neither rebuilt nor copied.
+# Instead,:@link #new_configuration()} resets the compiled configuration after an execution:
+# each port is connected by a new unexecuted pipe again, and the state of each stage is reset (see:@link AbstractStage#_reset()}).
+# A stage whose own fields must not carry over from one execution to the next resets them in:@link AbstractStage#_on_reset()}.
+# Hence, the executions of a compiled configuration must not overlap,
+# and its topology must not be changed at runtime (e.g., by a dynamic task farm).
+# </p>
+# Example:
+# <pre>
+# compiled = CompiledConfiguration(MyConfiguration())
+# for batch in batches:
+#     Execution(compiled.new_configuration()).execute_blocking()
+# </pre>
+#
+# @param <T>
+#            the type of the:@link Configuration}
+#
+# @since 3.0
+class CompiledConfiguration(Generic[T]):
+
+	# The analyzed topology of one particular configuration instance.
+	class Topology:
+
+		_start_stages: List[AbstractStage]
+		_stages: List[AbstractStage]
+		_connected_output_ports: List[OutputPort]
+		_threadable_stages: List[AbstractStage]
+		_intra_stages: Dict[AbstractStage, Set[AbstractStage]]
+		_max_level_index: int
+
+		def __init__(self, start_stages: List[AbstractStage], stages: List[AbstractStage], connected_output_ports: List[OutputPort],
+				threadable_stages: List[AbstractStage], intra_stages: Dict[AbstractStage, Set[AbstractStage]], max_level_index: int):
+			self._start_stages = start_stages
+			self._stages = stages
+			self._connected_output_ports = connected_output_ports
+			self._threadable_stages = threadable_stages
+			self._intra_stages = intra_stages
+			self._max_level_index = max_level_index
+
+		def get_start_stages(self) -> List[AbstractStage]:
+			return self._start_stages
+
+		# @return all stages in traversal order
+		def get_stages(self) -> List[AbstractStage]:
+			return self._stages
+
+		# @return each output port which is connected to an input port (by means of a pipe), in traversal order
+		def get_connected_output_ports(self) -> List[OutputPort]:
+			return self._connected_output_ports
+
+		def get_threadable_stages(self) -> List[AbstractStage]:
+			return self._threadable_stages
+
+		# @return for each threadable stage, the stages executed by its thread (including itself)
+		def get_intra_stages(self) -> Dict[AbstractStage, Set[AbstractStage]]:
+			return self._intra_stages
+
+		# The level index of each stage is stored in the stage itself (see:@link A2LevelIndexVisitor}).
+		def get_max_level_index(self) -> int:
+			return self._max_level_index
+
+	class _TopologyCollector(ITraverserVisitor):
+
+		def __init__(self):
+			self.stages = []
+			self.connected_output_ports = []
+			self._visited_ports = set()
+
+		def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+			self.stages.append(stage)
+			return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+		def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+			output_port = port.get_pipe().get_source_port()
+			if (output_port not in self._visited_ports):
+				self._visited_ports.add(output_port)
+				self.connected_output_ports.append(output_port)
+			return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+		def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+			# do nothing
+			pass
+
+	_configuration: T
+	_topology: "CompiledConfiguration.Topology"
+	# source port, target port, capacity, and pipe factory (if any) of each connection
+	_connections: List[Tuple[OutputPort, InputPort, int, Optional[IPipeFactory]]]
+
+	# @param configuration
+	#            which must not have been used so far. It is executed by each execution of this compiled configuration.
+	# @throws ValueError
+	#             if a connection cannot be re-established, i.e., it has been registered by:@link Configuration#register_custom_pipe}
+	def __init__(self, configuration: T):
+		if (configuration._is_initialized()):
+			raise Exception("3001 - Configuration has already been used.") # IllegalStateException
+		self._configuration = configuration
+		self._topology = self._compile(configuration)
+		self._connections = self._collect_connections(configuration, self._topology)
+		configuration._set_compiled_topology(self._topology)
+
+	@staticmethod
+	def _collect_connections(configuration: T, topology: "CompiledConfiguration.Topology") -> List[Tuple[OutputPort, InputPort, int, Optional[IPipeFactory]]]:
+		connections = []
+		for output_port in topology.get_connected_output_ports():
+			pipe = output_port.get_pipe()
+			if (isinstance(pipe, InstantiationPipe)):
+				connections.append((output_port, pipe.get_target_port(), pipe.capacity(), None))
+				continue
+			pipe_factory = configuration._get_pipe_factory(output_port)
+			if (pipe_factory is None):
+				raise ValueError("3003 - Configuration cannot be compiled, since the custom pipe of " + str(output_port) + " cannot be re-created.")
+			factory, capacity = pipe_factory
+			connections.append((output_port, pipe.get_target_port(), capacity, factory))
+		return connections
+
+	def _compile(self, configuration: T) -> "CompiledConfiguration.Topology":
+		start_stages = list(CONFIG_FACADE.get_start_stages(configuration))
+		if (not start_stages):
+			raise Exception("The start stage may not be null.") # IllegalStateException
+
+		# declares producers as active
+		stage_collector = A1ThreadableStageCollector()
+		traverser = Traverser(stage_collector)
+		for start_stage in start_stages:
+			traverser.traverse(start_stage)
+		threadable_stages = stage_collector.get_threadable_stages()
+
+		A2InvalidThreadAssignmentCheck(threadable_stages).check()
+
+		topology_collector = CompiledConfiguration._TopologyCollector()
+		traverser = Traverser(topology_collector)
+		for start_stage in start_stages:
+			traverser.traverse(start_stage)
+
+		intra_stages = {}
+		for threadable_stage in threadable_stages:
+			intra_stage_collector = IntraStageCollector(threadable_stage)
+			Traverser(intra_stage_collector).traverse(threadable_stage)
+			intra_stages[threadable_stage] = intra_stage_collector.get_intra_stages()
+
+		level_index_visitor = A2LevelIndexVisitor()
+		traverser = Traverser(level_index_visitor)
+		for stage in topology_collector.stages:
+			if (stage.is_producer()):
+				traverser.traverse(stage)
+
+		ordered_threadable_stages = [stage for stage in topology_collector.stages if stage in threadable_stages]
+		return CompiledConfiguration.Topology(start_stages, topology_collector.stages, topology_collector.connected_output_ports,
+				ordered_threadable_stages, intra_stages, level_index_visitor.get_max_level_index())
+
+	# Prepares the compiled configuration for its next execution.
+	#
+	# @return the compiled configuration in a not yet used state
+	# @throws Exception
+	#             if the previous execution has not terminated yet
+	def new_configuration(self) -> T:
+		configuration = self._configuration
+		if (configuration._is_initialized()):
+			self._reset(configuration)
+		return configuration
+
+	def _reset(self, configuration: T):
+		stages = self._topology.get_stages()
+		if (configuration._is_executed()):
+			for stage in stages:
+				if (stage.get_current_state().is_before(StageState.TERMINATED)):
+					raise Exception("3004 - The previous execution has not terminated yet: " + stage.get_id()) # IllegalStateException
+
+		for source_port, target_port, capacity, pipe_factory in self._connections:
+			if (pipe_factory is None):
+				InstantiationPipe(source_port, target_port, capacity)
+			else:
+				pipe_factory.new_pipe(source_port, target_port, capacity)
+		for stage in stages:
+			STAGE_FACADE.reset(stage)
+
+		# otherwise, the exceptions of the previous execution would be raised again
+		CONFIG_FACADE.get_factory(configuration).get_thread_exceptions_map().clear()
+		configuration._set_executed(False)
+		configuration._set_initialized(False)
+
+	def get_topology(self) -> "CompiledConfiguration.Topology":
+		return self._topology
@@ -11,12 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from typing import List, TypeVar
 
-import java.util.ArrayList
-import java.util.List
+T = TypeVar("T")
 
-import teetime.framework.pipe.DummyPipe
+from teetime.framework.InputPort import InputPort
+from teetime.framework.InstantiationPipe import InstantiationPipe
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.DummyPipe import DummyPipe
 
 # Represents a minimal stage that composes several other stages.
 # In order to work with this class, you need to extend from it and work from within the extending class.
@@ -25,71 +27,46 @@ import teetime.framework.pipe.DummyPipe
 #
 # @author Christian Wulf, Nelson Tavares de Sousa
 #
-public class CompositeStage:
+class CompositeStage:
 
 	# Default capacity for pipes
-	protected static final int DEFAULT_PIPE_CAPACITY = 512
+	DEFAULT_PIPE_CAPACITY = 512
 
-	private final List<InputPort<?>> inputPorts = new ArrayList<>()
-	private final List<OutputPort<?>> outputPorts = new ArrayList<>()
+	_input_ports: List[InputPort]
+	_output_ports: List[OutputPort]
 
-	protected CompositeStage():
-		// prohibit direct instantiation of this class
-	}
-
-	# Connects two ports with a pipe with a default capacity of currently:@value #DEFAULT_PIPE_CAPACITY}.
-	#
-	# @param sourcePort
-	#           :@link OutputPort} of the sending stage
-	# @param targetPort
-	#           :@link InputPort} of the sending stage
-	# @param <T>
-	#            the type of elements to be sent
-	protected final <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		connectPorts(sourcePort, targetPort, DEFAULT_PIPE_CAPACITY)
-	}
+	def __init__(self):
+		self._input_ports = []
+		self._output_ports = []
 
 	# Connects to ports with a pipe of a certain capacity
 	#
-	# @param sourcePort
+	# @param source_port
 	#           :@link OutputPort} of the sending stage
-	# @param targetPort
+	# @param target_port
 	#           :@link InputPort} of the sending stage
 	# @param capacity
 	#            the pipe is set to this capacity, if the value is greater than 0. If it is 0, than the pipe is unbounded, thus growing of the pipe is enabled.
-	# @param <T>
-	#            the type of elements to be sent
-	protected <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int capacity):
-		if (sourcePort == null):
-			throw new IllegalArgumentException("1002 - SourcePort may not be null")
-		}
-		if (targetPort == null):
-			throw new IllegalArgumentException("1003 - TargetPort may not be null")
-		}
-		if (targetPort.getPipe() != null || sourcePort.getPipe() != DummyPipe.INSTANCE):
-			throw new IllegalStateException("1005 - Ports may not be reconnected")
-		}
-		new InstantiationPipe<T>(sourcePort, targetPort, capacity)
-	}
-
-	protected <T> InputPort<T> createInputPort(final InputPort<T> subStageInputPort):
-		// InputPort<T> inputPort = new InputPort<>(inputPort.getType(), this, inputPort.getName())
-		inputPorts.add(subStageInputPort)
-		return subStageInputPort
-	}
+	#            Defaults to:@link #DEFAULT_PIPE_CAPACITY}.
+	def _connect_ports(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = DEFAULT_PIPE_CAPACITY):
+		if (source_port is None):
+			raise ValueError("1002 - SourcePort may not be null")
+		if (target_port is None):
+			raise ValueError("1003 - TargetPort may not be null")
+		if (target_port.get_pipe() is not None or source_port.get_pipe() is not DummyPipe.INSTANCE):
+			raise Exception("1005 - Ports may not be reconnected") # IllegalStateException
+		InstantiationPipe(source_port, target_port, capacity)
 
-	protected <T> OutputPort<T> createOutputPort(final OutputPort<T> subStageOutputPort):
-		// InputPort<T> inputPort = new InputPort<>(inputPort.getType(), this, inputPort.getName())
-		outputPorts.add(subStageOutputPort)
-		return subStageOutputPort
-	}
+	def _create_input_port(self, sub_stage_input_port: InputPort[T]) -> InputPort[T]:
+		self._input_ports.append(sub_stage_input_port)
+		return sub_stage_input_port
 
-	List<InputPort<?>> getInputPorts():
-		return inputPorts
-	}
+	def _create_output_port(self, sub_stage_output_port: OutputPort[T]) -> OutputPort[T]:
+		self._output_ports.append(sub_stage_output_port)
+		return sub_stage_output_port
 
-	List<OutputPort<?>> getOutputPorts():
-		return outputPorts
-	}
+	def _get_input_ports(self) -> List[InputPort]:
+		return self._input_ports
 
-}
+	def _get_output_ports(self) -> List[OutputPort]:
+		return self._output_ports
@@ -11,115 +11,128 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from typing import Collection, Dict, Optional, Set, Tuple, TypeVar
 
-import java.util.Collection
-import java.util.HashSet
-import java.util.Set
+T = TypeVar("T")
 
-import teetime.framework.exceptionHandling.AbstractExceptionListenerFactory
-import teetime.framework.exceptionHandling.TerminatingExceptionListenerFactory
-import teetime.framework.pipe.IPipe
-import teetime.framework.pipe.IPipeFactory
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.CompositeStage import CompositeStage
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.exceptionHandling.AbstractExceptionListenerFactory import AbstractExceptionListenerFactory
+from teetime.framework.exceptionHandling.TerminatingExceptionListenerFactory import TerminatingExceptionListenerFactory
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.placement.IPlacementPolicy import IPlacementPolicy
 
 # Represents a configuration of connected stages. Available to be extended.
 #
 # @author Christian Wulf, Nelson Tavares de Sousa
 #
 # @since 2.0
-public class Configuration extends CompositeStage:
+class Configuration(CompositeStage):
 
-	private final AbstractExceptionListenerFactory<?> factory
-	private final ConfigurationContext context
-	private final Set<AbstractStage> startStages
+	_factory: AbstractExceptionListenerFactory
+	_context: Optional["ConfigurationContext"]
+	_start_stages: Set[AbstractStage]
+	# the factory and the capacity of each pipe which has been created by a factory, by its source port
+	_pipe_factories: Dict[OutputPort, Tuple[IPipeFactory, int]]
+	_compiled_topology: Optional["CompiledConfiguration.Topology"] = None
+	_placement_policy: Optional[IPlacementPolicy] = None
 
-	private boolean initialized
-	private boolean executed
-
-	public Configuration():
-		this(new TerminatingExceptionListenerFactory())
-	}
-
-	# @param factory
-	#            to define a common exception behavior
-	// TODO use ctor with 2 arguments (problem: ConfigContext uses this)
-	public Configuration(final AbstractExceptionListenerFactory<?> factory):
-		self.factory = factory
-		self.context = new ConfigurationContext(this)
-		self.startStages = new HashSet<AbstractStage>()
-	}
+	_initialized: bool = False
+	_executed: bool = False
 
 	# @param factory
-	#            that defines a common exception behavior
+	#            to define a common exception behavior. Defaults to a:@link TerminatingExceptionListenerFactory}.
 	# @param context
-	#            that includes the scheduler algorithm to use
-	#
-	# @deprecated since 3.0. Scheduled to be removed in 3.1 or above. Use:@link #Configuration(AbstractExceptionListenerFactory)} instead.
-	@Deprecated
-	public Configuration(final AbstractExceptionListenerFactory<?> factory, final ConfigurationContext context):
-		self.factory = factory
-		self.context = context
-		self.startStages = new HashSet<AbstractStage>()
-	}
-
-	boolean isInitialized():
-		return initialized
-	}
-
-	void setInitialized(final boolean executed):
-		self.initialized = executed
-	}
-
-	boolean isExecuted():
-		return executed
-	}
-
-	void setExecuted(final boolean executed):
-		self.executed = executed
-	}
-
-	AbstractExceptionListenerFactory<?> getFactory():
-		return factory
-	}
-
-	# Register pipes if your configuration only relies on custom pipes and therefore:@link #connectPorts(OutputPort, InputPort)} is never called.
+	#            that includes the scheduler algorithm to use.
+	#            <i>Deprecated since 3.0. Scheduled to be removed in 3.1 or above.</i>
+	def __init__(self, factory: Optional[AbstractExceptionListenerFactory] = None, context: Optional["ConfigurationContext"] = None):
+		super().__init__()
+		self._factory = factory if factory is not None else TerminatingExceptionListenerFactory()
+		self._context = context
+		self._start_stages = set()
+		self._pipe_factories = dict()
+
+	def _is_initialized(self) -> bool:
+		return self._initialized
+
+	def _set_initialized(self, initialized: bool):
+		self._initialized = initialized
+
+	def _is_executed(self) -> bool:
+		return self._executed
+
+	def _set_executed(self, executed: bool):
+		self._executed = executed
+
+	def _get_factory(self) -> AbstractExceptionListenerFactory:
+		return self._factory
+
+	# Register pipes if your configuration only relies on custom pipes and therefore:@link #connect_ports(OutputPort, InputPort)} is never called.
 	#
 	# @param pipe
 	#            A custom pipe instance
 	#
-	# @deprecated since 3.0. Use:@link #connectPorts(OutputPort, InputPort, IPipeFactory)} instead.
-	@Deprecated
-	public void registerCustomPipe(final AbstractPipe<?> pipe):
-		startStages.add(pipe.getSourcePort().getOwningStage()) // memorize all source stages as starting point for traversing
-	}
-
-	@Override
-	public <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int capacity):
-		startStages.add(sourcePort.getOwningStage()) // memorize all source stages as starting point for traversing
-		super.connectPorts(sourcePort, targetPort, capacity)
-	}
-
-	public <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final IPipeFactory pipeFactory):
-		IPipe<T> pipe = pipeFactory.newPipe(sourcePort, targetPort)
-		startStages.add(pipe.getSourcePort().getOwningStage()) // memorize all source stages as starting point for traversing
-	}
-
-	public <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int capacity, final IPipeFactory pipeFactory):
-		IPipe<T> pipe = pipeFactory.newPipe(sourcePort, targetPort, capacity)
-		startStages.add(pipe.getSourcePort().getOwningStage()) // memorize all source stages as starting point for traversing
-	}
+	# @deprecated since 3.0. Use:@link #connect_ports(OutputPort, InputPort, int, IPipeFactory)} instead.
+	def register_custom_pipe(self, pipe):
+		self._start_stages.add(pipe.get_source_port().get_owning_stage()) # memorize all source stages as starting point for traversing
 
-	# @deprecated since 3.0.
-	@Deprecated
-		return context
-	}
+	# Connects two ports with a pipe.
+	#
+	# @param capacity
+	#            the capacity of the pipe (see:@link CompositeStage#_connect_ports(OutputPort, InputPort, int)})
+	# @param pipe_factory
+	#            creates the pipe instead of the scheduler if given
+	def connect_ports(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = CompositeStage.DEFAULT_PIPE_CAPACITY,
+			pipe_factory: Optional[IPipeFactory] = None):
+		if (pipe_factory is None):
+			self._start_stages.add(source_port.get_owning_stage()) # memorize all source stages as starting point for traversing
+			super()._connect_ports(source_port, target_port, capacity)
+		else:
+			pipe = pipe_factory.new_pipe(source_port, target_port, capacity)
+			self._pipe_factories[source_port] = (pipe_factory, capacity)
+			self._start_stages.add(pipe.get_source_port().get_owning_stage()) # memorize all source stages as starting point for traversing
+
+	def _connect_ports(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = CompositeStage.DEFAULT_PIPE_CAPACITY):
+		self.connect_ports(source_port, target_port, capacity)
 
-	Collection<AbstractStage> getStartStages():
-		return startStages
-	}
+	# @deprecated since 3.0.
+	def _get_context(self) -> "ConfigurationContext":
+		if (self._context is None):
+			# created lazily since the context instantiates a scheduler for this configuration
+			from teetime.framework.ConfigurationContext import ConfigurationContext
+			self._context = ConfigurationContext(self)
+		return self._context
+
+	def _get_start_stages(self) -> Collection[AbstractStage]:
+		return self._start_stages
+
+	# @return the factory and the capacity of the pipe connected to the given port if it has been created by a factory, otherwise <code>None</code>
+	def _get_pipe_factory(self, source_port: OutputPort) -> Optional[Tuple[IPipeFactory, int]]:
+		return self._pipe_factories.get(source_port)
+
+	# @return the topology if this configuration has been compiled by a:@link CompiledConfiguration}, otherwise <code>None</code>
+	def _get_compiled_topology(self) -> Optional["CompiledConfiguration.Topology"]:
+		return self._compiled_topology
+
+	def _set_compiled_topology(self, compiled_topology: "CompiledConfiguration.Topology"):
+		self._compiled_topology = compiled_topology
+
+	# Determines the CPUs on which the threads (and processes) of this configuration run, e.g.,
+	# by means of an:@link ExplicitPlacementPolicy} or a:@link PackNeighboursPlacementPolicy}.
+	# By default, no thread is pinned.
+	#
+	# @param placement_policy
+	#            <code>None</code> to not pin any thread
+	#
+	# @since 3.0
+	def set_placement_policy(self, placement_policy: Optional[IPlacementPolicy]):
+		self._placement_policy = placement_policy
 
-	public <O> ConfigurationBuilder.Connection<O> from(final AbstractProducerStage<O> stage):
-		return ConfigurationBuilder.create(this, stage)
-	}
+	def get_placement_policy(self) -> Optional[IPlacementPolicy]:
+		return self._placement_policy
 
-}
+	def from_(self, stage: AbstractStage) -> "ConfigurationBuilder.Connection":
+		from teetime.framework.ConfigurationBuilder import ConfigurationBuilder
+		return ConfigurationBuilder.create(self, stage)
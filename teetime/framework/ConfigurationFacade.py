@@ -11,34 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
-
-import java.util.Collection
-
-import teetime.framework.exceptionHandling.AbstractExceptionListenerFactory
+from typing import Collection
 
 # Used to access the package-private methods of:@link Configuration}.
 #
 # @author Christian Wulf (chw)
 #
-public final class ConfigurationFacade:
-
-	public static final ConfigurationFacade INSTANCE = new ConfigurationFacade()
+class ConfigurationFacade:
 
-	private ConfigurationFacade():
-		// singleton class
-	}
+	def get_factory(self, configuration):
+		return configuration._get_factory()
 
-	public AbstractExceptionListenerFactory<?> getFactory(final Configuration configuration):
-		return configuration.getFactory()
-	}
+	def get_context(self, configuration):
+		return configuration._get_context()
 
-	public ConfigurationContext getContext(final Configuration configuration):
-		return configuration.getContext()
-	}
+	def get_start_stages(self, configuration) -> Collection:
+		return configuration._get_start_stages()
 
-	public Collection<AbstractStage> getStartStages(final Configuration configuration):
-		return configuration.getStartStages()
-	}
+	# @return the topology of a configuration compiled by a:@link CompiledConfiguration}, otherwise <code>None</code>
+	def get_compiled_topology(self, configuration):
+		return configuration._get_compiled_topology()
 
-}
+ConfigurationFacade.INSTANCE = ConfigurationFacade()
@@ -11,26 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+import importlib
+import logging
+import sys
+from enum import Enum
+from time import perf_counter_ns
+from typing import Dict, Generic, List, Optional, TypeVar
 
-import java.util.ArrayList
-import java.util.Iterator
-import java.util.List
-import java.util.Map
-import java.util.Map.Entry
-import java.util.concurrent.Future
-import java.util.concurrent.TimeUnit
-import java.util.concurrent.TimeoutException
-import org.slf4j.Logger
+from teetime.framework.Configuration import Configuration
+from teetime.framework.ExecutionException import ExecutionException
+from teetime.framework.TeeTimeScheduler import TeeTimeScheduler
 
-import org.slf4j.LoggerFactory
+T = TypeVar("T", bound=Configuration)
 
-import teetime.framework.scheduling.pushpullmodel.PushPullScheduling
+LOGGER = logging.getLogger("Execution")
 
 # Represents an Execution to which stages can be added and executed later.
 # This class requires a:@link Configuration},
 # in which the adding and configuring of stages takes place.
-# To start the analysis:@link #executeBlocking()} needs to be executed.
+# To start the analysis:@link #execute_blocking()} needs to be executed.
 # This class will automatically create threads and join them without any further commitment.
 #
 # @author Christian Wulf, Nelson Tavares de Sousa
@@ -39,110 +38,77 @@ import teetime.framework.scheduling.pushpullmodel.PushPullScheduling
 #            the type of the:@link Configuration}
 #
 # @since 2.0
-public final class Execution<T extends Configuration>:
-
-	private static enum ExecutionState:
-		INITIALIZED, CANCELING, CANCELED, EXECUTING, COMPLETED,
-	}
-
-	private static class ExecutionFuture implements Future<Void>:
-
-		private final Execution<?> execution
-
-		public ExecutionFuture(final Execution<?> execution):
-			self.execution = execution
-		}
-
-		@Override
-		public boolean cancel(final boolean mayInterruptIfRunning):
-			if (self.execution.getState() == ExecutionState.COMPLETED):
-				return false
-			}
-			if (self.execution.getState() == ExecutionState.CANCELING):
-				return false
-			}
-			if (self.execution.getState() == ExecutionState.CANCELED):
-				return false
-			}
-			if (self.execution.getState() == ExecutionState.INITIALIZED):
-				return true
-			}
-			self.execution.abortEventually()
-			return true
-		}
-
-		@Override
-		public boolean isCancelled():
-			return self.execution.getState() == ExecutionState.CANCELED
-		}
-
-		@Override
-		public boolean isDone():
-			return self.execution.getState() == ExecutionState.COMPLETED
-		}
-
-		@Override
-		public Void get() throws InterruptedException, java.util.concurrent.ExecutionException:
-			self.execution.waitForTermination()
-			return null
-		}
-
-		@Override
-		public Void get(final long timeout, final TimeUnit unit) throws InterruptedException, java.util.concurrent.ExecutionException, TimeoutException:
-			throw new UnsupportedOperationException()
-		}
-
-	}
-
-	private static final Logger LOGGER = LoggerFactory.getLogger(Execution.class)
-
-	private final T configuration
-
-	private ExecutionState state
-
-	private TeeTimeScheduler scheduler
-
-	# Creates a new:@link Execution}. It validates the given configuration and uses the:@link PushPullScheduling} as default scheduler.
-	#
-	# @param configuration
-	#            to be executed
-	public Execution(final T configuration):
-		this(configuration, true)
-	}
+class Execution(Generic[T]):
+
+	class ExecutionState(Enum):
+		INITIALIZED = 1
+		CANCELING = 2
+		CANCELED = 3
+		EXECUTING = 4
+		COMPLETED = 5
+
+	class ExecutionFuture:
+
+		def __init__(self, execution: "Execution"):
+			self._execution = execution
+
+		def cancel(self, may_interrupt_if_running: bool = True) -> bool:
+			state = self._execution.get_state()
+			if (state == Execution.ExecutionState.COMPLETED):
+				return False
+			if (state == Execution.ExecutionState.CANCELING):
+				return False
+			if (state == Execution.ExecutionState.CANCELED):
+				return False
+			if (state == Execution.ExecutionState.INITIALIZED):
+				return True
+			self._execution.abort_eventually()
+			return True
+
+		def is_cancelled(self) -> bool:
+			return self._execution.get_state() == Execution.ExecutionState.CANCELED
+
+		def is_done(self) -> bool:
+			return self._execution.get_state() == Execution.ExecutionState.COMPLETED
+
+		def get(self, timeout: Optional[float] = None):
+			if (timeout is not None):
+				raise NotImplementedError() # UnsupportedOperationException
+			self._execution.wait_for_termination()
+
+	_configuration: T
+	_state: "Execution.ExecutionState"
+	_scheduler: TeeTimeScheduler
+	_startup_durations_in_ns: Dict[str, int]
 
-	# Uses:@link PushPullScheduling} as default scheduler.
-	#
 	# @param configuration
 	#            to be executed.
-	# @param validationEnabled
-	#            <code>true</code> if validation should be performed after initialization <code>false</code> otherwise.
-	public Execution(final T configuration, final boolean validationEnabled):
-		this(configuration, validationEnabled, new PushPullScheduling(configuration))
-	}
-
-	# @param configuration
-	#            to be executed.
-	# @param validationEnabled
+	# @param validation_enabled
 	#            <code>true</code> if validation should be performed after initialization <code>false</code> otherwise.
 	# @param scheduler
-	#            to be used for the given configuration.
-	public Execution(final T configuration, final boolean validationEnabled, final TeeTimeScheduler scheduler):
-		self.scheduler = scheduler
-		self.configuration = configuration
-		if (configuration.isInitialized()):
-			throw new IllegalStateException("3001 - Configuration has already been used.")
-		}
-		configuration.setInitialized(true)
-
-		scheduler.onInitialize()
-		self.state = ExecutionState.INITIALIZED
-
-		Execution.LOGGER.debug("Using scheduler::}", scheduler.getClass().getCanonicalName())
-
-		if (validationEnabled):
-			scheduler.onValidate()
-		}
-	}
+	#            to be used for the given configuration. Uses:@link PushPullScheduling} by default.
+	def __init__(self, configuration: T, validation_enabled: bool = True, scheduler: Optional[TeeTimeScheduler] = None):
+		if (scheduler is None):
+			from teetime.framework.scheduling.pushpullmodel.PushPullScheduling import PushPullScheduling
+			scheduler = PushPullScheduling(configuration)
+		self._scheduler = scheduler
+		self._configuration = configuration
+		self._startup_durations_in_ns = {}
+		if (configuration._is_initialized()):
+			raise Exception("3001 - Configuration has already been used.") # IllegalStateException
+		configuration._set_initialized(True)
+
+		start = perf_counter_ns()
+		scheduler.on_initialize()
+		self._startup_durations_in_ns["initialize"] = perf_counter_ns() - start
+		self._state = Execution.ExecutionState.INITIALIZED
+
+		LOGGER.debug("Using scheduler: %s", type(scheduler).__qualname__)
+
+		if (validation_enabled):
+			start = perf_counter_ns()
+			scheduler.on_validate()
+			self._startup_durations_in_ns["validate"] = perf_counter_ns() - start
 
 	# Calling this method will block the current thread until the execution terminates.
 	#
@@ -150,50 +116,42 @@ public final class Execution<T extends Configuration>:
 	#             if at least one exception in one thread has occurred within the execution. The exception contains the pairs of thread and throwable
 	#
 	# @since 2.0
-	public void waitForTermination():
-		self.scheduler.onFinish()
-		if (self.state == ExecutionState.CANCELING):
-			self.state = ExecutionState.CANCELED
-		} else:
-			self.state = ExecutionState.COMPLETED
-		}
-
-		final Map<Thread, List<Exception>> threadExceptionsMap = self.configuration.getFactory().getThreadExceptionsMap()
-		final Iterator<Entry<Thread, List<Exception>>> iterator = threadExceptionsMap.entrySet().iterator()
-		while (iterator.hasNext()):
-			final Entry<Thread, List<Exception>> entry = iterator.next()
-			if (entry.getValue().isEmpty()):
-				iterator.remove()
-			}
-		}
-
-		if (!threadExceptionsMap.isEmpty()):
-			throw new ExecutionException(threadExceptionsMap)
-		}
-	}
+	def wait_for_termination(self):
+		self._scheduler.on_finish()
+		if (self._state == Execution.ExecutionState.CANCELING):
+			self._state = Execution.ExecutionState.CANCELED
+		else:
+			self._state = Execution.ExecutionState.COMPLETED
+
+		thread_exceptions_map = self._configuration._get_factory().get_thread_exceptions_map()
+		for thread in [thread for thread, exceptions in thread_exceptions_map.items() if not exceptions]:
+			del thread_exceptions_map[thread]
+
+		if (thread_exceptions_map):
+			raise ExecutionException(thread_exceptions_map)
 
 	# Terminates all producer stages, interrupts all threads, and waits for a graceful termination.
-	public void abortEventually():
-		self.state = ExecutionState.CANCELING
-		self.scheduler.onTerminate()
-		self.waitForTermination()
-	}
+	def abort_eventually(self):
+		self._state = Execution.ExecutionState.CANCELING
+		self._scheduler.on_terminate()
+		self.wait_for_termination()
 
-	# This method starts this execution without waiting for its termination. The method:@link #waitForTermination()} must be called to unsure a correct termination
+	# This method starts this execution without waiting for its termination. The method:@link #wait_for_termination()} must be called to unsure a correct termination
 	# of the execution.
 	#
 	# @return a future object to cancel the execution or to wait for the execution to finish.
 	#
 	# @since 2.0
-	public Future<Void> executeNonBlocking():
-		if (self.configuration.isExecuted()):
-			throw new IllegalStateException("3002 - Any configuration instance may only be executed once.")
-		}
-		self.configuration.setExecuted(true)
-		self.state = ExecutionState.EXECUTING
-		self.scheduler.onExecute()
-		return new ExecutionFuture(this)
-	}
+	def execute_non_blocking(self) -> "Execution.ExecutionFuture":
+		if (self._configuration._is_executed()):
+			raise Exception("3002 - Any configuration instance may only be executed once.") # IllegalStateException
+		self._configuration._set_executed(True)
+		self._state = Execution.ExecutionState.EXECUTING
+		start = perf_counter_ns()
+		self._scheduler.on_execute()
+		self._startup_durations_in_ns["execute"] = perf_counter_ns() - start
+		LOGGER.debug("Start-up durations (ns): %s", self.get_startup_durations_in_ns())
+		return Execution.ExecutionFuture(self)
 
 	# This method will start this execution and block until it is finished.
 	#
@@ -201,52 +159,55 @@ public final class Execution<T extends Configuration>:
 	#             if at least one exception in one thread has occurred within the execution. The exception contains the pairs of thread and throwable.
 	#
 	# @since 2.0
-	public void executeBlocking():
-		self.executeNonBlocking()
-		self.waitForTermination()
-	}
+	def execute_blocking(self):
+		self.execute_non_blocking()
+		self.wait_for_termination()
+
+	# Provides the duration of each start-up phase in nanoseconds:
+	# <code>initialize</code>, <code>validate</code> (if enabled), and <code>execute</code> (once executed),
+	# followed by the scheduler-specific phases (see:@link TeeTimeScheduler#get_startup_durations_in_ns()}).
+	#
+	# @since 3.0
+	def get_startup_durations_in_ns(self) -> Dict[str, int]:
+		durations = dict(self._startup_durations_in_ns)
+		durations.update(self._scheduler.get_startup_durations_in_ns())
+		return durations
 
 	# Retrieves the Configuration which was used to add and arrange all stages needed for this execution.
 	#
 	# @return the configuration used for this execution
-	public T getConfiguration():
-		return self.configuration
-	}
-
-	private static List<Configuration> configLoader(final String... args):
-		final List<Configuration> instances = new ArrayList<Configuration>()
-		for (final String each : args):
+	def get_configuration(self) -> T:
+		return self._configuration
+
+	def get_state(self) -> "Execution.ExecutionState":
+		return self._state
+
+	# @param args
+	#            fully qualified class names, e.g., <code>my.module.MyConfiguration</code>
+	@staticmethod
+	def _config_loader(*args: str) -> List[Configuration]:
+		instances = []
+		for each in args:
+			module_name, _, class_name = each.rpartition(".")
 			try:
-				final Class<?> clazz = Class.forName(each)
-				final Object obj = clazz.newInstance()
-				if (obj instanceof Configuration):
-					instances.add((Configuration) obj)
-				}
-			} catch (final ClassNotFoundException e):
-				if (Execution.LOGGER.isErrorEnabled()):
-					Execution.LOGGER.error("Could not find class " + each)
-				}
-			} catch (final InstantiationException e):
-				if (Execution.LOGGER.isErrorEnabled()):
-					Execution.LOGGER.error("Could not instantiate class " + each, e)
-				}
-			} catch (final IllegalAccessException e):
-				if (Execution.LOGGER.isErrorEnabled()):
-					Execution.LOGGER.error("IllegalAccessException arised while instantiating class " + each, e)
-				}
-			}
-		}
+				clazz = getattr(importlib.import_module(module_name), class_name)
+			except (ImportError, AttributeError, ValueError):
+				LOGGER.error("Could not find class " + each)
+				continue
+			try:
+				obj = clazz()
+			except Exception as e:
+				LOGGER.error("Could not instantiate class " + each, exc_info=e)
+				continue
+			if (isinstance(obj, Configuration)):
+				instances.append(obj)
 		return instances
-	}
-
-	public static void main(final String... args):
-		final List<Configuration> instances = Execution.configLoader(args)
-		for (final Configuration configuration : instances):
-			new Execution<Configuration>(configuration).executeBlocking() // NOPMD
-		}
-	}
 
-		return self.state
-	}
+	@staticmethod
+	def main(*args: str):
+		instances = Execution._config_loader(*args)
+		for configuration in instances:
+			Execution(configuration).execute_blocking() # NOPMD
 
-}
+if __name__ == "__main__":
+	Execution.main(*sys.argv[1:])
@@ -11,36 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
-
-import java.util.List
-import java.util.Map
+from typing import Dict, List
 
 # Represents a exception, which is thrown by an analysis,
 # if any problems occurred within its execution.
 # A collection of thrown exceptions within the analysis
-# can be retrieved with:@link #getThrownExceptions()}.
+# can be retrieved with:@link #get_thrown_exceptions()}.
 #
 # @since 2.0
-public class ExecutionException extends RuntimeException:
-
-	private static final long serialVersionUID = 7486086437171884298L
+class ExecutionException(Exception):
 
-	private final Map<Thread, List<Exception>> exceptions
+	_exceptions: Dict[object, List[Exception]]
 
-	public ExecutionException(final Map<Thread, List<Exception>> exceptions):
-		super("3003 - " + ((exceptions.size() == 1) ? exceptions.toString() : exceptions.size())
+	def __init__(self, exceptions: Dict[object, List[Exception]]):
+		super().__init__("3003 - " + (str(exceptions) if len(exceptions) == 1 else str(len(exceptions)))
 				+ " error(s) occurred while execution. Check thrown exception(s).")
-		self.exceptions = exceptions
-	}
+		self._exceptions = exceptions
 
 	# Returns all exceptions thrown within the execution.
 	# These are passed on as pairs of threads and throwables,
 	# to indicate a exception's context.
 	#
 	# @return a thread-exceptionlist-map
-	public Map<Thread, List<Exception>> getThrownExceptions():
-		return exceptions
-	}
-
-}
+	def get_thrown_exceptions(self) -> Dict[object, List[Exception]]:
+		return self._exceptions
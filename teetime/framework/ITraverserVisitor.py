@@ -11,17 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
 
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.DummyPipe
+class ITraverserVisitor:
 
-public interface ITraverserVisitor:
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		pass
 
-	VisitorBehavior visit(AbstractStage stage)
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		pass
 
-	VisitorBehavior visit(AbstractPort<?> port)
-
-	void visit(DummyPipe pipe, AbstractPort<?> port)
-
-}
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		pass
@@ -31,34 +31,52 @@ class InputPort(AbstractPort[T]): # was generic
 		super.__init__(self, type, owning_stage, port_name)
 
 	#
-	# @return the next element from the connected pipe, or <code>null</code> if the pipe is currently empty.
+	# @return the next element from the connected pipe, or <code>None</code> if the pipe is currently empty.
 	def receive(self) -> T:
-		element:T = self.pipe.removeLast()
+		element:T = self._pipe.remove_last()
 		if (self.TERMINATE_ELEMENT == element):
-			self.pipe.close() # TODO remove volatile from isClosed
-			size: int = self.pipe.size()
-			if (size > 0):
-				raise Exception("Pipe " + self.pipe + " should be empty, but has a size of " + size)
-			
-			owning_stage = self.get_owning_stage()
-
-			# TODO let the input port trigger the (TERM) signal for the stage
-			# ISignal signal = pipe.removeNextSignal()
-			# owningStage.onSignal(signal, this)
-
-			num_opened_input_ports = owning_stage.dec_num_opened_input_ports()
-			owning_stage.logger.trace("numOpenedInputPorts (dec)::}", num_opened_input_ports)
-			if (num_opened_input_ports == 0):
-				owning_stage.terminate_stage_by_framework()
-			
+			self._on_terminate_element()
 			return None # NOPMD (two returns)
 		
 		return element
-	
+
+	#
+	# Retrieves up to <code>max_elements</code> elements from the connected pipe at once.
+	#
+	# @param target
+	#            list to which the received elements are appended
+	# @param max_elements
+	#            the maximum number of elements to receive
+	# @return the number of elements appended to <code>target</code>, <code>0</code> if the pipe is currently empty.
+	def receive_batch(self, target: List[T], max_elements: int) -> int:
+		count = self._pipe.drain_to(target, max_elements)
+		# the terminate element is the last element ever sent, so it can only be the last one drained
+		if (count > 0 and self.TERMINATE_ELEMENT == target[-1]):
+			target.pop()
+			count -= 1
+			self._on_terminate_element()
+		return count
+
+	def _on_terminate_element(self):
+		self._pipe.close() # TODO remove volatile from isClosed
+		size: int = self._pipe.size()
+		if (size > 0):
+			raise Exception("Pipe " + str(self._pipe) + " should be empty, but has a size of " + str(size))
+		
+		owning_stage = self.get_owning_stage()
+
+		# TODO let the input port trigger the (TERM) signal for the stage
+		# ISignal signal = pipe.removeNextSignal()
+		# owningStage.onSignal(signal, this)
+
+		num_opened_input_ports = owning_stage.dec_num_opened_input_ports()
+		owning_stage.logger.trace("numOpenedInputPorts (dec)::}", num_opened_input_ports)
+		if (num_opened_input_ports == 0):
+			owning_stage.terminate_stage_by_framework()
 
 	def is_closed(self) -> bool: #FIXME remove: only used by divide and conquer
-		return self.pipe.is_closed() and not self.pipe.has_more()
+		return self._pipe.is_closed() and not self._pipe.has_more()
 
 	def wait_for_start_signal(self): #throws InterruptedException:
-		self.pipe.wait_for_start_signal()
+		self._pipe.wait_for_start_signal()
 
@@ -11,103 +11,63 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
-
-import teetime.framework.pipe.IPipe
-import teetime.framework.scheduling.PipeScheduler
-import teetime.framework.signal.ISignal
-
-public class InstantiationPipe<T> implements IPipe<T>:
-
-	private static final String ERROR_MESSAGE = "This must not be called while executing the configuration"
-
-	private final OutputPort<? extends T> sourcePort
-	private final InputPort<T> targetPort
-	@SuppressWarnings("PMD.AvoidFieldNameMatchingMethodName")
-	private final int capacity
-
-	public InstantiationPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int capacity):
-		self.sourcePort = sourcePort
-		self.targetPort = targetPort
-		self.capacity = capacity
-		sourcePort.setPipe(this)
-		targetPort.setPipe(this)
-	}
-
-	@Override
-	public int capacity():
-		return capacity
-	}
-
-	@Override
-	public OutputPort<? extends T> getSourcePort():
-		return sourcePort
-	}
-
-	@Override
-	public InputPort<T> getTargetPort():
-		return targetPort
-	}
-
-	@Override
-	public void add(final Object element):
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public boolean addNonBlocking(final Object element):
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public boolean isEmpty():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public int size():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public Object removeLast():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public void sendSignal(final ISignal signal):
-		// throw new IllegalStateException(ERROR_MESSAGE + ": " + sourcePort.getOwningStage())
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public void reportNewElement():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public boolean isClosed():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public boolean hasMore():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public void waitForStartSignal() throws InterruptedException:
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public void close():
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-	@Override
-	public void setScheduler(final PipeScheduler scheduler):
-		throw new IllegalStateException(ERROR_MESSAGE)
-	}
-
-}
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.pipe.pipe import IPipe
+
+ERROR_MESSAGE = "This must not be called while executing the configuration"
+
+# Represents a connection declared by the configuration.
+# The scheduler replaces each instantiation pipe by an executable pipe upon initialization.
+class InstantiationPipe(IPipe[T]):
+
+	def __init__(self, source_port: "OutputPort", target_port: "InputPort[T]", capacity: int):
+		self._source_port = source_port
+		self._target_port = target_port
+		self._capacity = capacity
+		source_port.set_pipe(self)
+		target_port.set_pipe(self)
+
+	def capacity(self) -> int:
+		return self._capacity
+
+	def get_source_port(self) -> "OutputPort":
+		return self._source_port
+
+	def get_target_port(self) -> "InputPort[T]":
+		return self._target_port
+
+	def add(self, element):
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def add_non_blocking(self, element) -> bool:
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def is_empty(self) -> bool:
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def size(self) -> int:
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def remove_last(self):
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def send_signal(self, signal):
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def is_closed(self) -> bool:
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def has_more(self) -> bool:
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def wait_for_start_signal(self):
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def close(self):
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
+
+	def set_scheduler(self, scheduler):
+		raise Exception(ERROR_MESSAGE) # IllegalStateException
@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from typing import Iterable, TypeVar
 
-import teetime.framework.pipe.DummyPipe
-import teetime.framework.signal.ISignal
-import teetime.framework.signal.TerminatingSignal
+T = TypeVar("T")
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.signal.ISignal import ISignal
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
 
 #
 # @author Christian Wulf
@@ -24,49 +28,85 @@ import teetime.framework.signal.TerminatingSignal
 #            the type of elements to be sent
 #
 # @since 1.0
-public class OutputPort<T> extends AbstractPort<T>:
-
-	OutputPort(final Class<T> type, final AbstractStage owningStage, final String portName):
-		super(type, owningStage, portName)
-		setPipe((DummyPipe<T>)DummyPipe.INSTANCE)
-	}
+class OutputPort(AbstractPort[T]):
 
-	# For testing purposes only.
-	public OutputPort():
-		super(null, null, null)
-	}
+	# Passing <code>None</code> for all parameters is for testing purposes only.
+	def __init__(self, type = None, owning_stage: AbstractStage = None, port_name: str = None):
+		super().__init__(type, owning_stage, port_name)
+		if (owning_stage is not None):
+			self.set_pipe(DummyPipe.INSTANCE)
 
 	#
 	# Guarantees the delivery of the given <code>element</code>.
 	#
 	# @param element
-	#            to be sent May not be <code>null</code>.
+	#            to be sent May not be <code>None</code>.
+	#
+	def send(self, element: T):
+		self._pipe.add(element)
+
+	#
+	# Guarantees the delivery of all given <code>elements</code> in their iteration order.
+	# The connected pipe hands the elements over as a batch, i.e., with (at most) one scheduler notification per chunk.
+	#
+	# @param elements
+	#            to be sent. May not contain <code>None</code>.
 	#
-	public void send(final T element):
-		self.pipe.add(element)
-	}
+	def send_batch(self, elements: Iterable[T]):
+		self._pipe.add_all(elements)
 
+	#
+	# The awaitable counterpart of:@link #send(Object)} for stages which override:@link AbstractStage#_execute_async()}.
+	# If the connected pipe is full, it awaits free capacity instead of exceeding the capacity.
 	#
 	# @param element
-	#            to be sent May not be <code>null</code>.
+	#            to be sent May not be <code>None</code>.
+	#
+	# @since 3.1
+	async def send_async(self, element: T):
+		await self._pipe.add_async(element)
+
+	#
+	# The awaitable counterpart of:@link #send_batch(Iterable)}.
+	# The elements are handed over in chunks which fit into the free capacity of the connected pipe.
+	#
+	# @param elements
+	#            to be sent. May not contain <code>None</code>.
+	#
+	# @since 3.1
+	async def send_batch_async(self, elements: Iterable[T]):
+		await self._pipe.add_all_async(elements)
+
+	#
+	# Guarantees the delivery of the given <code>element</code> on the given lane, e.g., of a:@link MultiLanePipe}.
+	# Elements on a more urgent lane overtake the elements queued on less urgent lanes.
+	# If the connected pipe has only a single lane, this method is equivalent to:@link #send(Object)}.
+	#
+	# @param element
+	#            to be sent May not be <code>None</code>.
+	# @param lane
+	#            the index of the lane, where 0 is the most urgent one
+	#
+	# @since 3.0
+	def send_on_lane(self, element: T, lane: int):
+		self._pipe.add_on_lane(element, lane)
+
+	#
+	# @param element
+	#            to be sent May not be <code>None</code>.
 	#
 	# @return <code>true</code> iff the <code>element</code> was sent
 	#         <code>false</code> otherwise.
 	#
 	# @since 1.1
-	public boolean sendNonBlocking(final T element):
-		return self.pipe.addNonBlocking(element)
-	}
+	def send_non_blocking(self, element: T) -> bool:
+		return self._pipe.add_non_blocking(element)
 
 	#
 	# @param signal
-	#            to be sent May not be <code>null</code>.
-	public void sendSignal(final ISignal signal):
-		if (signal instanceof TerminatingSignal):
-			pipe.add(TERMINATE_ELEMENT)
-		}
-
-		pipe.sendSignal(signal)
-	}
+	#            to be sent May not be <code>None</code>.
+	def send_signal(self, signal: ISignal):
+		if (isinstance(signal, TerminatingSignal)):
+			self._pipe.add(self.TERMINATE_ELEMENT)
 
-}
+		self._pipe.send_signal(signal)
@@ -11,65 +11,54 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+import logging
+from typing import Collection, Optional, TypeVar
 
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
+T = TypeVar("T")
 
-import teetime.framework.pipe.BoundedSynchedPipe
-import teetime.framework.pipe.UnboundedSynchedPipe
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.BoundedSynchedPipe import BoundedSynchedPipe
+from teetime.framework.pipe.UnboundedSynchedPipe import UnboundedSynchedPipe
 
-public final class RuntimeServiceFacade:
+LOGGER = logging.getLogger("RuntimeServiceFacade")
 
-	public static final RuntimeServiceFacade INSTANCE = new RuntimeServiceFacade()
+class RuntimeServiceFacade:
 
-	private static final Logger LOGGER = LoggerFactory.getLogger(RuntimeServiceFacade.class)
-
-	private RuntimeServiceFacade():
-		// singleton
-	}
+	INSTANCE: "RuntimeServiceFacade"
 
 	# Does not send signals.
 	#
-	# @param previousStage
+	# @param previous_stage
 	# @param stage
-	public void startWithinNewThread(final AbstractStage previousStage, final AbstractStage stage):
-		previousStage.getScheduler().startStageAtRuntime(stage)
-	}
+	def start_within_new_thread(self, previous_stage: AbstractStage, stage: AbstractStage):
+		previous_stage.get_scheduler().start_stage_at_runtime(stage)
 
-	# Connects two ports with a pipe with an unlimited capacity.
+	# Starts all given stages together, e.g., the new worker stages of a task farm. Does not send signals.
 	#
-	# @param sourcePort
-	#           :@link OutputPort} of the sending stage
-	# @param targetPort
-	#           :@link InputPort} of the sending stage
-	# @param <T>
-	#            the type of elements to be sent
-	public <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		if ((sourcePort.getPipe() != null || targetPort.getPipe() != null) && LOGGER.isWarnEnabled()):
-			LOGGER.warn("Overwriting existing pipe while connecting stages " +
-					sourcePort.getOwningStage().getId() + " and " + targetPort.getOwningStage().getId() + ".")
-		}
-		// TODO: unbounded?
-		new UnboundedSynchedPipe<T>(sourcePort, targetPort)
-	}
+	# @since 3.0
+	def start_within_new_threads(self, previous_stage: AbstractStage, stages: Collection[AbstractStage]):
+		previous_stage.get_scheduler().start_stages_at_runtime(stages)
 
 	# Connects to ports with a pipe of a certain capacity
 	#
-	# @param sourcePort
+	# @param source_port
 	#           :@link OutputPort} of the sending stage
-	# @param targetPort
+	# @param target_port
 	#           :@link InputPort} of the sending stage
 	# @param capacity
-	#            the pipe is set to this capacity, if the value is greater than 0. If it is 0, than the pipe is unbounded, thus growing of the pipe is enabled.
+	#            the pipe is set to this capacity, if the value is given. Otherwise, the pipe is unbounded, thus growing of the pipe is enabled.
 	# @param <T>
 	#            the type of elements to be sent
-	public <T> void connectPorts(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int capacity):
-		if ((sourcePort.getPipe() != null || targetPort.getPipe() != null) && LOGGER.isWarnEnabled()):
-			LOGGER.warn("Overwriting existing pipe while connecting stages " +
-					sourcePort.getOwningStage().getId() + " and " + targetPort.getOwningStage().getId() + ".")
-		}
-		new BoundedSynchedPipe<T>(sourcePort, targetPort, capacity)
-	}
+	def connect_ports(self, source_port: OutputPort, target_port: InputPort[T], capacity: Optional[int] = None):
+		if (source_port.get_pipe() is not None or target_port.get_pipe() is not None):
+			LOGGER.warning("Overwriting existing pipe while connecting stages %s and %s.",
+					source_port.get_owning_stage().get_id(), target_port.get_owning_stage().get_id())
+		if (capacity is None):
+			# TODO: unbounded?
+			UnboundedSynchedPipe(source_port, target_port)
+		else:
+			BoundedSynchedPipe(source_port, target_port, capacity)
 
-}
+RuntimeServiceFacade.INSTANCE = RuntimeServiceFacade()
@@ -11,117 +11,88 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from typing import List
 
-import java.util.List
-
-import teetime.framework.exceptionHandling.AbstractExceptionListener
-import teetime.framework.exceptionHandling.TerminateException
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
 
 # Used to access the package-private methods of:@link AbstractStage} and:@link CompositeStage}.
 #
 # @author Christian Wulf (chw)
 #
-public final class StageFacade:
-
-	public static final StageFacade INSTANCE = new StageFacade()
-
-	private StageFacade():
-		// singleton instance
-	}
+class StageFacade:
 
-	public void abort(final AbstractStage stage):
+	def abort(self, stage):
 		stage.abort()
-	}
 
 	# @deprecated since 3.0. Will be removed.
-	@Deprecated
-	public TerminationStrategy getTerminationStrategy(final AbstractStage stage):
-		return stage.getTerminationStrategy()
-	}
+	def get_termination_strategy(self, stage):
+		return stage.get_termination_strategy()
 
-	public Thread getOwningThread(final AbstractStage stage):
-		return stage.getOwningThread()
-	}
+	def get_owning_thread(self, stage):
+		return stage._get_owning_thread()
 
-	public void setOwningThread(final AbstractStage stage, final Thread newThread):
-		stage.setOwningThread(newThread)
-	}
+	def set_owning_thread(self, stage, new_thread):
+		stage._set_owning_thread(new_thread)
 
-	public void setExceptionHandler(final AbstractStage stage, final AbstractExceptionListener exceptionHandler):
-		stage.setExceptionHandler(exceptionHandler)
-	}
+	def set_exception_handler(self, stage, exception_handler):
+		stage._set_exception_handler(exception_handler)
 
-	public void setScheduler(final AbstractStage stage, final TeeTimeScheduler scheduler):
-		stage.setScheduler(scheduler)
-	}
+	def set_scheduler(self, stage, scheduler):
+		stage.set_scheduler(scheduler)
 
-	public AbstractExceptionListener getExceptionListener(final AbstractStage stage):
-		return stage.getExceptionListener()
-	}
+	def get_exception_listener(self, stage):
+		return stage._get_exception_listener()
 
-	public boolean shouldBeTerminated(final AbstractStage stage):
-		return stage.shouldBeTerminated()
-	}
+	def reset(self, stage):
+		stage._reset()
 
-	public void runStage(final AbstractStage stage):
+	def should_be_terminated(self, stage) -> bool:
+		return stage._should_be_terminated()
+
+	def run_stage(self, stage):
 		try:
-			while (!stage.shouldBeTerminated()):
-				stage.executeByFramework()
-			}
-		} catch (TerminateException e):
+			while (not stage._should_be_terminated()):
+				stage.execute_by_framework()
+		except TerminateException:
 			stage.abort()
-			stage.getScheduler().onTerminate()
-		}
-	}
+			stage.get_scheduler().on_terminate()
 
-	public void runStage(final AbstractStage stage, final int numOfExecutions):
+	# @return the number of executions which found an element to consume. For a producer, each execution counts.
+	def run_stage_n_times(self, stage, num_of_executions: int) -> int:
+		input_ports = None if stage.is_producer() else stage.get_input_ports()
+		num_consumed = 0
 		try:
-			for (int i = 0 i < numOfExecutions i++):
-				// break if stage terminates before completing the amount of iterations indicated by numOfExecutions
-				if (stage.shouldBeTerminated()):
+			for _ in range(num_of_executions):
+				# break if stage terminates before completing the amount of iterations indicated by num_of_executions
+				if (stage._should_be_terminated()):
 					break
-				}
-				stage.executeByFramework()
-			}
-		} catch (TerminateException e):
-			// "abort" triggers a terminated and onTerminate() triggers a terminating leading to an invalid state change.
-			// so, we uncomment abort here
-			// stage.abort()
-			stage.getScheduler().onTerminate()
-		}
-	}
-
-	public List<InputPort<?>> getInputPorts(final AbstractStage stage):
-		return stage.getInputPorts()
-	}
-
-	public List<InputPort<?>> getInputPorts(final CompositeStage stage):
-		return stage.getInputPorts()
-	}
-
-	public List<OutputPort<?>> getOutputPorts(final AbstractStage stage):
-		return stage.getOutputPorts()
-	}
-
-	public List<OutputPort<?>> getOutputPorts(final CompositeStage stage):
-		return stage.getOutputPorts()
-	}
-
-	public int getLevelIndex(final AbstractStage stage):
-		return stage.getLevelIndex()
-	}
-
-	public void setLevelIndex(final AbstractStage stage, final int levelIndex):
-		stage.setLevelIndex(levelIndex)
-	}
-
-	public void onStarting(final AbstractStage stage):
-		stage.onStarting()
-	}
-
-	public void onTerminating(final AbstractStage stage):
-		stage.onTerminating()
-	}
-
-}
+				has_input = input_ports is None or any(input_port.get_pipe().has_more() for input_port in input_ports)
+				stage.execute_by_framework()
+				if (has_input):
+					num_consumed += 1
+		except TerminateException:
+			# "abort" triggers a terminated and on_terminate() triggers a terminating leading to an invalid state change.
+			# so, we uncomment abort here
+			# stage.abort()
+			stage.get_scheduler().on_terminate()
+		return num_consumed
+
+	def get_input_ports(self, stage) -> List:
+		return stage.get_input_ports()
+
+	def get_output_ports(self, stage) -> List:
+		return stage.get_output_ports()
+
+	def get_level_index(self, stage) -> int:
+		return stage.get_level_index()
+
+	def set_level_index(self, stage, level_index: int):
+		stage.set_level_index(level_index)
+
+	def on_starting(self, stage):
+		stage._on_starting()
+
+	def on_terminating(self, stage):
+		stage._on_terminating()
+
+StageFacade.INSTANCE = StageFacade()
@@ -29,7 +29,7 @@ class StageState(Enum):
 		return self.compare_to(stage_state) > 0
 
 	def compare_to(self, stage_state) -> int:
-		return self.value - stage_stage.value
+		return self.value - stage_state.value
 
 
 
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Collection, Dict
+
 from teetime.framework.AbstractStage import AbstractStage
 
 # Represents a scheduling strategy for TeeTime-based configurations.
@@ -41,3 +43,16 @@ class TeeTimeScheduler:
 	# @since 3.0
 	def start_stage_at_runtime(self, stage: AbstractStage):
 		pass
+
+	# Starts all given stages together. Schedulers should override it to initialize the stages in a single pass.
+	#
+	# @since 3.0
+	def start_stages_at_runtime(self, stages: Collection[AbstractStage]):
+		for stage in stages:
+			self.start_stage_at_runtime(stage)
+
+	# @return the duration of each scheduler-specific start-up phase in nanoseconds, e.g., of the validation's signal propagation
+	#
+	# @since 3.0
+	def get_startup_durations_in_ns(self) -> Dict[str, int]:
+		return {}
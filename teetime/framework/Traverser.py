@@ -11,104 +11,79 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework
+from enum import Enum
+from typing import Set
 
-import java.util.HashSet
-import java.util.Set
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageState import StageState
+from teetime.framework.pipe.DummyPipe import DummyPipe
 
-import teetime.framework.pipe.DummyPipe
+class Traverser:
 
-# Traverses the all stages that are <b>reachable</b> from the given <i>stage</i>.
-# Each stage is visited exactly once (not more, not less).
-#
-# @author Christian Wulf
-#
-public class Traverser:
-
-	public static enum VisitorBehavior:
-		CONTINUE_FORWARD, CONTINUE_BACKWARD, CONTINUE_BACK_AND_FORTH, STOP
-	}
+	class VisitorBehavior(Enum):
+		CONTINUE_FORWARD = 1
+		CONTINUE_BACKWARD = 2
+		CONTINUE_BACK_AND_FORTH = 3
+		STOP = 4
 
-	public static interface EndOfTraverse:
-		public abstract boolean isMet(AbstractStage stage)
-	}
+	class EndOfTraverse:
+		def is_met(self, stage: AbstractStage) -> bool:
+			pass
 
 	# Represents the following termination condition: stop if the stage already runs or has been terminated
 	#
 	# @author Christian Wulf
 	#
-	public static class AlreadyRunsEndOfTraverse implements EndOfTraverse:
-		@Override
-		public boolean isMet(final AbstractStage stage):
-			return stage.getCurrentState().compareTo(StageState.STARTED) >= 0
-		}
-	}
+	class AlreadyRunsEndOfTraverse(EndOfTraverse):
+		def is_met(self, stage: AbstractStage) -> bool:
+			return stage.get_current_state().compare_to(StageState.STARTED) >= 0
 
-	private final Set<AbstractStage> visitedStages = new HashSet<AbstractStage>()
+	_visited_stages: Set[AbstractStage]
 
-	private final ITraverserVisitor traverserVisitor
+	def __init__(self, traverser_visitor, end_of_traverse: EndOfTraverse = None):
+		self._visited_stages = set()
+		self._traverser_visitor = traverser_visitor
+		self._end_of_traverse = end_of_traverse if end_of_traverse is not None else Traverser.AlreadyRunsEndOfTraverse()
 
-	private final EndOfTraverse endOfTraverse
+	def traverse(self, stage: AbstractStage):
+		if (self._end_of_traverse.is_met(stage)):
+			return # NOPMD sequential termination conditions are more readable
 
-	public Traverser(final ITraverserVisitor traverserVisitor):
-		this(traverserVisitor, new AlreadyRunsEndOfTraverse())
-	}
+		if (stage in self._visited_stages):
+			return
+		self._visited_stages.add(stage)
 
-	public Traverser(final ITraverserVisitor traverserVisitor, final EndOfTraverse endOfTraverse):
-		self.traverserVisitor = traverserVisitor
-		self.endOfTraverse = endOfTraverse
-	}
+		behavior = self._traverser_visitor.visit_stage(stage)
+		if (behavior == Traverser.VisitorBehavior.STOP):
+			return
 
-	public void traverse(final AbstractStage stage):
-		if (endOfTraverse.isMet(stage)):
-			return // NOPMD sequential termination conditions are more readable
-		}
+		if (behavior == Traverser.VisitorBehavior.CONTINUE_FORWARD or behavior == Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH):
+			for output_port in stage.get_output_ports():
+				self._visit_and_traverse(output_port, Traverser.VisitorBehavior.CONTINUE_FORWARD)
 
-		if (!visitedStages.add(stage)):
-			return
-		}
+		if (behavior == Traverser.VisitorBehavior.CONTINUE_BACKWARD or behavior == Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH):
+			for input_port in stage.get_input_ports():
+				self._visit_and_traverse(input_port, Traverser.VisitorBehavior.CONTINUE_BACKWARD)
 
-		VisitorBehavior behavior = traverserVisitor.visit(stage)
-		if (behavior == VisitorBehavior.STOP):
-			return
-		}
-
-		if (behavior == VisitorBehavior.CONTINUE_FORWARD || behavior == VisitorBehavior.CONTINUE_BACK_AND_FORTH):
-			for (OutputPort<?> outputPort : stage.getOutputPorts()):
-				visitAndTraverse(outputPort, VisitorBehavior.CONTINUE_FORWARD)
-			}
-		}
-
-		if (behavior == VisitorBehavior.CONTINUE_BACKWARD || behavior == VisitorBehavior.CONTINUE_BACK_AND_FORTH):
-			for (InputPort<?> inputPort : stage.getInputPorts()):
-				visitAndTraverse(inputPort, VisitorBehavior.CONTINUE_BACKWARD)
-			}
-		}
-	}
-
-	private void visitAndTraverse(final AbstractPort<?> port, final VisitorBehavior direction):
-		if (port.getPipe() == null):
-			throw new IllegalStateException("2003 - The port " + port + " of the stage " + port.getOwningStage() + " is not connected with another port.")
-		}
-
-		if (port.getPipe() instanceof DummyPipe):
-			traverserVisitor.visit((DummyPipe) port.getPipe(), port)
+	def _visit_and_traverse(self, port: AbstractPort, direction: "Traverser.VisitorBehavior"):
+		pipe = port.get_pipe()
+		if (pipe is None):
+			raise Exception("2003 - The port " + str(port) + " of the stage " + str(port.get_owning_stage()) + " is not connected with another port.") # IllegalStateException
+
+		if (isinstance(pipe, DummyPipe)):
+			self._traverser_visitor.visit_dummy_pipe(pipe, port)
 			return
-		}
 
-		VisitorBehavior behavior = traverserVisitor.visit(port)
+		behavior = self._traverser_visitor.visit_port(port)
 
-		if (behavior != VisitorBehavior.STOP):
-			AbstractPort<?> nextPort = (direction == VisitorBehavior.CONTINUE_FORWARD) ? port.getPipe().getTargetPort() : port.getPipe().getSourcePort()
+		if (behavior != Traverser.VisitorBehavior.STOP):
+			next_port = pipe.get_target_port() if direction == Traverser.VisitorBehavior.CONTINUE_FORWARD else pipe.get_source_port()
 
-			traverse(nextPort.getOwningStage()) // recursive call
-		}
-	}
+			self.traverse(next_port.get_owning_stage()) # recursive call
 
 	# For testing purposes only.
 	#
 	# @return the visited stages
-		return visitedStages
-	}
-
-}
+	def get_visited_stages(self) -> Set[AbstractStage]:
+		return self._visited_stages
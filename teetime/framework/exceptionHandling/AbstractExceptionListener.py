@@ -13,6 +13,8 @@
 # limitations under the License.
 
 from enum import Enum
+from typing import List
+
 from teetime.framework.AbstractStage import AbstractStage
 
 # Represents a minimalistic StageExceptionListener.
@@ -26,10 +28,11 @@ class AbstractExceptionListener:
 		TERMINATE = 2
 
 
-	logged_exceptions: list(Exception) = []
+	logged_exceptions: List[Exception]
 	log_exceptions: bool
 
 	def __init__(self, should_log_exceptions:bool):
+		self.logged_exceptions = []
 		self.log_exceptions = should_log_exceptions
 
 	# This method will be executed if an exception arises.
@@ -43,12 +46,12 @@ class AbstractExceptionListener:
 	def on_stage_exception(self, exception: Exception, throwing_stage: AbstractStage) -> FurtherExecution:
 		pass
 	
-	def get_logged_exceptions(self) -> list(Exception):
-		self.logged_exceptions
+	def get_logged_exceptions(self) -> List[Exception]:
+		return self.logged_exceptions
 
 	def report_exception(self, e: Exception, stage: AbstractStage) -> FurtherExecution:
 		if (self.log_exceptions):
-			self.logged_exceptions.add(e)
+			self.logged_exceptions.append(e)
 		
 		return self.on_stage_exception(e, stage)
 
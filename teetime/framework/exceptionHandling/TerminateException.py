@@ -11,22 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.exceptionHandling
-
-import teetime.util.StacklessException
+from teetime.util.StacklessException import StacklessException
 
 # Represents an exception which is used to terminate the running thread.
 #
 # @since 1.1
-public final class TerminateException extends StacklessException:
-
-	public static final TerminateException INSTANCE = new TerminateException("Framework Exception")
+class TerminateException(StacklessException):
 
-	# Generated UID
-	private static final long serialVersionUID = 6724637605943897808L
+	INSTANCE: "TerminateException"
 
-	private TerminateException(final String string):
-		super(string)
-	}
+	def __init__(self, string: str):
+		super().__init__(string)
 
-}
+TerminateException.INSTANCE = TerminateException("Framework Exception")
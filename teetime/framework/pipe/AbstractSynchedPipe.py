@@ -11,87 +11,57 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
+from typing import Optional, TypeVar
 
-import java.util.Queue
-import java.util.concurrent.BlockingQueue
+T = TypeVar("T")
 
-import org.jctools.queues.QueueFactory
-import org.jctools.queues.spec.ConcurrentQueueSpec
-import org.jctools.queues.spec.Ordering
-import org.jctools.queues.spec.Preference
-
-import teetime.framework.AbstractPipe
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.framework.signal.ISignal
-import teetime.framework.signal.StartingSignal
-import teetime.framework.signal.ValidatingSignal
-import teetime.util.framework.concurrent.queue.PCBlockingQueue
-import teetime.util.framework.concurrent.queue.putstrategy.PutStrategy
-import teetime.util.framework.concurrent.queue.putstrategy.YieldPutStrategy
-import teetime.util.framework.concurrent.queue.takestrategy.SCParkTakeStrategy
-import teetime.util.framework.concurrent.queue.takestrategy.TakeStrategy
+from teetime.framework.AbstractPipe import AbstractPipe
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.signal.ISignal import ISignal
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+from teetime.util.framework.concurrent.queue.PCBlockingQueue import PCBlockingQueue
+from teetime.util.framework.concurrent.queue.SpscLinkedQueue import SpscLinkedQueue
+from teetime.util.framework.concurrent.queue.putstrategy.YieldPutStrategy import YieldPutStrategy
+from teetime.util.framework.concurrent.queue.takestrategy.SCParkTakeStrategy import SCParkTakeStrategy
 
 #
 # @author Christian Wulf
 #
 # @param <T>
 #            the type of the elements which this pipe should transfer.
-public abstract class AbstractSynchedPipe<T> extends AbstractPipe<T>:
+class AbstractSynchedPipe(AbstractPipe[T]):
 
-	private final BlockingQueue<ISignal> signalQueue
+	_signal_queue: PCBlockingQueue[ISignal]
 
-	private volatile boolean closed
+	_closed: bool = False
 
-	protected AbstractSynchedPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		super(sourcePort, targetPort)
-		final Queue<ISignal> localSignalQueue = QueueFactory.newQueue(new ConcurrentQueueSpec(1, 1, 0, Ordering.FIFO, Preference.THROUGHPUT))
-		final PutStrategy<ISignal> putStrategy = new YieldPutStrategy<ISignal>()
-		final TakeStrategy<ISignal> takeStrategy = new SCParkTakeStrategy<ISignal>()
-		signalQueue = new PCBlockingQueue<ISignal>(localSignalQueue, putStrategy, takeStrategy)
-	}
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T]):
+		super().__init__(source_port, target_port)
+		# the target stage's thread parks (instead of spinning) until a signal arrives
+		self._signal_queue = PCBlockingQueue(SpscLinkedQueue(), YieldPutStrategy(), SCParkTakeStrategy())
 
-	@Override
-	public void sendSignal(final ISignal signal):
-		self.signalQueue.offer(signal)
-	}
+	def send_signal(self, signal: ISignal):
+		self._signal_queue.offer(signal)
 
 	# Retrieves and removes the head of the signal queue
 	#
-	# @return Head of signal queue, <code>null</code> if signal queue is empty.
-	public ISignal getSignal():
-		return self.signalQueue.poll()
-	}
-
-	# @deprecated since 3.0. Is removed without replacement.
-	@Deprecated
-	@Override
-	public void reportNewElement(): // NOPMD
-		// default implementation
-	}
+	# @return Head of signal queue, <code>None</code> if signal queue is empty.
+	def get_signal(self) -> Optional[ISignal]:
+		return self._signal_queue.poll()
 
-	@Override
-	public final void waitForStartSignal() throws InterruptedException:
-		final ISignal signal = signalQueue.take()
-		if (signal instanceof ValidatingSignal):
-			self.waitForStartSignal() // recursive call
-			return
-		}
-		if (!(signal instanceof StartingSignal)):
-			throw new IllegalStateException(
-					"2001 - Expected StartingSignal, but was " + signal.getClass().getSimpleName() + " in " + getTargetPort().getOwningStage().getId())
-		}
-		cachedTargetStage.onSignal(signal, getTargetPort())
-	}
+	def wait_for_start_signal(self):
+		signal = self._signal_queue.take()
+		while (isinstance(signal, ValidatingSignal)):
+			signal = self._signal_queue.take()
+		if (not isinstance(signal, StartingSignal)):
+			raise Exception( # IllegalStateException
+					"2001 - Expected StartingSignal, but was " + type(signal).__name__ + " in " + self.get_target_port().get_owning_stage().get_id())
+		self._cached_target_stage.on_signal(signal, self.get_target_port())
 
-	@Override
-	public final boolean isClosed():
-		return closed
-	}
+	def is_closed(self) -> bool:
+		return self._closed
 
-	@Override
-	public final void close():
-		closed = true
-	}
-}
+	def close(self):
+		self._closed = True
@@ -11,12 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
+from typing import TypeVar
 
-import teetime.framework.AbstractPipe
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.framework.signal.ISignal
+T = TypeVar("T")
+
+from teetime.framework.AbstractPipe import AbstractPipe
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.signal.ISignal import ISignal
 
 # Represents an unsynchronized pipe which can be used to connect stages within the same thread.
 #
@@ -24,39 +26,23 @@ import teetime.framework.signal.ISignal
 #
 # @param <T>
 #            the type of the elements which this pipe should transfer.
-public abstract class AbstractUnsynchedPipe<T> extends AbstractPipe<T>:
-
-	private boolean closed
-
-	protected AbstractUnsynchedPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		super(sourcePort, targetPort)
-	}
-
-	@Override
-	public final void sendSignal(final ISignal signal):
-		// getTargetPort is always non-null since the framework adds dummy ports if necessary
-		self.cachedTargetStage.onSignal(signal, self.getTargetPort())
-	}
-
-	@Override
-	public final void reportNewElement():
-		self.cachedTargetStage.executeByFramework()
-	}
-
-	@Override
-	public boolean isClosed():
-		return closed
-	}
-
-	@Override
-	public void close():
-		closed = true
-	}
-
-	@SuppressWarnings("PMD.EmptyMethodInAbstractClassShouldBeAbstract")
-	@Override
-	public void waitForStartSignal() throws InterruptedException:
-		// default implementation
-	}
-
-}
+class AbstractUnsynchedPipe(AbstractPipe[T]):
+
+	_closed: bool = False
+
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T]):
+		super().__init__(source_port, target_port)
+
+	def send_signal(self, signal: ISignal):
+		# get_target_port is always non-None since the framework adds dummy ports if necessary
+		self._cached_target_stage.on_signal(signal, self.get_target_port())
+
+	def is_closed(self) -> bool:
+		return self._closed
+
+	def close(self):
+		self._closed = True
+
+	def wait_for_start_signal(self):
+		# default implementation
+		pass
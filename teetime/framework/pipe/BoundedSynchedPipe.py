@@ -11,98 +11,154 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
+from typing import Deque, Iterable, List, TypeVar, Optional
 
-import org.jctools.queues.SpscArrayQueue
+T = TypeVar("T")
 
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.framework.pipe.strategy.SleepIfFullStrategy
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.AbstractSynchedPipe import AbstractSynchedPipe
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
+from teetime.framework.pipe.strategy.SpinYieldParkStrategy import SpinYieldParkStrategy
+from teetime.util.framework.concurrent.queue.SpscArrayQueue import SpscArrayQueue
+from teetime.util.stage.OneTimeCondition import OneTimeCondition
 
 #
 # @author Christian Wulf
 #
 # @param <T>
 #            the type of the elements which this pipe should transfer.
-public class BoundedSynchedPipe<T> extends AbstractSynchedPipe<T> implements IMonitorablePipe:
+class BoundedSynchedPipe(AbstractSynchedPipe[T], IMonitorablePipe):
 
-	private final SpscArrayQueue<T> queue
-	private final SleepIfFullStrategy strategy
+	_queue: SpscArrayQueue[T]
+	_strategy: PipeElementInsertionStrategy[T]
 
-	private transient long lastProducerIndex, lastConsumerIndex
+	_last_producer_index: int = 0
+	_last_consumer_index: int = 0
 
-	public BoundedSynchedPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int capacity):
-		super(sourcePort, targetPort)
-		self.queue = new SpscArrayQueue<>(capacity)
-		self.strategy = new SleepIfFullStrategy()
-	}
+	# set by the producer; the consumer hands the remaining elements over to this target instead of returning them
+	_migration_target: Optional[Deque[T]] = None
+	_migration_completed: Optional[OneTimeCondition] = None
 
-	@Override
-	public void add(final T element):
-		strategy.add(this, element)
-		getScheduler().onElementAdded(this)
-	}
+	# @param capacity
+	#            is rounded up to the next power of 2
+	# @param strategy
+	#            how to wait if the pipe is full. Defaults to:@link SpinYieldParkStrategy}.
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], capacity: int, strategy: PipeElementInsertionStrategy[T] = None):
+		super().__init__(source_port, target_port)
+		self._queue = SpscArrayQueue(capacity)
+		self._strategy = strategy if strategy is not None else SpinYieldParkStrategy()
 
-	@Override
-	public boolean addNonBlocking(final T element):
-		boolean offered = self.queue.offer(element)
+	def add(self, element: T):
+		self._strategy.add(self, element)
+		self.get_scheduler().on_element_added(self)
+
+	def add_non_blocking(self, element: T) -> bool:
+		offered = self._queue.offer(element)
 		if (offered):
-			getScheduler().onElementAdded(this)
-		} else:
-			getScheduler().onElementNotAdded(this)
-		}
+			self.get_scheduler().on_element_added(self)
+		else:
+			self.get_scheduler().on_element_not_added(self)
 		return offered
-	}
-
-	@Override
-	public T removeLast():
-		return self.queue.poll()
-	}
-
-	@Override
-	public boolean isEmpty():
-		return self.queue.isEmpty()
-	}
-
-	@Override
-	public int size():
-		return self.queue.size()
-	}
-
-	@Override
-	public int getNumWaits():
-		return strategy.getNumWaits()
-	}
-
-	@Override
-	public long getPushThroughput():
-		final long currentProducerIndex = getNumPushesSinceAppStart()
-		long diff = currentProducerIndex - lastProducerIndex
-		lastProducerIndex = currentProducerIndex
-		return diff
-	}
 
-	@Override
-	public long getPullThroughput():
-		final long currentConsumerIndex = getNumPullsSinceAppStart()
-		long diff = currentConsumerIndex - lastConsumerIndex
-		lastConsumerIndex = currentConsumerIndex
+	# Offers the elements in chunks as large as the free capacity allows.
+	# The scheduler is notified once per chunk instead of once per element.
+	def add_all(self, elements: Iterable[T]):
+		elements = elements if isinstance(elements, list) else list(elements)
+		num_elements = len(elements)
+		offset = 0
+		while (offset < num_elements):
+			num_offered = self._queue.offer_all(elements, offset)
+			if (num_offered > 0):
+				offset += num_offered
+				self.get_scheduler().on_element_added(self)
+			if (offset < num_elements):
+				# the queue is full: wait for (at least) one free slot
+				self._strategy.add(self, elements[offset])
+				offset += 1
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		if (self._migration_target is not None):
+			element = self._migrate_remaining_elements()
+			if (element is None):
+				return 0
+			target.append(element)
+			return 1
+		count = self._queue.drain_to(target, max_elements)
+		if (count > 0):
+			self._strategy.signal()
+		return count
+
+	def remove_last(self) -> Optional[T]:
+		if (self._migration_target is not None):
+			return self._migrate_remaining_elements()
+		element = self._queue.poll()
+		if (element is not None):
+			self._strategy.signal()
+		return element
+
+	# Lets the consumer hand all elements, which are still queued, over to <code>migration_target</code> instead of returning them.
+	# As soon as the consumer reaches the terminate element, it signals <code>migration_completed</code> and terminates.
+	# The element the consumer is currently processing is not affected.
+	# <p>
+	# May only be invoked by the producer thread and only before it sends the terminate element.
+	# </p>
+	#
+	# @param migration_target
+	#            a thread-safe deque to which the consumer appends the remaining elements in their original order
+	# @param migration_completed
+	#            signaled after the last remaining element has been appended
+	#
+	# @since 3.0
+	def migrate_remaining_elements(self, migration_target: Deque[T], migration_completed: OneTimeCondition):
+		self._migration_completed = migration_completed
+		self._migration_target = migration_target # publish
+
+	# @return the terminate element if it has been reached, <code>None</code> otherwise
+	def _migrate_remaining_elements(self) -> Optional[T]:
+		elements: List[T] = []
+		if (self._queue.drain_to(elements, self._queue.capacity()) == 0):
+			return None
+		self._strategy.signal()
+		if (elements[-1] is AbstractPort.TERMINATE_ELEMENT):
+			elements.pop()
+			self._migration_target.extend(elements)
+			self._migration_completed.signal_all()
+			return AbstractPort.TERMINATE_ELEMENT
+		self._migration_target.extend(elements)
+		return None
+
+	def is_empty(self) -> bool:
+		return self._queue.is_empty()
+
+	def size(self) -> int:
+		return self._queue.size()
+
+	def get_num_waits(self) -> int:
+		return self._strategy.get_num_waits()
+
+	def get_strategy(self) -> PipeElementInsertionStrategy[T]:
+		return self._strategy
+
+	def get_push_throughput(self) -> int:
+		current_producer_index = self.get_num_pushes_since_app_start()
+		diff = current_producer_index - self._last_producer_index
+		self._last_producer_index = current_producer_index
 		return diff
-	}
 
-	@Override
-	public long getNumPushesSinceAppStart():
-		return queue.currentProducerIndex()
-	}
+	def get_pull_throughput(self) -> int:
+		current_consumer_index = self.get_num_pulls_since_app_start()
+		diff = current_consumer_index - self._last_consumer_index
+		self._last_consumer_index = current_consumer_index
+		return diff
 
-	@Override
-	public long getNumPullsSinceAppStart():
-		return queue.currentConsumerIndex()
-	}
+	def get_num_pushes_since_app_start(self) -> int:
+		return self._queue.current_producer_index()
 
-	@Override
-	public int capacity():
-		return self.queue.capacity()
-	}
+	def get_num_pulls_since_app_start(self) -> int:
+		return self._queue.current_consumer_index()
 
-}
+	def capacity(self) -> int:
+		return self._queue.capacity()
@@ -0,0 +1,124 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.BoundedSynchedPipe import BoundedSynchedPipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
+
+# A bounded pipe with explicit, credit-based flow control.
+# The producer may only add an element if it holds a credit. Initially, it holds one credit per slot.
+# The consumer grants the credits of the removed elements back in batches of <code>credit_batch_size</code>
+# (or as soon as the pipe runs empty), and then notifies the registered credit listeners.
+# <p>
+# Thus, a producer can ask each pipe via:@link #get_credits()} whether an element would be accepted
+# instead of blocking on a full pipe, e.g., by means of a:@link CreditBasedDistributorStrategy}.
+# Since the granted and the used credits are counted separately, each counter has a single writer and no lock is required.
+# </p>
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+#
+# @since 3.0
+class CreditBasedPipe(BoundedSynchedPipe[T]):
+
+	DEFAULT_CREDIT_BATCH_SIZE = 16
+
+	_credit_batch_size: int
+	_granted_credits: int # written by the consumer only
+	_used_credits: int = 0 # written by the producer only
+	_pending_credits: int = 0
+	_credit_listeners: List[Callable[["CreditBasedPipe"], None]]
+
+	# @param capacity
+	#            is rounded up to the next power of 2
+	# @param credit_batch_size
+	#            the number of removed elements after which the consumer grants their credits back
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], capacity: int, strategy: PipeElementInsertionStrategy[T] = None,
+			credit_batch_size: int = DEFAULT_CREDIT_BATCH_SIZE):
+		super().__init__(source_port, target_port, capacity, strategy)
+		if (credit_batch_size < 1):
+			raise ValueError("credit_batch_size must be positive, but was " + str(credit_batch_size))
+		self._credit_batch_size = min(credit_batch_size, self._queue.capacity())
+		self._granted_credits = self._queue.capacity()
+		self._credit_listeners = []
+
+	# @return the number of elements the producer may currently add without waiting
+	def get_credits(self) -> int:
+		return self._granted_credits - self._used_credits
+
+	def has_credits(self) -> bool:
+		return self._granted_credits > self._used_credits
+
+	# Registers a listener which is invoked (by the consumer's thread) whenever credits have been granted.
+	def add_credit_listener(self, listener: Callable[["CreditBasedPipe"], None]):
+		self._credit_listeners.append(listener)
+
+	def add_non_blocking(self, element: T) -> bool:
+		if (self._granted_credits == self._used_credits):
+			self.get_scheduler().on_element_not_added(self)
+			return False
+		# a credit guarantees a free slot
+		self._queue.offer(element)
+		self._used_credits += 1
+		self.get_scheduler().on_element_added(self)
+		return True
+
+	def add_all(self, elements: Iterable[T]):
+		elements = elements if isinstance(elements, list) else list(elements)
+		num_elements = len(elements)
+		offset = 0
+		while (offset < num_elements):
+			credits = self.get_credits()
+			if (credits > 0):
+				num_offered = self._queue.offer_all(elements[offset:offset + credits])
+				self._used_credits += num_offered
+				offset += num_offered
+				self.get_scheduler().on_element_added(self)
+			if (offset < num_elements and not self.has_credits()):
+				# wait for (at least) one credit
+				self._strategy.add(self, elements[offset])
+				offset += 1
+
+	def remove_last(self) -> Optional[T]:
+		if (self._migration_target is not None):
+			# the port has been removed, so credits are irrelevant
+			return super().remove_last()
+		element = self._queue.poll()
+		if (element is not None):
+			self._release_credits(1)
+		return element
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		if (self._migration_target is not None):
+			return super().drain_to(target, max_elements)
+		count = self._queue.drain_to(target, max_elements)
+		if (count > 0):
+			self._release_credits(count)
+		return count
+
+	def _release_credits(self, num_credits: int):
+		self._pending_credits += num_credits
+		if (self._pending_credits >= self._credit_batch_size or self._queue.is_empty()):
+			self._granted_credits += self._pending_credits # publish
+			self._pending_credits = 0
+			self._strategy.signal()
+			for listener in self._credit_listeners:
+				listener(self)
+
+	def get_credit_batch_size(self) -> int:
+		return self._credit_batch_size
@@ -0,0 +1,44 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.CreditBasedPipe import CreditBasedPipe
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.pipe.pipe import IPipe
+
+# Creates:@link CreditBasedPipe}s, e.g., for the output ports of a:@link Distributor}
+# which uses a:@link CreditBasedDistributorStrategy}.
+#
+# @since 3.0
+class CreditBasedPipeFactory(IPipeFactory):
+
+	INSTANCE: "CreditBasedPipeFactory"
+
+	DEFAULT_CAPACITY = 1024
+
+	_credit_batch_size: int
+
+	# @param credit_batch_size
+	#            see:@link CreditBasedPipe#__init__}
+	def __init__(self, credit_batch_size: int = CreditBasedPipe.DEFAULT_CREDIT_BATCH_SIZE):
+		self._credit_batch_size = credit_batch_size
+
+	def new_pipe(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = DEFAULT_CAPACITY) -> IPipe[T]:
+		return CreditBasedPipe(source_port, target_port, capacity, credit_batch_size=self._credit_batch_size)
+
+CreditBasedPipeFactory.INSTANCE = CreditBasedPipeFactory()
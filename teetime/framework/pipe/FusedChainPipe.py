@@ -0,0 +1,76 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Collection, FrozenSet, Iterable, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.exceptionHandling.AbstractExceptionListener import AbstractExceptionListener
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.pipe.FusedPipe import FusedPipe
+
+STAGE_FACADE = StageFacade.INSTANCE
+
+# Represents the head of a fused stage chain (see:@link A5StageFusion}).
+# Like:@link FusedPipe}, it passes each element directly to its target stage,
+# but wraps the execution of the whole chain in a single try/except.
+# An exception is reported to the exception listener of the stage which raised it.
+# Note that the exception aborts the processing of the current element in the whole chain,
+# i.e., an upstream stage of the chain does not continue to process the element (e.g., its remaining tokens)
+# even if the listener decides to continue the execution.
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+class FusedChainPipe(FusedPipe[T]):
+
+	_chain_stages: FrozenSet[AbstractStage]
+
+	# @param chain_stages
+	#            all stages of the chain which is headed by this pipe
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], chain_stages: Collection[AbstractStage]):
+		super().__init__(source_port, target_port)
+		self._chain_stages = frozenset(chain_stages)
+
+	def add(self, element: T):
+		try:
+			super().add(element)
+		except TerminateException as e:
+			raise e
+		except Exception as e:
+			self._report_exception(e)
+
+	def add_all(self, elements: Iterable[T]):
+		# one try per element (instead of one per stage and element) so that a failing element does not discard the rest of the batch
+		add = super().add
+		for element in elements:
+			try:
+				add(element)
+			except TerminateException as e:
+				raise e
+			except Exception as e:
+				self._report_exception(e)
+
+	def get_chain_stages(self) -> FrozenSet[AbstractStage]:
+		return self._chain_stages
+
+	def _report_exception(self, e: Exception):
+		throwing_stage = FusedPipe.get_throwing_stage(e)
+		if (throwing_stage is None):
+			throwing_stage = self._cached_target_stage
+		further_execution = STAGE_FACADE.get_exception_listener(throwing_stage).report_exception(e, throwing_stage)
+		if (further_execution == AbstractExceptionListener.FurtherExecution.TERMINATE):
+			raise TerminateException.INSTANCE
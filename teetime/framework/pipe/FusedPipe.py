@@ -0,0 +1,104 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.pipe.AbstractUnsynchedPipe import AbstractUnsynchedPipe
+
+# Represents an inner link of a fused stage chain (see:@link A5StageFusion}).
+# Instead of buffering the element and asking the scheduler to execute the target stage,
+# this pipe passes each element directly to the element-wise <code>_execute</code> of its target stage.
+# Hence, the input port, the scheduler and the exception wrapper of the target stage are bypassed.
+# Exceptions propagate to the head of the chain (see:@link FusedChainPipe}).
+# The innermost fused pipe tags a propagating exception with its target stage (see:@link #get_throwing_stage(Exception)}).
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+class FusedPipe(AbstractUnsynchedPipe[T]):
+
+	# the attribute of an exception which holds the stage that has raised it
+	_THROWING_STAGE_ATTRIBUTE = "_teetime_throwing_stage"
+
+	_execute = None # bound element-wise execute of the target stage
+
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T]):
+		super().__init__(source_port, target_port)
+		self._execute = self._cached_target_stage._execute
+
+	def add(self, element: T):
+		if (element is None):
+			raise ValueError("Parameter 'element' is None, but must be non-None.")
+		if (element is AbstractPort.TERMINATE_ELEMENT):
+			self.get_target_port()._on_terminate_element()
+		else:
+			try:
+				self._execute(element)
+			except TerminateException as e:
+				raise e
+			except Exception as e:
+				self._tag_exception(e)
+				raise
+
+	def add_non_blocking(self, element: T) -> bool:
+		self.add(element)
+		return True
+
+	def add_all(self, elements: Iterable[T]):
+		execute = self._execute
+		try:
+			for element in elements:
+				if (element is None):
+					raise ValueError("Parameter 'elements' contains None, but must only contain non-None elements.")
+				execute(element)
+		except TerminateException as e:
+			raise e
+		except Exception as e:
+			self._tag_exception(e)
+			raise
+
+	def _tag_exception(self, e: Exception):
+		# an exception raised by a downstream stage of the chain has already been tagged
+		if (not hasattr(e, self._THROWING_STAGE_ATTRIBUTE)):
+			try:
+				setattr(e, self._THROWING_STAGE_ATTRIBUTE, self._cached_target_stage)
+			except AttributeError:
+				pass # e.g., an exception type with __slots__; reported for the head of the chain then
+
+	# Retrieves and clears the stage which has raised the given exception.
+	#
+	# @return the tagged stage, or <code>None</code> if the exception has not been raised within a fused chain
+	@staticmethod
+	def get_throwing_stage(e: Exception):
+		return getattr(e, "__dict__", {}).pop(FusedPipe._THROWING_STAGE_ATTRIBUTE, None)
+
+	# A fused pipe never holds an element.
+	def remove_last(self) -> Optional[T]:
+		return None
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		return 0
+
+	def is_empty(self) -> bool:
+		return True
+
+	def size(self) -> int:
+		return 0
+
+	def capacity(self) -> int:
+		return 1
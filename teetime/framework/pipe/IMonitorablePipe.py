@@ -11,27 +11,32 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
 
-public interface IMonitorablePipe:
+class IMonitorablePipe:
 
-	int size()
+	def size(self) -> int:
+		pass
 
-	int capacity()
+	def capacity(self) -> int:
+		pass
 
 	# @return the number of pushes to this queue since application start
-	long getNumPushesSinceAppStart()
+	def get_num_pushes_since_app_start(self) -> int:
+		pass
 
 	# @return the number of pulls from this queue since application start
-	long getNumPullsSinceAppStart()
+	def get_num_pulls_since_app_start(self) -> int:
+		pass
 
 	# @return the number of pushes to this queue since last method call
-	long getPushThroughput()
+	def get_push_throughput(self) -> int:
+		pass
 
 	# @return the number of pulls to this queue since last method call
-	long getPullThroughput()
+	def get_pull_throughput(self) -> int:
+		pass
 
 	#
 	# @return the number of pauses of the pushing stage
-	int getNumWaits()
-}
+	def get_num_waits(self) -> int:
+		pass
@@ -11,14 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
+from typing import TypeVar
 
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
+T = TypeVar("T")
 
-public interface IPipeFactory:
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.pipe import IPipe
 
-	<T> IPipe<T> newPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort)
+class IPipeFactory:
 
-	<T> IPipe<T> newPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, int capacity)
-}
+	# @param capacity
+	#            the capacity of the new pipe. Each factory defines its own default.
+	def new_pipe(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = None) -> IPipe[T]:
+		pass
@@ -0,0 +1,320 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+import struct
+import time
+from collections import deque
+from typing import Deque, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractPipe import AbstractPipe
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
+from teetime.framework.pipe.strategy.SpinYieldParkStrategy import SpinYieldParkStrategy
+from teetime.framework.signal.ISignal import ISignal
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+from teetime.util.framework.concurrent.queue.SharedMemoryRingBuffer import SharedMemoryRingBuffer
+
+# A synchronized pipe which connects two stages hosted by different processes.
+# <p>
+# Elements are transferred through a:@link SharedMemoryRingBuffer}.
+# Arbitrary elements are serialized with pickle protocol 5: out-of-band buffers
+# (e.g., of <code>bytearray</code>s or numpy arrays) are copied directly into the shared memory
+# instead of into the pickle stream.
+# <code>bytes</code> and <code>bytearray</code> elements bypass pickle entirely.
+# Signals are transferred in-band, i.e., in the same ring buffer and thus in order with the elements.
+# A batch of elements added by:@link #add_all(Iterable)} is transferred as a single record.
+# </p>
+# <p>
+# Both processes must share the same pipe instance, i.e., the consumer process must be forked after the pipe has been created.
+# The pipe is waiting-free for the consumer: if it is empty,:@link #remove_last()} returns <code>None</code> immediately.
+# A full pipe is handled by the pipe's:@link PipeElementInsertionStrategy}.
+# Since the consumer cannot signal a producer in another process, parking strategies fall back to their timeout.
+# Once the consumer process has terminated (see:@link #mark_consumer_terminated()}),
+# adding to a full pipe raises a:@link TerminateException} so that a waiting producer does not wait forever.
+# </p>
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+class InterProcessPipe(AbstractPipe[T], IMonitorablePipe):
+
+	# the layout of a record is [kind, unused, unused, unused, number of out-of-band buffers] followed by the kind-specific payload
+	_RECORD_HEADER = struct.Struct("<BxxxI")
+	_LENGTH = struct.Struct("<I")
+
+	_KIND_PICKLED = 0
+	_KIND_BYTES = 1
+	_KIND_BYTEARRAY = 2
+	_KIND_TERMINATE = 3
+
+	# time to sleep if the consumer waits for a signal on an empty pipe
+	_SIGNAL_POLL_INTERVAL_IN_S = 0.0005
+
+	_ring_buffer: SharedMemoryRingBuffer
+	_strategy: PipeElementInsertionStrategy[T]
+	_closed: bool
+
+	# consumer-local: elements received while waiting for the starting signal, and the remaining elements of a batch
+	_early_elements: Deque[T]
+	# consumer-local: signals received after the starting signal
+	_signals: Deque[ISignal]
+
+	# producer-local cache so that retrying a full pipe does not serialize the element again
+	_last_element: object
+	_last_record: tuple
+
+	_last_producer_index: int = 0
+	_last_consumer_index: int = 0
+
+	# @param capacity_in_bytes
+	#            the size of the shared memory ring buffer. Is rounded up to the next power of 2.
+	# @param strategy
+	#            how to wait if the pipe is full. Defaults to:@link SpinYieldParkStrategy}.
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], capacity_in_bytes: int, strategy: PipeElementInsertionStrategy[T] = None):
+		super().__init__(source_port, target_port)
+		self._ring_buffer = SharedMemoryRingBuffer(capacity_in_bytes)
+		self._strategy = strategy if strategy is not None else SpinYieldParkStrategy()
+		self._closed = False
+		self._early_elements = deque()
+		self._signals = deque()
+		self._last_element = None
+		self._last_record = None
+
+	def _serialize(self, element) -> tuple:
+		if (element is self._last_element):
+			return self._last_record
+
+		if (element is self.get_source_port().TERMINATE_ELEMENT):
+			parts = [self._RECORD_HEADER.pack(self._KIND_TERMINATE, 0)]
+		elif (type(element) is bytes):
+			parts = [self._RECORD_HEADER.pack(self._KIND_BYTES, 0), element]
+		elif (type(element) is bytearray):
+			parts = [self._RECORD_HEADER.pack(self._KIND_BYTEARRAY, 0), element]
+		else:
+			buffers: List[pickle.PickleBuffer] = []
+			main = pickle.dumps(element, protocol=5, buffer_callback=buffers.append)
+			raw_buffers = [buffer.raw() for buffer in buffers]
+			lengths = [self._LENGTH.pack(len(main))]
+			lengths.extend(self._LENGTH.pack(raw.nbytes) for raw in raw_buffers)
+			parts = [self._RECORD_HEADER.pack(self._KIND_PICKLED, len(raw_buffers)), b"".join(lengths), main]
+			parts.extend(raw_buffers)
+
+		size = sum(len(part) if isinstance(part, (bytes, bytearray)) else part.nbytes for part in parts)
+		record = (parts, size)
+		self._last_element = element
+		self._last_record = record
+		return record
+
+	def _deserialize(self, view):
+		kind, num_buffers = self._RECORD_HEADER.unpack_from(view, 0)
+		offset = self._RECORD_HEADER.size
+		if (kind == self._KIND_BYTES):
+			return bytes(view[offset:])
+		if (kind == self._KIND_BYTEARRAY):
+			return bytearray(view[offset:])
+		if (kind == self._KIND_TERMINATE):
+			return self.get_target_port().TERMINATE_ELEMENT
+
+		lengths = struct.unpack_from("<%dI" % (num_buffers + 1), view, offset)
+		offset += 4 * (num_buffers + 1)
+		main_end = offset + lengths[0]
+		main = view[offset:main_end]
+		offset = main_end
+		# copy each out-of-band buffer out of the ring buffer since its slot is reused after advance()
+		buffers = []
+		for length in lengths[1:]:
+			buffers.append(bytearray(view[offset:offset + length]))
+			offset += length
+		element = pickle.loads(main, buffers=buffers)
+		if (isinstance(main, memoryview)):
+			main.release()
+		return element
+
+	# @return the next record, or <code>None</code> if the ring buffer is empty
+	def _poll_record(self):
+		view = self._ring_buffer.peek()
+		if (view is None):
+			return None
+		try:
+			return self._deserialize(view)
+		finally:
+			if (isinstance(view, memoryview)):
+				view.release()
+			self._ring_buffer.advance()
+
+	def add(self, element: T):
+		self._strategy.add(self, element)
+		self.get_scheduler().on_element_added(self)
+
+	def add_non_blocking(self, element: T) -> bool:
+		if (element is None):
+			raise ValueError("Parameter 'element' is None, but must be non-None.")
+		parts, size = self._serialize(element)
+		offered = self._ring_buffer.offer(parts, size)
+		if (offered):
+			self._last_element = None
+			self._last_record = None
+			self.get_scheduler().on_element_added(self)
+		else:
+			# the state of the parent's copy of the consumer stage never changes, so the shared flag is checked instead
+			if (self._ring_buffer.is_consumer_terminated()):
+				raise TerminateException.INSTANCE
+			self.get_scheduler().on_element_not_added(self)
+		return offered
+
+	# Serializes the elements at once and transfers them as a single record, i.e., the consumer is notified only once.
+	# Hence, the push and pull counters as well as:@link #size()} count a batch as one record.
+	# A batch whose record would occupy more than half of the ring buffer is split.
+	def add_all(self, elements: Iterable[T]):
+		elements = elements if isinstance(elements, list) else list(elements)
+		if (len(elements) < 2):
+			for element in elements:
+				self.add(element)
+			return
+		batch = _BatchRecord(elements)
+		_, size = self._serialize(batch)
+		if (size > self._ring_buffer.capacity() // 2):
+			self._last_element = None
+			self._last_record = None
+			middle = len(elements) // 2
+			self.add_all(elements[:middle])
+			self.add_all(elements[middle:])
+			return
+		# the serialized record is cached, so the element insertion strategy does not serialize the batch again
+		self.add(batch)
+
+	def remove_last(self) -> Optional[T]:
+		if (self._early_elements):
+			return self._early_elements.popleft()
+		while (True):
+			record = self._poll_record()
+			if (isinstance(record, _BatchRecord)):
+				self._early_elements.extend(record.elements)
+				return self._early_elements.popleft()
+			if (not isinstance(record, _SignalRecord)):
+				return record
+			self._signals.append(record.signal)
+
+	def is_empty(self) -> bool:
+		return not self._early_elements and self._ring_buffer.is_empty()
+
+	def size(self) -> int:
+		return len(self._early_elements) + self._ring_buffer.size()
+
+	# @return <code>-1</code> since the number of elements that fit into the pipe depends on their serialized size
+	def capacity(self) -> int:
+		return -1
+
+	def get_capacity_in_bytes(self) -> int:
+		return self._ring_buffer.capacity()
+
+	def send_signal(self, signal: ISignal):
+		parts, size = self._serialize(_SignalRecord(signal))
+		self._last_element = None
+		self._last_record = None
+		while (not self._ring_buffer.offer(parts, size, counted=False)):
+			if (self._ring_buffer.is_consumer_terminated()):
+				return # nobody will receive the signal anymore
+			time.sleep(self._SIGNAL_POLL_INTERVAL_IN_S)
+
+	# Retrieves and removes the next signal which arrived after the starting signal.
+	#
+	# @return the next signal, or <code>None</code> if there is none
+	def get_signal(self) -> Optional[ISignal]:
+		if (self._signals):
+			return self._signals.popleft()
+		return None
+
+	def wait_for_start_signal(self):
+		while (True):
+			record = self._poll_record()
+			if (record is None):
+				time.sleep(self._SIGNAL_POLL_INTERVAL_IN_S)
+			elif (isinstance(record, _BatchRecord)):
+				self._early_elements.extend(record.elements)
+			elif (not isinstance(record, _SignalRecord)):
+				self._early_elements.append(record)
+			elif (isinstance(record.signal, ValidatingSignal)):
+				continue
+			elif (isinstance(record.signal, StartingSignal)):
+				self._cached_target_stage.on_signal(record.signal, self.get_target_port())
+				return
+			else:
+				raise Exception( # IllegalStateException
+						"2001 - Expected StartingSignal, but was " + type(record.signal).__name__ + " in " + self.get_target_port().get_owning_stage().get_id())
+
+	def is_closed(self) -> bool:
+		return self._closed
+
+	def close(self):
+		self._closed = True
+
+	# Announces to the producer, possibly within another process, that the consumer will not consume any element anymore.
+	def mark_consumer_terminated(self):
+		self._ring_buffer.mark_consumer_terminated()
+
+	def is_consumer_terminated(self) -> bool:
+		return self._ring_buffer.is_consumer_terminated()
+
+	# Detaches from the shared memory, and frees it if invoked by the creating process.
+	def release(self):
+		self._ring_buffer.release()
+
+	def get_num_waits(self) -> int:
+		return self._strategy.get_num_waits()
+
+	def get_push_throughput(self) -> int:
+		current_producer_index = self.get_num_pushes_since_app_start()
+		diff = current_producer_index - self._last_producer_index
+		self._last_producer_index = current_producer_index
+		return diff
+
+	def get_pull_throughput(self) -> int:
+		current_consumer_index = self.get_num_pulls_since_app_start()
+		diff = current_consumer_index - self._last_consumer_index
+		self._last_consumer_index = current_consumer_index
+		return diff
+
+	def get_num_pushes_since_app_start(self) -> int:
+		return self._ring_buffer.get_num_pushes()
+
+	def get_num_pulls_since_app_start(self) -> int:
+		return self._ring_buffer.get_num_pulls()
+
+# Wraps a signal so that it can be distinguished from an element of the same type.
+class _SignalRecord:
+
+	__slots__ = ("signal",)
+
+	def __init__(self, signal: ISignal):
+		self.signal = signal
+
+	def __reduce__(self):
+		return (_SignalRecord, (self.signal,))
+
+# Wraps the elements of:@link InterProcessPipe#add_all(Iterable)} so that they are transferred as a single record.
+class _BatchRecord:
+
+	__slots__ = ("elements",)
+
+	def __init__(self, elements: List):
+		self.elements = elements
+
+	def __reduce__(self):
+		return (_BatchRecord, (self.elements,))
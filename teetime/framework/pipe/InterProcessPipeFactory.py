@@ -0,0 +1,31 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.pipe.InterProcessPipe import InterProcessPipe
+from teetime.framework.pipe.pipe import IPipe
+
+class InterProcessPipeFactory(IPipeFactory):
+
+	INSTANCE: "InterProcessPipeFactory"
+
+	DEFAULT_CAPACITY_IN_BYTES = 1 << 20
+
+	# @param capacity
+	#            the size of the shared memory ring buffer in bytes (not in elements)
+	def new_pipe(self, source_port: OutputPort, target_port: InputPort, capacity: int = DEFAULT_CAPACITY_IN_BYTES) -> IPipe:
+		return InterProcessPipe(source_port, target_port, capacity)
+
+InterProcessPipeFactory.INSTANCE = InterProcessPipeFactory()
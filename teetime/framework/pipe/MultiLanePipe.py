@@ -0,0 +1,243 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.AbstractSynchedPipe import AbstractSynchedPipe
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
+from teetime.framework.pipe.strategy.SpinYieldParkStrategy import SpinYieldParkStrategy
+from teetime.util.framework.concurrent.queue.SpscArrayQueue import SpscArrayQueue
+
+# A bounded pipe with <code>num_lanes</code> FIFO lanes of descending priority, i.e., lane 0 is the most urgent one.
+# The consumer always drains the lanes in the order of their priority, so that, e.g., a heartbeat sent on lane 0
+# overtakes all bulk elements queued on the other lanes. Within a lane, the order is preserved.
+# <p>
+# :@link #add(Object)} sends on the last lane, i.e., on the one with the lowest priority.
+# Use:@link OutputPort#send_on_lane(Object, int)} to send on any other lane.
+# Each lane is bounded by its own capacity and keeps its own:@link IMonitorablePipe} counters.
+# The counters of this pipe are the sums over all lanes.
+# </p>
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+#
+# @since 3.0
+class MultiLanePipe(AbstractSynchedPipe[T], IMonitorablePipe):
+
+	DEFAULT_NUM_LANES = 2
+
+	# Represents a single lane together with its insertion strategy and its counters.
+	# It is passed to the lane's:@link PipeElementInsertionStrategy} instead of the pipe.
+	class Lane(IMonitorablePipe):
+
+		_pipe: "MultiLanePipe"
+		_queue: SpscArrayQueue
+		_strategy: PipeElementInsertionStrategy
+
+		_last_producer_index: int = 0
+		_last_consumer_index: int = 0
+
+		def __init__(self, pipe: "MultiLanePipe", capacity: int, strategy: PipeElementInsertionStrategy):
+			self._pipe = pipe
+			self._queue = SpscArrayQueue(capacity)
+			self._strategy = strategy
+
+		# The strategy inserts through add_non_blocking, which already notifies the scheduler.
+		def add(self, element):
+			self._strategy.add(self, element)
+
+		def add_non_blocking(self, element) -> bool:
+			offered = self._queue.offer(element)
+			if (offered):
+				self._pipe.get_scheduler().on_element_added(self._pipe)
+			else:
+				self._pipe.get_scheduler().on_element_not_added(self._pipe)
+			return offered
+
+		def add_all(self, elements: List):
+			num_elements = len(elements)
+			offset = 0
+			while (offset < num_elements):
+				num_offered = self._queue.offer_all(elements, offset)
+				if (num_offered > 0):
+					offset += num_offered
+					self._pipe.get_scheduler().on_element_added(self._pipe)
+				if (offset < num_elements):
+					# the lane is full: wait for (at least) one free slot
+					self._strategy.add(self, elements[offset])
+					offset += 1
+
+		def drain_to(self, target: List, max_elements: int) -> int:
+			count = self._queue.drain_to(target, max_elements)
+			if (count > 0):
+				self._strategy.signal()
+			return count
+
+		def remove_last(self):
+			element = self._queue.poll()
+			if (element is not None):
+				self._strategy.signal()
+			return element
+
+		def get_target_port(self) -> InputPort:
+			return self._pipe.get_target_port()
+
+		def is_empty(self) -> bool:
+			return self._queue.is_empty()
+
+		def size(self) -> int:
+			return self._queue.size()
+
+		def capacity(self) -> int:
+			return self._queue.capacity()
+
+		def get_num_pushes_since_app_start(self) -> int:
+			return self._queue.current_producer_index()
+
+		def get_num_pulls_since_app_start(self) -> int:
+			return self._queue.current_consumer_index()
+
+		def get_push_throughput(self) -> int:
+			current_producer_index = self.get_num_pushes_since_app_start()
+			diff = current_producer_index - self._last_producer_index
+			self._last_producer_index = current_producer_index
+			return diff
+
+		def get_pull_throughput(self) -> int:
+			current_consumer_index = self.get_num_pulls_since_app_start()
+			diff = current_consumer_index - self._last_consumer_index
+			self._last_consumer_index = current_consumer_index
+			return diff
+
+		def get_num_waits(self) -> int:
+			return self._strategy.get_num_waits()
+
+		def get_strategy(self) -> PipeElementInsertionStrategy:
+			return self._strategy
+
+	_lanes: List[Lane]
+	_default_lane: Lane
+	# the terminate element is held back by the consumer while any more urgent lane is not yet empty
+	_held_terminate_element: Optional[object] = None
+
+	# @param capacity
+	#            of each lane; is rounded up to the next power of 2
+	# @param num_lanes
+	#            the number of lanes, at least 1
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], capacity: int, num_lanes: int = DEFAULT_NUM_LANES):
+		super().__init__(source_port, target_port)
+		if (num_lanes < 1):
+			raise ValueError("num_lanes must be positive, but was " + str(num_lanes))
+		self._lanes = [MultiLanePipe.Lane(self, capacity, SpinYieldParkStrategy()) for _ in range(num_lanes)]
+		self._default_lane = self._lanes[-1]
+
+	def add(self, element: T):
+		self._default_lane.add(element)
+
+	def add_non_blocking(self, element: T) -> bool:
+		return self._default_lane.add_non_blocking(element)
+
+	def add_all(self, elements: Iterable[T]):
+		self._default_lane.add_all(elements if isinstance(elements, list) else list(elements))
+
+	# Guarantees the delivery of the given element on the given lane.
+	#
+	# @param lane
+	#            the index of the lane, where 0 is the most urgent one
+	def add_on_lane(self, element: T, lane: int):
+		self._lanes[lane].add(element)
+
+	def add_non_blocking_on_lane(self, element: T, lane: int) -> bool:
+		return self._lanes[lane].add_non_blocking(element)
+
+	def remove_last(self) -> Optional[T]:
+		for lane in self._lanes:
+			element = lane.remove_last()
+			if (element is not None):
+				if (element is AbstractPort.TERMINATE_ELEMENT and not self._are_lanes_empty()):
+					self._held_terminate_element = element
+					return self.remove_last()
+				return element
+		return self._release_held_terminate_element()
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		count = self._drain_lanes(target, max_elements)
+		if (count > 0 and target[-1] is AbstractPort.TERMINATE_ELEMENT and not self._are_lanes_empty()):
+			# more urgent elements were added after their lanes had been drained
+			self._held_terminate_element = target.pop()
+			count -= 1
+			count += self._drain_lanes(target, max_elements - count)
+		if (count < max_elements):
+			element = self._release_held_terminate_element()
+			if (element is not None):
+				target.append(element)
+				count += 1
+		return count
+
+	def _drain_lanes(self, target: List[T], max_elements: int) -> int:
+		count = 0
+		for lane in self._lanes:
+			if (count >= max_elements):
+				break
+			count += lane.drain_to(target, max_elements - count)
+		return count
+
+	def _release_held_terminate_element(self) -> Optional[T]:
+		element = self._held_terminate_element
+		if (element is not None and self._are_lanes_empty()):
+			self._held_terminate_element = None
+			return element
+		return None
+
+	def _are_lanes_empty(self) -> bool:
+		for lane in self._lanes:
+			if (not lane.is_empty()):
+				return False
+		return True
+
+	def is_empty(self) -> bool:
+		return self._held_terminate_element is None and self._are_lanes_empty()
+
+	def size(self) -> int:
+		return sum(lane.size() for lane in self._lanes) + (0 if self._held_terminate_element is None else 1)
+
+	def capacity(self) -> int:
+		return sum(lane.capacity() for lane in self._lanes)
+
+	def get_num_lanes(self) -> int:
+		return len(self._lanes)
+
+	# @return the lane with the given index, e.g., to read its counters
+	def get_lane(self, lane: int) -> Lane:
+		return self._lanes[lane]
+
+	def get_num_pushes_since_app_start(self) -> int:
+		return sum(lane.get_num_pushes_since_app_start() for lane in self._lanes)
+
+	def get_num_pulls_since_app_start(self) -> int:
+		return sum(lane.get_num_pulls_since_app_start() for lane in self._lanes)
+
+	def get_push_throughput(self) -> int:
+		return sum(lane.get_push_throughput() for lane in self._lanes)
+
+	def get_pull_throughput(self) -> int:
+		return sum(lane.get_pull_throughput() for lane in self._lanes)
+
+	def get_num_waits(self) -> int:
+		return sum(lane.get_num_waits() for lane in self._lanes)
@@ -0,0 +1,43 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.pipe.MultiLanePipe import MultiLanePipe
+from teetime.framework.pipe.pipe import IPipe
+
+# Creates:@link MultiLanePipe}s.
+#
+# @since 3.0
+class MultiLanePipeFactory(IPipeFactory):
+
+	INSTANCE: "MultiLanePipeFactory"
+
+	DEFAULT_CAPACITY = 1024
+
+	_num_lanes: int
+
+	def __init__(self, num_lanes: int = MultiLanePipe.DEFAULT_NUM_LANES):
+		self._num_lanes = num_lanes
+
+	# @param capacity
+	#            of each lane
+	def new_pipe(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = DEFAULT_CAPACITY) -> IPipe[T]:
+		return MultiLanePipe(source_port, target_port, capacity, self._num_lanes)
+
+MultiLanePipeFactory.INSTANCE = MultiLanePipeFactory()
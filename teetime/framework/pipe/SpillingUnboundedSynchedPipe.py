@@ -0,0 +1,181 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import pickle
+import threading
+import zlib
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.UnboundedSynchedPipe import UnboundedSynchedPipe
+
+LOGGER = logging.getLogger("SpillingUnboundedSynchedPipe")
+
+# An:@link UnboundedSynchedPipe} which caps its memory consumption if the consumer lags behind.
+# As soon as more than <code>spill_threshold</code> elements are queued,
+# the producer pickles the oldest <code>segment_size</code> of them into a zlib-compressed segment.
+# The consumer inflates one segment after another when it catches up. The order of the elements is preserved.
+# <p>
+# The queue consists of three parts: the consumer's head, the compressed segments, and the producer's tail.
+# Both threads only synchronize when a segment is spilled or when the head runs empty;
+# adding to the tail and removing from the head stay lock-free.
+# Elements move from the tail via the segments to the head, and each element is accounted in its new part
+# before it is removed from its old one. Since:@link #is_empty()} and:@link #size()} read the parts in this order without locking,
+# they may count an element twice while it moves, but never miss it.
+# If an element cannot be pickled, spilling is disabled for this pipe and it behaves like an:@link UnboundedSynchedPipe}.
+# </p>
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+#
+# @since 3.0
+class SpillingUnboundedSynchedPipe(UnboundedSynchedPipe[T]):
+
+	DEFAULT_SPILL_THRESHOLD = 100000
+	DEFAULT_SEGMENT_SIZE = 10000
+	# fast rather than small; text lines still compress well
+	DEFAULT_COMPRESSION_LEVEL = 1
+
+	_spill_threshold: int
+	_segment_size: int
+	_compression_level: int
+	_spilling_enabled: bool = True
+
+	_head: Deque[T] # consumer only
+	_segments: Deque[Tuple[int, bytes]]
+	_lock: threading.Lock
+	_num_spilled_elements: int = 0
+	_num_compressed_bytes: int = 0
+	_num_spilled_segments: int = 0
+
+	# @param spill_threshold
+	#            the number of queued elements above which the oldest ones are compressed
+	# @param segment_size
+	#            the number of elements per compressed segment, at most <code>spill_threshold</code>
+	# @param compression_level
+	#            the zlib compression level from 1 (fastest) to 9 (smallest)
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+			segment_size: int = DEFAULT_SEGMENT_SIZE, compression_level: int = DEFAULT_COMPRESSION_LEVEL):
+		super().__init__(source_port, target_port)
+		if (segment_size < 1 or segment_size > spill_threshold):
+			raise ValueError("segment_size must be between 1 and spill_threshold (" + str(spill_threshold) + "), but was " + str(segment_size))
+		self._spill_threshold = spill_threshold
+		# the newest element is never spilled; this keeps the terminate element's identity
+		self._segment_size = segment_size
+		self._compression_level = compression_level
+		self._head = deque()
+		self._segments = deque()
+		self._lock = threading.Lock()
+
+	def add(self, element: T):
+		self._queue.append(element)
+		if (len(self._queue) > self._spill_threshold and self._spilling_enabled):
+			self._spill()
+		self.get_scheduler().on_element_added(self)
+
+	def add_all(self, elements: Iterable[T]):
+		self._queue.extend(elements)
+		while (len(self._queue) > self._spill_threshold and self._spilling_enabled):
+			self._spill()
+		self.get_scheduler().on_element_added(self)
+
+	# Compresses the oldest elements of the tail into a new segment. Invoked by the producer only.
+	def _spill(self):
+		with self._lock: # the consumer does not take from the tail in the meantime
+			queue = self._queue
+			if (len(queue) <= self._spill_threshold): # the consumer has caught up in the meantime
+				return
+			segment_size = self._segment_size
+			# account for the segment before its elements leave the tail, i.e., also while they are compressed
+			self._num_spilled_elements += segment_size
+			popleft = queue.popleft
+			elements = [popleft() for _ in range(segment_size)]
+			try:
+				segment = zlib.compress(pickle.dumps(elements, pickle.HIGHEST_PROTOCOL), self._compression_level)
+			except (pickle.PicklingError, TypeError, AttributeError) as e:
+				queue.extendleft(reversed(elements))
+				self._num_spilled_elements -= segment_size
+				self._spilling_enabled = False
+				LOGGER.warning("Disabled spilling of %s since an element could not be pickled: %s", self, e)
+				return
+			self._segments.append((segment_size, segment))
+			self._num_compressed_bytes += len(segment)
+			self._num_spilled_segments += 1
+
+	# Refills the empty head by the oldest segment or, if there is none, by the tail. Invoked by the consumer only.
+	#
+	# @return <code>true</code> iff the head is not empty afterwards
+	def _refill_head(self) -> bool:
+		with self._lock:
+			if (self._segments):
+				num_elements, segment = self._segments.popleft()
+				self._head.extend(pickle.loads(zlib.decompress(segment)))
+				self._num_spilled_elements -= num_elements
+				self._num_compressed_bytes -= len(segment)
+			else:
+				queue = self._queue
+				head = self._head
+				popleft = queue.popleft
+				for _ in range(len(queue)):
+					head.append(queue[0])
+					popleft()
+		return bool(self._head)
+
+	def remove_last(self) -> Optional[T]:
+		try:
+			return self._head.popleft()
+		except IndexError:
+			if (not self._refill_head()):
+				return None
+			return self._head.popleft()
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		count = 0
+		while (count < max_elements):
+			head = self._head
+			if (not head and not self._refill_head()):
+				break
+			num_elements = min(len(head), max_elements - count)
+			popleft = head.popleft
+			for _ in range(num_elements):
+				target.append(popleft())
+			count += num_elements
+		return count
+
+	def is_empty(self) -> bool:
+		# in the order in which the elements move
+		return not self._queue and self._num_spilled_elements == 0 and not self._head
+
+	def size(self) -> int:
+		# in the order in which the elements move
+		return len(self._queue) + self._num_spilled_elements + len(self._head)
+
+	# @return the number of elements currently held in compressed segments
+	def get_num_spilled_elements(self) -> int:
+		return self._num_spilled_elements
+
+	# @return the number of bytes currently held in compressed segments
+	def get_num_compressed_bytes(self) -> int:
+		return self._num_compressed_bytes
+
+	# @return the number of segments compressed since the start of this pipe
+	def get_num_spilled_segments(self) -> int:
+		return self._num_spilled_segments
+
+	def is_spilling_enabled(self) -> bool:
+		return self._spilling_enabled
@@ -0,0 +1,45 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.pipe.SpillingUnboundedSynchedPipe import SpillingUnboundedSynchedPipe
+from teetime.framework.pipe.pipe import IPipe
+
+# Creates:@link SpillingUnboundedSynchedPipe}s.
+#
+# @since 3.0
+class SpillingUnboundedSynchedPipeFactory(IPipeFactory):
+
+	INSTANCE: "SpillingUnboundedSynchedPipeFactory"
+
+	_segment_size: int
+	_compression_level: int
+
+	def __init__(self, segment_size: int = SpillingUnboundedSynchedPipe.DEFAULT_SEGMENT_SIZE,
+			compression_level: int = SpillingUnboundedSynchedPipe.DEFAULT_COMPRESSION_LEVEL):
+		self._segment_size = segment_size
+		self._compression_level = compression_level
+
+	# @param capacity
+	#            the spill threshold, i.e., the number of queued elements above which the oldest ones are compressed
+	def new_pipe(self, source_port: OutputPort, target_port: InputPort[T],
+			capacity: int = SpillingUnboundedSynchedPipe.DEFAULT_SPILL_THRESHOLD) -> IPipe[T]:
+		return SpillingUnboundedSynchedPipe(source_port, target_port, capacity, min(self._segment_size, capacity), self._compression_level)
+
+SpillingUnboundedSynchedPipeFactory.INSTANCE = SpillingUnboundedSynchedPipeFactory()
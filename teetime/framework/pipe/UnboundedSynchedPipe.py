@@ -11,63 +11,60 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
+from collections import deque
+from typing import Deque, Iterable, List, Optional, TypeVar
 
-import java.util.Queue
+T = TypeVar("T")
 
-import org.jctools.queues.QueueFactory
-import org.jctools.queues.spec.ConcurrentQueueSpec
-import org.jctools.queues.spec.Ordering
-import org.jctools.queues.spec.Preference
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.AbstractSynchedPipe import AbstractSynchedPipe
 
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
+# A deque's <code>append</code> and <code>popleft</code> are atomic,
+# so it serves as a lock-free single-producer/single-consumer queue without a capacity bound.
+class UnboundedSynchedPipe(AbstractSynchedPipe[T]):
 
-public class UnboundedSynchedPipe<T> extends AbstractSynchedPipe<T>:
+	_queue: Deque[T]
 
-	private final Queue<T> queue
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T]):
+		super().__init__(source_port, target_port)
+		self._queue = deque()
 
-	public UnboundedSynchedPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		super(sourcePort, targetPort)
-		ConcurrentQueueSpec specification = new ConcurrentQueueSpec(1, 1, 0, Ordering.FIFO, Preference.THROUGHPUT)
-		self.queue = QueueFactory.newQueue(specification)
-	}
+	def add(self, element: T):
+		self._queue.append(element)
+		self.get_scheduler().on_element_added(self)
 
-	@Override
-	public void add(final T element):
-		self.queue.add(element)
-		getScheduler().onElementAdded(this)
-	}
+	def add_non_blocking(self, element: T) -> bool:
+		# an unbounded queue always accepts the element
+		self.add(element)
+		return True
 
-	@Override
-	public boolean addNonBlocking(final T element):
-		boolean offered = self.queue.offer(element)
-		if (offered):
-			getScheduler().onElementAdded(this)
-		} else:
-			getScheduler().onElementNotAdded(this)
-		}
-		return offered
-	}
+	def add_all(self, elements: Iterable[T]):
+		queue = self._queue
+		size_before = len(queue)
+		queue.extend(elements)
+		if (len(queue) > size_before):
+			self.get_scheduler().on_element_added(self)
 
-	@Override
-	public T removeLast():
-		return self.queue.poll()
-	}
+	def remove_last(self) -> Optional[T]:
+		try:
+			return self._queue.popleft()
+		except IndexError:
+			return None
 
-	@Override
-	public boolean isEmpty():
-		return self.queue.isEmpty()
-	}
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		queue = self._queue
+		count = min(len(queue), max_elements)
+		popleft = queue.popleft
+		for _ in range(count):
+			target.append(popleft())
+		return count
 
-	@Override
-	public int size():
-		return self.queue.size()
-	}
+	def is_empty(self) -> bool:
+		return not self._queue
 
-	@Override
-	public int capacity():
-		return -1
-	}
+	def size(self) -> int:
+		return len(self._queue)
 
-}
+	def capacity(self) -> int:
+		return -1
@@ -11,59 +11,63 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe
+from typing import Iterable, List, Optional, TypeVar
 
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
+T = TypeVar("T")
 
-public final class UnsynchedPipe<T> extends AbstractUnsynchedPipe<T>:
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.AbstractUnsynchedPipe import AbstractUnsynchedPipe
 
-	// private final StopWatch stopWatch = new StopWatch()
-	private T element
+class UnsynchedPipe(AbstractUnsynchedPipe[T]):
 
-	public UnsynchedPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort):
-		super(sourcePort, targetPort)
-	}
+	# the following stopwatch-related lines are commented out since they are computationally too expensive
+	# _stop_watch = StopWatch()
+	_element: Optional[T] = None
 
-	@Override
-	public void add(final T element):
-		if (null == element):
-			throw new IllegalArgumentException("Parameter 'element' is null, but must be non-null.")
-		}
-		self.element = element
-		// the following stopwatch-related lines are commented out since they are computationally too expensive
-		// self.stopWatch.start()
-		getScheduler().onElementAdded(this)
-		// self.stopWatch.end()
-		// self.getSourcePort().getOwningStage().addActiveWaitingTime(self.stopWatch.getDurationInNs())
-	}
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T]):
+		super().__init__(source_port, target_port)
 
-	@Override
-	public boolean addNonBlocking(final T element):
-		add(element)
-		return true
-	}
+	def add(self, element: T):
+		if (element is None):
+			raise ValueError("Parameter 'element' is None, but must be non-None.")
+		self._element = element
+		# self._stop_watch.start()
+		self.get_scheduler().on_element_added(self)
+		# self._stop_watch.end()
+		# self.get_source_port().get_owning_stage().add_active_waiting_time(self._stop_watch.get_duration_in_ns())
 
-	@Override
-	public T removeLast():
-		final T temp = self.element
-		self.element = null // NOPMD
-		return temp
-	}
+	def add_non_blocking(self, element: T) -> bool:
+		self.add(element)
+		return True
 
-	@Override
-	public boolean isEmpty():
-		return self.element == null
-	}
+	# The pipe holds at most one element and the scheduler executes the target stage synchronously on each addition.
+	# Hence, each element is still handed over individually, but without the overhead of the port indirection.
+	def add_all(self, elements: Iterable[T]):
+		on_element_added = self.get_scheduler().on_element_added
+		for element in elements:
+			if (element is None):
+				raise ValueError("Parameter 'elements' contains None, but must only contain non-None elements.")
+			self._element = element
+			on_element_added(self)
 
-	@Override
-	public int size():
-		return (self.element == null) ? 0 : 1
-	}
+	def remove_last(self) -> Optional[T]:
+		temp = self._element
+		self._element = None # NOPMD
+		return temp
 
-	@Override
-	public int capacity():
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		if (self._element is None or max_elements < 1):
+			return 0
+		target.append(self._element)
+		self._element = None # NOPMD
 		return 1
-	}
 
-}
+	def is_empty(self) -> bool:
+		return self._element is None
+
+	def size(self) -> int:
+		return 0 if self._element is None else 1
+
+	def capacity(self) -> int:
+		return 1
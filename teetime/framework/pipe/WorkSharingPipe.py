@@ -0,0 +1,193 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import deque
+from typing import Deque, Generic, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.AbstractSynchedPipe import AbstractSynchedPipe
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.framework.pipe.strategy.SpinYieldParkStrategy import SpinYieldParkStrategy
+
+# A pipe whose elements are held in a:@link SharedQueue} together with the elements of other work-sharing pipes.
+# All pipes of a shared queue must have the same source stage, e.g., a:@link Distributor}.
+# Regardless of the port an element has been sent to, it is removed by the next consumer that asks for an element.
+# Hence, an idle consumer never waits while other consumers have a backlog, even if the processing time of the elements varies a lot.
+# <p>
+# A deque's <code>append</code> and <code>popleft</code> are atomic,
+# so the shared queue serves as a lock-free single-producer/multi-consumer queue.
+# Its capacity is the sum of the capacities of its pipes.
+# </p>
+# <p>
+# The consumer of a pipe terminates as soon as the terminate element has been sent to its pipe and the shared queue is empty.
+# Thus, all pipes of a shared queue are expected to be terminated together, i.e., ports should not be removed at runtime.
+# </p>
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+#
+# @since 3.0
+class WorkSharingPipe(AbstractSynchedPipe[T], IMonitorablePipe):
+
+	# The elements of several:@link WorkSharingPipe}s.
+	# Its attributes are only written by the producer, except for the elements themselves.
+	class SharedQueue(Generic[T]):
+
+		_elements: Deque[T]
+		_capacity: int
+		# the producer waits for any consumer, so the strategy is shared by all pipes
+		_strategy: SpinYieldParkStrategy
+
+		def __init__(self):
+			self._elements = deque()
+			self._capacity = 0
+			self._strategy = SpinYieldParkStrategy()
+
+		def size(self) -> int:
+			return len(self._elements)
+
+		def capacity(self) -> int:
+			return self._capacity
+
+	_shared_queue: "WorkSharingPipe.SharedQueue[T]"
+	_capacity: int
+	# set by the producer after it has sent the last element to the shared queue
+	_terminate_element_added: bool = False
+
+	# only written by the producer
+	_num_pushes: int = 0
+	# only written by the consumer
+	_num_pulls: int = 0
+
+	_last_producer_index: int = 0
+	_last_consumer_index: int = 0
+
+	# @param capacity
+	#            the capacity this pipe adds to the shared queue
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], capacity: int, shared_queue: "WorkSharingPipe.SharedQueue[T]"):
+		super().__init__(source_port, target_port)
+		if (capacity < 1):
+			raise ValueError("The capacity must be at least 1, but was " + str(capacity))
+		self._shared_queue = shared_queue
+		self._capacity = capacity
+		shared_queue._capacity += capacity
+
+	def add(self, element: T):
+		if (element is AbstractPort.TERMINATE_ELEMENT):
+			self._terminate_element_added = True
+		else:
+			self._shared_queue._strategy.add(self, element)
+		self.get_scheduler().on_element_added(self)
+
+	def add_non_blocking(self, element: T) -> bool:
+		shared_queue = self._shared_queue
+		# a single producer cannot exceed the capacity between the check and the append
+		if (len(shared_queue._elements) >= shared_queue._capacity):
+			self.get_scheduler().on_element_not_added(self)
+			return False
+		shared_queue._elements.append(element)
+		self._num_pushes += 1
+		self.get_scheduler().on_element_added(self)
+		return True
+
+	# Offers the elements in chunks as large as the free capacity allows.
+	# The scheduler is notified once per chunk instead of once per element.
+	def add_all(self, elements: Iterable[T]):
+		elements = elements if isinstance(elements, list) else list(elements)
+		shared_queue = self._shared_queue
+		num_elements = len(elements)
+		offset = 0
+		while (offset < num_elements):
+			num_offered = min(num_elements - offset, shared_queue._capacity - len(shared_queue._elements))
+			if (num_offered > 0):
+				shared_queue._elements.extend(elements[offset:offset + num_offered])
+				self._num_pushes += num_offered
+				offset += num_offered
+				self.get_scheduler().on_element_added(self)
+			if (offset < num_elements):
+				# the queue is full: wait for (at least) one free slot
+				shared_queue._strategy.add(self, elements[offset])
+				offset += 1
+
+	def remove_last(self) -> Optional[T]:
+		# read before polling: once set, the producer does not add any further element
+		terminate_element_added = self._terminate_element_added
+		try:
+			element = self._shared_queue._elements.popleft()
+		except IndexError:
+			return AbstractPort.TERMINATE_ELEMENT if terminate_element_added else None
+		self._num_pulls += 1
+		self._shared_queue._strategy.signal()
+		return element
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		terminate_element_added = self._terminate_element_added
+		popleft = self._shared_queue._elements.popleft
+		count = 0
+		is_drained = False
+		try:
+			while (count < max_elements):
+				target.append(popleft())
+				count += 1
+		except IndexError:
+			is_drained = True
+		if (count > 0):
+			self._num_pulls += count
+			self._shared_queue._strategy.signal()
+		if (is_drained and terminate_element_added):
+			target.append(AbstractPort.TERMINATE_ELEMENT)
+			count += 1
+		return count
+
+	def is_empty(self) -> bool:
+		# the terminate element is pending until the consumer has removed it
+		return not self._shared_queue._elements and (not self._terminate_element_added or self.is_closed())
+
+	# @return the number of elements in the shared queue, i.e., the number of elements the consumer of this pipe can remove
+	def size(self) -> int:
+		return len(self._shared_queue._elements)
+
+	# @return the capacity of the shared queue
+	def capacity(self) -> int:
+		return self._shared_queue._capacity
+
+	def get_shared_queue(self) -> "WorkSharingPipe.SharedQueue[T]":
+		return self._shared_queue
+
+	# @return the number of waits of the producer on the shared queue
+	def get_num_waits(self) -> int:
+		return self._shared_queue._strategy.get_num_waits()
+
+	def get_push_throughput(self) -> int:
+		current_producer_index = self._num_pushes
+		diff = current_producer_index - self._last_producer_index
+		self._last_producer_index = current_producer_index
+		return diff
+
+	def get_pull_throughput(self) -> int:
+		current_consumer_index = self._num_pulls
+		diff = current_consumer_index - self._last_consumer_index
+		self._last_consumer_index = current_consumer_index
+		return diff
+
+	# @return the number of elements sent to this pipe since application start
+	def get_num_pushes_since_app_start(self) -> int:
+		return self._num_pushes
+
+	# @return the number of elements removed by the consumer of this pipe since application start
+	def get_num_pulls_since_app_start(self) -> int:
+		return self._num_pulls
@@ -0,0 +1,41 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.framework.pipe.WorkSharingPipe import WorkSharingPipe
+from teetime.framework.pipe.pipe import IPipe
+
+# Creates:@link WorkSharingPipe}s which all share the same queue.
+# Hence, use a new factory instance for each group of consumers that should share their work, e.g., for each task farm.
+#
+# @since 3.0
+class WorkSharingPipeFactory(IPipeFactory):
+
+	DEFAULT_CAPACITY = 512
+
+	_shared_queue: "WorkSharingPipe.SharedQueue"
+
+	def __init__(self):
+		self._shared_queue = WorkSharingPipe.SharedQueue()
+
+	def new_pipe(self, source_port: OutputPort, target_port: InputPort[T], capacity: int = DEFAULT_CAPACITY) -> IPipe[T]:
+		return WorkSharingPipe(source_port, target_port, capacity, self._shared_queue)
+
+	def get_shared_queue(self) -> "WorkSharingPipe.SharedQueue":
+		return self._shared_queue
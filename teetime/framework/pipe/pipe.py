@@ -1,5 +1,5 @@
 import abc
-from typing import TypeVar, Generic
+from typing import Iterable, List, TypeVar, Generic
 from . import port
 from . import pipe_scheduler as sched
 
@@ -24,6 +24,41 @@ class IPipe(Generic[T]):
     def add_non_blocking(self, element) -> bool:
         return ""
 
+	# Adds all given elements to the pipe in their iteration order.
+	# Like:@link #add(Object)}, it guarantees the delivery of each element.
+	# Implementations should notify the scheduler once per batch rather than once per element.
+	# 
+	# @param elements
+	#            to be added; may not contain <code>null</code>
+    def add_all(self, elements: Iterable[T]):
+        for element in elements:
+            self.add(element)
+
+	# The awaitable counterpart of:@link #add(Object)} for stages which are executed as coroutines.
+	# A bounded pipe awaits free capacity instead of blocking the event loop.
+	# 
+	# @param element
+	#            to be added
+    async def add_async(self, element):
+        self.add(element)
+
+	# The awaitable counterpart of:@link #add_all(Iterable)}.
+	# 
+	# @param elements
+	#            to be added; may not contain <code>null</code>
+    async def add_all_async(self, elements: Iterable[T]):
+        self.add_all(elements)
+
+	# Adds an element to the given lane of the pipe. Like:@link #add(Object)}, it guarantees the element delivery.
+	# Pipes with a single lane ignore the lane.
+	# 
+	# @param element
+	#            to be added
+	# @param lane
+	#            the index of the lane, where 0 is the most urgent one
+    def add_on_lane(self, element, lane: int):
+        self.add(element)
+
 	# Checks whether the pipe is empty or not.
 	# 
 	# @return <code>true</code> if the pipe is empty, false otherwise.
@@ -44,6 +79,23 @@ class IPipe(Generic[T]):
     def remove_last(self):
         pass
 
+	# Retrieves and removes up to <code>max_elements</code> elements from the pipe in FIFO order.
+	# 
+	# @param target
+	#            list to which the removed elements are appended
+	# @param max_elements
+	#            the maximum number of elements to remove
+	# @return the number of elements removed, <code>0</code> if the pipe is currently empty.
+    def drain_to(self, target: List[T], max_elements: int) -> int:
+        count = 0
+        while (count < max_elements):
+            element = self.remove_last()
+            if (element is None):
+                break
+            target.append(element)
+            count += 1
+        return count
+
 	# @return the output port that is connected to the pipe.
     def get_source_port(self) -> OutputPort:
         pass
@@ -63,7 +115,7 @@ class IPipe(Generic[T]):
 	# @return <code>true</code> if the pipe is closed, that is, if the pipe is empty <b>and</b> if the source stage will not send any elements anymore (because the
 	#         stage has finished its whole work)
 	#         returns <code>false</code> in all other cases.
-    def is_closed(self) -> bool
+    def is_closed(self) -> bool:
         return False
 
 	# @return <code>true</code> if the pipe is not empty, that is, if the pipe contains at least one element.
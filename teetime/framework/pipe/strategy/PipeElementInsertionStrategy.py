@@ -11,19 +11,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe.strategy
+from typing import TypeVar, Generic
 
-import teetime.framework.pipe.IPipe
+T = TypeVar("T")
 
-public interface PipeElementInsertionStrategy<T>:
+from teetime.framework.pipe.pipe import IPipe
+
+class PipeElementInsertionStrategy(Generic[T]):
 
 	# Adds the given element to the given pipe. This method does not return anything because it should guarantee element delivery.
-	# If it cannot guarantee element delivery in some special situation, it then must throw an exception.
+	# If it cannot guarantee element delivery in some special situation, it then must raise an exception.
 	#
 	# @param pipe
 	#            to be used
 	#
 	# @param element
 	#            to be added
-	void add(IPipe<T> pipe, T element)
-}
+	def add(self, pipe: IPipe[T], element: T):
+		pass
+
+	# Invoked by the consumer of the pipe whenever it has removed at least one element, i.e., whenever capacity has become free.
+	# Must be cheap if no producer is waiting since it is called on the hot path.
+	def signal(self):
+		pass
+
+	# @return the number of pauses of the pushing stage
+	def get_num_waits(self) -> int:
+		return 0
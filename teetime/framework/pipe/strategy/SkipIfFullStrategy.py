@@ -11,15 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe.strategy
+from typing import TypeVar
 
-import teetime.framework.pipe.IPipe
+T = TypeVar("T")
 
-public class SkipIfFullStrategy<T> implements PipeElementInsertionStrategy<T>:
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
 
-	@Override
-	public void add(final IPipe<T> pipe, final T element):
-		pipe.addNonBlocking(element)
-	}
+class SkipIfFullStrategy(PipeElementInsertionStrategy[T]):
 
-}
+	def add(self, pipe: IPipe[T], element: T):
+		pipe.add_non_blocking(element)
@@ -11,41 +11,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.pipe.strategy
+import time
+from typing import TypeVar
 
-import teetime.framework.StageState
-import teetime.framework.exceptionHandling.TerminateException
-import teetime.framework.pipe.IPipe
+T = TypeVar("T")
 
-public class SleepIfFullStrategy<T> implements PipeElementInsertionStrategy<T>:
+from teetime.framework.StageState import StageState
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
 
-	// statistics
-	private int numWaits
+class SleepIfFullStrategy(PipeElementInsertionStrategy[T]):
 
-	@Override
-	public void add(final IPipe<T> pipe, final T element):
-		while (!pipe.addNonBlocking(element)):
-			// the following sending*-related lines are commented out since they are computationally too expensive
-			// self.getSourcePort().getOwningStage().sendingFailed()
-			// Thread.yield()
-			StageState targetStageState = pipe.getTargetPort().getOwningStage().getCurrentState()
-			if (targetStageState == StageState.TERMINATED ||
-					Thread.currentThread().isInterrupted()):
-				throw TerminateException.INSTANCE
-			}
-			self.numWaits++
-			try:
-				Thread.sleep(10)
-			} catch (InterruptedException ignore): // NOPMD can be interrupted w/o any reason
-				throw TerminateException.INSTANCE
-			}
-		}
-		// self.getSourcePort().getOwningStage().sendingSucceeded()
-		// self.reportNewElement()
-	}
+	# statistics
+	_num_waits: int = 0
 
-	public int getNumWaits():
-		return numWaits
-	}
+	def add(self, pipe: IPipe[T], element: T):
+		while (not pipe.add_non_blocking(element)):
+			# the following sending*-related lines are commented out since they are computationally too expensive
+			# self.get_source_port().get_owning_stage().sending_failed()
+			target_stage_state = pipe.get_target_port().get_owning_stage().get_current_state()
+			if (target_stage_state == StageState.TERMINATED):
+				raise TerminateException.INSTANCE
+			self._num_waits += 1
+			time.sleep(0.010)
+		# self.get_source_port().get_owning_stage().sending_succeeded()
 
-}
+	def get_num_waits(self) -> int:
+		return self._num_waits
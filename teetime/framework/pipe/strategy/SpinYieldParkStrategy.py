@@ -0,0 +1,126 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.StageState import StageState
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.pipe.strategy.PipeElementInsertionStrategy import PipeElementInsertionStrategy
+from teetime.framework.pipe.strategy.WaitTimeHistogram import WaitTimeHistogram
+
+# An adaptive back-off strategy for full bounded pipes.
+# It retries in three phases:
+# <ol>
+# <li>spin: retry immediately for <code>num_spins</code> attempts</li>
+# <li>yield: retry after yielding the GIL/CPU for <code>num_yields</code> further attempts</li>
+# <li>park: wait on a condition until the consumer signals free capacity via:@link #signal()},
+#     but at most <code>park_timeout_in_s</code> per attempt</li>
+# </ol>
+# Thus, a short back-pressure phase costs microseconds instead of a fixed 10 ms sleep,
+# while a long one does not burn CPU.
+# <p>
+# Each strategy instance belongs to exactly one pipe, i.e., it serves a single producer and a single consumer.
+# The duration of each wait is recorded in a:@link WaitTimeHistogram}.
+# </p>
+#
+# @param <T>
+#            the type of the elements to be added
+class SpinYieldParkStrategy(PipeElementInsertionStrategy[T]):
+
+	DEFAULT_NUM_SPINS = 64
+	DEFAULT_NUM_YIELDS = 256
+	# only a safety net against a missed signal; regular wake-ups are triggered by the consumer
+	DEFAULT_PARK_TIMEOUT_IN_S = 0.001
+
+	_num_spins: int
+	_num_yields: int
+	_park_timeout_in_s: float
+
+	_condition: threading.Condition
+	_parked: bool
+	_histogram: WaitTimeHistogram
+
+	def __init__(self, num_spins: int = DEFAULT_NUM_SPINS, num_yields: int = DEFAULT_NUM_YIELDS, park_timeout_in_s: float = DEFAULT_PARK_TIMEOUT_IN_S):
+		if (num_spins < 0 or num_yields < 0):
+			raise ValueError("num_spins and num_yields may not be negative")
+		if (park_timeout_in_s <= 0):
+			raise ValueError("park_timeout_in_s must be positive, but was " + str(park_timeout_in_s))
+		self._num_spins = num_spins
+		self._num_yields = num_yields
+		self._park_timeout_in_s = park_timeout_in_s
+		self._condition = threading.Condition(threading.Lock())
+		self._parked = False
+		self._histogram = WaitTimeHistogram()
+
+	def add(self, pipe: IPipe[T], element: T):
+		if (pipe.add_non_blocking(element)):
+			return
+
+		start = time.perf_counter_ns()
+		target_stage = pipe.get_target_port().get_owning_stage()
+		attempt = 0
+		while (True):
+			if (target_stage.get_current_state() == StageState.TERMINATED):
+				raise TerminateException.INSTANCE
+
+			if (attempt < self._num_spins):
+				pass # retry immediately
+			elif (attempt < self._num_spins + self._num_yields):
+				time.sleep(0) # yield
+			elif (self._park(pipe, element)):
+				break
+			attempt += 1
+
+			if (pipe.add_non_blocking(element)):
+				break
+
+		self._histogram.record(time.perf_counter_ns() - start)
+
+	# @return <code>true</code> iff the element was added while holding the condition's lock
+	def _park(self, pipe: IPipe[T], element: T) -> bool:
+		with self._condition:
+			self._parked = True
+			try:
+				# re-check after announcing the park so that a concurrent signal cannot be missed
+				if (pipe.add_non_blocking(element)):
+					return True
+				self._condition.wait(self._park_timeout_in_s)
+			finally:
+				self._parked = False
+		return False
+
+	def signal(self):
+		# lock-free fast path: only notify if the producer is (about to be) parked
+		if (self._parked):
+			with self._condition:
+				self._condition.notify()
+
+	def get_num_waits(self) -> int:
+		return self._histogram.get_count()
+
+	def get_wait_histogram(self) -> WaitTimeHistogram:
+		return self._histogram
+
+	def get_num_spins(self) -> int:
+		return self._num_spins
+
+	def get_num_yields(self) -> int:
+		return self._num_yields
+
+	def get_park_timeout_in_s(self) -> float:
+		return self._park_timeout_in_s
@@ -0,0 +1,84 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List
+
+# A histogram of wait durations with logarithmic (power-of-two) bucket boundaries in nanoseconds.
+# Bucket <code>i</code> counts durations in <code>[2^(i-1), 2^i)</code> ns; bucket 0 counts durations below 1 ns.
+# Durations of 2^(NUM_BUCKETS-2) ns (about 4.3 s) and longer all fall into the last bucket.
+# <p>
+# Recording is not synchronized; it is meant to be updated by the single producer of a pipe only.
+# </p>
+class WaitTimeHistogram:
+
+	NUM_BUCKETS = 34
+
+	_buckets: List[int]
+	_count: int
+	_total_duration_in_ns: int
+	_max_duration_in_ns: int
+
+	def __init__(self):
+		self._buckets = [0] * self.NUM_BUCKETS
+		self._count = 0
+		self._total_duration_in_ns = 0
+		self._max_duration_in_ns = 0
+
+	def record(self, duration_in_ns: int):
+		index = min(max(duration_in_ns, 0).bit_length(), self.NUM_BUCKETS - 1)
+		self._buckets[index] += 1
+		self._count += 1
+		self._total_duration_in_ns += duration_in_ns
+		if (duration_in_ns > self._max_duration_in_ns):
+			self._max_duration_in_ns = duration_in_ns
+
+	# @return the number of recorded waits
+	def get_count(self) -> int:
+		return self._count
+
+	def get_total_duration_in_ns(self) -> int:
+		return self._total_duration_in_ns
+
+	def get_max_duration_in_ns(self) -> int:
+		return self._max_duration_in_ns
+
+	def get_mean_duration_in_ns(self) -> float:
+		if (self._count == 0):
+			return 0.0
+		return self._total_duration_in_ns / self._count
+
+	# @return a copy of the bucket counts
+	def get_buckets(self) -> List[int]:
+		return list(self._buckets)
+
+	# @return the exclusive upper bound in ns of the given bucket
+	@staticmethod
+	def get_upper_bound_in_ns(bucket_index: int) -> int:
+		return 1 << bucket_index
+
+	# @param percentile
+	#            in <code>[0, 100]</code>
+	# @return an upper bound in ns of the given percentile of the recorded durations, or <code>0</code> if nothing was recorded
+	def get_percentile_upper_bound_in_ns(self, percentile: float) -> int:
+		if (self._count == 0):
+			return 0
+		threshold = self._count * percentile / 100.0
+		cumulative = 0
+		for index, bucket_count in enumerate(self._buckets):
+			cumulative += bucket_count
+			if (cumulative >= threshold and bucket_count > 0):
+				return min(self.get_upper_bound_in_ns(index), self._max_duration_in_ns)
+		return self._max_duration_in_ns
+
+	def __str__(self) -> str:
+		return "WaitTimeHistogram(count=%d, mean=%.0fns, max=%dns)" % (self._count, self.get_mean_duration_in_ns(), self._max_duration_in_ns)
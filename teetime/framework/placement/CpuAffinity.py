@@ -0,0 +1,49 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import os
+from typing import Collection, FrozenSet, Optional
+
+LOGGER = logging.getLogger("CpuAffinity")
+
+# Pins the calling thread or process to a set of CPUs, if the platform supports it.
+# On Linux, <code>os.sched_setaffinity(0, ...)</code> only affects the calling thread.
+# Hence, it is applied within the thread to pin, or within the (single-threaded) worker process.
+#
+# @since 3.0
+class CpuAffinity:
+
+	# @return whether the affinity can be set on this platform
+	@staticmethod
+	def is_supported() -> bool:
+		return hasattr(os, "sched_setaffinity")
+
+	# @return the previous CPUs of the calling thread, or <code>None</code> if the affinity has not been changed
+	@staticmethod
+	def pin_current_thread(cpus: Collection[int]) -> Optional[FrozenSet[int]]:
+		if (not CpuAffinity.is_supported()):
+			LOGGER.debug("CPU affinity is not supported on this platform")
+			return None
+		previous_cpus = frozenset(os.sched_getaffinity(0))
+		try:
+			os.sched_setaffinity(0, cpus)
+		except OSError as e: # e.g., if the CPUs are not available to this process
+			LOGGER.warning("Could not pin the current thread to the CPUs %s: %s", sorted(cpus), e)
+			return None
+		return previous_cpus
+
+	@staticmethod
+	def restore_current_thread(previous_cpus: Optional[FrozenSet[int]]):
+		if (previous_cpus is not None):
+			os.sched_setaffinity(0, previous_cpus)
@@ -0,0 +1,82 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import glob
+import logging
+import os
+import re
+from typing import FrozenSet, List, Optional
+
+LOGGER = logging.getLogger("CpuTopology")
+
+# Represents the NUMA nodes of this machine together with the CPUs this process may use.
+# Nodes without any usable CPU are omitted.
+# If the topology is not available (e.g., not on Linux), all usable CPUs form a single node.
+#
+# @since 3.0
+class CpuTopology:
+
+	NODE_DIRECTORY = "/sys/devices/system/node"
+
+	INSTANCE: "CpuTopology"
+
+	_nodes: List[FrozenSet[int]]
+
+	# @param nodes
+	#            the CPUs of each node. Read from the system if not given.
+	def __init__(self, nodes: Optional[List[FrozenSet[int]]] = None):
+		self._nodes = nodes if nodes is not None else CpuTopology._read_nodes()
+
+	@staticmethod
+	def _read_nodes() -> List[FrozenSet[int]]:
+		usable_cpus = CpuTopology.get_usable_cpus()
+		nodes = []
+		node_directories = glob.glob(os.path.join(CpuTopology.NODE_DIRECTORY, "node[0-9]*"))
+		for node_directory in sorted(node_directories, key=lambda directory: int(re.sub(r"\D", "", os.path.basename(directory)))):
+			try:
+				with open(os.path.join(node_directory, "cpulist")) as cpulist_file:
+					cpus = CpuTopology.parse_cpu_list(cpulist_file.read()) & usable_cpus
+			except OSError as e:
+				LOGGER.debug("Could not read the CPUs of %s: %s", node_directory, e)
+				continue
+			if (cpus):
+				nodes.append(cpus)
+		if (not nodes):
+			nodes.append(usable_cpus)
+		return nodes
+
+	# @return the CPUs this process may use
+	@staticmethod
+	def get_usable_cpus() -> FrozenSet[int]:
+		if (hasattr(os, "sched_getaffinity")):
+			return frozenset(os.sched_getaffinity(0))
+		return frozenset(range(os.cpu_count() or 1))
+
+	# Parses a list in the format of the Linux kernel, e.g., <code>0-3,8,10-11</code>.
+	@staticmethod
+	def parse_cpu_list(cpu_list: str) -> FrozenSet[int]:
+		cpus = set()
+		for cpu_range in cpu_list.strip().split(","):
+			if (not cpu_range):
+				continue
+			first, _, last = cpu_range.partition("-")
+			cpus.update(range(int(first), int(last or first) + 1))
+		return frozenset(cpus)
+
+	def get_nodes(self) -> List[FrozenSet[int]]:
+		return self._nodes
+
+	def get_num_cpus(self) -> int:
+		return sum(len(node) for node in self._nodes)
+
+CpuTopology.INSTANCE = CpuTopology()
@@ -0,0 +1,55 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Collection, Dict, FrozenSet, Iterable, Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.placement.IPlacementPolicy import IPlacementPolicy
+
+# Pins the threads of explicitly given stages (and workers) to explicitly given CPUs.
+#
+# @since 3.0
+class ExplicitPlacementPolicy(IPlacementPolicy):
+
+	_cpus_by_stage: Dict[AbstractStage, FrozenSet[int]]
+	_cpus_by_worker: Dict[int, FrozenSet[int]]
+
+	def __init__(self):
+		self._cpus_by_stage = {}
+		self._cpus_by_worker = {}
+
+	# Pins the thread (or process) of the given active stage.
+	#
+	# @return this policy
+	def pin_stage(self, stage: AbstractStage, cpus: Iterable[int]) -> "ExplicitPlacementPolicy":
+		self._cpus_by_stage[stage] = self._to_cpu_set(cpus)
+		return self
+
+	# Pins the worker thread with the given index, e.g., of the:@link GlobalTaskPoolScheduling}.
+	#
+	# @return this policy
+	def pin_worker(self, worker_index: int, cpus: Iterable[int]) -> "ExplicitPlacementPolicy":
+		self._cpus_by_worker[worker_index] = self._to_cpu_set(cpus)
+		return self
+
+	def _to_cpu_set(self, cpus: Iterable[int]) -> FrozenSet[int]:
+		cpu_set = frozenset(cpus)
+		if (not cpu_set):
+			raise ValueError("The set of CPUs may not be empty.")
+		return cpu_set
+
+	def place_stages(self, threadable_stages: Collection[AbstractStage]) -> Dict[AbstractStage, FrozenSet[int]]:
+		return {stage: self._cpus_by_stage[stage] for stage in threadable_stages if stage in self._cpus_by_stage}
+
+	def place_worker(self, worker_index: int, num_workers: int) -> Optional[FrozenSet[int]]:
+		return self._cpus_by_worker.get(worker_index)
@@ -0,0 +1,38 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from abc import ABC, abstractmethod
+from typing import Collection, Dict, FrozenSet, Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+
+# Represents a policy which determines the CPUs on which the threads (and processes) of a configuration run.
+# It is set on the:@link Configuration} and applied by the scheduler upon initialization.
+#
+# @since 3.0
+class IPlacementPolicy(ABC):
+
+	# Used by schedulers which dedicate a thread (or a process) to each threadable stage, e.g.,:@link PushPullScheduling}.
+	#
+	# @param threadable_stages
+	#            the stages which are executed by an own thread or process
+	# @return the CPUs for each threadable stage; stages without an entry are not pinned
+	@abstractmethod
+	def place_stages(self, threadable_stages: Collection[AbstractStage]) -> Dict[AbstractStage, FrozenSet[int]]:
+		pass
+
+	# Used by schedulers whose worker threads execute any stage, e.g.,:@link GlobalTaskPoolScheduling}.
+	#
+	# @return the CPUs of the given worker thread, or <code>None</code> if it should not be pinned
+	def place_worker(self, worker_index: int, num_workers: int) -> Optional[FrozenSet[int]]:
+		return None
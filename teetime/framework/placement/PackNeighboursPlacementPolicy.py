@@ -0,0 +1,99 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+from collections import deque
+from typing import Collection, Dict, FrozenSet, List, Optional, Set
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.placement.CpuTopology import CpuTopology
+from teetime.framework.placement.IPlacementPolicy import IPlacementPolicy
+
+STAGE_FACADE = StageFacade.INSTANCE
+
+# Places connected threadable stages on the same NUMA node so that their pipe transfers do not cross the interconnect.
+# <p>
+# The threadable stages are ordered breadth-first along the pipes, starting at the producers.
+# Then, this order is cut into one contiguous block per node, each sized in proportion to the node's number of CPUs.
+# Each stage is pinned to all CPUs of its node so that the OS still balances the load within the node.
+# Worker threads which execute any stage fill up one node after another.
+# </p>
+# On a machine with a single node, no thread is pinned.
+#
+# @since 3.0
+class PackNeighboursPlacementPolicy(IPlacementPolicy):
+
+	_topology: CpuTopology
+
+	# @param topology
+	#            Defaults to:@link CpuTopology#INSTANCE}.
+	def __init__(self, topology: Optional[CpuTopology] = None):
+		self._topology = topology if topology is not None else CpuTopology.INSTANCE
+
+	def place_stages(self, threadable_stages: Collection[AbstractStage]) -> Dict[AbstractStage, FrozenSet[int]]:
+		nodes = self._topology.get_nodes()
+		if (len(nodes) < 2):
+			return {}
+
+		ordered_stages = self._order_by_neighbourhood(threadable_stages)
+		num_cpus = self._topology.get_num_cpus()
+		placement = {}
+		index = 0
+		for node in nodes:
+			block_size = math.ceil(len(ordered_stages) * len(node) / num_cpus)
+			for stage in ordered_stages[index:index + block_size]:
+				placement[stage] = node
+			index += block_size
+		for stage in ordered_stages[index:]: # due to rounding
+			placement[stage] = nodes[-1]
+		return placement
+
+	# @return the threadable stages in breadth-first order along the pipes
+	def _order_by_neighbourhood(self, threadable_stages: Collection[AbstractStage]) -> List[AbstractStage]:
+		threadable_stage_set = set(threadable_stages)
+		ordered_stages = []
+		visited_stages: Set[AbstractStage] = set()
+		# start at the producers (in a stable order), then at any remaining (cyclic) part
+		start_stages = [stage for stage in threadable_stages if stage.is_producer()] + list(threadable_stages)
+		for start_stage in start_stages:
+			if (start_stage in visited_stages):
+				continue
+			visited_stages.add(start_stage)
+			queue = deque([start_stage])
+			while (queue):
+				stage = queue.popleft()
+				if (stage in threadable_stage_set):
+					ordered_stages.append(stage)
+				for output_port in STAGE_FACADE.get_output_ports(stage):
+					pipe = output_port.get_pipe()
+					if (isinstance(pipe, DummyPipe)):
+						continue
+					target_stage = pipe.get_target_port().get_owning_stage()
+					if (target_stage not in visited_stages):
+						visited_stages.add(target_stage)
+						queue.append(target_stage)
+		return ordered_stages
+
+	def place_worker(self, worker_index: int, num_workers: int) -> Optional[FrozenSet[int]]:
+		nodes = self._topology.get_nodes()
+		if (len(nodes) < 2):
+			return None
+		# fill up one node after another, i.e., use as few nodes as possible
+		cpu_index = worker_index % self._topology.get_num_cpus()
+		for node in nodes:
+			if (cpu_index < len(node)):
+				return node
+			cpu_index -= len(node)
+		return nodes[-1]
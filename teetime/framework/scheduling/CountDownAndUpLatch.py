@@ -11,53 +11,46 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling
+import threading
 
-public class CountDownAndUpLatch:
+# Represents a counter which can be waited for to become zero.
+# <p>
+# Only the modifications take a lock. Reading the counter does not, since reading an attribute is atomic in Python.
+# Hence, threads polling:@link #get_current_count()} do not serialize.
+# Waiting threads are notified only on the transition to zero.
+# </p>
+class CountDownAndUpLatch:
 
-	// private final Phaser phaser = new Phaser()
+	_counter: int
 
-	private final Object lock = new Object()
-	private int counter
+	def __init__(self):
+		self._lock = threading.Lock()
+		# set iff the counter is non-positive
+		self._zero_reached = threading.Event()
+		self._zero_reached.set()
+		self._counter = 0
 
 	# Increases the counter by 1 in a thread-safe manner.
-	public void countUp():
-		// phaser.register()
-		synchronized (lock):
-			counter++
-		}
-	}
+	def count_up(self):
+		with self._lock:
+			self._counter += 1
+			if (self._counter == 1):
+				self._zero_reached.clear()
 
 	# Decreases the counter by 1 in a thread-safe manner.
 	# <p>
 	# Notifies all waiting threads if the counter becomes zero.
-	public void countDown():
-		// phaser.arriveAndDeregister()
-		synchronized (lock):
-			counter--
-			if (counter == 0):
-				lock.notifyAll()
-			}
-		}
-	}
+	def count_down(self):
+		with self._lock:
+			self._counter -= 1
+			if (self._counter == 0):
+				self._zero_reached.set()
 
 	# Waits for the counter to become non-positive.
-	#
-	# @throws InterruptedException
-	public void await() throws InterruptedException:
-		// phaser.arriveAndAwaitAdvance()
-		synchronized (lock):
-			while (counter > 0):
-				lock.wait()
-			}
-		}
-	}
+	def await_(self):
+		# the counter may have been increased again after the notification
+		while (self._counter > 0):
+			self._zero_reached.wait()
 
-	public int getCurrentCount():
-		// return phaser.getUnarrivedParties()
-		synchronized (lock):
-			return counter
-		}
-	}
-
-}
+	def get_current_count(self) -> int:
+		return self._counter
@@ -0,0 +1,98 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import sys
+import threading
+import time
+from typing import Callable, List
+
+from teetime.framework.scheduling.CountDownAndUpLatch import CountDownAndUpLatch
+
+# Compares:@link CountDownAndUpLatch} with its former monitor-based implementation.
+# Each worker thread repeatedly counts up, polls the counter like:@link TeeTimeTaskQueueThreadChw#run()}, and counts down.
+# <p>
+# Usage: <code>python -m teetime.framework.scheduling.CountDownAndUpLatchBenchmark [iterations per thread]</code>
+# </p>
+class CountDownAndUpLatchBenchmark:
+
+	NUM_THREADS = (1, 4, 16, 64)
+	NUM_POLLS_PER_ITERATION = 8
+
+	# The former implementation which takes the monitor on each access.
+	class MonitorLatch:
+
+		def __init__(self):
+			self._lock = threading.Condition()
+			self._counter = 0
+
+		def count_up(self):
+			with self._lock:
+				self._counter += 1
+
+		def count_down(self):
+			with self._lock:
+				self._counter -= 1
+				if (self._counter == 0):
+					self._lock.notify_all()
+
+		def await_(self):
+			with self._lock:
+				while (self._counter > 0):
+					self._lock.wait()
+
+		def get_current_count(self) -> int:
+			with self._lock:
+				return self._counter
+
+	_num_iterations: int
+
+	def __init__(self, num_iterations: int = 20000):
+		self._num_iterations = num_iterations
+
+	# @return the duration in seconds until all threads have finished and the latch has been awaited
+	def measure(self, latch_factory: Callable[[], object], num_threads: int) -> float:
+		latch = latch_factory()
+		start_barrier = threading.Barrier(num_threads + 1)
+		num_iterations = self._num_iterations // num_threads
+		num_polls = self.NUM_POLLS_PER_ITERATION
+
+		def work():
+			start_barrier.wait()
+			for _ in range(num_iterations):
+				latch.count_up()
+				for _ in range(num_polls):
+					latch.get_current_count()
+				latch.count_down()
+
+		threads = [threading.Thread(target=work) for _ in range(num_threads)]
+		for thread in threads:
+			thread.start()
+		start_barrier.wait()
+		start = time.perf_counter()
+		for thread in threads:
+			thread.join()
+		latch.await_()
+		return time.perf_counter() - start
+
+	def run(self) -> List[str]:
+		lines = ["%8s %14s %14s %8s" % ("threads", "monitor [ms]", "atomic [ms]", "speedup")]
+		for num_threads in self.NUM_THREADS:
+			monitor_duration = self.measure(CountDownAndUpLatchBenchmark.MonitorLatch, num_threads)
+			atomic_duration = self.measure(CountDownAndUpLatch, num_threads)
+			lines.append("%8d %14.1f %14.1f %7.2fx" % (num_threads, monitor_duration * 1000, atomic_duration * 1000, monitor_duration / atomic_duration))
+		return lines
+
+if __name__ == "__main__":
+	benchmark = CountDownAndUpLatchBenchmark(int(sys.argv[1])) if len(sys.argv) > 1 else CountDownAndUpLatchBenchmark()
+	for line in benchmark.run():
+		print(line)
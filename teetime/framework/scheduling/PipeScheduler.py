@@ -11,26 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling
+from typing import Generic, TypeVar
 
-import teetime.framework.pipe.AbstractSynchedPipe
-import teetime.framework.pipe.AbstractUnsynchedPipe
+T = TypeVar("T")
 
-public interface PipeScheduler<T>:
+class PipeScheduler(Generic[T]):
 
-	# This event is invoked by the given <b>unsynchronized</b> pipe whenever a new element was added to it.
+	# This event is invoked by the given pipe whenever a new element was added to it.
+	# For an <b>unsynchronized</b> pipe, the scheduler is expected to execute the pipe's target stage.
 	#
 	# @param pipe
-	void onElementAdded(AbstractUnsynchedPipe<T> pipe)
-
-	# This event is invoked by the given <b>synchronized</b> pipe whenever a new element was added to it.
-	#
-	# @param pipe
-	void onElementAdded(AbstractSynchedPipe<T> pipe)
+	def on_element_added(self, pipe):
+		pass
 
 	# This event is invoked by the given <b>synchronized</b> pipe whenever a new element could not be added to it.
 	#
 	# @param pipe
-	void onElementNotAdded(AbstractSynchedPipe<T> pipe)
-
-}
+	def on_element_not_added(self, pipe):
+		pass
@@ -0,0 +1,93 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+import threading
+from typing import Collection, FrozenSet, Optional
+
+from teetime.framework.placement.CpuAffinity import CpuAffinity
+from teetime.framework.scheduling.WorkerThreadPool import WorkerThreadPool
+
+_THREAD_IDS = itertools.count()
+
+# Represents a thread whose:@link #run()} is executed by a worker of a:@link WorkerThreadPool}.
+# It offers the subset of the interface of <code>threading.Thread</code> used by the schedulers.
+# Since the executing worker is not this object, use:@link #current()} instead of <code>threading.current_thread()</code>.
+#
+# @since 3.0
+class PooledThread:
+
+	_current = threading.local()
+
+	name: str
+	_pool: Optional[WorkerThreadPool]
+	_started: bool = False
+	_terminated: threading.Event
+	_cpus: Optional[FrozenSet[int]] = None
+
+	# @param pool
+	#            to lease the worker from. Defaults to:@link WorkerThreadPool#INSTANCE}.
+	def __init__(self, name: Optional[str] = None, pool: Optional[WorkerThreadPool] = None):
+		self.name = name if name is not None else "PooledThread-" + str(next(_THREAD_IDS))
+		self._pool = pool
+		self._terminated = threading.Event()
+
+	def start(self):
+		if (self._started):
+			raise RuntimeError("threads can only be started once")
+		self._started = True
+		pool = self._pool if self._pool is not None else WorkerThreadPool.INSTANCE
+		pool.execute(self._bootstrap)
+
+	# Pins this thread to the given CPUs when it is started.
+	#
+	# @param cpus
+	#            <code>None</code> to not pin this thread
+	def set_cpu_affinity(self, cpus: Optional[Collection[int]]):
+		if (self._started):
+			raise RuntimeError("the CPU affinity can only be set before the thread is started")
+		self._cpus = frozenset(cpus) if cpus is not None else None
+
+	def get_cpu_affinity(self) -> Optional[FrozenSet[int]]:
+		return self._cpus
+
+	def _bootstrap(self):
+		threading.current_thread().name = self.name # for logging; reset by the worker
+		PooledThread._current.thread = self
+		# the worker is reused afterwards, so its previous affinity is restored
+		previous_cpus = CpuAffinity.pin_current_thread(self._cpus) if self._cpus is not None else None
+		try:
+			self.run()
+		finally:
+			CpuAffinity.restore_current_thread(previous_cpus)
+			PooledThread._current.thread = None
+			self._terminated.set()
+
+	def run(self):
+		pass
+
+	def join(self, timeout: Optional[float] = None):
+		if (not self._started):
+			raise RuntimeError("cannot join thread before it is started")
+		self._terminated.wait(timeout)
+
+	def is_alive(self) -> bool:
+		return self._started and not self._terminated.is_set()
+
+	# @return the pooled thread executed by the calling worker, or <code>None</code> if the caller is not executing a pooled thread
+	@staticmethod
+	def current() -> Optional["PooledThread"]:
+		return getattr(PooledThread._current, "thread", None)
+
+	def __str__(self) -> str:
+		return "PooledThread(" + self.name + ")"
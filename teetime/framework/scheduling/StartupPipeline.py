@@ -0,0 +1,117 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from time import perf_counter_ns
+from typing import Collection, Dict, List, Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.signal.ISignal import ISignal
+
+# Validates and starts a configuration with a single traversal of the graph.
+# <p>
+# The graph is traversed only once (see:@link #cache_traversal(Collection)}).
+# The traversal is cached as breadth-first levels, each with the outgoing connections of its stages grouped by their target stage.
+# A signal is then propagated level by level: first to the producers of a level, afterwards to the targets of the level's connections.
+# </p>
+# <p>
+# The propagation runs in the calling thread.
+# Passing a signal consists of pure-Python <code>on_signal</code> calls, so that distributing them among threads
+# only adds overhead under the GIL.
+# </p>
+# Moreover, this class records the duration of each start-up phase (see:@link #get_durations_in_ns()}).
+#
+# @since 3.0
+class StartupPipeline:
+
+	_levels: Optional[List[List[AbstractStage]]] = None
+	_connections_by_level: List[Dict[AbstractStage, List[OutputPort]]]
+	_durations_in_ns: Dict[str, int]
+
+	def __init__(self):
+		self._connections_by_level = []
+		self._durations_in_ns = {}
+
+	# Traverses the graph breadth-first starting at the given stages.
+	def cache_traversal(self, front_stages: Collection[AbstractStage]):
+		start = perf_counter_ns()
+
+		levels = []
+		connections_by_level = []
+		level = list(dict.fromkeys(front_stages)) # without duplicates, but in order
+		visited_stages = set(level)
+		while (level):
+			connections_by_target: Dict[AbstractStage, List[OutputPort]] = {}
+			next_level = []
+			for stage in level:
+				for output_port in stage.get_output_ports():
+					pipe = output_port.get_pipe()
+					if (isinstance(pipe, DummyPipe)):
+						continue
+					target_stage = pipe.get_target_port().get_owning_stage()
+					connections_by_target.setdefault(target_stage, []).append(output_port)
+					if (target_stage not in visited_stages):
+						visited_stages.add(target_stage)
+						next_level.append(target_stage)
+			levels.append(level)
+			connections_by_level.append(connections_by_target)
+			level = next_level
+
+		self._levels = levels
+		self._connections_by_level = connections_by_level
+		self.record_duration("traversal", start)
+
+	def is_traversal_cached(self) -> bool:
+		return self._levels is not None
+
+	# @return the number of stages of the cached traversal
+	def get_num_stages(self) -> int:
+		return sum(len(level) for level in self._levels) if (self._levels is not None) else 0
+
+	# Propagates the given signal along the cached traversal.
+	# Each producer receives the signal directly; every other stage receives it from the signal queue of its input pipes.
+	#
+	# @param phase
+	#            the name under which the duration of the propagation is recorded
+	def propagate_signal(self, signal: ISignal, phase: str):
+		if (self._levels is None):
+			raise Exception("The traversal has not been cached yet.") # IllegalStateException
+		start = perf_counter_ns()
+
+		for level, connections_by_target in zip(self._levels, self._connections_by_level):
+			for stage in level:
+				if (stage.is_producer()):
+					stage.on_signal(signal, None)
+			for target_stage, output_ports in connections_by_target.items():
+				self._deliver_signal(signal, target_stage, output_ports)
+
+		self.record_duration(phase, start)
+
+	def _deliver_signal(self, signal: ISignal, target_stage: AbstractStage, output_ports: List[OutputPort]):
+		for output_port in output_ports:
+			# drain signal from internal signal queue
+			pipe = output_port.get_pipe()
+			received_signal = pipe.get_signal()
+			if (received_signal is None):
+				continue
+			if (received_signal is not signal):
+				raise Exception("Unexpected signal: " + str(received_signal)) # IllegalStateException
+			target_stage.on_signal(received_signal, pipe.get_target_port())
+
+	def record_duration(self, phase: str, start_in_ns: int):
+		self._durations_in_ns[phase] = self._durations_in_ns.get(phase, 0) + perf_counter_ns() - start_in_ns
+
+	# @return the duration of each start-up phase recorded so far, in the order of their first occurrence
+	def get_durations_in_ns(self) -> Dict[str, int]:
+		return dict(self._durations_in_ns)
@@ -0,0 +1,195 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import atexit
+import itertools
+import logging
+import os
+import threading
+from typing import Callable, List, Optional
+
+LOGGER = logging.getLogger("WorkerThreadPool")
+
+# Represents a process-wide pool of warm worker threads (see:@link PooledThread}).
+# <p>
+# A task leases an idle worker or, if there is none, a newly created one.
+# The worker is returned to the pool as soon as the task has finished.
+# The pool keeps at most <code>max_idle_workers</code> idle workers; any further worker terminates after its task.
+# Hence, the number of concurrently running tasks is not bounded, since a stage's thread may not wait for another one.
+# An idle worker terminates after <code>idle_timeout_in_s</code> seconds.
+# </p>
+# The workers are daemon threads so that idle workers do not keep the interpreter alive.
+# Nevertheless, the interpreter waits for the running tasks at exit (see:@link #await_running_tasks()}),
+# so that, e.g., a non-blocking execution whose main thread returns still completes like with non-daemon threads.
+#
+# @since 3.0
+class WorkerThreadPool:
+
+	DEFAULT_MAX_IDLE_WORKERS = max(8, 2 * (os.cpu_count() or 1))
+	DEFAULT_IDLE_TIMEOUT_IN_S = 60.0
+
+	INSTANCE: "WorkerThreadPool"
+
+	class _Worker(threading.Thread):
+
+		_pool: "WorkerThreadPool"
+		_task: Optional[Callable[[], None]] = None
+		_task_assigned: threading.Event
+
+		def __init__(self, pool: "WorkerThreadPool", name: str):
+			super().__init__(name=name, daemon=True)
+			self._pool = pool
+			self._task_assigned = threading.Event()
+
+		# @param task
+		#            to run next, or <code>None</code> to terminate this worker
+		def assign(self, task: Optional[Callable[[], None]]):
+			self._task = task
+			self._task_assigned.set()
+
+		def run(self):
+			pool = self._pool
+			while (True):
+				if (not self._task_assigned.wait(pool._idle_timeout_in_s)):
+					if (pool._retire_idle_worker(self)):
+						return
+					continue # leased concurrently: the task is about to be assigned
+				self._task_assigned.clear()
+				task = self._task
+				self._task = None
+				if (task is None):
+					return
+
+				worker_name = self.name
+				try:
+					task()
+				except Exception: # NOPMD the worker must survive any task
+					LOGGER.exception("Uncaught exception in task of %s", self.name)
+				finally:
+					self.name = worker_name
+
+				if (not pool._return_worker(self)):
+					return
+
+	_max_idle_workers: int
+	_idle_timeout_in_s: float
+	_idle_workers: List["WorkerThreadPool._Worker"]
+	_lock: threading.Lock
+	_tasks_finished: threading.Condition
+	_num_created_workers: int = 0
+	_num_live_workers: int = 0
+	_num_running_tasks: int = 0
+	_is_shut_down: bool = False
+
+	# @param max_idle_workers
+	#            the maximum number of idle workers kept warm
+	# @param idle_timeout_in_s
+	#            the time after which an idle worker terminates
+	def __init__(self, max_idle_workers: int = DEFAULT_MAX_IDLE_WORKERS, idle_timeout_in_s: float = DEFAULT_IDLE_TIMEOUT_IN_S):
+		if (max_idle_workers < 0):
+			raise ValueError("max_idle_workers is " + str(max_idle_workers) + ", but must not be negative.")
+		self._max_idle_workers = max_idle_workers
+		self._idle_timeout_in_s = idle_timeout_in_s
+		self._idle_workers = []
+		self._lock = threading.Lock()
+		self._tasks_finished = threading.Condition(self._lock)
+		self._worker_ids = itertools.count()
+		# daemon threads keep running while the exit handlers run
+		atexit.register(self.await_running_tasks)
+
+	# Runs the given task in an idle worker or, if there is none, in a new one.
+	def execute(self, task: Callable[[], None]):
+		with self._lock:
+			if (self._is_shut_down):
+				raise Exception("The worker thread pool has been shut down.") # IllegalStateException
+			# LIFO: the most recently used worker is the warmest one
+			worker = self._idle_workers.pop() if self._idle_workers else None
+			if (worker is None):
+				worker = WorkerThreadPool._Worker(self, "TeeTimeWorker-" + str(next(self._worker_ids)))
+				self._num_created_workers += 1
+				self._num_live_workers += 1
+			self._num_running_tasks += 1
+		worker.assign(task)
+		if (not worker.is_alive()):
+			worker.start()
+
+	# @return <code>true</code> iff the worker has been put back into the pool
+	def _return_worker(self, worker: "WorkerThreadPool._Worker") -> bool:
+		with self._lock:
+			self._num_running_tasks -= 1
+			if (self._num_running_tasks == 0):
+				self._tasks_finished.notify_all()
+			if (not self._is_shut_down and len(self._idle_workers) < self._max_idle_workers):
+				self._idle_workers.append(worker)
+				return True
+			self._num_live_workers -= 1
+			return False
+
+	# @return <code>true</code> iff the idle worker has been removed from the pool, i.e., it has not been leased in the meantime
+	def _retire_idle_worker(self, worker: "WorkerThreadPool._Worker") -> bool:
+		with self._lock:
+			if (worker not in self._idle_workers):
+				return False
+			self._idle_workers.remove(worker)
+			self._num_live_workers -= 1
+			return True
+
+	# Sets the maximum number of idle workers and terminates the idle workers beyond it.
+	def set_max_idle_workers(self, max_idle_workers: int):
+		if (max_idle_workers < 0):
+			raise ValueError("max_idle_workers is " + str(max_idle_workers) + ", but must not be negative.")
+		with self._lock:
+			self._max_idle_workers = max_idle_workers
+			retired_workers = self._idle_workers[max_idle_workers:]
+			del self._idle_workers[max_idle_workers:]
+			self._num_live_workers -= len(retired_workers)
+		for worker in retired_workers:
+			worker.assign(None)
+
+	def get_max_idle_workers(self) -> int:
+		return self._max_idle_workers
+
+	def get_num_idle_workers(self) -> int:
+		return len(self._idle_workers)
+
+	# @return the number of workers which are running a task or are idle
+	def get_num_live_workers(self) -> int:
+		return self._num_live_workers
+
+	def get_num_running_tasks(self) -> int:
+		return self._num_running_tasks
+
+	# Waits until no task is running anymore.
+	#
+	# @param timeout_in_s
+	#            the maximum time to wait, or <code>None</code> to wait forever
+	# @return <code>true</code> iff no task is running anymore
+	def await_running_tasks(self, timeout_in_s: Optional[float] = None) -> bool:
+		with self._tasks_finished:
+			return self._tasks_finished.wait_for(lambda: self._num_running_tasks == 0, timeout_in_s)
+
+	# @return the number of workers created so far, i.e., the number of leases which could not be served by a warm worker
+	def get_num_created_workers(self) -> int:
+		return self._num_created_workers
+
+	# Terminates all idle workers. Running tasks are not affected, but their workers terminate afterwards.
+	def shutdown(self):
+		with self._lock:
+			self._is_shut_down = True
+			idle_workers = self._idle_workers
+			self._idle_workers = []
+			self._num_live_workers -= len(idle_workers)
+		for worker in idle_workers:
+			worker.assign(None)
+
+WorkerThreadPool.INSTANCE = WorkerThreadPool()
@@ -0,0 +1,72 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+from typing import Set
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.InstantiationPipe import InstantiationPipe
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.pipe.UnsynchedPipe import UnsynchedPipe
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
+from teetime.framework.scheduling.asynciomodel.AsyncioPipe import AsyncioPipe
+
+LOGGER = logging.getLogger("A3PipeInstantiation")
+
+# Automatically instantiates the correct pipes for:@link AsyncioScheduling}:
+# pipes between two active stages become:@link AsyncioPipe}s.
+class A3PipeInstantiation(ITraverserVisitor):
+
+	_scheduler: PipeScheduler
+	_visited_pipes: Set[IPipe]
+
+	def __init__(self, scheduler: PipeScheduler):
+		self._scheduler = scheduler
+		self._visited_pipes = set()
+
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		pipe = port.get_pipe()
+		if (pipe in self._visited_pipes):
+			return Traverser.VisitorBehavior.STOP # NOPMD two returns are better
+		self._visited_pipes.add(pipe)
+
+		self._instantiate_pipe(pipe)
+
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		LOGGER.info("Unconnected port %s in stage %s", port, port.get_owning_stage().get_id())
+
+	def _instantiate_pipe(self, pipe: IPipe):
+		source_stage = pipe.get_source_port().get_owning_stage()
+		target_stage = pipe.get_target_port().get_owning_stage()
+
+		if (not isinstance(pipe, InstantiationPipe)): # if manually connected
+			instantiated_pipe = pipe
+		elif (not target_stage.is_active() or source_stage is target_stage):
+			# normal or reflexive pipe => intra
+			instantiated_pipe = UnsynchedPipe(pipe.get_source_port(), pipe.get_target_port())
+			LOGGER.debug("Connected (unsynch) %s and %s", pipe.get_source_port(), pipe.get_target_port())
+		else:
+			# between two coroutines of the same event loop
+			instantiated_pipe = AsyncioPipe(pipe.get_source_port(), pipe.get_target_port(), pipe.capacity())
+			LOGGER.debug("Connected (asyncio) %s and %s", pipe.get_source_port(), pipe.get_target_port())
+
+		instantiated_pipe.set_scheduler(self._scheduler)
@@ -0,0 +1,238 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+from collections import deque
+from typing import Deque, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractPipe import AbstractPipe
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.signal.ISignal import ISignal
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+
+STAGE_FACADE = StageFacade.INSTANCE
+
+# A pipe between two active stages which are executed as coroutines on the same event loop.
+# Hence, it needs no locks at all.
+# <p>
+# The capacity is enforced depending on how the source stage is executed:
+# <ul>
+# <li>An async stage (see:@link AbstractStage#_execute_async()}) sends by:@link OutputPort#send_async(Object)},
+# which awaits:@link #wait_until_not_full()} before each element or chunk of elements.</li>
+# <li>A blocking stage (see:@link AbstractStage#declare_blocking()}) runs on an executor thread,
+# so that:@link #add(Object)} blocks this thread until the event loop reports free capacity.</li>
+# <li>Any other stage runs on the event loop itself and must not block it.
+# For such a stage, the capacity is a soft bound:
+# the scheduler lets the coroutine of the source stage await:@link #wait_until_not_full()} before the stage is executed again.
+# Hence, a stage which sends many elements per execution should be async.</li>
+# </ul>
+# The coroutine of the target stage is woken up by the scheduler on:@link PipeScheduler#on_element_added(IPipe)}.
+# </p>
+# <p>
+# Appending to and popping from a deque is atomic, so that executor threads may access the pipe as well;
+# waking up coroutines is delegated to the event loop.
+# </p>
+#
+# @param <T>
+#            the type of the elements which this pipe should transfer.
+class AsyncioPipe(AbstractPipe[T]):
+
+	_queue: Deque[T]
+	_capacity: int
+	_signals: Deque[ISignal]
+	_not_full: Optional[asyncio.Future] = None
+	_closed: bool = False
+
+	# @param capacity
+	#            the soft bound of this pipe, or <code>0</code> for an unbounded pipe
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], capacity: int):
+		super().__init__(source_port, target_port)
+		self._queue = deque()
+		self._capacity = capacity if capacity > 0 else -1
+		self._signals = deque()
+
+	def add(self, element: T):
+		if (self.is_full() and not _is_on_event_loop()):
+			self._wait_until_not_full_from_thread()
+		self._queue.append(element)
+		self.get_scheduler().on_element_added(self)
+
+	async def add_async(self, element: T):
+		await self.wait_until_not_full()
+		self._queue.append(element)
+		self.get_scheduler().on_element_added(self)
+
+	def add_non_blocking(self, element: T) -> bool:
+		if (self.is_full()):
+			self.get_scheduler().on_element_not_added(self)
+			return False
+		self.add(element)
+		return True
+
+	def add_all(self, elements: Iterable[T]):
+		if (self._capacity < 0 or _is_on_event_loop()):
+			self._queue.extend(elements)
+			self.get_scheduler().on_element_added(self)
+			return
+		elements = elements if isinstance(elements, list) else list(elements)
+		offset = 0
+		while (offset < len(elements)):
+			if (self.is_full()):
+				self._wait_until_not_full_from_thread()
+			offset = self._add_chunk(elements, offset)
+
+	async def add_all_async(self, elements: Iterable[T]):
+		elements = elements if isinstance(elements, list) else list(elements)
+		offset = 0
+		while (offset < len(elements)):
+			await self.wait_until_not_full()
+			offset = self._add_chunk(elements, offset)
+
+	# Adds as many elements from the given offset on as fit into the free capacity (all if the pipe is closed).
+	#
+	# @return the offset of the first element which has not been added
+	def _add_chunk(self, elements: List[T], offset: int) -> int:
+		end = len(elements)
+		if (self._capacity > 0 and not self._closed):
+			end = min(end, offset + max(1, self._capacity - len(self._queue)))
+		self._queue.extend(elements[offset:end])
+		self.get_scheduler().on_element_added(self)
+		return end
+
+	def remove_last(self) -> Optional[T]:
+		try:
+			element = self._queue.popleft()
+		except IndexError:
+			return None
+		if (self._not_full is not None):
+			self._notify_not_full()
+		return element
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		queue = self._queue
+		count = min(len(queue), max_elements)
+		popleft = queue.popleft
+		for _ in range(count):
+			target.append(popleft())
+		if (self._not_full is not None):
+			self._notify_not_full()
+		return count
+
+	def _notify_not_full(self):
+		not_full = self._not_full
+		if (not_full is not None and not self.is_full()):
+			self._not_full = None
+			_resolve_threadsafe(not_full)
+
+	# Waits until the number of buffered elements has dropped below the capacity or until the pipe has been closed.
+	# May only be awaited on behalf of the source stage.
+	async def wait_until_not_full(self):
+		while (self.is_full() and not self._closed):
+			not_full = asyncio.get_running_loop().create_future()
+			self._not_full = not_full
+			# the target stage may have drained the pipe from an executor thread before it could see the future
+			if (not self.is_full() or self._closed):
+				self._not_full = None
+				return
+			await not_full
+
+	# Blocks the calling executor thread of a blocking source stage until the pipe is not full anymore.
+	def _wait_until_not_full_from_thread(self):
+		coroutine = STAGE_FACADE.get_owning_thread(self._source_port.get_owning_stage())
+		loop = coroutine.get_loop()
+		if (loop is None or loop.is_closed()):
+			return
+		asyncio.run_coroutine_threadsafe(self.wait_until_not_full(), loop).result()
+
+	def is_full(self) -> bool:
+		return len(self._queue) >= self._capacity > 0
+
+	def is_empty(self) -> bool:
+		return not self._queue
+
+	def size(self) -> int:
+		return len(self._queue)
+
+	def capacity(self) -> int:
+		return self._capacity
+
+	def send_signal(self, signal: ISignal):
+		self._signals.append(signal)
+		# wakes up the target stage
+		self.get_scheduler().on_element_added(self)
+
+	# Retrieves and removes the head of the signal queue
+	#
+	# @return Head of signal queue, <code>None</code> if signal queue is empty.
+	def get_signal(self) -> Optional[ISignal]:
+		try:
+			return self._signals.popleft()
+		except IndexError:
+			return None
+
+	# Passes the starting signal to the target stage if it has already arrived.
+	# Preceding validating signals are skipped.
+	#
+	# @return <code>true</code> if the starting signal has been passed, <code>false</code> if it is yet to arrive
+	def try_accept_start_signal(self) -> bool:
+		signal = self.get_signal()
+		while (isinstance(signal, ValidatingSignal)):
+			signal = self.get_signal()
+		if (signal is None):
+			return False
+		if (not isinstance(signal, StartingSignal)):
+			raise Exception( # IllegalStateException
+					"2001 - Expected StartingSignal, but was " + type(signal).__name__ + " in " + self.get_target_port().get_owning_stage().get_id())
+		self._cached_target_stage.on_signal(signal, self.get_target_port())
+		return True
+
+	def wait_for_start_signal(self):
+		# blocking would block the whole event loop
+		raise NotImplementedError("Use try_accept_start_signal() from within the coroutine of the target stage") # UnsupportedOperationException
+
+	def is_closed(self) -> bool:
+		return self._closed
+
+	def close(self):
+		self._closed = True
+		not_full = self._not_full
+		if (not_full is not None):
+			_resolve_threadsafe(not_full)
+
+def _is_on_event_loop() -> bool:
+	try:
+		asyncio.get_running_loop()
+		return True
+	except RuntimeError:
+		return False
+
+def _resolve(future: asyncio.Future):
+	if (not future.done()):
+		future.set_result(None)
+
+# Resolves the given future within its event loop, even if invoked by another thread.
+def _resolve_threadsafe(future: asyncio.Future):
+	loop = future.get_loop()
+	try:
+		on_loop = asyncio.get_running_loop() is loop
+	except RuntimeError:
+		on_loop = False
+	if (on_loop):
+		_resolve(future)
+	elif (not loop.is_closed()):
+		loop.call_soon_threadsafe(_resolve, future)
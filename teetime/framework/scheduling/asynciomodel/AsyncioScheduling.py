@@ -0,0 +1,240 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, List, Optional, Set
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.Configuration import Configuration
+from teetime.framework.ConfigurationFacade import ConfigurationFacade
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.TeeTimeScheduler import TeeTimeScheduler
+from teetime.framework.TerminationStrategy import TerminationStrategy
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.UnsynchedPipe import UnsynchedPipe
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
+from teetime.framework.scheduling.asynciomodel.A3PipeInstantiation import A3PipeInstantiation
+from teetime.framework.scheduling.asynciomodel.TeeTimeCoroutine import TeeTimeCoroutine
+from teetime.framework.scheduling.pushpullmodel.A1ThreadableStageCollector import A1ThreadableStageCollector
+from teetime.framework.scheduling.pushpullmodel.A2InvalidThreadAssignmentCheck import A2InvalidThreadAssignmentCheck
+from teetime.framework.scheduling.pushpullmodel.IntraStageCollector import IntraStageCollector
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+from teetime.framework.validation.AnalysisNotValidException import AnalysisNotValidException
+
+LOGGER = logging.getLogger("AsyncioScheduling")
+
+STAGE_FACADE = StageFacade.INSTANCE
+CONFIG_FACADE = ConfigurationFacade.INSTANCE
+
+# Executes each active stage as a coroutine (see:@link TeeTimeCoroutine}) on one event loop
+# instead of within an own thread.
+# The event loop runs in a single thread which is started on:@link #on_execute()}.
+# <p>
+# Pipes between active stages are instantiated as:@link AsyncioPipe}s.
+# As:@link PipeScheduler}, this scheduler wakes up the coroutine of the target stage whenever an element has been added
+# and lets the coroutine of the source stage await a full pipe before executing the source stage again.
+# </p>
+# <p>
+# I/O-bound stages should either override:@link AbstractStage#_execute_async()}
+# or be declared blocking (see:@link AbstractStage#declare_blocking()}) so that they do not stall the event loop.
+# Blocking stages and the I/O calls of async stages share one bounded executor, which is the default executor of the event loop.
+# Since a blocking stage may occupy an executor thread while it waits for a full pipe,
+# there must be fewer blocking stages than executor threads; the remaining threads serve the short I/O calls.
+# </p>
+# <p>
+# Usage: <code>Execution(configuration, True, AsyncioScheduling(configuration))</code>
+# </p>
+#
+# @since 3.1
+class AsyncioScheduling(TeeTimeScheduler, PipeScheduler):
+
+	_configuration: Configuration
+	_threadable_stages: Set[AbstractStage]
+	_finite_producer_coroutines: List[TeeTimeCoroutine]
+	_infinite_producer_coroutines: List[TeeTimeCoroutine]
+	_consumer_coroutines: List[TeeTimeCoroutine]
+	_tasks: List[asyncio.Task]
+	_loop: Optional[asyncio.AbstractEventLoop] = None
+	_loop_thread: Optional[threading.Thread] = None
+	_executor: Optional[ThreadPoolExecutor] = None
+	_num_blocking_stages: int = 0
+
+	# @param executions_per_yield
+	#            the maximum number of executions of a stage before its coroutine yields to the others
+	# @param max_executor_threads
+	#            the maximum number of threads executing blocking stages and I/O calls;
+	#            by default, the same as for a:@link ThreadPoolExecutor}
+	def __init__(self, configuration: Configuration, executions_per_yield: int = 64, max_executor_threads: Optional[int] = None):
+		self._configuration = configuration
+		self._executions_per_yield = executions_per_yield
+		self._max_executor_threads = max_executor_threads if max_executor_threads is not None else min(32, (os.cpu_count() or 1) + 4)
+		self._threadable_stages = set()
+		self._finite_producer_coroutines = []
+		self._infinite_producer_coroutines = []
+		self._consumer_coroutines = []
+		self._tasks = []
+
+	def on_initialize(self):
+		start_stages = CONFIG_FACADE.get_start_stages(self._configuration)
+		self._initialize(start_stages)
+
+	def _initialize(self, start_stages: Collection[AbstractStage]) -> Set[AbstractStage]:
+		if (not start_stages):
+			raise Exception("The start stage may not be null.") # IllegalStateException
+
+		stage_collector = A1ThreadableStageCollector()
+		traversor = Traverser(stage_collector)
+		for start_stage in start_stages:
+			traversor.traverse(start_stage)
+
+		new_threadable_stages = stage_collector.get_threadable_stages()
+
+		self._threadable_stages.update(new_threadable_stages)
+		if (not self._threadable_stages):
+			raise Exception("1004 - No threadable stages in this configuration.") # IllegalStateException
+
+		checker = A2InvalidThreadAssignmentCheck(new_threadable_stages)
+		checker.check()
+		self._check_num_blocking_stages(new_threadable_stages)
+
+		pipe_visitor = A3PipeInstantiation(self)
+		traversor = Traverser(pipe_visitor)
+		for start_stage in start_stages:
+			traversor.traverse(start_stage)
+
+		for stage in new_threadable_stages:
+			self._set_attributes(stage)
+
+		return new_threadable_stages
+
+	def _check_num_blocking_stages(self, new_threadable_stages: Set[AbstractStage]):
+		num_blocking_stages = self._num_blocking_stages
+		for stage in new_threadable_stages:
+			if (stage.is_blocking() and not stage.is_async()):
+				num_blocking_stages += 1
+		if (num_blocking_stages >= self._max_executor_threads):
+			raise Exception(str(num_blocking_stages) + " blocking stages need at least " + str(num_blocking_stages + 1) # IllegalStateException
+					+ " executor threads, but max_executor_threads is " + str(self._max_executor_threads)
+					+ ". Increase max_executor_threads or let the stages override _execute_async().")
+		self._num_blocking_stages = num_blocking_stages
+
+	def _set_attributes(self, threadable_stage: AbstractStage):
+		collector = IntraStageCollector(threadable_stage)
+		Traverser(collector).traverse(threadable_stage)
+		intra_stages = collector.get_intra_stages()
+
+		coroutine = TeeTimeCoroutine(threadable_stage, "Coroutine for " + threadable_stage.get_id(), self._executions_per_yield)
+		exception_handler = CONFIG_FACADE.get_factory(self._configuration).create_instance(coroutine)
+
+		intra_stages.add(threadable_stage)
+		for stage in intra_stages:
+			STAGE_FACADE.set_owning_thread(stage, coroutine)
+			STAGE_FACADE.set_exception_handler(stage, exception_handler)
+			STAGE_FACADE.set_scheduler(stage, self)
+
+		termination_strategy = STAGE_FACADE.get_termination_strategy(threadable_stage)
+		if (termination_strategy == TerminationStrategy.BY_INTERRUPT):
+			self._infinite_producer_coroutines.append(coroutine)
+		elif (termination_strategy == TerminationStrategy.BY_SELF_DECISION):
+			self._finite_producer_coroutines.append(coroutine)
+		elif (termination_strategy == TerminationStrategy.BY_SIGNAL):
+			self._consumer_coroutines.append(coroutine)
+		else:
+			LOGGER.warning("Unknown termination strategy '%s' in stage %s", termination_strategy, threadable_stage)
+
+	def on_validate(self):
+		for stage in self._threadable_stages:
+			validating_signal = ValidatingSignal() # NOPMD we need a new instance every iteration
+			stage.on_signal(validating_signal, None)
+			if (len(validating_signal.get_invalid_port_connections()) > 0):
+				raise AnalysisNotValidException(validating_signal.get_invalid_port_connections())
+
+	def on_execute(self):
+		for stage in self._threadable_stages:
+			STAGE_FACADE.get_owning_thread(stage).send_starting_signal()
+
+		self._loop = asyncio.new_event_loop()
+		self._executor = ThreadPoolExecutor(max_workers=self._max_executor_threads, thread_name_prefix="AsyncioScheduling-executor")
+		self._loop.set_default_executor(self._executor)
+		self._loop_thread = threading.Thread(target=self._run_loop, name="AsyncioScheduling")
+		self._loop_thread.start()
+
+	def _run_loop(self):
+		asyncio.set_event_loop(self._loop)
+		try:
+			self._loop.run_until_complete(self._run_coroutines())
+		finally:
+			self._loop.close()
+			self._executor.shutdown(wait=True)
+
+	async def _run_coroutines(self):
+		finite_producer_tasks = [self._start_coroutine(c) for c in self._finite_producer_coroutines]
+		for coroutine in self._infinite_producer_coroutines + self._consumer_coroutines:
+			self._start_coroutine(coroutine)
+
+		await asyncio.gather(*finite_producer_tasks, return_exceptions=True)
+
+		if (self._infinite_producer_coroutines):
+			LOGGER.debug("Interrupting infinite producer coroutines...")
+			for coroutine in self._infinite_producer_coroutines:
+				coroutine.interrupt()
+
+		# includes the coroutines of stages started at runtime
+		while (not all(task.done() for task in self._tasks)):
+			await asyncio.gather(*self._tasks, return_exceptions=True)
+
+	def _start_coroutine(self, coroutine: TeeTimeCoroutine) -> asyncio.Task:
+		task = self._loop.create_task(coroutine.run())
+		self._tasks.append(task)
+		return task
+
+	def start_stage_at_runtime(self, new_stage: AbstractStage):
+		new_stage.declare_active()
+		new_threadable_stages = self._initialize([new_stage])
+
+		for stage in new_threadable_stages:
+			coroutine = STAGE_FACADE.get_owning_thread(stage)
+			if (new_stage.is_producer()):
+				validating_signal = ValidatingSignal()
+				new_stage.on_signal(validating_signal, None)
+				if (len(validating_signal.get_invalid_port_connections()) > 0):
+					raise AnalysisNotValidException(validating_signal.get_invalid_port_connections())
+				coroutine.send_starting_signal()
+			self._loop.call_soon_threadsafe(self._start_coroutine, coroutine)
+
+	def on_terminate(self):
+		for stage in list(self._threadable_stages):
+			STAGE_FACADE.abort(stage)
+
+	def on_finish(self):
+		if (self._loop_thread is not None):
+			self._loop_thread.join()
+
+	def on_element_added(self, pipe):
+		if (isinstance(pipe, UnsynchedPipe)):
+			# unsynched pipes execute their target stage directly
+			pipe.get_cached_target_stage().execute_by_framework()
+			return
+
+		STAGE_FACADE.get_owning_thread(pipe.get_cached_target_stage()).wake_up()
+		if (pipe.is_full()):
+			source_stage = pipe.get_source_port().get_owning_stage()
+			STAGE_FACADE.get_owning_thread(source_stage).add_congested_pipe(pipe)
+
+	def on_element_not_added(self, pipe):
+		# do nothing
+		pass
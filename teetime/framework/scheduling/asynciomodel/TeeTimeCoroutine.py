@@ -0,0 +1,216 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import logging
+from typing import List, Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.scheduling.asynciomodel.AsyncioPipe import AsyncioPipe
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
+
+STAGE_FACADE = StageFacade.INSTANCE
+
+# Executes an active stage (together with its passive successors) as a coroutine.
+# It takes the role of the stage's owning thread in:@link AsyncioScheduling}.
+# <p>
+# Between two executions of the stage, the coroutine yields to the event loop.
+# A consumer stage is only executed if one of its input pipes holds an element;
+# otherwise, the coroutine parks until it is woken up by the scheduler.
+# </p>
+# <p>
+# A stage which overrides:@link AbstractStage#_execute_async()} is awaited, so that it can await I/O without blocking the other stages.
+# A stage which has been declared blocking (see:@link AbstractStage#declare_blocking()}) is executed
+# by the bounded executor which:@link AsyncioScheduling} shares among all blocking stages and I/O calls,
+# while the coroutine awaits the execution.
+# Any other stage is executed synchronously on the event loop, i.e., if it blocks, it blocks the whole event loop.
+# </p>
+class TeeTimeCoroutine:
+
+	_TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION = "Terminating coroutine due to the following exception: "
+
+	stage: AbstractStage
+	_name: str
+	_logger: logging.Logger
+	_loop: Optional[asyncio.AbstractEventLoop] = None
+	_wakeup: Optional[asyncio.Future] = None
+	_congested_pipes: List[AsyncioPipe]
+	_started: bool = False
+	_interrupted: bool = False
+
+	# @param executions_per_yield
+	#            the maximum number of executions of the stage before yielding to other coroutines
+	def __init__(self, stage: AbstractStage, name: str, executions_per_yield: int = 64):
+		self.stage = stage
+		self._name = name
+		self._logger = logging.getLogger(type(stage).__name__)
+		self._executions_per_yield = executions_per_yield
+		self._congested_pipes = []
+
+	def get_name(self) -> str:
+		return self._name
+
+	async def run(self):
+		self._loop = asyncio.get_running_loop()
+		stage = self.stage
+		self._logger.debug("Executing coroutine stage...")
+		try:
+			await self._before_stage_execution()
+			try:
+				await self._run_stage()
+			finally:
+				try:
+					# create and pass TERM to all input ports (for both producer and consumer)
+					self._after_stage_execution()
+				finally:
+					self._close_input_pipes()
+		except Exception as e:
+			self._logger.error(self._TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION, exc_info=e)
+			raise
+		self._logger.debug("Finished coroutine stage. (%s)", stage.get_id())
+
+	async def _before_stage_execution(self):
+		if (self.stage.is_producer()):
+			while (not self._started and not self._interrupted):
+				await self._park()
+			self.stage.on_signal(StartingSignal(), None)
+		else:
+			for input_port in STAGE_FACADE.get_input_ports(self.stage):
+				pipe = input_port.get_pipe()
+				while (not pipe.try_accept_start_signal() and not self._interrupted):
+					await self._park()
+
+	async def _run_stage(self):
+		stage = self.stage
+		is_producer = stage.is_producer()
+		if (stage.is_async()):
+			execute = stage.execute_by_framework_async
+		elif (stage.is_blocking()):
+			execute = self._execute_in_executor
+		else:
+			execute = None
+		try:
+			while (not STAGE_FACADE.should_be_terminated(stage)):
+				if (not is_producer):
+					while (not self._has_input() and not STAGE_FACADE.should_be_terminated(stage)):
+						await self._park()
+
+				for _ in range(self._executions_per_yield):
+					if (STAGE_FACADE.should_be_terminated(stage) or not (is_producer or self._has_input())):
+						break
+					if (execute is None):
+						stage.execute_by_framework()
+					else:
+						await execute()
+					if (self._congested_pipes):
+						break
+
+				if (self._congested_pipes):
+					# back pressure
+					for pipe in self._congested_pipes:
+						await pipe.wait_until_not_full()
+					self._congested_pipes.clear()
+				else:
+					await asyncio.sleep(0)
+		except TerminateException:
+			stage.abort()
+			stage.get_scheduler().on_terminate()
+
+	# Executes the stage by the default executor of the event loop, i.e., by the shared executor of the scheduler.
+	# The executions of the stage never overlap since the coroutine awaits each of them.
+	async def _execute_in_executor(self):
+		await self._loop.run_in_executor(None, self.stage.execute_by_framework)
+
+	# @return the event loop which runs this coroutine, or <code>None</code> if it has not been started yet
+	def get_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+		return self._loop
+
+	# @return <code>true</code> iff the caller runs on the event loop of this coroutine
+	def is_on_event_loop(self) -> bool:
+		try:
+			return asyncio.get_running_loop() is self._loop
+		except RuntimeError:
+			return False
+
+	def _after_stage_execution(self):
+		signal = TerminatingSignal()
+		if (self.stage.is_producer()):
+			self.stage.on_signal(signal, None)
+		else:
+			for input_port in STAGE_FACADE.get_input_ports(self.stage):
+				self.stage.on_signal(signal, input_port)
+
+	# Releases the producers which await free capacity in a pipe which is not drained anymore,
+	# e.g., if the stage has been aborted due to an exception.
+	def _close_input_pipes(self):
+		for input_port in STAGE_FACADE.get_input_ports(self.stage):
+			pipe = input_port.get_pipe()
+			if (isinstance(pipe, AsyncioPipe) and not pipe.is_closed()):
+				pipe.close()
+
+	def _has_input(self) -> bool:
+		for input_port in STAGE_FACADE.get_input_ports(self.stage):
+			if (not input_port.get_pipe().is_empty()):
+				return True
+		return False
+
+	async def _park(self):
+		self._wakeup = self._loop.create_future()
+		try:
+			await self._wakeup
+		finally:
+			self._wakeup = None
+
+	# Wakes up this coroutine if it is parked.
+	def wake_up(self):
+		if (not self.is_on_event_loop()):
+			# e.g., by the executor thread of a blocking stage
+			self._wake_up_threadsafe()
+			return
+		wakeup = self._wakeup
+		if (wakeup is not None and not wakeup.done()):
+			wakeup.set_result(None)
+
+	# Lets this coroutine await the given pipe before the stage is executed again.
+	def add_congested_pipe(self, pipe: AsyncioPipe):
+		if (not self.is_on_event_loop()):
+			# runs before the awaiting coroutine resumes since the executor completes its future by the same mechanism
+			self._loop.call_soon_threadsafe(self.add_congested_pipe, pipe)
+			return
+		if (pipe not in self._congested_pipes):
+			self._congested_pipes.append(pipe)
+
+	# This method is thread-safe.
+	def send_starting_signal(self):
+		self._started = True
+		self._wake_up_threadsafe()
+
+	# Aborts the hosted stage and wakes up this coroutine. This method is thread-safe.
+	def interrupt(self):
+		# aborting a stage interrupts its owning coroutine in turn
+		if (self._interrupted):
+			return
+		self._interrupted = True
+		STAGE_FACADE.abort(self.stage)
+		self._wake_up_threadsafe()
+
+	def _wake_up_threadsafe(self):
+		loop = self._loop
+		if (loop is not None and not loop.is_closed()):
+			loop.call_soon_threadsafe(self.wake_up)
+
+	def __str__(self) -> str:
+		return self._name
@@ -11,40 +11,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
+from typing import Set
 
-import java.util.HashSet
-import java.util.Set
-
-import teetime.framework.*
-import teetime.framework.pipe.DummyPipe
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.StageState import StageState
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
 
 # Visits stages which are in the state:@link teetime.framework.StageState#CREATED}.
-class A1CreatedStageCollector implements ITraverserVisitor:
+class A1CreatedStageCollector(ITraverserVisitor):
 
-	private final Set<AbstractStage> stages = new HashSet<AbstractStage>()
+	_stages: Set[AbstractStage]
 
-	public Set<AbstractStage> getStages():
-		return self.stages
-	}
+	def __init__(self):
+		self._stages = set()
 
-	@Override
-	public Traverser.VisitorBehavior visit(final AbstractStage stage):
-		if (!stages.contains(stage) && stage.getCurrentState() == StageState.CREATED):
-			stages.add(stage)
-		}
-		// visitor termination condition: stop if the stage already runs or has been terminated
-		return stage.getCurrentState() == StageState.CREATED ? Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH : Traverser.VisitorBehavior.STOP
-	}
+	def get_stages(self) -> Set[AbstractStage]:
+		return self._stages
 
-	@Override
-	public Traverser.VisitorBehavior visit(final AbstractPort<?> port):
-		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		if (stage not in self._stages and stage.get_current_state() == StageState.CREATED):
+			self._stages.add(stage)
+		# visitor termination condition: stop if the stage already runs or has been terminated
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH if stage.get_current_state() == StageState.CREATED else Traverser.VisitorBehavior.STOP
 
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		// do nothing
-	}
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
 
-}
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		# do nothing
+		pass
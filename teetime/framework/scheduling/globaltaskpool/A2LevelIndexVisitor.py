@@ -11,48 +11,38 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
 
-import teetime.framework.AbstractPort
-import teetime.framework.AbstractStage
-import teetime.framework.ITraverserVisitor
-import teetime.framework.StageFacade
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.DummyPipe
+STAGE_FACADE = StageFacade.INSTANCE
 
-class A2LevelIndexVisitor implements ITraverserVisitor:
+class A2LevelIndexVisitor(ITraverserVisitor):
 
-	private static final StageFacade STAGE_FACADE = StageFacade.INSTANCE
+	_max_level_index: int = 0
 
-	private int maxLevelIndex
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_FORWARD
 
-	@Override
-	public VisitorBehavior visit(final AbstractStage stage):
-		return VisitorBehavior.CONTINUE_FORWARD
-	}
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		source_stage = port.get_owning_stage()
+		target_stage = port.get_pipe().get_target_port().get_owning_stage()
 
-	@Override
-	public VisitorBehavior visit(final AbstractPort<?> port):
-		AbstractStage sourceStage = port.getOwningStage()
-		AbstractStage targetStage = port.getPipe().getTargetPort().getOwningStage()
+		target_level_index = STAGE_FACADE.get_level_index(target_stage)
+		source_level_index = STAGE_FACADE.get_level_index(source_stage)
+		level_index = max(target_level_index, source_level_index + 1)
+		STAGE_FACADE.set_level_index(target_stage, level_index)
 
-		int targetLevelIndex = STAGE_FACADE.getLevelIndex(targetStage)
-		int sourceLevelIndex = STAGE_FACADE.getLevelIndex(sourceStage)
-		int levelIndex = Math.max(targetLevelIndex, sourceLevelIndex + 1)
-		STAGE_FACADE.setLevelIndex(targetStage, levelIndex)
+		self._max_level_index = max(self._max_level_index, level_index)
 
-		maxLevelIndex = Math.max(maxLevelIndex, levelIndex)
+		return Traverser.VisitorBehavior.CONTINUE_FORWARD
 
-		return VisitorBehavior.CONTINUE_FORWARD
-	}
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		# do nothing
+		pass
 
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		// do nothing
-	}
-
-	public int getMaxLevelIndex():
-		return maxLevelIndex
-	}
-
-}
+	def get_max_level_index(self) -> int:
+		return self._max_level_index
@@ -11,66 +11,53 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
+import logging
+from typing import Set
 
-import java.util.HashSet
-import java.util.Set
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.InstantiationPipe import InstantiationPipe
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
+from teetime.framework.scheduling.globaltaskpool.BoundedMpMcSynchedPipe import BoundedMpMcSynchedPipe
 
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
-
-import teetime.framework.*
-import teetime.framework.pipe.DummyPipe
-import teetime.framework.pipe.IPipe
-import teetime.framework.scheduling.PipeScheduler
+LOGGER = logging.getLogger("A3PipeInstantiation")
 
 # Created by nilsziermann on 30.12.16.
-class A3PipeInstantiation implements ITraverserVisitor:
-
-	private static final Logger LOGGER = LoggerFactory.getLogger(A3PipeInstantiation.class)
-
-	private final Set<IPipe<?>> visitedPipes = new HashSet<IPipe<?>>()
+class A3PipeInstantiation(ITraverserVisitor):
 
-	private final PipeScheduler scheduler
-	private final int requestedCapcity
+	_visited_pipes: Set[IPipe]
+	_scheduler: PipeScheduler
+	_requested_capcity: int
 
-	public A3PipeInstantiation(final PipeScheduler scheduler, final int requestedCapcity):
-		self.scheduler = scheduler
-		self.requestedCapcity = requestedCapcity
-	}
+	def __init__(self, scheduler: PipeScheduler, requested_capcity: int):
+		self._visited_pipes = set()
+		self._scheduler = scheduler
+		self._requested_capcity = requested_capcity
 
-	@Override
-	public Traverser.VisitorBehavior visit(final AbstractStage stage):
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
 		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
 
-	@Override
-	public Traverser.VisitorBehavior visit(final AbstractPort<?> port):
-		IPipe<?> pipe = port.getPipe()
-		if (visitedPipes.contains(pipe)):
-			return Traverser.VisitorBehavior.STOP // NOPMD two returns are better
-		}
-		visitedPipes.add(pipe)
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		pipe = port.get_pipe()
+		if (pipe in self._visited_pipes):
+			return Traverser.VisitorBehavior.STOP # NOPMD two returns are better
+		self._visited_pipes.add(pipe)
 
-		instantiatePipe(pipe)
+		self._instantiate_pipe(pipe)
 
 		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
 
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		if (LOGGER.isInfoEnabled()):
-			LOGGER.info("Unconnected port " + port + " in stage " + port.getOwningStage().getId())
-		}
-	}
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		LOGGER.info("Unconnected port %s in stage %s", port, port.get_owning_stage().get_id())
 
-	private <T> void instantiatePipe(final IPipe<T> pipe):
-		if (!(pipe instanceof InstantiationPipe)): // if manually connected
+	def _instantiate_pipe(self, pipe: IPipe):
+		if (not isinstance(pipe, InstantiationPipe)): # if manually connected
 			return
-		}
 
-		BoundedMpMcSynchedPipe<T> synchedPipe = new BoundedMpMcSynchedPipe<T>(pipe.getSourcePort(), pipe.getTargetPort(), requestedCapcity)
-		synchedPipe.setScheduler(scheduler)
-		LOGGER.debug("Connected (bounded MpMc):} and:}", pipe.getSourcePort(), pipe.getTargetPort())
-	}
-}
+		synched_pipe = BoundedMpMcSynchedPipe(pipe.get_source_port(), pipe.get_target_port(), self._requested_capcity)
+		synched_pipe.set_scheduler(self._scheduler)
+		LOGGER.debug("Connected (bounded MpMc) %s and %s", pipe.get_source_port(), pipe.get_target_port())
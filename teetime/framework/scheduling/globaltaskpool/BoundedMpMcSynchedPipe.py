@@ -11,15 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
+from typing import Iterable, List, Optional, TypeVar
 
-import org.jctools.queues.MpmcArrayQueue
+T = TypeVar("T")
 
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.framework.pipe.AbstractSynchedPipe
-import teetime.framework.pipe.IMonitorablePipe
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.AbstractSynchedPipe import AbstractSynchedPipe
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.util.framework.concurrent.queue.SpscArrayQueue import SpscArrayQueue
 
+#
+# Although the source and the target stage of this pipe may be executed by different threads over time,
+# each of them is executed by at most one thread at once.
+# Hence, there is at most one producer and at most one consumer at each moment in time
+# so that a:@link SpscArrayQueue} suffices.
 #
 # @author Christian Wulf (chw)
 #
@@ -27,84 +33,65 @@ import teetime.framework.pipe.IMonitorablePipe
 #            the permitted type of the elements
 #
 # @since 3.0
-class BoundedMpMcSynchedPipe<T> extends AbstractSynchedPipe<T> implements IMonitorablePipe:
-
-	private final MpmcArrayQueue<Object> queue
-
-	private transient long lastProducerIndex, lastConsumerIndex
-
-	public BoundedMpMcSynchedPipe(final OutputPort<? extends T> sourcePort, final InputPort<T> targetPort, final int requestedCapacity):
-		super(sourcePort, targetPort)
-		self.queue = new MpmcArrayQueue<Object>(requestedCapacity)
-	}
-
-	@Override
-	public void add(final Object element):
-		while (!self.queue.offer(element)):
-			getScheduler().onElementNotAdded(this)
-		}
-		getScheduler().onElementAdded(this)
-	}
-
-	@Override
-	public boolean addNonBlocking(final Object element):
-		return self.queue.offer(element)
-	}
-
-	@Override
-	public boolean isEmpty():
-		return self.queue.isEmpty()
-	}
-
-	@Override
-	public int size():
-		return self.queue.size()
-	}
-
-	@Override
-	public Object removeLast():
-		return self.queue.poll()
-	}
-
-	@Override
-	public int capacity():
-		return self.queue.capacity()
-	}
-
-	@Override
-	public long getNumPushesSinceAppStart():
-		return queue.currentProducerIndex()
-	}
-
-	@Override
-	public long getNumPullsSinceAppStart():
-		return queue.currentConsumerIndex()
-	}
-
-	@Override
-	public long getPushThroughput():
-		throw new UnsupportedOperationException("we use get/setLastProducerIndex instead")
-	}
-
-	@Override
-	public long getPullThroughput():
-		final long currentConsumerIndex = getNumPullsSinceAppStart()
-		long diff = currentConsumerIndex - lastConsumerIndex
-		lastConsumerIndex = currentConsumerIndex
+class BoundedMpMcSynchedPipe(AbstractSynchedPipe[T], IMonitorablePipe):
+
+	_queue: SpscArrayQueue
+
+	_last_producer_index: int = 0
+	_last_consumer_index: int = 0
+
+	def __init__(self, source_port: OutputPort, target_port: InputPort[T], requested_capacity: int):
+		super().__init__(source_port, target_port)
+		self._queue = SpscArrayQueue(requested_capacity)
+
+	def add(self, element: T):
+		while (not self._queue.offer(element)):
+			self.get_scheduler().on_element_not_added(self)
+		self.get_scheduler().on_element_added(self)
+
+	def add_non_blocking(self, element: T) -> bool:
+		return self._queue.offer(element)
+
+	def add_all(self, elements: Iterable[T]):
+		# the scheduler decides per element whether to schedule the target stage
+		for element in elements:
+			self.add(element)
+
+	def is_empty(self) -> bool:
+		return self._queue.is_empty()
+
+	def size(self) -> int:
+		return self._queue.size()
+
+	def remove_last(self) -> Optional[T]:
+		return self._queue.poll()
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		return self._queue.drain_to(target, max_elements)
+
+	def capacity(self) -> int:
+		return self._queue.capacity()
+
+	def get_num_pushes_since_app_start(self) -> int:
+		return self._queue.current_producer_index()
+
+	def get_num_pulls_since_app_start(self) -> int:
+		return self._queue.current_consumer_index()
+
+	def get_push_throughput(self) -> int:
+		raise NotImplementedError("we use get/set_last_producer_index instead") # UnsupportedOperationException
+
+	def get_pull_throughput(self) -> int:
+		current_consumer_index = self.get_num_pulls_since_app_start()
+		diff = current_consumer_index - self._last_consumer_index
+		self._last_consumer_index = current_consumer_index
 		return diff
-	}
 
-	public long getLastProducerIndex():
-		return lastProducerIndex
-	}
+	def get_last_producer_index(self) -> int:
+		return self._last_producer_index
 
-	public void setLastProducerIndex(final long lastProducerIndex):
-		self.lastProducerIndex = lastProducerIndex
-	}
+	def set_last_producer_index(self, last_producer_index: int):
+		self._last_producer_index = last_producer_index
 
-	@Override
-	public int getNumWaits():
+	def get_num_waits(self) -> int:
 		return 0
-	}
-
-}
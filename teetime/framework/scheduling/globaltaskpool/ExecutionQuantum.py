@@ -0,0 +1,107 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+
+# Determines how often a thread executes a stage per task (the quantum) in:@link GlobalTaskPoolScheduling}.
+# <p>
+# Without a target time slice, the quantum is fixed to <code>max_num_of_executions</code> for each stage.
+# Otherwise, the quantum adapts per stage:
+# it is the largest power of two whose expected duration does not exceed the target time slice,
+# based on an exponentially weighted moving average of the measured execution time per call.
+# A cheap stage is thus executed many times per task, an expensive stage only once.
+# </p>
+# <p>
+# The measurements of a stage are only recorded by the thread which currently executes this stage.
+# Hence, no lock is required.
+# </p>
+class ExecutionQuantum:
+
+	# weight of the most recent measurement in the moving average
+	SMOOTHING_FACTOR = 0.25
+
+	_max_num_of_executions: int
+	_target_time_slice_in_ns: Optional[int]
+	# stage -> [quantum, mean execution time per call in ns, total number of executions]
+	_statistics: Dict[AbstractStage, List]
+
+	# @param max_num_of_executions
+	#            the upper bound of each quantum; a power of two
+	# @param target_time_slice_in_ns
+	#            the time a thread should spend per task, or <code>None</code> for a fixed quantum
+	def __init__(self, max_num_of_executions: int, target_time_slice_in_ns: Optional[int] = None):
+		if (target_time_slice_in_ns is not None and target_time_slice_in_ns <= 0):
+			raise ValueError("target_time_slice_in_ns is " + str(target_time_slice_in_ns) + ", but must have a positive value.")
+		self._max_num_of_executions = max_num_of_executions
+		self._target_time_slice_in_ns = target_time_slice_in_ns
+		self._statistics = dict()
+
+	def is_adaptive(self) -> bool:
+		return self._target_time_slice_in_ns is not None
+
+	def _get_statistics(self, stage: AbstractStage) -> List:
+		statistics = self._statistics.get(stage)
+		if (statistics is None):
+			# start with a single execution until the first measurement is available
+			initial_quantum = 1 if self.is_adaptive() else self._max_num_of_executions
+			statistics = self._statistics.setdefault(stage, [initial_quantum, 0.0, 0])
+		return statistics
+
+	# @return the number of executions of the given stage per task
+	def get_num_of_executions(self, stage: AbstractStage) -> int:
+		return self._get_statistics(stage)[0]
+
+	# Records a task and adapts the quantum of the given stage.
+	#
+	# @param num_of_executions
+	#            the number of executions within the task which consumed an element
+	# @param duration_in_ns
+	#            the duration of the task
+	def record(self, stage: AbstractStage, num_of_executions: int, duration_in_ns: int):
+		if (num_of_executions <= 0):
+			return
+		statistics = self._get_statistics(stage)
+		execution_time_in_ns = duration_in_ns / num_of_executions
+		if (statistics[2] == 0):
+			statistics[1] = execution_time_in_ns
+		else:
+			statistics[1] += self.SMOOTHING_FACTOR * (execution_time_in_ns - statistics[1])
+		statistics[2] += num_of_executions
+
+		if (self.is_adaptive()):
+			statistics[0] = self._compute_quantum(statistics[1])
+
+	def _compute_quantum(self, mean_execution_time_in_ns: float) -> int:
+		if (mean_execution_time_in_ns <= 0):
+			return self._max_num_of_executions
+		num_fitting_executions = int(self._target_time_slice_in_ns / mean_execution_time_in_ns)
+		if (num_fitting_executions <= 1):
+			return 1
+		# round down to a power of two
+		return min(1 << (num_fitting_executions.bit_length() - 1), self._max_num_of_executions)
+
+	# @return the moving average of the execution time per call in nanoseconds, or <code>0</code> if not yet measured
+	def get_mean_execution_time_in_ns(self, stage: AbstractStage) -> float:
+		return self._get_statistics(stage)[1]
+
+	# @return the number of executions of the given stage recorded so far
+	def get_total_num_of_executions(self, stage: AbstractStage) -> int:
+		return self._get_statistics(stage)[2]
+
+	def get_max_num_of_executions(self) -> int:
+		return self._max_num_of_executions
+
+	def get_target_time_slice_in_ns(self) -> Optional[int]:
+		return self._target_time_slice_in_ns
@@ -11,29 +11,42 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
-
-import java.lang.Thread.UncaughtExceptionHandler
-import java.util.*
-import java.util.concurrent.ConcurrentHashMap
-
-import org.jctools.util.Pow2
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
-
-import teetime.framework.*
-import teetime.framework.exceptionHandling.AbstractExceptionListener
-import teetime.framework.exceptionHandling.AbstractExceptionListenerFactory
-import teetime.framework.pipe.AbstractSynchedPipe
-import teetime.framework.pipe.AbstractUnsynchedPipe
-import teetime.framework.scheduling.CountDownAndUpLatch
-import teetime.framework.scheduling.PipeScheduler
-import teetime.framework.signal.StartingSignal
-import teetime.framework.signal.ValidatingSignal
-import teetime.framework.validation.AnalysisNotValidException
-
-# This scheduling approach maintains a global, synchronized, prioritized task pool whose tasks are stages.
+import logging
+import threading
+from typing import Collection, Dict, List, Optional, Set
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.CompiledConfiguration import CompiledConfiguration
+from teetime.framework.Configuration import Configuration
+from teetime.framework.ConfigurationFacade import ConfigurationFacade
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.TeeTimeScheduler import TeeTimeScheduler
+from teetime.framework.TerminationStrategy import TerminationStrategy
+from teetime.framework.Traverser import Traverser
+from teetime.framework.scheduling.CountDownAndUpLatch import CountDownAndUpLatch
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
+from teetime.framework.scheduling.PooledThread import PooledThread
+from teetime.framework.scheduling.StartupPipeline import StartupPipeline
+from teetime.framework.scheduling.WorkerThreadPool import WorkerThreadPool
+from teetime.framework.scheduling.globaltaskpool.A1CreatedStageCollector import A1CreatedStageCollector
+from teetime.framework.scheduling.globaltaskpool.A2LevelIndexVisitor import A2LevelIndexVisitor
+from teetime.framework.scheduling.globaltaskpool.A3PipeInstantiation import A3PipeInstantiation
+from teetime.framework.scheduling.globaltaskpool.BoundedMpMcSynchedPipe import BoundedMpMcSynchedPipe
+from teetime.framework.scheduling.globaltaskpool.ExecutionQuantum import ExecutionQuantum
+from teetime.framework.scheduling.globaltaskpool.TeeTimeTaskQueueThreadChw import TeeTimeTaskQueueThreadChw
+from teetime.framework.scheduling.globaltaskpool.WorkStealingTaskPool import WorkStealingTaskPool
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+from teetime.framework.validation.AnalysisNotValidException import AnalysisNotValidException
+from teetime.util.framework.concurrent.queue.SpscArrayQueue import round_to_power_of_two
+
+LOGGER = logging.getLogger("GlobalTaskPoolScheduling")
+STAGE_FACADE = StageFacade.INSTANCE
+CONFIG_FACADE = ConfigurationFacade.INSTANCE
+
+# This scheduling approach maintains a prioritized task pool whose tasks are stages.
 # Multiple threads access this task pool concurrently.
+# Each thread owns a local part of the pool and steals from the other parts if its own part is empty (see:@link WorkStealingTaskPool}).
 # At each moment in time, a particular stage is executed only by at most one thread.
 # Thus, a stage in combination with the task data structure acts as a lock for executing that stage.
 #
@@ -41,390 +54,399 @@ import teetime.framework.validation.AnalysisNotValidException
 #
 # @since 3.0
 #
-public class GlobalTaskPoolScheduling implements TeeTimeScheduler, PipeScheduler, UncaughtExceptionHandler:
+class GlobalTaskPoolScheduling(TeeTimeScheduler, PipeScheduler):
 
-	private static final Logger LOGGER = LoggerFactory.getLogger(GlobalTaskPoolScheduling.class)
-	private static final StageFacade STAGE_FACADE = StageFacade.INSTANCE
-	private static final ConfigurationFacade CONFIG_FACADE = ConfigurationFacade.INSTANCE
-	private static final int DEFAULT_NUM_OF_EXECUTIONS = 1
+	DEFAULT_NUM_OF_EXECUTIONS = 1
+	DEFAULT_BACKUP_IDLE_TIMEOUT_IN_S = 1.0
 
-	private final List<AbstractStage> finiteProducerStages = Collections.synchronizedList(new LinkedList<AbstractStage>())
-	private final Set<AbstractStage> frontStages = ConcurrentHashMap.newKeySet()
+	_finite_producer_stages: List[AbstractStage]
+	_front_stages: Set[AbstractStage]
 
-	# Holds all stages which should be executed next. A stage instance can occur more than once in this pool.
+	# Holds all stages which should be executed next.
 	# <br>
 	# <i>(synchronized pool)</i>
-	private PrioritizedTaskPool taskPool
-	private final int numThreads
-	private final int actualNumOfExecutions
-	private final int numOfExecutionsMask
-	private final Configuration configuration
-	private final List<TeeTimeTaskQueueThreadChw> regularThreads = new ArrayList<>()
-	private final CountDownAndUpLatch numRunningStages = new CountDownAndUpLatch()
-	private final List<TeeTimeTaskQueueThreadChw> backupThreads = Collections.synchronizedList(new ArrayList<>())
-	private Set<AbstractStage> allStages
-
-	# A thread executes a stage:@value #DEFAULT_NUM_OF_EXECUTIONS}x per job.
-	#
-	# @param numThreads
-	# @param configuration
-	public GlobalTaskPoolScheduling(final int numThreads, final Configuration configuration):
-		this(numThreads, configuration, DEFAULT_NUM_OF_EXECUTIONS)
-	}
-
-	# @param numThreads
+	_task_pool: WorkStealingTaskPool
+	_num_threads: int
+	_actual_num_of_executions: int
+	_num_of_executions_mask: int
+	_configuration: Configuration
+	_execution_quantum: ExecutionQuantum
+	_regular_threads: List[TeeTimeTaskQueueThreadChw]
+	_num_running_stages: CountDownAndUpLatch
+	# the idle backup threads
+	_backup_threads: List[TeeTimeTaskQueueThreadChw]
+	_backup_threads_lock: threading.Lock
+	# the backup threads which have not been retired so far
+	_live_backup_threads: List[TeeTimeTaskQueueThreadChw]
+	_free_backup_worker_indices: List[int]
+	_backup_idle_timeout_in_s: float
+	_num_created_backup_threads: int = 0
+	_backup_threads_high_water_mark: int = 0
+	_all_stages: Set[AbstractStage]
+	# marks each stage which is currently being executed (or paused) by a thread
+	_running_markers: Dict[AbstractStage, threading.Lock]
+	_startup_pipeline: StartupPipeline
+	_worker_pool: Optional[WorkerThreadPool]
+
+	# @param num_threads
 	#            the number of threads to use for executing the given P&ampF configuration
 	# @param configuration
 	#            the configuration to execute/schedule
-	# @param numOfExecutions
+	# @param num_of_executions
 	#            the number of execution per scheduled stage (task) for a thread. Is rounded up to the next power of 2, i.e., <code>1,2,4,16,...</code>
-	public GlobalTaskPoolScheduling(final int numThreads, final Configuration configuration, final int numOfExecutions):
-		self.numThreads = numThreads
-		self.configuration = configuration
-		if (numOfExecutions <= 0):
-			throw new IllegalArgumentException("numOfExecutions is " + numOfExecutions + ", but must have a positive value.")
-		}
-		int actualNumOfExecutions = Pow2.roundToPowerOfTwo(numOfExecutions)
-		self.actualNumOfExecutions = actualNumOfExecutions
-		self.numOfExecutionsMask = actualNumOfExecutions - 1
-	}
-
-	// 1. initializeServices
-	// 2. validateServices
-	// 3. executeConfiguration
-	// (4. abortConfigurationRun)
-	// 5. waitForConfigurationToTerminate
-
-	@Override
-	public void onInitialize():
-		Collection<AbstractStage> startStages = CONFIG_FACADE.getStartStages(configuration)
-		initialize(startStages)
-
-		initializeThreads(numThreads, regularThreads, "regular")
-		// We need at most n-1 backup threads.
-		// Consider the situation where all consumers are slower than their producers.
-		// Then, all stages but sinks are paused.
-		// For each of these paused stage, the scheduler requires a backup thread.
-		initializeThreads(allStages.size() - 1, backupThreads, "backup")
-	}
-
-	private void initializeThreads(final int size, final List<TeeTimeTaskQueueThreadChw> threads, final String threadNameSuffix):
-		final AbstractExceptionListenerFactory<?> factory = ConfigurationFacade.INSTANCE.getFactory(configuration)
-
-		for (int i = 0 i < size i++):
-			TeeTimeTaskQueueThreadChw backupThread = new TeeTimeTaskQueueThreadChw(this, actualNumOfExecutions)
-			backupThread.setName(backupThread.getName() + "-" + threadNameSuffix)
-			AbstractExceptionListener listener = factory.createInstance(backupThread)
-			backupThread.setExceptionListener(listener)
-			backupThread.setUncaughtExceptionHandler(this)
-			backupThread.start()
-
-			threads.add(backupThread)
-		}
-	}
-
-	private void initialize(final Collection<AbstractStage> startStages):
-		// TODO: Add port type validation again.
-		if (startStages.isEmpty()):
-			throw new IllegalStateException("No start stages passed. You need to pass at least one start stage.")
-		}
-
-		A1CreatedStageCollector stageCollector = new A1CreatedStageCollector()
-		Traverser traversor = new Traverser(stageCollector)
-		for (AbstractStage startStage : startStages):
-			traversor.traverse(startStage)
-		}
-
-		allStages = stageCollector.getStages()
-
-		for (AbstractStage stage : allStages):
-			categorizeStage(stage)
-			setScheduler(stage)
-		}
-
-		if (finiteProducerStages.isEmpty()):
-			throw new IllegalStateException("1004 - No producer stages in this configuration.")
-		}
-
-		// (re-)compute level index for each stage
-		A2LevelIndexVisitor levelIndexVisitor = new A2LevelIndexVisitor()
-		traversor = new Traverser(levelIndexVisitor)
-		for (AbstractStage startStage : finiteProducerStages):
-			traversor.traverse(startStage)
-		}
-
-		final int capacity = numRunningStages.getCurrentCount()
-		taskPool = new PrioritizedTaskPool(levelIndexVisitor.getMaxLevelIndex() + 1, capacity)
-		taskPool.scheduleStages(frontStages)
-
-		// instantiate pipes
-		int requestPipeCapcity = actualNumOfExecutions# 128 // with additional buffer factor
-		A3PipeInstantiation pipeVisitor = new A3PipeInstantiation(this, requestPipeCapcity)
-		traversor = new Traverser(pipeVisitor)
-		for (AbstractStage startStage : startStages):
-			traversor.traverse(startStage)
-		}
-	}
-
-	private void categorizeStage(final AbstractStage stage):
-		switch (STAGE_FACADE.getTerminationStrategy(stage)):
-		case BY_INTERRUPT:
-			throw new IllegalStateException("Infinite producers are not supported by this scheduling strategy.")
-		case BY_SELF_DECISION:
-			finiteProducerStages.add(stage)
-			frontStages.add(stage)
-			numRunningStages.countUp()
-			break
-		case BY_SIGNAL:
-			numRunningStages.countUp()
-			break
-		default:
-			LOGGER.warn("Unknown termination strategy '{}' in stage:}", STAGE_FACADE.getTerminationStrategy(stage), stage)
-			break
-		}
-	}
-
-	@Override
-	public void onValidate():
-		// // BETTER validate concurrently
-		final ValidatingSignal signal = new ValidatingSignal()
-		SignalVisitor signalVisitor = new SignalVisitor(signal)
-		BreadthFirstTraverser traversor = new BreadthFirstTraverser()
-
-		synchronized (frontStages):
-			for (AbstractStage stage : frontStages):
-				traversor.traverse(stage, signalVisitor)
-
-				if (signal.getInvalidPortConnections().size() > 0):
-					throw new AnalysisNotValidException(signal.getInvalidPortConnections())
-				}
-			}
-		}
-	}
-
-	@Override
-	public void onExecute():
-		final StartingSignal signal = new StartingSignal()
-		SignalVisitor signalVisitor = new SignalVisitor(signal)
-		BreadthFirstTraverser traversor = new BreadthFirstTraverser()
-
-		synchronized (frontStages):
-			for (AbstractStage stage : frontStages):
-				traversor.traverse(stage, signalVisitor)
-			}
-		}
-
-		// TODO move before onExecute so that starting the threads does not count to the execution time #350
-		for (TeeTimeTaskQueueThreadChw thread : regularThreads):
+	#            If a target time slice is given, it is the upper bound of the adaptive number of executions.
+	# @param target_time_slice_in_ns
+	#            the time a thread should spend per task. If given, the number of executions adapts per stage (see:@link ExecutionQuantum}).
+	# @param worker_pool
+	#            to lease the threads from. Defaults to the process-wide:@link WorkerThreadPool#INSTANCE}.
+	# @param backup_idle_timeout_in_s
+	#            the time after which an idle backup thread terminates
+	def __init__(self, num_threads: int, configuration: Configuration, num_of_executions: int = DEFAULT_NUM_OF_EXECUTIONS,
+			target_time_slice_in_ns: Optional[int] = None, worker_pool: Optional[WorkerThreadPool] = None,
+			backup_idle_timeout_in_s: float = DEFAULT_BACKUP_IDLE_TIMEOUT_IN_S):
+		self._num_threads = num_threads
+		self._worker_pool = worker_pool
+		self._configuration = configuration
+		if (num_of_executions <= 0):
+			raise ValueError("numOfExecutions is " + str(num_of_executions) + ", but must have a positive value.")
+		actual_num_of_executions = round_to_power_of_two(num_of_executions)
+		self._actual_num_of_executions = actual_num_of_executions
+		self._num_of_executions_mask = actual_num_of_executions - 1
+		self._execution_quantum = ExecutionQuantum(actual_num_of_executions, target_time_slice_in_ns)
+		self._finite_producer_stages = []
+		self._front_stages = set()
+		self._front_stages_lock = threading.RLock()
+		self._regular_threads = []
+		self._num_running_stages = CountDownAndUpLatch()
+		self._backup_threads = []
+		self._backup_threads_lock = threading.Lock()
+		self._live_backup_threads = []
+		self._free_backup_worker_indices = []
+		self._backup_idle_timeout_in_s = backup_idle_timeout_in_s
+		self._all_stages = set()
+		self._running_markers = dict()
+		self._startup_pipeline = StartupPipeline()
+
+	# 1. initializeServices
+	# 2. validateServices
+	# 3. executeConfiguration
+	# (4. abortConfigurationRun)
+	# 5. waitForConfigurationToTerminate
+
+	def on_initialize(self):
+		start_stages = CONFIG_FACADE.get_start_stages(self._configuration)
+		self._initialize(start_stages, CONFIG_FACADE.get_compiled_topology(self._configuration))
+
+		self._initialize_threads(0, self._num_threads, self._regular_threads, "regular")
+		# Backup threads are created on demand (see:@link #_yield_stage}).
+
+	def _get_num_workers(self) -> int:
+		return self._num_threads + max(0, len(self._all_stages) - 1)
+
+	def _initialize_threads(self, first_worker_index: int, size: int, threads: List[TeeTimeTaskQueueThreadChw], thread_name_suffix: str):
+		for i in range(size):
+			thread = self._create_thread(first_worker_index + i, thread_name_suffix)
+			thread.start()
+
+			threads.append(thread)
+
+	def _create_thread(self, worker_index: int, thread_name_suffix: str) -> TeeTimeTaskQueueThreadChw:
+		factory = CONFIG_FACADE.get_factory(self._configuration)
+
+		thread = TeeTimeTaskQueueThreadChw(self, worker_index, self._execution_quantum, self._worker_pool)
+		thread.name = thread.name + "-" + thread_name_suffix
+		listener = factory.create_instance(thread)
+		thread.set_exception_listener(listener)
+		placement_policy = self._configuration.get_placement_policy()
+		if (placement_policy is not None):
+			thread.set_cpu_affinity(placement_policy.place_worker(worker_index, self._get_num_workers()))
+		return thread
+
+	# @param topology
+	#            of the given start stages if compiled in advance. Then, the traversals are skipped.
+	def _initialize(self, start_stages: Collection[AbstractStage], topology: Optional[CompiledConfiguration.Topology] = None):
+		# TODO: Add port type validation again.
+		if (not start_stages):
+			raise Exception("No start stages passed. You need to pass at least one start stage.") # IllegalStateException
+
+		if (topology is None):
+			stage_collector = A1CreatedStageCollector()
+			traversor = Traverser(stage_collector)
+			for start_stage in start_stages:
+				traversor.traverse(start_stage)
+
+			self._all_stages = stage_collector.get_stages()
+		else:
+			self._all_stages = set(topology.get_stages())
+
+		for stage in self._all_stages:
+			self._categorize_stage(stage)
+			self._set_scheduler(stage)
+
+		if (not self._finite_producer_stages):
+			raise Exception("1004 - No producer stages in this configuration.") # IllegalStateException
+
+		if (topology is None):
+			# (re-)compute level index for each stage
+			level_index_visitor = A2LevelIndexVisitor()
+			traversor = Traverser(level_index_visitor)
+			for start_stage in self._finite_producer_stages:
+				traversor.traverse(start_stage)
+			max_level_index = level_index_visitor.get_max_level_index()
+		else:
+			# the level indices have been computed upon compilation and are kept by the stages
+			max_level_index = topology.get_max_level_index()
+
+		self._task_pool = WorkStealingTaskPool(max_level_index + 1, self._get_num_workers())
+		self._task_pool.schedule_stages(self._front_stages)
+
+		# instantiate pipes
+		request_pipe_capcity = self._actual_num_of_executions # 128 with additional buffer factor
+		pipe_visitor = A3PipeInstantiation(self, request_pipe_capcity)
+		if (topology is None):
+			traversor = Traverser(pipe_visitor)
+			for start_stage in start_stages:
+				traversor.traverse(start_stage)
+		else:
+			for output_port in topology.get_connected_output_ports():
+				pipe_visitor.visit_port(output_port)
+
+	def _categorize_stage(self, stage: AbstractStage):
+		termination_strategy = STAGE_FACADE.get_termination_strategy(stage)
+		if (termination_strategy == TerminationStrategy.BY_INTERRUPT):
+			raise Exception("Infinite producers are not supported by this scheduling strategy.") # IllegalStateException
+		elif (termination_strategy == TerminationStrategy.BY_SELF_DECISION):
+			self._finite_producer_stages.append(stage)
+			self._front_stages.add(stage)
+			self._num_running_stages.count_up()
+		elif (termination_strategy == TerminationStrategy.BY_SIGNAL):
+			self._num_running_stages.count_up()
+		else:
+			LOGGER.warning("Unknown termination strategy '%s' in stage %s", termination_strategy, stage)
+
+	def on_validate(self):
+		signal = ValidatingSignal()
+		with self._front_stages_lock:
+			self._cache_traversal()
+			self._startup_pipeline.propagate_signal(signal, "validating_signal")
+
+		if (len(signal.get_invalid_port_connections()) > 0):
+			raise AnalysisNotValidException(signal.get_invalid_port_connections())
+
+	def on_execute(self):
+		signal = StartingSignal()
+		with self._front_stages_lock:
+			self._cache_traversal()
+			self._startup_pipeline.propagate_signal(signal, "starting_signal")
+
+		# TODO move before onExecute so that starting the threads does not count to the execution time #350
+		for thread in self._regular_threads:
 			thread.awake()
-		}
-	}
-
-	@Override
-	public void onTerminate():
-		synchronized (frontStages):
-			for (AbstractStage finiteProducerStage : frontStages):
-				STAGE_FACADE.abort(finiteProducerStage)
-			}
-		}
-	}
-
-	@Override
-	public void onFinish():
-		try:
-			numRunningStages.await()
-			LOGGER.debug("Finished execution.")
-		} catch (InterruptedException e):
-			LOGGER.warn("Interrupted execution.", e)
-		}
 
-		try:
-			for (TeeTimeTaskQueueThreadChw thread : regularThreads):
-				thread.awake()
-				thread.join()
-			}
-			for (TeeTimeTaskQueueThreadChw thread : backupThreads):
-				thread.awake()
-				thread.join()
-			}
-		} catch (InterruptedException e):
-			throw new IllegalStateException(e)
-		}
-
-		// List<Exception> exceptions = collectExceptions()
-		// if (!exceptions.isEmpty()):
-		// throw new ExecutionException(exceptions)
-		// }
-	}
-
-	// TODO impl throw exception... see line 175
-	// private List<Exception> collectExceptions():
-	// Collection<ThreadThrowableContainer> exceptions = new ConcurrentLinkedQueue<ThreadThrowableContainer>()
-	// List<Exception> exceptions = new ArrayList<Exception>()
-	//
-	// for (Stage stage : threadableStages.keySet()):
-	// List<Exception> stageExceptions = stage.exceptionListener.getExceptions()
-	// exceptions.addAll(stageExceptions)
-	// }
-	//
-	// return exceptions
-	// }
-
-	// @Override
-	// void merge(final ThreadService source):
-	// threadableStages.putAll(source.getThreadableStages())
-	// runnableCounter.inc(source.runnableCounter)
-	// }
-
-	@Override
-	public void startStageAtRuntime(final AbstractStage stage):
-		// Nothing has to be done here
-	}
-
-	public List<AbstractStage> getFiniteProducerStages():
-		return finiteProducerStages
-	}
-
-	# @return a thread-safe set
-	public Set<AbstractStage> getFrontStages():
-		return frontStages
-	}
-
-	public PrioritizedTaskPool getPrioritizedTaskPool():
-		return taskPool
-	}
-
-	private void setScheduler(final AbstractStage stage):
-		STAGE_FACADE.setScheduler(stage, this)
-	}
-
-		return numRunningStages
-	}
-
-	@Override
-	public void onElementAdded(final AbstractUnsynchedPipe<?> pipe):
-		String message = String.format("This scheduler does not allow unsynched pipes: %s", pipe)
-		throw new IllegalStateException(message)
-	}
-
-	@Override
-	public void onElementAdded(final AbstractSynchedPipe<?> pipe):
-		BoundedMpMcSynchedPipe<?> castedPipe = (BoundedMpMcSynchedPipe<?>) pipe
-		long numPushes = castedPipe.getNumPushesSinceAppStart()
-		long lastNumPushes = castedPipe.getLastProducerIndex()
-		// performance optimization: & represents % (modulo)
-		// if ((numPushes & numOfExecutionsMask) != 0):
-		if (numPushes - lastNumPushes >= actualNumOfExecutions):
-			castedPipe.setLastProducerIndex(numPushes)
-			AbstractStage targetStage = pipe.getCachedTargetStage()
-			// We do not schedule the target stage on each incoming element.
-			// Instead, we schedule it after adding 'actualNumOfExecutions' elements.
-			if (!taskPool.scheduleStage(targetStage)):
-				String message = String.format("Could not schedule %s pool=%s", targetStage, taskPool)
-				throw new IllegalStateException(message)
-			}
-		}
-	}
-
-	@Override
-	public void onElementNotAdded(final AbstractSynchedPipe<?> pipe):
-		if (!taskPool.scheduleStage(pipe.getCachedTargetStage())):
-			throw new IllegalStateException(String.format("onElementNotAdded: scheduling target stage failed for %s", pipe.getCachedTargetStage()))
-		}
-
-		AbstractStage owningStage = pipe.getSourcePort().getOwningStage()
-		LoggerFactory.getLogger(owningStage.getClass()).debug("Yielding:} cause of the full pipe:}", owningStage, this)
-		self.yieldStage(owningStage)
-	}
+	# traverses the graph only once for both the validating and the starting signal
+	def _cache_traversal(self):
+		if (not self._startup_pipeline.is_traversal_cached()):
+			self._startup_pipeline.cache_traversal(self._front_stages)
+
+	def get_startup_durations_in_ns(self) -> Dict[str, int]:
+		return self._startup_pipeline.get_durations_in_ns()
+
+	def on_terminate(self):
+		with self._front_stages_lock:
+			for finite_producer_stage in list(self._front_stages):
+				STAGE_FACADE.abort(finite_producer_stage)
+
+	def on_finish(self):
+		self._num_running_stages.await_()
+		LOGGER.debug("Finished execution.")
+
+		for thread in self._regular_threads:
+			thread.awake()
+			thread.join()
+		with self._backup_threads_lock:
+			backup_threads = list(self._live_backup_threads)
+		for thread in backup_threads:
+			thread.awake()
+			thread.join()
+
+	def start_stage_at_runtime(self, stage: AbstractStage):
+		# Nothing has to be done here
+		pass
+
+	def get_finite_producer_stages(self) -> List[AbstractStage]:
+		return self._finite_producer_stages
+
+	# @return a set which may only be accessed while holding:@link #get_front_stages_lock()}
+	def get_front_stages(self) -> Set[AbstractStage]:
+		return self._front_stages
+
+	def get_front_stages_lock(self):
+		return self._front_stages_lock
+
+	# @return the number of executions per task for each stage, e.g., for an:@link ExecutionQuantumMonitoringService}
+	def get_execution_quantum(self) -> ExecutionQuantum:
+		return self._execution_quantum
+
+	def get_task_pool(self) -> WorkStealingTaskPool:
+		return self._task_pool
+
+	def _set_scheduler(self, stage: AbstractStage):
+		STAGE_FACADE.set_scheduler(stage, self)
+
+	def get_num_running_stages(self) -> CountDownAndUpLatch:
+		return self._num_running_stages
+
+	def on_element_added(self, pipe):
+		if (not isinstance(pipe, BoundedMpMcSynchedPipe)):
+			raise Exception("This scheduler does not allow unsynched pipes: %s" % pipe) # IllegalStateException
+
+		num_pushes = pipe.get_num_pushes_since_app_start()
+		last_num_pushes = pipe.get_last_producer_index()
+		target_stage = pipe.get_cached_target_stage()
+		if (num_pushes - last_num_pushes >= self._execution_quantum.get_num_of_executions(target_stage)):
+			pipe.set_last_producer_index(num_pushes)
+			# We do not schedule the target stage on each incoming element.
+			# Instead, we schedule it after adding as many elements as it executes per task.
+			if (not self._task_pool.schedule_stage(target_stage)):
+				raise Exception("Could not schedule %s pool=%s" % (target_stage, self._task_pool)) # IllegalStateException
+
+	def on_element_not_added(self, pipe):
+		if (not self._task_pool.schedule_stage(pipe.get_cached_target_stage())):
+			raise Exception("onElementNotAdded: scheduling target stage failed for %s" % pipe.get_cached_target_stage()) # IllegalStateException
+
+		owning_stage = pipe.get_source_port().get_owning_stage()
+		logging.getLogger(type(owning_stage).__name__).debug("Yielding %s cause of the full pipe %s", owning_stage, self)
+		self._yield_stage(owning_stage)
 
 	# Among others, pauses the executing thread.
 	#
 	# @param stage
-	private void yieldStage(final AbstractStage stage):
-		// 1. update state attributes before scheduling the stage again
-		stage.setPaused(true)
-		// allow other to execute the stage (only) in order to awake the current thread again
-		setIsBeingExecuted(stage, false)
+	def _yield_stage(self, stage: AbstractStage):
+		# 1. update state attributes before scheduling the stage again
+		stage.set_paused(True)
+		# allow other to execute the stage (only) in order to awake the current thread again
+		self.set_is_being_executed(stage, False)
 
-		if (!taskPool.scheduleStage(stage)):
-			throw new IllegalStateException(String.format("(yieldStage) Self-scheduling failed for %s", stage))
-		}
+		if (not self._task_pool.schedule_stage(stage)):
+			raise Exception("(yieldStage) Self-scheduling failed for %s" % stage) # IllegalStateException
 
-		// 2. awake any backup thread after scheduling the stage
-		backupThreads.remove(0).awake()
+		# 2. awake any backup thread after scheduling the stage
+		self._lease_backup_thread().awake()
 
-		getCurrentThread().pause()
+		self._get_current_thread().pause()
 
-		if (!stage.isBeingExecuted()):
-			throw new IllegalStateException("Stage must be in state 'is being executed'")
-		}
+		if (not self.is_being_executed(stage)):
+			raise Exception("Stage must be in state 'is being executed'") # IllegalStateException
 
-		stage.setPaused(false)
-		LOGGER.debug("Continue with:}", stage)
-	}
+		stage.set_paused(False)
+		LOGGER.debug("Continue with %s", stage)
 
-	private TeeTimeTaskQueueThreadChw getCurrentThread():
-		return (TeeTimeTaskQueueThreadChw) Thread.currentThread()
-	}
+	def _get_current_thread(self) -> TeeTimeTaskQueueThreadChw:
+		return PooledThread.current()
 
 	# Revokes the stage's pause and pauses the current thread afterwards.
 	#
 	# @param stage
-	void continueStage(final AbstractStage stage):
-		TeeTimeTaskQueueThreadChw thisThread = getCurrentThread()
-		backupThreads.add(thisThread)
-
-		if (!stage.isBeingExecuted()):
-			throw new IllegalStateException("Stage must be in state 'is being executed'")
-		}
-
-		TeeTimeTaskQueueThreadChw owningThread = self.getOwningThreadSynched(stage)
-		owningThread.awake()
-
-		thisThread.pause()
-		LOGGER.debug("Continue (backup) with:}", stage)
-	}
-
-	public boolean isPausedStage(final AbstractStage stage):
-		return stage.isPaused()
-	}
-
-	public boolean isBeingExecuted(final AbstractStage stage):
-		return stage.isBeingExecuted()
-	}
-
-	public boolean setIsBeingExecuted(final AbstractStage stage, final boolean newValue):
-		return stage.compareAndSetBeingExecuted(newValue)
-	}
-
-	public void setOwningThreadSynced(final AbstractStage stage, final TeeTimeTaskQueueThreadChw newThread):
-		synchronized (stage):
-			STAGE_FACADE.setOwningThread(stage, newThread)
-		}
-	}
-
-	public TeeTimeTaskQueueThreadChw getOwningThreadSynched(final AbstractStage stage):
-		synchronized (stage):
-			return (TeeTimeTaskQueueThreadChw) STAGE_FACADE.getOwningThread(stage)
-		}
-	}
-
-	@Override
-	public void uncaughtException(final Thread thread, final Throwable throwable):
-		LOGGER.error("Terminating execution due to exception in thread:}::}", thread, throwable)
-		// terminate the whole execution if a thread has been terminated by an exception
-		// for (TeeTimeTaskQueueThreadChw usualThread : threadPool):
-		// usualThread.interrupt()
-		// }
-		// for (TeeTimeTaskQueueThreadChw backupThread : backupThreads):
-		// backupThread.interrupt()
-		// }
-		onTerminate()
-	}
-
-	@Override
-	public String toString():
-		return super.toString() + ": " + allStages
-	}
-
-}
+	def continue_stage(self, stage: AbstractStage):
+		this_thread = self._get_current_thread()
+		with self._backup_threads_lock:
+			self._backup_threads.append(this_thread)
+
+		if (not self.is_being_executed(stage)):
+			raise Exception("Stage must be in state 'is being executed'") # IllegalStateException
+
+		owning_thread = self.get_owning_thread_synched(stage)
+		owning_thread.awake()
+
+		# only backup threads retire so that the number of regular threads is kept
+		timeout_in_s = None if this_thread in self._regular_threads else self._backup_idle_timeout_in_s
+		while (not this_thread.pause(timeout_in_s)):
+			with self._backup_threads_lock:
+				if (this_thread in self._backup_threads):
+					self._backup_threads.remove(this_thread)
+					self._live_backup_threads.remove(this_thread)
+					# the stages left in the retired thread's deques are stolen by the others or by its successor
+					self._free_backup_worker_indices.append(this_thread.get_worker_index())
+					this_thread.retire()
+					LOGGER.debug("Retired idle backup thread %s", this_thread)
+					return
+			# leased in the meantime: the awake is about to come
+		LOGGER.debug("Continue (backup) with %s", stage)
+
+	# @return an idle backup thread, or a new one if there is none
+	def _lease_backup_thread(self) -> TeeTimeTaskQueueThreadChw:
+		with self._backup_threads_lock:
+			if (self._backup_threads):
+				# LIFO so that rarely used backup threads time out
+				return self._backup_threads.pop()
+
+			# We need at most n-1 backup threads.
+			# Consider the situation where all consumers are slower than their producers.
+			# Then, all stages but sinks are paused.
+			# For each of these paused stage, the scheduler requires a backup thread.
+			if (self._free_backup_worker_indices):
+				worker_index = self._free_backup_worker_indices.pop()
+			else:
+				worker_index = self._num_threads + len(self._live_backup_threads)
+			if (worker_index >= self._get_num_workers()):
+				raise Exception("No backup thread left for %d stages" % len(self._all_stages)) # IllegalStateException
+			backup_thread = self._create_thread(worker_index, "backup")
+			self._live_backup_threads.append(backup_thread)
+			self._num_created_backup_threads += 1
+			self._backup_threads_high_water_mark = max(self._backup_threads_high_water_mark, len(self._live_backup_threads))
+		backup_thread.start()
+		return backup_thread
+
+	# @return the number of backup threads which have been created and not yet retired
+	def get_num_live_backup_threads(self) -> int:
+		return len(self._live_backup_threads)
+
+	# @return the maximum number of backup threads which have been alive at the same time
+	def get_backup_threads_high_water_mark(self) -> int:
+		return self._backup_threads_high_water_mark
+
+	# @return the number of backup threads created so far, including the retired ones
+	def get_num_created_backup_threads(self) -> int:
+		return self._num_created_backup_threads
+
+	def is_paused_stage(self, stage: AbstractStage) -> bool:
+		return stage.is_paused()
+
+	def _get_running_marker(self, stage: AbstractStage) -> threading.Lock:
+		marker = self._running_markers.get(stage)
+		if (marker is None):
+			# setdefault is atomic so that concurrent threads agree on one marker
+			marker = self._running_markers.setdefault(stage, threading.Lock())
+		return marker
+
+	def is_being_executed(self, stage: AbstractStage) -> bool:
+		return self._get_running_marker(stage).locked()
+
+	# Atomically sets the running marker of the given stage.
+	# The marker may be cleared by another thread than the one which has set it (see:@link #_yield_stage}).
+	#
+	# @return <code>true</code> iff the marker has been changed to <code>new_value</code>
+	def set_is_being_executed(self, stage: AbstractStage, new_value: bool) -> bool:
+		marker = self._get_running_marker(stage)
+		if (new_value):
+			return marker.acquire(False)
+		try:
+			marker.release()
+			return True
+		except RuntimeError: # not set
+			return False
+
+	# Reading and writing a single attribute is atomic in Python. Hence, no lock is required.
+	def set_owning_thread_synced(self, stage: AbstractStage, new_thread: Optional[TeeTimeTaskQueueThreadChw]):
+		STAGE_FACADE.set_owning_thread(stage, new_thread)
+
+	def get_owning_thread_synched(self, stage: AbstractStage) -> Optional[TeeTimeTaskQueueThreadChw]:
+		return STAGE_FACADE.get_owning_thread(stage)
+
+	def uncaught_exception(self, thread: threading.Thread, throwable: Exception):
+		LOGGER.error("Terminating execution due to exception in thread %s", thread, exc_info=throwable)
+		# terminate the whole execution if a thread has been terminated by an exception
+		self.on_terminate()
+
+	def __str__(self) -> str:
+		return super().__str__() + ": " + str(self._all_stages)
@@ -11,11 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
+from typing import Collection, Optional
 
-import java.util.Collection
-
-import teetime.framework.AbstractStage
+from teetime.framework.AbstractStage import AbstractStage
 
 # Represents a queue which can be used by the scheduler.
 # By definition, this data structure is ordered and potentially prioritized.
@@ -23,26 +21,24 @@ import teetime.framework.AbstractStage
 # @author Christian Wulf (chw)
 #
 # @since 3.0
-public interface ScheduleQueue:
+class ScheduleQueue:
 
-	# @return and removes the next stage from this queue, or <code>null</code> otherwise.
-	AbstractStage removeNextStage()
+	# @return and removes the next stage from this queue, or <code>None</code> otherwise.
+	def remove_next_stage(self) -> Optional[AbstractStage]:
+		pass
 
 	# @param stage
 	#            to be scheduled
 	# @return <code>true</code> iff the given stage could be scheduled, otherwise <code>false</code>.
-	boolean scheduleStage(final AbstractStage stage)
+	def schedule_stage(self, stage: AbstractStage) -> bool:
+		pass
 
 	# @param stages
 	#            to be scheduled
 	# @return <code>true</code> iff all of the given stages could be scheduled, otherwise <code>false</code>.
-	default boolean scheduleStages(final Collection<? extends AbstractStage> stages):
-		boolean scheduledAllStages = true
-		for (AbstractStage stage : stages):
-			boolean scheduledStage = scheduleStage(stage)
-			scheduledAllStages = scheduledAllStages && scheduledStage
-		}
-		return scheduledAllStages
-	}
-
-}
+	def schedule_stages(self, stages: Collection[AbstractStage]) -> bool:
+		scheduled_all_stages = True
+		for stage in stages:
+			scheduled_stage = self.schedule_stage(stage)
+			scheduled_all_stages = scheduled_all_stages and scheduled_stage
+		return scheduled_all_stages
@@ -11,53 +11,41 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
-
-import teetime.framework.*
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.AbstractSynchedPipe
-import teetime.framework.pipe.DummyPipe
-import teetime.framework.signal.ISignal
-
-public class SignalVisitor implements ITraverserVisitor:
-
-	private final ISignal signal
-
-	public SignalVisitor(final ISignal signal):
-		self.signal = signal
-	}
-
-	@Override
-	public VisitorBehavior visit(final AbstractStage stage):
-		if (stage.isProducer()):
-			stage.onSignal(signal, null)
-		}
-		return VisitorBehavior.CONTINUE_FORWARD
-	}
-
-	@Override
-	public VisitorBehavior visit(final AbstractPort<?> port):
-		if (!(port instanceof OutputPort)):
-			throw new IllegalStateException("Unexpected port type: " + port.getClass())
-		}
-		InputPort<?> inputPort = port.getPipe().getTargetPort()
-
-		// drain signal from internal signal queue
-		AbstractSynchedPipe<?> synchedPipe = (AbstractSynchedPipe<?>) port.getPipe()
-		ISignal receivedSignal = synchedPipe.getSignal()
-		if (null == receivedSignal):
-			return VisitorBehavior.CONTINUE_FORWARD
-		}
-		if (receivedSignal != signal):
-			throw new IllegalStateException("Unexpected signal: " + receivedSignal)
-		}
-		inputPort.getOwningStage().onSignal(receivedSignal, inputPort)
-		return VisitorBehavior.CONTINUE_FORWARD
-	}
-
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		// do nothing
-	}
-
-}
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.signal.ISignal import ISignal
+
+class SignalVisitor(ITraverserVisitor):
+
+	_signal: ISignal
+
+	def __init__(self, signal: ISignal):
+		self._signal = signal
+
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		if (stage.is_producer()):
+			stage.on_signal(self._signal, None)
+		return Traverser.VisitorBehavior.CONTINUE_FORWARD
+
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		if (not isinstance(port, OutputPort)):
+			raise Exception("Unexpected port type: " + str(type(port))) # IllegalStateException
+		input_port = port.get_pipe().get_target_port()
+
+		# drain signal from internal signal queue
+		synched_pipe = port.get_pipe()
+		received_signal = synched_pipe.get_signal()
+		if (received_signal is None):
+			return Traverser.VisitorBehavior.CONTINUE_FORWARD
+		if (received_signal is not self._signal):
+			raise Exception("Unexpected signal: " + str(received_signal)) # IllegalStateException
+		input_port.get_owning_stage().on_signal(received_signal, input_port)
+		return Traverser.VisitorBehavior.CONTINUE_FORWARD
+
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		# do nothing
+		pass
@@ -11,239 +11,235 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.globaltaskpool
-
-import java.util.Set
-import java.util.concurrent.Semaphore
-
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
-
-import teetime.framework.*
-import teetime.framework.exceptionHandling.AbstractExceptionListener
-import teetime.framework.scheduling.CountDownAndUpLatch
-import teetime.framework.signal.ISignal
-import teetime.framework.signal.TerminatingSignal
-
-class TeeTimeTaskQueueThreadChw extends Thread:
-
-	private static final Logger LOGGER = LoggerFactory.getLogger(TeeTimeTaskQueueThreadChw.class)
-	private static final StageFacade STAGE_FACADE = StageFacade.INSTANCE
-
-	private final GlobalTaskPoolScheduling scheduling
-	private final int numOfExecutions
-	private final Semaphore runtimePermission = new Semaphore(0)
-
-	private AbstractStage lastStage
-	private AbstractExceptionListener listener
+import logging
+import threading
+import time
+from typing import Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.StageState import StageState
+from teetime.framework.exceptionHandling.AbstractExceptionListener import AbstractExceptionListener
+from teetime.framework.scheduling.PooledThread import PooledThread
+from teetime.framework.scheduling.WorkerThreadPool import WorkerThreadPool
+from teetime.framework.scheduling.globaltaskpool.ExecutionQuantum import ExecutionQuantum
+from teetime.framework.scheduling.globaltaskpool.WorkStealingTaskPool import WorkStealingTaskPool
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
+
+LOGGER = logging.getLogger("TeeTimeTaskQueueThreadChw")
+STAGE_FACADE = StageFacade.INSTANCE
+
+class TeeTimeTaskQueueThreadChw(PooledThread):
+
+	# the maximum number of stages which are removed from the pool in order to find one which is not running
+	CLAIM_RETRY_BUDGET = 8
+	# a parked thread re-checks the termination condition after this time at the latest
+	PARK_TIMEOUT_IN_S = 0.01
+
+	_scheduling: "GlobalTaskPoolScheduling"
+	_worker_index: int
+	_execution_quantum: ExecutionQuantum
+	_runtime_permission: threading.Semaphore
+
+	_last_stage: Optional[AbstractStage] = None
+	_listener: Optional[AbstractExceptionListener] = None
+	_retired: bool = False
+
+	# @param worker_index
+	#            the index of this thread's local deques in the task pool
+	# @param execution_quantum
+	#            determines how often a stage is executed per task
+	# @param pool
+	#            to lease the worker from. Defaults to:@link WorkerThreadPool#INSTANCE}.
+	def __init__(self, scheduling: "GlobalTaskPoolScheduling", worker_index: int, execution_quantum: ExecutionQuantum,
+			pool: Optional[WorkerThreadPool] = None):
+		super().__init__(pool=pool)
+		self._scheduling = scheduling
+		self._worker_index = worker_index
+		self._execution_quantum = execution_quantum
+		self._runtime_permission = threading.Semaphore(0)
+
+	def run(self):
+		try:
+			num_non_terminated_finite_stages = self._scheduling.get_num_running_stages()
+			task_pool = self._scheduling.get_task_pool() # NOPMD (DU anomaly)
 
-	public TeeTimeTaskQueueThreadChw(final GlobalTaskPoolScheduling scheduling, final int numOfExecutions):
-		super()
-		self.scheduling = scheduling
-		self.numOfExecutions = numOfExecutions
-	}
+			self._await()
 
-	@Override
-	public void run():
-		final CountDownAndUpLatch numNonTerminatedFiniteStages = scheduling.getNumRunningStages()
-		final PrioritizedTaskPool taskPool = scheduling.getPrioritizedTaskPool() // NOPMD (DU anomaly)
+			task_pool.register_worker(self._worker_index)
 
-		await()
+			# TODO start processing not until receiving a sign by the scheduler #350
 
-		// TODO start processing not until receiving a sign by the scheduler #350
+			LOGGER.debug("Started thread, running stages: %s", num_non_terminated_finite_stages.get_current_count())
 
-		LOGGER.debug("Started thread, running stages::}", numNonTerminatedFiniteStages.getCurrentCount())
+			while (num_non_terminated_finite_stages.get_current_count() > 0 and not self._retired):
+				if (not self.process_next_stage(task_pool)):
+					task_pool.await_stage(self.PARK_TIMEOUT_IN_S)
 
-		while (numNonTerminatedFiniteStages.getCurrentCount() > 0):
-			processNextStage(taskPool)
-		}
+			LOGGER.debug("Terminated thread, running stages: %s", num_non_terminated_finite_stages.get_current_count())
+		except Exception as e:
+			self._scheduling.uncaught_exception(self, e)
 
-		LOGGER.debug("Terminated thread, running stages::}", numNonTerminatedFiniteStages.getCurrentCount())
-	}
+	def _await(self):
+		self._runtime_permission.acquire()
 
-	private void await():
+	# Claims the next stage which is not being executed by another thread and executes it.
+	# Stages which are being executed are skipped and re-scheduled afterwards.
+	#
+	# @return <code>false</code> if no stage could be claimed within the retry budget, <code>true</code> otherwise
+	def process_next_stage(self, task_pool: WorkStealingTaskPool) -> bool:
+		skipped_stages = []
 		try:
-			runtimePermission.acquire()
-		} catch (InterruptedException e):
-			throw new IllegalStateException(e)
-		}
-	}
-
-	public void processNextStage(final PrioritizedTaskPool taskPool):
-		AbstractStage stage = taskPool.removeNextStage()
-		if (stage == null): // no stage available in the pool
-			return
-		}
-
-		// what's the purpose of this flag?:
-		// ensures that only one thread executes the stage instance at once
-		// TODO perhaps realize with the owningThread variable and remove the additional beingExecuted variable
-		if (!scheduling.setIsBeingExecuted(stage, true)):
-			if (LOGGER.isDebugEnabled()):
-				LOGGER.debug("{} is being executed. Trying another stage...", stage)
-			}
-
-			// process next stage (potentially across the current level index)
-			// without re-adding the current stage in order to prevent re-executing this stage again
-			processNextStage(taskPool) // recursive call
-
-			// re-add stage
-			if (!taskPool.scheduleStage(stage)):
-				throw new IllegalStateException(String.format("(processNextStage) Re-scheduling failed for paused %s", stage))
-			}
-			return
-		}
-
-		if (lastStage != stage): // for debugging purposes only
-			LOGGER.trace("Changed execution from:} to:}", lastStage, stage)
-			lastStage = stage
-		}
-
-		if (scheduling.isPausedStage(stage)):
-			if (LOGGER.isTraceEnabled()):
-				LOGGER.trace("Stage is paused. Continueing stage::}", stage)
-			}
-			scheduling.continueStage(stage)
-		} else:
+			stage = self._claim_next_stage(task_pool, skipped_stages)
+			if (stage is None):
+				return False
+			self._process_claimed_stage(stage)
+			return True
+		finally:
+			# re-add the skipped stages not until now in order to prevent claiming them again
+			for skipped_stage in skipped_stages:
+				if (not task_pool.schedule_stage(skipped_stage)):
+					raise Exception("(processNextStage) Re-scheduling failed for paused %s" % skipped_stage) # IllegalStateException
+
+	def _claim_next_stage(self, task_pool: WorkStealingTaskPool, skipped_stages: list) -> Optional[AbstractStage]:
+		for _ in range(self.CLAIM_RETRY_BUDGET):
+			stage = task_pool.remove_next_stage()
+			if (stage is None): # no stage available in the pool
+				return None
+			# ensures that only one thread executes the stage instance at once
+			if (self._scheduling.set_is_being_executed(stage, True)):
+				return stage
+			LOGGER.debug("%s is being executed. Trying another stage...", stage)
+			skipped_stages.append(stage)
+		return None
+
+	def _process_claimed_stage(self, stage: AbstractStage):
+		if (self._last_stage is not stage): # for debugging purposes only
+			LOGGER.debug("Changed execution from %s to %s", self._last_stage, stage)
+			self._last_stage = stage
+
+		if (self._scheduling.is_paused_stage(stage)):
+			LOGGER.debug("Stage is paused. Continueing stage: %s", stage)
+			self._scheduling.continue_stage(stage)
+		else:
 			try:
-				// do nothing if the stage is about to terminate or has already been terminated
-				if (stage.getCurrentState().isAfter(StageState.STARTED)):
-					LOGGER.trace("Skipped execution since the stage is terminating::}", stage)
-					// throw new IllegalStateException()
+				# do nothing if the stage is about to terminate or has already been terminated
+				if (stage.get_current_state().is_after(StageState.STARTED)):
+					LOGGER.debug("Skipped execution since the stage is terminating: %s", stage)
 					return
-				}
 
-				Thread owningThread = scheduling.getOwningThreadSynched(stage)
-				if (null != owningThread):
-					String message = String.format("%s vs. %s", owningThread, Thread.currentThread())
-					throw new IllegalStateException(message)
-				}
-				scheduling.setOwningThreadSynced(stage, this)
+				owning_thread = self._scheduling.get_owning_thread_synched(stage)
+				if (owning_thread is not None):
+					raise Exception("%s vs. %s" % (owning_thread, self)) # IllegalStateException
+				self._scheduling.set_owning_thread_synced(stage, self)
 
 				try:
-					executeStage(stage)
-
-					reschedule(stage)
-				} finally:
-					scheduling.setOwningThreadSynced(stage, null)
-				}
-			} finally:
-				scheduling.setIsBeingExecuted(stage, false)
-			}
-		}
-
-	}
-
-	private void executeStage(final AbstractStage stage):
-		if (LOGGER.isTraceEnabled()):
-			LOGGER.trace("Executing:}", stage)
-		}
-
-		STAGE_FACADE.setExceptionHandler(stage, listener) // FIXME do not set it on each execution
-		STAGE_FACADE.runStage(stage, numOfExecutions)
-
-		if (STAGE_FACADE.shouldBeTerminated(stage)):
-			// LOGGER.info("TERMINATING:}", stage)
-
-			sendTerminationSignal(stage)
-
-			if (stage.getCurrentState() != StageState.TERMINATED):
-				String message = String.format("(TeeTimeTaskQueueThreadChw) %s: Expected state TERMINATED, but was %s", stage, stage.getCurrentState())
-				throw new IllegalStateException(message)
-			}
-
-			// since afterStageExecution() can still send elements,
-			// passFrontStatusToSuccessorStages(stage) must be behind
-			passFrontStatusToSuccessorStages(stage)
-
-			scheduleSuccessorStages(stage)
-
-			scheduling.getNumRunningStages().countDown()
-		}
-
-		if (LOGGER.isTraceEnabled()):
-			LOGGER.trace("Executed:}", stage)
-		}
-	}
-
-	private void sendTerminationSignal(final AbstractStage stage):
-		if (stage.isProducer()):
-			stage.onSignal(new TerminatingSignal(), null)
-		} else: // is consumer
-			final ISignal signal = new TerminatingSignal() // NOPMD DU caused by loop
-			for (InputPort<?> inputPort : STAGE_FACADE.getInputPorts(stage)):
-				stage.onSignal(signal, inputPort)
-			}
-		}
-	}
-
-	private void passFrontStatusToSuccessorStages(final AbstractStage stage):
-		// a set, not a list since multiple predecessors of a merger would add the merger multiple times
-		Set<AbstractStage> frontStages = scheduling.getFrontStages()
-		synchronized (frontStages):
-			frontStages.remove(stage)
-
-			for (OutputPort<?> outputPort : STAGE_FACADE.getOutputPorts(stage)):
-				AbstractStage targetStage = outputPort.getPipe().getTargetPort().getOwningStage()
-				if (targetStage.getCurrentState().isBefore(StageState.TERMINATING)):
-					frontStages.add(targetStage)
-				}
-			}
-			LOGGER.info("New front stages:}", frontStages)
-		}
-	}
-
-	private void scheduleSuccessorStages(final AbstractStage stage):
-		ScheduleQueue taskPool = scheduling.getPrioritizedTaskPool()
-		for (OutputPort<?> outputPort : STAGE_FACADE.getOutputPorts(stage)):
-			AbstractStage targetStage = outputPort.getPipe().getTargetPort().getOwningStage()
-			if (targetStage.getCurrentState().isBefore(StageState.TERMINATING)):
-
-				if (!taskPool.scheduleStage(targetStage)):
-					String message = String.format("(passFrontStatusToSuccessorStages) Scheduling successor failed for %s", targetStage)
-					throw new IllegalStateException(message)
-				}
-			}
-		}
-	}
-
-	private void reschedule(final AbstractStage stage):
-		if (!STAGE_FACADE.shouldBeTerminated(stage)):
-			boolean reschedule = stage.isProducer()
-
-			// Only schedule this (consumer) stage if it has input to consume.
-			// Otherwise, wait for a predecessor stage to re-schedule this stage again.
-			for (InputPort<?> inputPort : STAGE_FACADE.getInputPorts(stage)):
-				if (inputPort.getPipe().hasMore()):
-					reschedule = true
+					self._execute_stage(stage)
+
+					self._reschedule(stage)
+				finally:
+					self._scheduling.set_owning_thread_synced(stage, None)
+			finally:
+				self._scheduling.set_is_being_executed(stage, False)
+
+	def _execute_stage(self, stage: AbstractStage):
+		LOGGER.debug("Executing %s", stage)
+
+		STAGE_FACADE.set_exception_handler(stage, self._listener) # FIXME do not set it on each execution
+		execution_quantum = self._execution_quantum
+		start_time = time.perf_counter_ns()
+		# executions which found no input are not counted so that they do not pull down the mean execution time
+		num_consumed = STAGE_FACADE.run_stage_n_times(stage, execution_quantum.get_num_of_executions(stage))
+		execution_quantum.record(stage, num_consumed, time.perf_counter_ns() - start_time)
+
+		if (STAGE_FACADE.should_be_terminated(stage)):
+			self._send_termination_signal(stage)
+
+			if (stage.get_current_state() != StageState.TERMINATED):
+				raise Exception("(TeeTimeTaskQueueThreadChw) %s: Expected state TERMINATED, but was %s" % (stage, stage.get_current_state())) # IllegalStateException
+
+			# since afterStageExecution() can still send elements,
+			# pass_front_status_to_successor_stages(stage) must be behind
+			self._pass_front_status_to_successor_stages(stage)
+
+			self._schedule_successor_stages(stage)
+
+			num_running_stages = self._scheduling.get_num_running_stages()
+			num_running_stages.count_down()
+			if (num_running_stages.get_current_count() == 0):
+				# let parked threads recognize the termination
+				self._scheduling.get_task_pool().wake_up_all()
+
+		LOGGER.debug("Executed %s", stage)
+
+	def _send_termination_signal(self, stage: AbstractStage):
+		if (stage.is_producer()):
+			stage.on_signal(TerminatingSignal(), None)
+		else: # is consumer
+			signal = TerminatingSignal() # NOPMD DU caused by loop
+			for input_port in STAGE_FACADE.get_input_ports(stage):
+				stage.on_signal(signal, input_port)
+
+	def _pass_front_status_to_successor_stages(self, stage: AbstractStage):
+		# a set, not a list since multiple predecessors of a merger would add the merger multiple times
+		front_stages = self._scheduling.get_front_stages()
+		with self._scheduling.get_front_stages_lock():
+			front_stages.discard(stage)
+
+			for output_port in STAGE_FACADE.get_output_ports(stage):
+				target_stage = output_port.get_pipe().get_target_port().get_owning_stage()
+				if (target_stage.get_current_state().is_before(StageState.TERMINATING)):
+					front_stages.add(target_stage)
+			LOGGER.info("New front stages: %s", front_stages)
+
+	def _schedule_successor_stages(self, stage: AbstractStage):
+		task_pool = self._scheduling.get_task_pool()
+		for output_port in STAGE_FACADE.get_output_ports(stage):
+			target_stage = output_port.get_pipe().get_target_port().get_owning_stage()
+			if (target_stage.get_current_state().is_before(StageState.TERMINATING)):
+				if (not task_pool.schedule_stage(target_stage)):
+					raise Exception("(passFrontStatusToSuccessorStages) Scheduling successor failed for %s" % target_stage) # IllegalStateException
+
+	def _reschedule(self, stage: AbstractStage):
+		if (not STAGE_FACADE.should_be_terminated(stage)):
+			reschedule = stage.is_producer()
+
+			# Only schedule this (consumer) stage if it has input to consume.
+			# Otherwise, wait for a predecessor stage to re-schedule this stage again.
+			for input_port in STAGE_FACADE.get_input_ports(stage):
+				if (input_port.get_pipe().has_more()):
+					reschedule = True
 					break
-				}
-			}
 
-			ScheduleQueue taskPool = scheduling.getPrioritizedTaskPool()
-			if (reschedule && !taskPool.scheduleStage(stage)):
-				String message = String.format("(reschedule) Scheduling stage again failed for %s", stage)
-				throw new IllegalStateException(message)
-			}
-		}
-	}
+			task_pool = self._scheduling.get_task_pool()
+			if (reschedule and not task_pool.schedule_stage(stage)):
+				raise Exception("(reschedule) Scheduling stage again failed for %s" % stage) # IllegalStateException
 
 	# Should be executed by a different thread.
-	public void awake():
-		LOGGER.debug("Awaking:}", this)
-		runtimePermission.release()
-	}
+	def awake(self):
+		LOGGER.debug("Awaking %s", self)
+		self._runtime_permission.release()
 
 	# Must be executed by the current thread.
-	public void pause():
-		if (Thread.currentThread() != this):
-			String message = String.format("Expected this thread, but was %s", Thread.currentThread())
-			throw new IllegalStateException(message)
-		}
-		await()
-	}
-
-	public void setExceptionListener(final AbstractExceptionListener listener):
-		self.listener = listener
-	}
-}
+	#
+	# @param timeout_in_s
+	#            the maximum time to wait for being awaked, or <code>None</code> to wait forever
+	# @return <code>true</code> iff this thread has been awaked
+	def pause(self, timeout_in_s: Optional[float] = None) -> bool:
+		if (PooledThread.current() is not self):
+			raise Exception("Expected this thread, but was %s" % PooledThread.current()) # IllegalStateException
+		return self._runtime_permission.acquire(timeout=timeout_in_s)
+
+	# Lets this thread terminate as soon as it returns from its current stage.
+	def retire(self):
+		self._retired = True
+
+	# Python threads cannot be interrupted; an aborted stage is not executed again (see:@link #process_next_stage}).
+	def interrupt(self):
+		pass
+
+	def get_worker_index(self) -> int:
+		return self._worker_index
+
+	def set_exception_listener(self, listener: AbstractExceptionListener):
+		self._listener = listener
@@ -0,0 +1,198 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.scheduling.globaltaskpool.ScheduleQueue import ScheduleQueue
+
+STAGE_FACADE = StageFacade.INSTANCE
+
+# Represents a task pool whose tasks are stages and categorized into levels (like the former <code>PrioritizedTaskPool</code>).
+# Instead of one global set of level queues, each worker thread owns a local deque per level.
+# <p>
+# A worker schedules stages into its own deques and removes them from the head of its own deques.
+# If its deque of a level is empty, it steals from the tail of the other workers' deques of the same level
+# before it considers the next higher level.
+# Hence, a worker still searches for the next task starting at the deepest level and traversing up to the root.
+# A stage at the deepest level has no output ports.
+# </p>
+# <p>
+# The deques of a worker are allocated when it registers (see:@link #register_worker(int)}),
+# so that the pool does not grow with backup threads which are never created.
+# Stages scheduled by threads other than the workers (e.g., the front stages) are put into a shared injection deque.
+# Per level, the pool keeps the set of workers whose deque of that level may be non-empty.
+# Thus, stealing and:@link #is_empty()} only visit those workers instead of all workers at all levels.
+# A worker is added to the set after a stage has been added to its deque,
+# and is only removed if its deque is still empty after the removal, so that a non-empty deque is never missed.
+# </p>
+# <p>
+# A stage is contained at most once in the whole pool.
+# This is ensured by a per-stage marker rather than by a global set:
+# a non-blocking <code>Lock.acquire</code> is an atomic test-and-set.
+# </p>
+# <p>
+# A worker which finds no stage parks in:@link #await_stage(float)}.
+# Scheduling a stage only touches the corresponding condition if at least one worker is parked.
+# </p>
+class WorkStealingTaskPool(ScheduleQueue):
+
+	# the index of the deques of all threads which are not registered as worker
+	INJECTION_INDEX = -1
+
+	_num_levels: int
+	_num_workers: int
+	# worker index -> level index -> deque
+	_deques: Dict[int, List[Deque[AbstractStage]]]
+	# level index -> indices of the workers whose deque of this level may be non-empty
+	_non_empty_workers: List[Set[int]]
+	_scheduled_markers: Dict[AbstractStage, threading.Lock]
+	_num_parked_workers: int = 0
+
+	#
+	# @param num_levels
+	#            number of levels
+	# @param num_workers
+	#            maximum number of worker threads which own a local deque per level
+	def __init__(self, num_levels: int, num_workers: int):
+		if (num_workers <= 0):
+			raise ValueError("num_workers is " + str(num_workers) + ", but must have a positive value.")
+		self._num_levels = num_levels
+		self._num_workers = num_workers
+		self._deques = {self.INJECTION_INDEX: self._new_deques()}
+		self._non_empty_workers = [set() for _ in range(num_levels)]
+		self._scheduled_markers = dict()
+		self._local = threading.local()
+		self._stage_available = threading.Condition()
+
+	def _new_deques(self) -> List[Deque[AbstractStage]]:
+		return [deque() for _ in range(self._num_levels)]
+
+	# Must be invoked by each worker thread before it uses this pool.
+	# A worker which re-uses the index of a retired worker adopts its deques together with the stages left in them.
+	#
+	# @param worker_index
+	#            the index of the deques owned by the current thread
+	def register_worker(self, worker_index: int):
+		if (not 0 <= worker_index < self._num_workers):
+			raise ValueError("worker_index is " + str(worker_index) + ", but must be in [0," + str(self._num_workers) + ").")
+		# setdefault is atomic so that concurrent registrations cannot replace each other's deques
+		self._deques.setdefault(worker_index, self._new_deques())
+		self._local.worker_index = worker_index
+
+	def _get_worker_index(self) -> int:
+		return getattr(self._local, "worker_index", self.INJECTION_INDEX)
+
+	def _get_scheduled_marker(self, stage: AbstractStage) -> threading.Lock:
+		marker = self._scheduled_markers.get(stage)
+		if (marker is None):
+			# setdefault is atomic so that concurrent threads agree on one marker
+			marker = self._scheduled_markers.setdefault(stage, threading.Lock())
+		return marker
+
+	def schedule_stage(self, stage: AbstractStage) -> bool:
+		if (not self._get_scheduled_marker(stage).acquire(False)):
+			return True # already contained
+
+		level_index = STAGE_FACADE.get_level_index(stage)
+		worker_index = self._get_worker_index()
+		self._deques[worker_index][level_index].appendleft(stage)
+		# announced after adding the stage (see _discard_hint)
+		self._non_empty_workers[level_index].add(worker_index)
+		# the stage has been added before reading the number of parked workers (see await_stage)
+		if (self._num_parked_workers > 0):
+			with self._stage_available:
+				self._stage_available.notify()
+		return True
+
+	def remove_next_stage(self) -> Optional[AbstractStage]:
+		return self.remove_next_stage_from(self._num_levels - 1)
+
+	def remove_next_stage_from(self, deepest_start_level: int) -> Optional[AbstractStage]:
+		worker_index = self._get_worker_index()
+		own_deques = self._deques[worker_index]
+		non_empty_workers = self._non_empty_workers
+		for level_index in range(deepest_start_level, -1, -1):
+			if (not non_empty_workers[level_index]):
+				continue
+			try:
+				stage = own_deques[level_index].popleft()
+			except IndexError:
+				stage = self._steal(worker_index, level_index)
+				if (stage is None):
+					continue
+			# the stage cannot be re-added to this pool until its marker has been released
+			self._scheduled_markers[stage].release()
+			return stage
+		return None
+
+	def _steal(self, thief_index: int, level_index: int) -> Optional[AbstractStage]:
+		deques = self._deques
+		# a snapshot since other threads may add or discard workers concurrently
+		for victim_index in tuple(self._non_empty_workers[level_index]):
+			victim = deques[victim_index][level_index]
+			if (victim_index != thief_index):
+				try:
+					return victim.pop()
+				except IndexError:
+					pass # the owner or another thief was faster
+			self._discard_hint(level_index, victim_index)
+		return None
+
+	def _discard_hint(self, level_index: int, worker_index: int):
+		non_empty_workers = self._non_empty_workers[level_index]
+		non_empty_workers.discard(worker_index)
+		# re-announce if a stage has been added concurrently
+		if (self._deques[worker_index][level_index]):
+			non_empty_workers.add(worker_index)
+
+	# Parks the current worker until a stage is scheduled, :@link #wake_up_all()} is invoked, or the timeout elapses.
+	#
+	# @param timeout_in_s
+	#            the maximum time to park
+	def await_stage(self, timeout_in_s: float):
+		with self._stage_available:
+			# announce the parking before checking for stages so that no schedule_stage is missed
+			self._num_parked_workers += 1
+			try:
+				if (self.is_empty()):
+					self._stage_available.wait(timeout_in_s)
+			finally:
+				self._num_parked_workers -= 1
+
+	def wake_up_all(self):
+		with self._stage_available:
+			self._stage_available.notify_all()
+
+	# May return <code>false</code> for a short time after the last stage has been removed.
+	def is_empty(self) -> bool:
+		for non_empty_workers in self._non_empty_workers:
+			if (non_empty_workers):
+				return False
+		return True
+
+	def get_num_workers(self) -> int:
+		return self._num_workers
+
+	# @return the number of workers which have registered so far
+	def get_num_registered_workers(self) -> int:
+		return len(self._deques) - 1
+
+	def size(self) -> int:
+		return sum(len(stages) for worker_deques in tuple(self._deques.values()) for stages in worker_deques)
+
+	def __str__(self) -> str: # IMPORTANT: do not manipulate the deques in this method
+		return super().__str__() + "[size=" + str(self.size()) + "]"
@@ -11,47 +11,37 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+from typing import Set
 
-import java.util.HashSet
-import java.util.Set
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
 
-import teetime.framework.AbstractPort
-import teetime.framework.AbstractStage
-import teetime.framework.ITraverserVisitor
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.DummyPipe
+class A1ThreadableStageCollector(ITraverserVisitor):
 
-# Searches for threadable stages
-class A1ThreadableStageCollector implements ITraverserVisitor:
+	_threadable_stages: Set[AbstractStage]
 
-	private final Set<AbstractStage> threadableStages = new HashSet<AbstractStage>()
+	def __init__(self):
+		self._threadable_stages = set()
 
-	public Set<AbstractStage> getThreadableStages():
-		return threadableStages
-	}
+	def get_threadable_stages(self) -> Set[AbstractStage]:
+		return self._threadable_stages
 
-	@Override
-	public VisitorBehavior visit(final AbstractStage stage):
-		if (stage.isProducer()):
-			stage.declareActive()
-		}
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		# an explicit declaration (e.g., to be hosted in an own process) takes precedence
+		if (stage.is_producer() and not stage.is_active()):
+			stage.declare_active()
 
-		if (stage.isActive() && !threadableStages.contains(stage)):
-			threadableStages.add(stage)
-		}
+		if (stage.is_active()):
+			self._threadable_stages.add(stage)
 
-		return VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
 
-	@Override
-	public VisitorBehavior visit(final AbstractPort<?> port):
-		return VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
 
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		// do nothing
-	}
-
-}
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		# do nothing
+		pass
@@ -11,87 +11,64 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
-
-import java.util.Set
-
-import com.carrotsearch.hppc.ObjectIntHashMap
-import com.carrotsearch.hppc.ObjectIntMap
-
-import teetime.framework.AbstractPort
-import teetime.framework.AbstractStage
-import teetime.framework.ITraverserVisitor
-import teetime.framework.Traverser
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.DummyPipe
-import teetime.framework.pipe.IPipe
-
-# Checks for invalid thread assignments
-public class A2InvalidThreadAssignmentCheck:
-
-	private static final int DEFAULT_COLOR = 0
-
-	private final Set<AbstractStage> threadableStages
-
-	public A2InvalidThreadAssignmentCheck(final Set<AbstractStage> threadableStages):
-		self.threadableStages = threadableStages
-	}
-
-	@SuppressWarnings("PMD.DataflowAnomalyAnalysis")
-	public void check():
-		int color = DEFAULT_COLOR
-		ObjectIntMap<AbstractStage> colors = new ObjectIntHashMap<AbstractStage>()
-		ThreadPainter threadPainter = new ThreadPainter()
-		Traverser traverser = new Traverser(threadPainter)
-
-		for (AbstractStage threadableStage : threadableStages):
-			color++
-			colors.put(threadableStage, color)
-
-			threadPainter.reset(colors, color, threadableStages)
-			traverser.traverse(threadableStage)
-		}
-	}
-
-	private static class ThreadPainter implements ITraverserVisitor:
-
-		private ObjectIntMap<AbstractStage> colors
-		private int color
-		private Set<AbstractStage> threadableStages
-
-		public void reset(final ObjectIntMap<AbstractStage> colors, final int color, final Set<AbstractStage> threadableStages):
-			self.colors = colors
-			self.color = color
-			self.threadableStages = threadableStages
-		}
-
-		@Override
-		public VisitorBehavior visit(final AbstractStage stage):
-			return VisitorBehavior.CONTINUE_FORWARD
-		}
-
-		@Override
-		public VisitorBehavior visit(final AbstractPort<?> port):
-			IPipe<?> pipe = port.getPipe()
-			AbstractStage targetStage = pipe.getTargetPort().getOwningStage()
-
-			int targetColor = colors.containsKey(targetStage) ? colors.get(targetStage) : DEFAULT_COLOR
-
-			if (!threadableStages.contains(targetStage) || targetColor == color):
-				if (colors.containsKey(targetStage) && colors.get(targetStage) != color):
-					throw new IllegalStateException("1001 - Crossing threads in " + targetStage.getId()) // One stage is connected to a stage of another thread
-																											// (but not its "headstage")
-				}
-				colors.put(targetStage, color)
-				return VisitorBehavior.CONTINUE_FORWARD // NOPMD makes it clearer
-			}
-			return VisitorBehavior.STOP
-		}
-
-		@Override
-		public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-			// do nothing
-		}
-
-	}
-}
+from typing import Dict, Set
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+
+class A2InvalidThreadAssignmentCheck:
+
+	_DEFAULT_COLOR = 0
+
+	_threadable_stages: Set[AbstractStage]
+
+	def __init__(self, threadable_stages: Set[AbstractStage]):
+		self._threadable_stages = threadable_stages
+
+	def check(self):
+		color = self._DEFAULT_COLOR
+		colors: Dict[AbstractStage, int] = dict()
+		thread_painter = A2InvalidThreadAssignmentCheck._ThreadPainter()
+		traverser = Traverser(thread_painter)
+
+		for threadable_stage in self._threadable_stages:
+			color += 1
+			colors[threadable_stage] = color
+
+			thread_painter.reset(colors, color, self._threadable_stages)
+			traverser.traverse(threadable_stage)
+
+	class _ThreadPainter(ITraverserVisitor):
+
+		_colors: Dict[AbstractStage, int]
+		_color: int
+		_threadable_stages: Set[AbstractStage]
+
+		def reset(self, colors: Dict[AbstractStage, int], color: int, threadable_stages: Set[AbstractStage]):
+			self._colors = colors
+			self._color = color
+			self._threadable_stages = threadable_stages
+
+		def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+			return Traverser.VisitorBehavior.CONTINUE_FORWARD
+
+		def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+			pipe = port.get_pipe()
+			target_stage = pipe.get_target_port().get_owning_stage()
+
+			target_color = self._colors.get(target_stage, A2InvalidThreadAssignmentCheck._DEFAULT_COLOR)
+
+			if (target_stage not in self._threadable_stages or target_color == self._color):
+				if (target_stage in self._colors and self._colors[target_stage] != self._color):
+					# One stage is connected to a stage of another thread (but not its "headstage")
+					raise Exception("1001 - Crossing threads in " + target_stage.get_id()) # IllegalStateException
+				self._colors[target_stage] = self._color
+				return Traverser.VisitorBehavior.CONTINUE_FORWARD # NOPMD makes it clearer
+			return Traverser.VisitorBehavior.STOP
+
+		def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+			# do nothing
+			pass
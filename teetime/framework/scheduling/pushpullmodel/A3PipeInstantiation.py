@@ -11,92 +11,83 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
-
-import java.util.HashSet
-import java.util.Set
-
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
-
-import teetime.framework.AbstractPort
-import teetime.framework.AbstractStage
-import teetime.framework.ITraverserVisitor
-import teetime.framework.InstantiationPipe
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.*
-import teetime.framework.scheduling.PipeScheduler
+import logging
+from typing import Set
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.InstantiationPipe import InstantiationPipe
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.BoundedSynchedPipe import BoundedSynchedPipe
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.pipe.InterProcessPipeFactory import InterProcessPipeFactory
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.pipe.UnboundedSynchedPipe import UnboundedSynchedPipe
+from teetime.framework.pipe.UnsynchedPipe import UnsynchedPipe
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
+
+LOGGER = logging.getLogger("A3PipeInstantiation")
 
 # Automatically instantiates the correct pipes
-class A3PipeInstantiation implements ITraverserVisitor, PipeScheduler:
-
-	private static final Logger LOGGER = LoggerFactory.getLogger(A3PipeInstantiation.class)
-
-	private final Set<IPipe<?>> visitedPipes = new HashSet<IPipe<?>>()
-
-	@Override
-	public VisitorBehavior visit(final AbstractStage stage):
-		return VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
-
-	@Override
-	public VisitorBehavior visit(final AbstractPort<?> port):
-		IPipe<?> pipe = port.getPipe()
-		if (visitedPipes.contains(pipe)):
-			return VisitorBehavior.STOP // NOPMD two returns are better
-		}
-		visitedPipes.add(pipe)
-
-		instantiatePipe(pipe)
-
-		return VisitorBehavior.CONTINUE_BACK_AND_FORTH
-	}
-
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		if (LOGGER.isInfoEnabled()):
-			LOGGER.info("Unconnected port:} in stage:}", port, port.getOwningStage().getId())
-		}
-	}
-
-	private <T> void instantiatePipe(final IPipe<T> pipe):
-		IPipe<T> instantiatedPipe
-
-		AbstractStage sourceStage = pipe.getSourcePort().getOwningStage()
-		AbstractStage targetStage = pipe.getTargetPort().getOwningStage()
-
-		if (!(pipe instanceof InstantiationPipe)): // if manually connected
-			instantiatedPipe = pipe
-		} else if (!targetStage.isActive() || sourceStage == targetStage): // NOPMD .equals() can't be used here
-			// normal or reflexive pipe => intra
-			instantiatedPipe = new UnsynchedPipe<T>(pipe.getSourcePort(), pipe.getTargetPort())
-			LOGGER.debug("Connected (unsynch):} and:}", pipe.getSourcePort(), pipe.getTargetPort())
-		} else if (pipe.capacity() == 0):
-			// synchronized, unlimited capacity
-			instantiatedPipe = new UnboundedSynchedPipe<T>(pipe.getSourcePort(), pipe.getTargetPort())
-			LOGGER.debug("Connected (unbounded):} and:}", pipe.getSourcePort(), pipe.getTargetPort())
-		} else:
-			// synchronized, limited capacity
-			instantiatedPipe = new BoundedSynchedPipe<T>(pipe.getSourcePort(), pipe.getTargetPort(), pipe.capacity())
-			LOGGER.debug("Connected (bounded):} and:}", pipe.getSourcePort(), pipe.getTargetPort())
-		}
-
-		instantiatedPipe.setScheduler(this)
-	}
-
-	@Override
-	public void onElementAdded(final AbstractUnsynchedPipe<?> pipe):
-		pipe.getCachedTargetStage().executeByFramework()
-	}
-
-	@Override
-	public void onElementAdded(final AbstractSynchedPipe<?> pipe):
-		// do nothing
-	}
-
-	@Override
-	public void onElementNotAdded(final AbstractSynchedPipe<?> pipe):
-		// do nothing
-	}
-
-}
+class A3PipeInstantiation(ITraverserVisitor, PipeScheduler):
+
+	_visited_pipes: Set[IPipe]
+	_process_hosted_stages: Set[AbstractStage]
+
+	# @param process_hosted_stages
+	#            all stages which are executed in a worker process (see:@link AbstractStage#declare_active(bool)}),
+	#            including their passive successors
+	def __init__(self, process_hosted_stages: Set[AbstractStage] = frozenset()):
+		self._visited_pipes = set()
+		self._process_hosted_stages = process_hosted_stages
+
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		pipe = port.get_pipe()
+		if (pipe in self._visited_pipes):
+			return Traverser.VisitorBehavior.STOP # NOPMD two returns are better
+		self._visited_pipes.add(pipe)
+
+		self._instantiate_pipe(pipe)
+
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		LOGGER.info("Unconnected port %s in stage %s", port, port.get_owning_stage().get_id())
+
+	def _instantiate_pipe(self, pipe: IPipe):
+		source_stage = pipe.get_source_port().get_owning_stage()
+		target_stage = pipe.get_target_port().get_owning_stage()
+
+		if (not isinstance(pipe, InstantiationPipe)): # if manually connected
+			instantiated_pipe = pipe
+		elif (not target_stage.is_active() or source_stage is target_stage):
+			# normal or reflexive pipe => intra
+			instantiated_pipe = UnsynchedPipe(pipe.get_source_port(), pipe.get_target_port())
+			LOGGER.debug("Connected (unsynch) %s and %s", pipe.get_source_port(), pipe.get_target_port())
+		elif (source_stage in self._process_hosted_stages or target_stage in self._process_hosted_stages):
+			# synchronized across process boundaries
+			instantiated_pipe = InterProcessPipeFactory.INSTANCE.new_pipe(pipe.get_source_port(), pipe.get_target_port())
+			LOGGER.debug("Connected (inter-process) %s and %s", pipe.get_source_port(), pipe.get_target_port())
+		elif (pipe.capacity() == 0):
+			# synchronized, unlimited capacity
+			instantiated_pipe = UnboundedSynchedPipe(pipe.get_source_port(), pipe.get_target_port())
+			LOGGER.debug("Connected (unbounded) %s and %s", pipe.get_source_port(), pipe.get_target_port())
+		else:
+			# synchronized, limited capacity
+			instantiated_pipe = BoundedSynchedPipe(pipe.get_source_port(), pipe.get_target_port(), pipe.capacity())
+			LOGGER.debug("Connected (bounded) %s and %s", pipe.get_source_port(), pipe.get_target_port())
+
+		instantiated_pipe.set_scheduler(self)
+
+	def on_element_added(self, pipe):
+		# unsynched pipes execute their target stage directly; synched pipes do nothing
+		if (isinstance(pipe, UnsynchedPipe)):
+			pipe.get_cached_target_stage().execute_by_framework()
+
+	def on_element_not_added(self, pipe):
+		# do nothing
+		pass
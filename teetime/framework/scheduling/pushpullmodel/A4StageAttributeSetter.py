@@ -11,57 +11,74 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+from typing import Dict, Optional, Set
 
-import java.util.Set
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.Configuration import Configuration
+from teetime.framework.ConfigurationFacade import ConfigurationFacade
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.TeeTimeScheduler import TeeTimeScheduler
+from teetime.framework.scheduling.WorkerThreadPool import WorkerThreadPool
+from teetime.framework.Traverser import Traverser
+from teetime.framework.scheduling.pushpullmodel.IntraStageCollector import IntraStageCollector
+from teetime.framework.scheduling.pushpullmodel.RunnableConsumerStage import RunnableConsumerStage
+from teetime.framework.scheduling.pushpullmodel.RunnableProducerStage import RunnableProducerStage
+from teetime.framework.scheduling.pushpullmodel.TeeTimeProcess import TeeTimeProcess
+from teetime.framework.scheduling.pushpullmodel.TeeTimeThread import TeeTimeThread
 
-import teetime.framework.*
-import teetime.framework.exceptionHandling.AbstractExceptionListener
+STAGE_FACADE = StageFacade.INSTANCE
+CONFIG_FACADE = ConfigurationFacade.INSTANCE
 
-# Sets the attributes of all stages within the same thread
 class A4StageAttributeSetter:
 
-	private static final StageFacade STAGE_FACADE = StageFacade.INSTANCE
-	private static final ConfigurationFacade CONFIG_FACADE = ConfigurationFacade.INSTANCE
+	# requires: factory and context
+	_configuration: Configuration
+	_threadable_stages: Set[AbstractStage]
+	_scheduler: TeeTimeScheduler
+	_intra_stages: Optional[Dict[AbstractStage, Set[AbstractStage]]]
+	_worker_pool: Optional[WorkerThreadPool]
 
-	// requires: factory and context
-	private final Configuration configuration
-	private final Set<AbstractStage> threadableStages
-	private final TeeTimeScheduler scheduler
+	# @param intra_stages
+	#            the intra stages of each threadable stage if already known, e.g., from a:@link CompiledConfiguration}
+	# @param worker_pool
+	#            to lease the threads from. Defaults to:@link WorkerThreadPool#INSTANCE}.
+	def __init__(self, configuration: Configuration, threadable_stages: Set[AbstractStage], scheduler: TeeTimeScheduler,
+			intra_stages: Optional[Dict[AbstractStage, Set[AbstractStage]]] = None, worker_pool: Optional[WorkerThreadPool] = None):
+		super().__init__()
+		self._configuration = configuration
+		self._threadable_stages = threadable_stages
+		self._scheduler = scheduler
+		self._intra_stages = intra_stages
+		self._worker_pool = worker_pool
 
-	public A4StageAttributeSetter(final Configuration configuration, final Set<AbstractStage> threadableStages, final TeeTimeScheduler scheduler):
-		super()
-		self.configuration = configuration
-		self.threadableStages = threadableStages
-		self.scheduler = scheduler
-	}
+	def set_attributes(self):
+		for threadable_stage in self._threadable_stages:
+			if (self._intra_stages is not None):
+				intra_stages = set(self._intra_stages[threadable_stage])
+			else:
+				collector = IntraStageCollector(threadable_stage)
+				traverser = Traverser(collector)
+				traverser.traverse(threadable_stage)
+				intra_stages = collector.get_intra_stages()
 
-	public void setAttributes():
-		for (AbstractStage threadableStage : threadableStages):
-			IntraStageCollector collector = new IntraStageCollector(threadableStage)
-			Traverser traverser = new Traverser(collector)
-			traverser.traverse(threadableStage)
+			self._set_attributes(threadable_stage, intra_stages)
 
-			setAttributes(threadableStage, collector.getIntraStages())
-		}
-	}
+	def _set_attributes(self, threadable_stage: AbstractStage, intra_stages: Set[AbstractStage]):
+		if (threadable_stage.is_producer()):
+			runnable = RunnableProducerStage(threadable_stage)
+		else:
+			runnable = RunnableConsumerStage(threadable_stage)
 
-	private void setAttributes(final AbstractStage threadableStage, final Set<AbstractStage> intraStages):
-		AbstractRunnableStage runnable
-		if (threadableStage.isProducer()):
-			runnable = new RunnableProducerStage(threadableStage)
-		} else:
-			runnable = new RunnableConsumerStage(threadableStage)
-		}
+		if (threadable_stage.is_process_hosted()):
+			new_thread = TeeTimeProcess(runnable, "Process for " + threadable_stage.get_id())
+		else:
+			new_thread = TeeTimeThread(runnable, "Thread for " + threadable_stage.get_id(), self._worker_pool)
+		exception_handler = CONFIG_FACADE.get_factory(self._configuration).create_instance(new_thread)
 
-		Thread newThread = new TeeTimeThread(runnable, "Thread for " + threadableStage.getId())
-		AbstractExceptionListener exceptionhandler = CONFIG_FACADE.getFactory(configuration).createInstance(newThread)
-
-		intraStages.add(threadableStage)
-		for (AbstractStage stage : intraStages):
-			STAGE_FACADE.setOwningThread(stage, newThread)
-			STAGE_FACADE.setExceptionHandler(stage, exceptionhandler)
-			STAGE_FACADE.setScheduler(stage, scheduler)
-		}
-	}
-}
+		intra_stages.add(threadable_stage)
+		if (isinstance(new_thread, TeeTimeProcess)):
+			new_thread.set_hosted_stages(intra_stages)
+		for stage in intra_stages:
+			STAGE_FACADE.set_owning_thread(stage, new_thread)
+			STAGE_FACADE.set_exception_handler(stage, exception_handler)
+			STAGE_FACADE.set_scheduler(stage, self._scheduler)
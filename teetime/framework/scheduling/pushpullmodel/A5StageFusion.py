@@ -0,0 +1,134 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+from typing import Dict, List, Set, Tuple
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+from teetime.framework.pipe.FusedChainPipe import FusedChainPipe
+from teetime.framework.pipe.FusedPipe import FusedPipe
+from teetime.framework.pipe.UnsynchedPipe import UnsynchedPipe
+from teetime.framework.pipe.pipe import IPipe
+from teetime.framework.scheduling.PipeScheduler import PipeScheduler
+from teetime.stage.basic.AbstractTransformation import AbstractTransformation
+
+LOGGER = logging.getLogger("A5StageFusion")
+
+# Fuses linear chains of passive filters and transformations (see:@link AbstractTransformation})
+# which are connected by:@link UnsynchedPipe}s, e.g., <code>Tokenizer -> ToLowerCase -> MappingCounter</code>.
+# <p>
+# Without fusion, each hop stores the element in the pipe, notifies the scheduler,
+# and lets the target stage receive it via its input port within its own try/except.
+# With fusion, the first pipe of a chain is replaced by a:@link FusedChainPipe}, which wraps the whole chain in a single try/except,
+# and each further pipe by a:@link FusedPipe}, which calls the element-wise <code>_execute</code> of its target stage directly.
+# A chain is strictly linear: it ends at a fan-out, i.e., each outgoing fusible pipe of such a stage heads its own chain,
+# and before a fan-in.
+# Signals still travel along the (fused) pipes as before.
+# </p>
+# Requires the pipes to be instantiated (see:@link A3PipeInstantiation}).
+class A5StageFusion(ITraverserVisitor):
+
+	_visited_pipes: Set[IPipe]
+	_fusible_pipes: List[UnsynchedPipe]
+	_pipe_scheduler: PipeScheduler
+
+	# @param pipe_scheduler
+	#            the scheduler of the pipes which are not affected by the fusion
+	def __init__(self, pipe_scheduler: PipeScheduler):
+		self._visited_pipes = set()
+		self._fusible_pipes = []
+		self._pipe_scheduler = pipe_scheduler
+
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		pipe = port.get_pipe()
+		if (pipe in self._visited_pipes):
+			return Traverser.VisitorBehavior.STOP # NOPMD two returns are better
+		self._visited_pipes.add(pipe)
+
+		if (self._is_fusible(pipe)):
+			self._fusible_pipes.append(pipe)
+
+		return Traverser.VisitorBehavior.CONTINUE_BACK_AND_FORTH
+
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		# do nothing
+		pass
+
+	def _is_fusible(self, pipe: IPipe) -> bool:
+		# exact type check: subclasses of UnsynchedPipe may rely on buffering the element
+		if (type(pipe) is not UnsynchedPipe):
+			return False
+		target_stage = pipe.get_cached_target_stage()
+		return isinstance(target_stage, AbstractTransformation) and not target_stage.is_active() \
+				and pipe.get_source_port().get_owning_stage() is not target_stage
+
+	# Replaces all fusible pipes found by the previous traversals.
+	#
+	# @return the number of fused chains
+	def fuse(self) -> int:
+		pipe_by_source_stage: Dict[AbstractStage, List[UnsynchedPipe]] = {}
+		fused_targets = set()
+		for pipe in self._fusible_pipes:
+			pipe_by_source_stage.setdefault(pipe.get_source_port().get_owning_stage(), []).append(pipe)
+			fused_targets.add(pipe.get_cached_target_stage())
+
+		num_chains = 0
+		for pipe in self._fusible_pipes:
+			source_stage = pipe.get_source_port().get_owning_stage()
+			if (source_stage in fused_targets and self._continues_chain(source_stage, pipe_by_source_stage)):
+				continue # inner pipe: replaced by the head of its chain
+			chain_stages, inner_pipes = self._collect_chain(pipe, pipe_by_source_stage)
+			self._replace_chain(pipe, chain_stages, inner_pipes)
+			num_chains += 1
+			LOGGER.debug("Fused %s", " -> ".join(stage.get_id() for stage in chain_stages))
+
+		self._fusible_pipes.clear()
+		return num_chains
+
+	# A chain ends at a stage with more than one outgoing fusible pipe (a fan-out)
+	# and before a stage with more than one incoming pipe (a fan-in).
+	#
+	# @return <code>true</code> iff the chain which contains the given stage continues with its only outgoing fusible pipe
+	def _continues_chain(self, stage: AbstractStage, pipe_by_source_stage: Dict[AbstractStage, List[UnsynchedPipe]]) -> bool:
+		out_pipes = pipe_by_source_stage.get(stage, ())
+		return len(out_pipes) == 1 and len(out_pipes[0].get_cached_target_stage().get_input_ports()) == 1
+
+	# @return the stages of the linear chain headed by the given pipe, and the pipes between them
+	def _collect_chain(self, head_pipe: UnsynchedPipe,
+			pipe_by_source_stage: Dict[AbstractStage, List[UnsynchedPipe]]) -> Tuple[List[AbstractStage], List[UnsynchedPipe]]:
+		chain_stages = [head_pipe.get_cached_target_stage()]
+		inner_pipes = []
+		visited_stages = set(chain_stages)
+		while (self._continues_chain(chain_stages[-1], pipe_by_source_stage)):
+			pipe = pipe_by_source_stage[chain_stages[-1]][0]
+			stage = pipe.get_cached_target_stage()
+			if (stage in visited_stages):
+				break # a cycle within the chain
+			visited_stages.add(stage)
+			chain_stages.append(stage)
+			inner_pipes.append(pipe)
+		return chain_stages, inner_pipes
+
+	def _replace_chain(self, head_pipe: UnsynchedPipe, chain_stages: List[AbstractStage], inner_pipes: List[UnsynchedPipe]):
+		fused_pipe = FusedChainPipe(head_pipe.get_source_port(), head_pipe.get_target_port(), chain_stages)
+		fused_pipe.set_scheduler(self._pipe_scheduler)
+		for pipe in inner_pipes:
+			fused_pipe = FusedPipe(pipe.get_source_port(), pipe.get_target_port())
+			fused_pipe.set_scheduler(self._pipe_scheduler)
@@ -11,75 +11,61 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+import logging
 
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.util.StopWatch import StopWatch
 
-import teetime.framework.AbstractStage
-import teetime.framework.StageFacade
-import teetime.util.StopWatch
+class AbstractRunnableStage:
 
-abstract class AbstractRunnableStage implements Runnable:
+	_TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION = "Terminating thread due to the following exception: "
 
-	private static final String TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION = "Terminating thread due to the following exception: "
+	stage: AbstractStage
+	_logger: logging.Logger
 
-	protected final AbstractStage stage
-	@SuppressWarnings("PMD.LoggerIsNotStaticFinal")
-	protected final Logger logger
+	_durations_in_ns: int = 0
 
-	private final StopWatch stopWatch = new StopWatch()
-	private long durationsInNs
-
-	protected AbstractRunnableStage(final AbstractStage stage):
-		if (stage == null):
-			throw new IllegalArgumentException("Argument stage may not be null")
-		}
+	def __init__(self, stage: AbstractStage):
+		if (stage is None):
+			raise ValueError("Argument stage may not be None")
 
 		self.stage = stage
-		self.logger = LoggerFactory.getLogger(stage.getClass())
-	}
+		self._logger = logging.getLogger(type(stage).__name__)
+		self._stop_watch = StopWatch()
 
-	@Override
-	public final void run():
-		final AbstractStage stage = self.stage // should prevent the stage to be reloaded after a volatile read
-		final Logger logger = self.logger // should prevent the logger to be reloaded after a volatile read
+	def run(self):
+		stage = self.stage
+		logger = self._logger
 
 		logger.debug("Executing runnable stage...")
 
 		try:
-			beforeStageExecution()
-			stopWatch.start()
+			self._before_stage_execution()
+			self._stop_watch.start()
 			try:
-				StageFacade.INSTANCE.runStage(stage)
-			} finally:
-				stopWatch.end()
-				durationsInNs = stopWatch.getDurationInNs()
-				// create and pass TERM to all input ports (for both producer and consumer)
-				afterStageExecution()
-			}
+				StageFacade.INSTANCE.run_stage(stage)
+			finally:
+				self._stop_watch.end()
+				self._durations_in_ns = self._stop_watch.get_duration_in_ns()
+				# create and pass TERM to all input ports (for both producer and consumer)
+				self._after_stage_execution()
 
-		} catch (RuntimeException e):
-			logger.error(TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION, e)
-			throw e
-		} catch (InterruptedException e):
-			// logger.error(TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION, e)
-			StageFacade.INSTANCE.getExceptionListener(stage).reportException(e, stage)
-		}
+		except Exception as e:
+			logger.error(self._TERMINATING_THREAD_DUE_TO_THE_FOLLOWING_EXCEPTION, exc_info=e)
+			raise
 
-		logger.debug("Finished runnable stage. ({})", stage.getId())
-	}
+		logger.debug("Finished runnable stage. (%s)", stage.get_id())
 
 	# Only accessible after thread termination.
 	#
 	# @return the thread's execution time in nanoseconds
-	// TODO not yet used and accessed reasonable
-	public long getDurationsInNs():
-		return durationsInNs
-	}
-
-	protected abstract void beforeStageExecution() throws InterruptedException
+	# TODO not yet used and accessed reasonable
+	def get_durations_in_ns(self) -> int:
+		return self._durations_in_ns
 
-	protected abstract void afterStageExecution()
+	def _before_stage_execution(self):
+		pass
 
-}
+	def _after_stage_execution(self):
+		pass
@@ -11,48 +11,36 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
-
-import java.util.HashSet
-import java.util.Set
-
-import teetime.framework.AbstractPort
-import teetime.framework.AbstractStage
-import teetime.framework.ITraverserVisitor
-import teetime.framework.Traverser.VisitorBehavior
-import teetime.framework.pipe.DummyPipe
-
-class IntraStageCollector implements ITraverserVisitor:
-
-	private final Set<AbstractStage> intraStages = new HashSet<AbstractStage>()
-	private final AbstractStage startStage
-
-	public IntraStageCollector(final AbstractStage startStage):
-		super()
-		self.startStage = startStage
-	}
-
-	@Override
-	public VisitorBehavior visit(final AbstractStage stage):
-		if (stage.equals(startStage) || !stage.isActive()):
-			intraStages.add(stage)
-			return VisitorBehavior.CONTINUE_FORWARD // NOPMD two return stmts make the code clearer to understand
-		}
-		return VisitorBehavior.STOP
-	}
-
-	@Override
-	public VisitorBehavior visit(final AbstractPort<?> port):
-		return VisitorBehavior.CONTINUE_FORWARD
-	}
-
-	@Override
-	public void visit(final DummyPipe pipe, final AbstractPort<?> port):
-		// do nothing
-	}
-
-	public Set<AbstractStage> getIntraStages():
-		return intraStages
-	}
-
-}
+from typing import Set
+
+from teetime.framework.AbstractPort import AbstractPort
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.ITraverserVisitor import ITraverserVisitor
+from teetime.framework.Traverser import Traverser
+from teetime.framework.pipe.DummyPipe import DummyPipe
+
+class IntraStageCollector(ITraverserVisitor):
+
+	_intra_stages: Set[AbstractStage]
+	_start_stage: AbstractStage
+
+	def __init__(self, start_stage: AbstractStage):
+		super().__init__()
+		self._intra_stages = set()
+		self._start_stage = start_stage
+
+	def visit_stage(self, stage: AbstractStage) -> Traverser.VisitorBehavior:
+		if (stage is self._start_stage or not stage.is_active()):
+			self._intra_stages.add(stage)
+			return Traverser.VisitorBehavior.CONTINUE_FORWARD # NOPMD two return stmts make the code clearer to understand
+		return Traverser.VisitorBehavior.STOP
+
+	def visit_port(self, port: AbstractPort) -> Traverser.VisitorBehavior:
+		return Traverser.VisitorBehavior.CONTINUE_FORWARD
+
+	def visit_dummy_pipe(self, pipe: DummyPipe, port: AbstractPort):
+		# do nothing
+		pass
+
+	def get_intra_stages(self) -> Set[AbstractStage]:
+		return self._intra_stages
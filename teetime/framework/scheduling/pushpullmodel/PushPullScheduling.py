@@ -11,260 +11,275 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
-
-import java.util.*
+import logging
+from time import perf_counter_ns
+from typing import Collection, Dict, List, Optional, Set
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.CompiledConfiguration import CompiledConfiguration
+from teetime.framework.Configuration import Configuration
+from teetime.framework.ConfigurationFacade import ConfigurationFacade
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.TeeTimeScheduler import TeeTimeScheduler
+from teetime.framework.TerminationStrategy import TerminationStrategy
+from teetime.framework.Traverser import Traverser
+from teetime.framework.scheduling.CountDownAndUpLatch import CountDownAndUpLatch
+from teetime.framework.scheduling.StartupPipeline import StartupPipeline
+from teetime.framework.scheduling.WorkerThreadPool import WorkerThreadPool
+from teetime.framework.scheduling.pushpullmodel.A1ThreadableStageCollector import A1ThreadableStageCollector
+from teetime.framework.scheduling.pushpullmodel.A2InvalidThreadAssignmentCheck import A2InvalidThreadAssignmentCheck
+from teetime.framework.scheduling.pushpullmodel.A3PipeInstantiation import A3PipeInstantiation
+from teetime.framework.scheduling.pushpullmodel.A4StageAttributeSetter import A4StageAttributeSetter
+from teetime.framework.scheduling.pushpullmodel.A5StageFusion import A5StageFusion
+from teetime.framework.scheduling.pushpullmodel.IntraStageCollector import IntraStageCollector
+from teetime.framework.scheduling.pushpullmodel.TeeTimeProcess import TeeTimeProcess
+from teetime.framework.scheduling.pushpullmodel.ThreadListener import ThreadListener
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+from teetime.framework.validation.AnalysisNotValidException import AnalysisNotValidException
+
+LOGGER = logging.getLogger("PushPullScheduling")
+
+STAGE_FACADE = StageFacade.INSTANCE
+CONFIG_FACADE = ConfigurationFacade.INSTANCE
+
+class PushPullScheduling(TeeTimeScheduler, ThreadListener):
+
+	_consumer_threads: List
+	_finite_producer_threads: List
+	_infinite_producer_threads: List
+
+	_threadable_stages: Set[AbstractStage]
+
+	_configuration: Configuration
+	_stage_fusion_enabled: bool
+	_worker_pool: Optional[WorkerThreadPool]
+
+	_num_running_finite_producers: CountDownAndUpLatch
+	_num_running_consumers: CountDownAndUpLatch
+	_startup_pipeline: StartupPipeline
+
+	# requires: startstages, factory and context
+	#
+	# @param stage_fusion_enabled
+	#            whether chains of passive filters and transformations are fused (see:@link A5StageFusion})
+	# @param worker_pool
+	#            to lease the threads from. Defaults to the process-wide:@link WorkerThreadPool#INSTANCE}.
+	def __init__(self, configuration: Configuration, stage_fusion_enabled: bool = True, worker_pool: Optional[WorkerThreadPool] = None):
+		self._configuration = configuration
+		self._stage_fusion_enabled = stage_fusion_enabled
+		self._worker_pool = worker_pool
+		self._consumer_threads = []
+		self._finite_producer_threads = []
+		self._infinite_producer_threads = []
+		self._threadable_stages = set()
+		self._num_running_finite_producers = CountDownAndUpLatch()
+		self._num_running_consumers = CountDownAndUpLatch()
+		self._startup_pipeline = StartupPipeline()
+
+	def on_initialize(self):
+		start_stages = CONFIG_FACADE.get_start_stages(self._configuration)
+		topology = CONFIG_FACADE.get_compiled_topology(self._configuration)
+
+		new_threadable_stages = self._initialize(start_stages, topology)
+		self._start_threads(new_threadable_stages)
+
+	def start_stage_at_runtime(self, new_stage: AbstractStage):
+		self.start_stages_at_runtime([new_stage])
+
+	# Initializes all given stages in a single traversal and then starts their threads together.
+	def start_stages_at_runtime(self, new_stages: Collection[AbstractStage]):
+		new_stages = list(new_stages)
+		for new_stage in new_stages:
+			new_stage.declare_active()
+
+		new_threadable_stages = self._initialize(new_stages)
+		self._start_threads(new_threadable_stages)
+
+		# FIXME remove this hack and find a consistent solution
+		new_producer_stages = [new_stage for new_stage in new_stages if new_stage.is_producer()]
+		for new_stage in new_producer_stages:
+			validating_signal = ValidatingSignal()
+			new_stage.on_signal(validating_signal, None)
+			if (len(validating_signal.get_invalid_port_connections()) > 0):
+				raise AnalysisNotValidException(validating_signal.get_invalid_port_connections())
+		if (new_producer_stages):
+			self._send_starting_signal(new_threadable_stages)
+
+	# extracted for runtime use
+	#
+	# @param topology
+	#            of the given start stages if compiled in advance. Then, the corresponding traversals are skipped.
+	def _initialize(self, start_stages: Collection[AbstractStage], topology: Optional[CompiledConfiguration.Topology] = None) -> Set[AbstractStage]:
+		if (not start_stages):
+			raise Exception("The start stage may not be null.") # IllegalStateException
+
+		if (topology is None):
+			stage_collector = A1ThreadableStageCollector()
+			traversor = Traverser(stage_collector)
+			for start_stage in start_stages:
+				traversor.traverse(start_stage)
+
+			new_threadable_stages = stage_collector.get_threadable_stages()
+		else:
+			new_threadable_stages = set(topology.get_threadable_stages())
+
+		self._threadable_stages.update(new_threadable_stages)
+		if (not self._threadable_stages):
+			raise Exception("1004 - No threadable stages in this configuration.") # IllegalStateException
+
+		if (topology is None):
+			checker = A2InvalidThreadAssignmentCheck(new_threadable_stages)
+			checker.check()
+			intra_stages = None
+		else:
+			# already checked upon compilation
+			intra_stages = topology.get_intra_stages()
+
+		pipe_visitor = A3PipeInstantiation(self._collect_process_hosted_stages(new_threadable_stages, intra_stages))
+		self._visit_pipes(pipe_visitor, start_stages, topology)
+
+		attribute_setter = A4StageAttributeSetter(self._configuration, new_threadable_stages, self, intra_stages, self._worker_pool)
+		attribute_setter.set_attributes()
+		self._place_threads(new_threadable_stages)
+
+		if (self._stage_fusion_enabled):
+			stage_fusion = A5StageFusion(pipe_visitor)
+			self._visit_pipes(stage_fusion, start_stages, topology)
+			stage_fusion.fuse()
+
+		for stage in new_threadable_stages:
+			self._categorize_threadable_stage(stage)
+			# watchTerminationThread.addConsumerStage(stage)
+
+		return new_threadable_stages
+
+	# Pins the threads (and processes) of the given threadable stages according to the configuration's placement policy, if any.
+	def _place_threads(self, threadable_stages: Set[AbstractStage]):
+		placement_policy = self._configuration.get_placement_policy()
+		if (placement_policy is None):
+			return
+		for stage, cpus in placement_policy.place_stages(threadable_stages).items():
+			STAGE_FACADE.get_owning_thread(stage).set_cpu_affinity(cpus)
+
+	# Lets the given visitor visit each connection, either by traversing the graph or by means of the compiled topology.
+	def _visit_pipes(self, visitor, start_stages: Collection[AbstractStage], topology: Optional[CompiledConfiguration.Topology]):
+		if (topology is None):
+			traversor = Traverser(visitor)
+			for start_stage in start_stages:
+				traversor.traverse(start_stage)
+		else:
+			for output_port in topology.get_connected_output_ports():
+				visitor.visit_port(output_port)
+
+	# @return the process-hosted threadable stages together with their intra stages
+	def _collect_process_hosted_stages(self, threadable_stages: Set[AbstractStage],
+			intra_stages: Optional[Dict[AbstractStage, Set[AbstractStage]]] = None) -> Set[AbstractStage]:
+		process_hosted_stages = set()
+		for threadable_stage in threadable_stages:
+			if (threadable_stage.is_process_hosted()):
+				if (intra_stages is not None):
+					process_hosted_stages.update(intra_stages[threadable_stage])
+				else:
+					collector = IntraStageCollector(threadable_stage)
+					Traverser(collector).traverse(threadable_stage)
+					process_hosted_stages.update(collector.get_intra_stages())
+		return process_hosted_stages
+
+	def _categorize_threadable_stage(self, stage: AbstractStage):
+		termination_strategy = STAGE_FACADE.get_termination_strategy(stage)
+
+		thread = STAGE_FACADE.get_owning_thread(stage)
+		if (termination_strategy == TerminationStrategy.BY_INTERRUPT):
+			self._infinite_producer_threads.append(thread)
+		elif (termination_strategy == TerminationStrategy.BY_SELF_DECISION):
+			self._finite_producer_threads.append(thread)
+		elif (termination_strategy == TerminationStrategy.BY_SIGNAL):
+			self._consumer_threads.append(thread)
+		else:
+			LOGGER.warning("Unknown termination strategy '%s' in stage %s", termination_strategy, stage)
+
+	# Forks the worker processes before any thread is started
+	# since forking a multithreaded process may deadlock the child (see:@link TeeTimeProcess}).
+	def _start_threads(self, threadable_stages: Set[AbstractStage]):
+		threads = []
+		processes = []
+		for stage in threadable_stages:
+			thread = STAGE_FACADE.get_owning_thread(stage)
+			thread.set_listener(self)
+			if (isinstance(thread, TeeTimeProcess)):
+				processes.append(thread)
+			else:
+				threads.append(thread)
+
+		TeeTimeProcess.start_all(processes)
+		for thread in threads:
+			thread.start()
 
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
+	def _send_starting_signal(self, new_threadable_stages: Set[AbstractStage]):
+		for stage in new_threadable_stages:
+			STAGE_FACADE.get_owning_thread(stage).send_starting_signal()
 
-import teetime.framework.*
-import teetime.framework.scheduling.CountDownAndUpLatch
-import teetime.framework.signal.ValidatingSignal
-import teetime.framework.validation.AnalysisNotValidException
-
-public class PushPullScheduling implements TeeTimeScheduler, ThreadListener:
-
-	private static final Logger LOGGER = LoggerFactory.getLogger(PushPullScheduling.class)
-
-	private static final StageFacade STAGE_FACADE = StageFacade.INSTANCE
-	private static final ConfigurationFacade CONFIG_FACADE = ConfigurationFacade.INSTANCE
-
-	private final List<Thread> consumerThreads = Collections.synchronizedList(new LinkedList<Thread>())
-	private final List<Thread> finiteProducerThreads = Collections.synchronizedList(new LinkedList<Thread>())
-	private final List<Thread> infiniteProducerThreads = Collections.synchronizedList(new LinkedList<Thread>())
-
-	private final Set<AbstractStage> threadableStages = Collections.synchronizedSet(new HashSet<AbstractStage>())
-
-	private final Configuration configuration
-
-	private final CountDownAndUpLatch numRunningFiniteProducers = new CountDownAndUpLatch()
-	private final CountDownAndUpLatch numRunningConsumers = new CountDownAndUpLatch()
-
-	// requires: startstages, factory and context
-	public PushPullScheduling(final Configuration configuration):
-		self.configuration = configuration
-	}
-
-	@Override
-	public void onInitialize():
-		Collection<AbstractStage> startStages = CONFIG_FACADE.getStartStages(configuration)
-
-		Set<AbstractStage> newThreadableStages = initialize(startStages)
-		startThreads(newThreadableStages)
-	}
-
-	@Override
-	public void startStageAtRuntime(final AbstractStage newStage):
-		newStage.declareActive()
-		List<AbstractStage> newStages = Arrays.asList(newStage)
-
-		Set<AbstractStage> newThreadableStages = initialize(newStages)
-		startThreads(newThreadableStages)
-
-		// FIXME remove this hack and find a consistent solution
-		if (newStage.isProducer()):
-			ValidatingSignal validatingSignal = new ValidatingSignal()
-			newStage.onSignal(validatingSignal, null)
-			if (validatingSignal.getInvalidPortConnections().size() > 0):
-				throw new AnalysisNotValidException(validatingSignal.getInvalidPortConnections())
-			}
-			sendStartingSignal(newThreadableStages)
-		}
-	}
-
-	// extracted for runtime use
-	private Set<AbstractStage> initialize(final Collection<AbstractStage> startStages):
-		if (startStages.isEmpty()):
-			throw new IllegalStateException("The start stage may not be null.")
-		}
-
-		A1ThreadableStageCollector stageCollector = new A1ThreadableStageCollector()
-		Traverser traversor = new Traverser(stageCollector)
-		for (AbstractStage startStage : startStages):
-			traversor.traverse(startStage)
-		}
-
-		Set<AbstractStage> newThreadableStages = stageCollector.getThreadableStages()
-
-		threadableStages.addAll(newThreadableStages)
-		if (threadableStages.isEmpty()):
-			throw new IllegalStateException("1004 - No threadable stages in this configuration.")
-		}
-
-		A2InvalidThreadAssignmentCheck checker = new A2InvalidThreadAssignmentCheck(newThreadableStages)
-		checker.check()
-
-		A3PipeInstantiation pipeVisitor = new A3PipeInstantiation()
-		traversor = new Traverser(pipeVisitor)
-		for (AbstractStage startStage : startStages):
-			traversor.traverse(startStage)
-		}
-
-		A4StageAttributeSetter attributeSetter = new A4StageAttributeSetter(configuration, newThreadableStages, this)
-		attributeSetter.setAttributes()
-
-		for (AbstractStage stage : newThreadableStages):
-			categorizeThreadableStage(stage)
-			// watchTerminationThread.addConsumerStage(stage)
-		}
-
-		return newThreadableStages
-	}
-
-	private void categorizeThreadableStage(final AbstractStage stage):
-		TerminationStrategy terminationStrategy = STAGE_FACADE.getTerminationStrategy(stage)
-
-		switch (terminationStrategy):
-		case BY_INTERRUPT::
-			Thread thread = STAGE_FACADE.getOwningThread(stage)
-			infiniteProducerThreads.add(thread)
-			break
-		}
-		case BY_SELF_DECISION::
-			Thread thread = STAGE_FACADE.getOwningThread(stage)
-			finiteProducerThreads.add(thread)
-			break
-		}
-		case BY_SIGNAL::
-			Thread thread = STAGE_FACADE.getOwningThread(stage)
-			consumerThreads.add(thread)
-			break
-		}
-		default:
-			LOGGER.warn("Unknown termination strategy '{}' in stage:}", terminationStrategy, stage)
-			break
-		}
-	}
-
-	private void startThreads(final Set<AbstractStage> threadableStages):
-		for (AbstractStage stage : threadableStages):
-			TeeTimeThread thread = (TeeTimeThread) STAGE_FACADE.getOwningThread(stage)
-			thread.setListener(this)
-			thread.start()
-		}
-	}
-
-	private void sendStartingSignal(final Set<AbstractStage> newThreadableStages):
-		// TODO why synchronized?
-		synchronized (newThreadableStages):
-			for (AbstractStage stage : newThreadableStages):
-				((TeeTimeThread) STAGE_FACADE.getOwningThread(stage)).sendStartingSignal()
-			}
-		}
-	}
-
-	@Override
-	public void onValidate():
-		// BETTER validate concurrently
-		for (AbstractStage stage : threadableStages):
-			final ValidatingSignal validatingSignal = new ValidatingSignal() // NOPMD we need a new instance every iteration
-			stage.onSignal(validatingSignal, null)
-			if (validatingSignal.getInvalidPortConnections().size() > 0):
-				throw new AnalysisNotValidException(validatingSignal.getInvalidPortConnections())
-			}
-		}
-	}
-
-	@Override
-	public void onExecute():
-		sendStartingSignal(threadableStages)
-	}
-
-	@Override
-	public void onTerminate():
-		abortStages(threadableStages)
-	}
-
-	private void abortStages(final Set<AbstractStage> currentTreadableStages):
-		synchronized (currentTreadableStages):
-			for (AbstractStage stage : currentTreadableStages):
-				STAGE_FACADE.abort(stage)
-			}
-		}
-	}
-
-	@Override
-	public void onFinish():
+	def on_validate(self):
+		start = perf_counter_ns()
+		invalid_port_connections = []
 		try:
-			numRunningFiniteProducers.await()
-		} catch (InterruptedException e):
-			LOGGER.error("Execution has stopped unexpectedly", e)
-			for (Thread thread : self.finiteProducerThreads):
-				thread.interrupt()
-			}
-		}
+			# each threadable stage validates its own intra stages
+			for stage in self._threadable_stages:
+				invalid_port_connections.extend(self._validate_stage(stage))
+		finally:
+			self._startup_pipeline.record_duration("validating_signal", start)
+
+		if (invalid_port_connections):
+			raise AnalysisNotValidException(invalid_port_connections)
+
+	def _validate_stage(self, stage: AbstractStage) -> List:
+		validating_signal = ValidatingSignal() # NOPMD we need a new instance for every stage
+		stage.on_signal(validating_signal, None)
+		return validating_signal.get_invalid_port_connections()
+
+	def on_execute(self):
+		start = perf_counter_ns()
+		try:
+			self._send_starting_signal(self._threadable_stages)
+		finally:
+			self._startup_pipeline.record_duration("starting_signal", start)
 
-		if (!self.infiniteProducerThreads.isEmpty()):
+	def get_startup_durations_in_ns(self) -> Dict[str, int]:
+		return self._startup_pipeline.get_durations_in_ns()
+
+	def on_terminate(self):
+		self._abort_stages(self._threadable_stages)
+
+	def _abort_stages(self, current_treadable_stages: Set[AbstractStage]):
+		for stage in list(current_treadable_stages):
+			STAGE_FACADE.abort(stage)
+
+	def on_finish(self):
+		self._num_running_finite_producers.await_()
+
+		if (self._infinite_producer_threads):
 			LOGGER.debug("Interrupting infiniteProducerThreads...")
-			for (Thread thread : self.infiniteProducerThreads):
+			for thread in self._infinite_producer_threads:
 				thread.interrupt()
-			}
 			LOGGER.debug("infiniteProducerThreads have been terminated")
-		}
 
-		try:
-			numRunningConsumers.await()
-		} catch (InterruptedException e):
-			LOGGER.error("Execution has stopped unexpectedly", e)
-			synchronized (consumerThreads):
-				for (Thread thread : self.consumerThreads):
-					thread.interrupt()
-				}
-			}
-		}
-
-		// List<Exception> exceptions = collectExceptions()
-		// if (!exceptions.isEmpty()):
-		// throw new ExecutionException(exceptions)
-		// }
-	}
-
-	@Override
-	public void onBeforeStart(final AbstractStage stage):
-		switch (STAGE_FACADE.getTerminationStrategy(stage)):
-		case BY_SELF_DECISION:
-			numRunningFiniteProducers.countUp()
-			break
-		case BY_SIGNAL:
-			numRunningConsumers.countUp()
-			break
-		default:
-			break
-		}
-	}
-
-	@Override
-	public void onAfterTermination(final AbstractStage stage):
-		switch (STAGE_FACADE.getTerminationStrategy(stage)):
-		case BY_SELF_DECISION:
-			numRunningFiniteProducers.countDown()
-			break
-		case BY_SIGNAL:
-			numRunningConsumers.countDown()
-			break
-		default:
-			break
-		}
-	}
-
-	// TODO impl throw exception... see line 175
-	// private List<Exception> collectExceptions():
-	// // Collection<ThreadThrowableContainer> exceptions = new ConcurrentLinkedQueue<ThreadThrowableContainer>()
-	// List<Exception> exceptions = new ArrayList<Exception>()
-	//
-	// // for (Stage stage : threadableStages.keySet()):
-	// // List<Exception> stageExceptions = stage.exceptionListener.getExceptions()
-	// // exceptions.addAll(stageExceptions)
-	// // }
-	//
-	// return exceptions
-	// }
-
-	// @Override
-	// void merge(final ThreadService source):
-	// threadableStages.putAll(source.getThreadableStages())
-	// // runnableCounter.inc(source.runnableCounter)
-	// }
-
-}
+		self._num_running_consumers.await_()
+
+		# List<Exception> exceptions = collectExceptions()
+		# if (!exceptions.isEmpty()):
+		# throw new ExecutionException(exceptions)
+		# }
+
+	def on_before_start(self, stage: AbstractStage):
+		termination_strategy = STAGE_FACADE.get_termination_strategy(stage)
+		if (termination_strategy == TerminationStrategy.BY_SELF_DECISION):
+			self._num_running_finite_producers.count_up()
+		elif (termination_strategy == TerminationStrategy.BY_SIGNAL):
+			self._num_running_consumers.count_up()
+
+	def on_after_termination(self, stage: AbstractStage):
+		termination_strategy = STAGE_FACADE.get_termination_strategy(stage)
+		if (termination_strategy == TerminationStrategy.BY_SELF_DECISION):
+			self._num_running_finite_producers.count_down()
+		elif (termination_strategy == TerminationStrategy.BY_SIGNAL):
+			self._num_running_consumers.count_down()
@@ -11,36 +11,26 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.scheduling.pushpullmodel.AbstractRunnableStage import AbstractRunnableStage
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
 
-import teetime.framework.*
-import teetime.framework.signal.ISignal
-import teetime.framework.signal.TerminatingSignal
-
-final class RunnableConsumerStage extends AbstractRunnableStage:
+class RunnableConsumerStage(AbstractRunnableStage):
 
 	# @param stage
 	#            to execute within an own thread
-	public RunnableConsumerStage(final AbstractStage stage):
-		super(stage)
-	}
-
-	@Override
-	protected void beforeStageExecution() throws InterruptedException:
-		logger.trace("waitForStartingSignal")
-		// FIXME should getInputPorts() really be defined in Stage?
-		// Instead, consider to provide a method "AbstractStage.waitForStartSignal"
-		for (InputPort<?> inputPort : StageFacade.INSTANCE.getInputPorts(stage)):
-			inputPort.waitForStartSignal()
-		}
-	}
+	def __init__(self, stage: AbstractStage):
+		super().__init__(stage)
 
-	@Override
-	protected void afterStageExecution():
-		final ISignal signal = new TerminatingSignal() // NOPMD DU caused by loop
-		for (InputPort<?> inputPort : StageFacade.INSTANCE.getInputPorts(stage)):
-			stage.onSignal(signal, inputPort)
-		}
-	}
+	def _before_stage_execution(self):
+		self._logger.debug("waitForStartingSignal")
+		# FIXME should getInputPorts() really be defined in Stage?
+		# Instead, consider to provide a method "AbstractStage.waitForStartSignal"
+		for input_port in StageFacade.INSTANCE.get_input_ports(self.stage):
+			input_port.wait_for_start_signal()
 
-}
+	def _after_stage_execution(self):
+		signal = TerminatingSignal() # NOPMD DU caused by loop
+		for input_port in StageFacade.INSTANCE.get_input_ports(self.stage):
+			self.stage.on_signal(signal, input_port)
@@ -11,41 +11,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+import threading
 
-import java.util.concurrent.Semaphore
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.scheduling.pushpullmodel.AbstractRunnableStage import AbstractRunnableStage
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
 
-import teetime.framework.AbstractStage
-import teetime.framework.signal.StartingSignal
-import teetime.framework.signal.TerminatingSignal
+class RunnableProducerStage(AbstractRunnableStage):
 
-class RunnableProducerStage extends AbstractRunnableStage:
+	def __init__(self, stage: AbstractStage):
+		super().__init__(stage)
+		self._start_semaphore = threading.Semaphore(0)
 
-	private final Semaphore startSemaphore = new Semaphore(0)
+	def _before_stage_execution(self):
+		self._wait_for_starting_signal()
+		self.stage.on_signal(StartingSignal(), None)
 
-	public RunnableProducerStage(final AbstractStage stage):
-		super(stage)
-	}
-
-	@Override
-	protected void beforeStageExecution() throws InterruptedException:
-		waitForStartingSignal()
-		self.stage.onSignal(new StartingSignal(), null)
-	}
-
-	@Override
-	protected void afterStageExecution():
-		self.stage.onSignal(new TerminatingSignal(), null)
-	}
+	def _after_stage_execution(self):
+		self.stage.on_signal(TerminatingSignal(), None)
 
 	# This method is thread-safe.
-	void triggerStartingSignal():
-		startSemaphore.release()
-	}
-
-	private void waitForStartingSignal() throws InterruptedException:
-		logger.trace("waitForStartingSignal")
-		startSemaphore.acquire()
-	}
+	def trigger_starting_signal(self):
+		self._start_semaphore.release()
 
-}
+	def _wait_for_starting_signal(self):
+		self._logger.debug("waitForStartingSignal")
+		self._start_semaphore.acquire()
@@ -0,0 +1,200 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import pickle
+import threading
+from typing import Collection, FrozenSet, List, Optional
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.exceptionHandling.TerminateException import TerminateException
+from teetime.framework.pipe.InterProcessPipe import InterProcessPipe
+from teetime.framework.placement.CpuAffinity import CpuAffinity
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
+
+from teetime.framework.scheduling.pushpullmodel.AbstractRunnableStage import AbstractRunnableStage
+from teetime.framework.scheduling.pushpullmodel.RunnableProducerStage import RunnableProducerStage
+from teetime.framework.scheduling.pushpullmodel.ThreadListener import DefaultThreadListener, ThreadListener
+
+# Hosts a threadable stage (and its intra stages) in an own worker process so that it is not bound by the GIL.
+# It offers the same interface as:@link TeeTimeThread}.
+# <p>
+# The worker process is forked so that it shares the configuration's:@link InterProcessPipe}s with the parent.
+# Hence, all pipes from and to the hosted stages must be:@link InterProcessPipe}s (see:@link A3PipeInstantiation}).
+# Any other state of the hosted stages, e.g., the elements collected by a sink, stays in the worker process.
+# The listener is notified within the parent process.
+# </p>
+# <p>
+# The exceptions raised within the worker process are sent back to the parent process
+# and recorded by the parent's copy of the hosted stages' exception listener.
+# A worker process which exits with a non-zero exit code without reporting an exception, e.g., because it has been killed,
+# is recorded as failed as well. In both cases,:@link Execution#wait_for_termination()} raises an:@link ExecutionException}.
+# Moreover, the input:@link InterProcessPipe}s of the hosted stages are marked as consumer-terminated
+# so that their producers do not wait forever for free capacity.
+# If the worker process has died without passing the terminating signal, e.g., due to SIGKILL,
+# the parent passes it into the output:@link InterProcessPipe}s on behalf of the hosted stages
+# so that their consumers terminate as well.
+# </p>
+# <p>
+# Forking a multithreaded process may deadlock the child on a lock which another thread holds at that time.
+# Hence,:@link #start_all(Collection)} forks all worker processes before any of their watcher threads is started,
+# and:@link PushPullScheduling} starts the worker processes before any of its threads.
+# </p>
+class TeeTimeProcess:
+
+	_runnable: AbstractRunnableStage
+	_listener: ThreadListener
+	_cpus: Optional[FrozenSet[int]] = None
+	_hosted_stages: FrozenSet[AbstractStage] = frozenset()
+	_interrupted: bool = False
+
+	def __init__(self, runnable: AbstractRunnableStage, name: str):
+		# raises a ValueError on platforms without fork()
+		context = multiprocessing.get_context("fork")
+		self._runnable = runnable
+		self._name = name
+		self._start_event = context.Event()
+		self._exception_receiver, self._exception_sender = context.Pipe(duplex=False)
+		self._process = context.Process(target=self._run_in_worker_process, name=name, daemon=True)
+		self._termination_watcher = threading.Thread(target=self._await_termination, name="Watcher of " + name, daemon=True)
+		self.set_listener(DefaultThreadListener())
+
+	def send_starting_signal(self):
+		if (isinstance(self._runnable, RunnableProducerStage)):
+			self._start_event.set()
+
+	def start(self):
+		TeeTimeProcess.start_all([self])
+
+	# Starts the given instances. All worker processes are forked before the first watcher thread is started.
+	@staticmethod
+	def start_all(processes: Collection["TeeTimeProcess"]):
+		for process in processes:
+			process._fork()
+		for process in processes:
+			process._termination_watcher.start()
+
+	def _fork(self):
+		self.get_listener().on_before_start(self._runnable.stage)
+		self._process.start()
+		# close the parent's copy so that receiving fails with an EOFError if the worker process dies without reporting
+		self._exception_sender.close()
+
+	# @param stages
+	#            the threadable stage and its intra stages which are hosted by this process
+	def set_hosted_stages(self, stages: Collection[AbstractStage]):
+		self._hosted_stages = frozenset(stages)
+
+	# Pins the worker process to the given CPUs when it is started.
+	#
+	# @param cpus
+	#            <code>None</code> to not pin the worker process
+	def set_cpu_affinity(self, cpus: Optional[Collection[int]]):
+		self._cpus = frozenset(cpus) if cpus is not None else None
+
+	def get_cpu_affinity(self) -> Optional[FrozenSet[int]]:
+		return self._cpus
+
+	def _run_in_worker_process(self):
+		self._exception_receiver.close()
+		exceptions: List[BaseException] = []
+		try:
+			if (self._cpus is not None):
+				CpuAffinity.pin_current_thread(self._cpus) # the worker process runs a single thread
+			if (isinstance(self._runnable, RunnableProducerStage)):
+				self._start_event.wait()
+				self._runnable.trigger_starting_signal()
+			self._runnable.run()
+		except TerminateException:
+			raise # the causing exception has been logged by the exception listener
+		except BaseException as e:
+			exceptions.append(e)
+			raise
+		finally:
+			# the worker process's copy of the listener holds the exceptions reported by the hosted stages
+			logged_exceptions = StageFacade.INSTANCE.get_exception_listener(self._runnable.stage).get_logged_exceptions()
+			self._exception_sender.send([self._to_picklable(e) for e in logged_exceptions + exceptions])
+			self._exception_sender.close()
+
+	@staticmethod
+	def _to_picklable(exception: BaseException) -> BaseException:
+		try:
+			pickle.dumps(exception)
+			return exception
+		except Exception:
+			return Exception(type(exception).__name__ + ": " + str(exception))
+
+	def _await_termination(self):
+		try:
+			try:
+				exceptions = self._exception_receiver.recv()
+				reported = True
+			except EOFError:
+				exceptions = [] # the worker process died before it could report
+				reported = False
+			finally:
+				self._exception_receiver.close()
+			self._process.join()
+			for stage in self._hosted_stages:
+				for input_port in stage.get_input_ports():
+					pipe = input_port.get_pipe()
+					if (isinstance(pipe, InterProcessPipe)):
+						pipe.mark_consumer_terminated()
+			if (not reported):
+				# the worker process reports only after its stages have passed the terminating signal
+				self._terminate_output_pipes()
+
+			exit_code = self._process.exitcode
+			if (not exceptions and exit_code != 0 and not self._interrupted):
+				exceptions = [Exception("Worker process " + self._name + " terminated with exit code " + str(exit_code))]
+			if (exceptions):
+				# the parent's copy of the listener is the one registered in the configuration's thread exceptions map
+				StageFacade.INSTANCE.get_exception_listener(self._runnable.stage).get_logged_exceptions().extend(exceptions)
+		finally:
+			self.get_listener().on_after_termination(self._runnable.stage)
+
+	# Passes the terminating signal on behalf of the hosted stages.
+	# Writing into the output pipes from the parent is safe since their only producer, the worker process, is dead.
+	def _terminate_output_pipes(self):
+		for stage in self._hosted_stages:
+			for output_port in StageFacade.INSTANCE.get_output_ports(stage):
+				if (isinstance(output_port.get_pipe(), InterProcessPipe)):
+					try:
+						output_port.send_signal(TerminatingSignal())
+					except TerminateException:
+						pass # the consumer process has terminated as well
+
+	def join(self, timeout: float = None):
+		self._termination_watcher.join(timeout)
+
+	def is_alive(self) -> bool:
+		return self._termination_watcher.is_alive()
+
+	# Terminates the worker process.
+	def interrupt(self):
+		self._interrupted = True
+		self._process.terminate()
+
+	def get_name(self) -> str:
+		return self._name
+
+	# @return the process id of the worker process, or <code>None</code> if it has not been started yet
+	def get_pid(self) -> int:
+		return self._process.pid
+
+	def get_listener(self) -> ThreadListener:
+		return self._listener
+
+	def set_listener(self, listener: ThreadListener):
+		self._listener = listener
@@ -11,48 +11,51 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+from typing import Optional
 
-class TeeTimeThread extends Thread:
+from teetime.framework.StageFacade import StageFacade
+from teetime.framework.scheduling.PooledThread import PooledThread
+from teetime.framework.scheduling.WorkerThreadPool import WorkerThreadPool
+from teetime.framework.scheduling.pushpullmodel.AbstractRunnableStage import AbstractRunnableStage
+from teetime.framework.scheduling.pushpullmodel.RunnableProducerStage import RunnableProducerStage
+from teetime.framework.scheduling.pushpullmodel.ThreadListener import DefaultThreadListener, ThreadListener
 
-	// private static final StageFacade STAGE_FACADE = StageFacade.INSTANCE
+# Executes a threadable stage (and its intra stages) by a leased worker of a:@link WorkerThreadPool}.
+class TeeTimeThread(PooledThread):
 
-	private final AbstractRunnableStage runnable
-	private ThreadListener listener
+	_runnable: AbstractRunnableStage
+	_listener: ThreadListener
+	_interrupted: bool = False
 
-	public TeeTimeThread(final AbstractRunnableStage runnable, final String name):
-		super(runnable, name)
-		self.runnable = runnable
-		setListener(new DefaultThreadListener())
-	}
+	def __init__(self, runnable: AbstractRunnableStage, name: str, pool: Optional[WorkerThreadPool] = None):
+		super().__init__(name, pool)
+		self._runnable = runnable
+		self.set_listener(DefaultThreadListener())
 
-	public void sendStartingSignal():
-		if (runnable instanceof RunnableProducerStage):
-			((RunnableProducerStage) runnable).triggerStartingSignal()
-		}
-	}
+	def send_starting_signal(self):
+		if (isinstance(self._runnable, RunnableProducerStage)):
+			self._runnable.trigger_starting_signal()
 
-	@Override
-	public void start():
-		getListener().onBeforeStart(runnable.stage)
-		super.start()
-	}
+	def start(self):
+		self.get_listener().on_before_start(self._runnable.stage)
+		super().start()
 
-	@Override
-	public void run():
+	def run(self):
 		try:
-			super.run()
-		} finally:
-			getListener().onAfterTermination(runnable.stage)
-		}
-	}
-
-	public ThreadListener getListener():
-		return listener
-	}
-
-	public void setListener(final ThreadListener listener):
-		self.listener = listener
-	}
-
-}
+			self._runnable.run()
+		finally:
+			self.get_listener().on_after_termination(self._runnable.stage)
+
+	# Python threads cannot be interrupted; instead, the hosted stage is aborted.
+	def interrupt(self):
+		# aborting a stage interrupts its owning thread in turn
+		if (self._interrupted):
+			return
+		self._interrupted = True
+		StageFacade.INSTANCE.abort(self._runnable.stage)
+
+	def get_listener(self) -> ThreadListener:
+		return self._listener
+
+	def set_listener(self, listener: ThreadListener):
+		self._listener = listener
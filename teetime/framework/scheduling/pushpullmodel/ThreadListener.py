@@ -11,26 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.framework.scheduling.pushpullmodel
+from teetime.framework.AbstractStage import AbstractStage
 
-import teetime.framework.AbstractStage
+class ThreadListener:
 
-interface ThreadListener:
+	def on_before_start(self, stage: AbstractStage):
+		pass
 
-	void onBeforeStart(AbstractStage stage)
+	def on_after_termination(self, stage: AbstractStage):
+		pass
 
-	void onAfterTermination(AbstractStage stage)
-}
+class DefaultThreadListener(ThreadListener):
 
-class DefaultThreadListener implements ThreadListener:
+	def on_before_start(self, stage: AbstractStage):
+		# do nothing
+		pass
 
-	@Override
-	public void onBeforeStart(final AbstractStage stage):
-		// do nothing
-	}
-
-	@Override
-	public void onAfterTermination(final AbstractStage stage):
-		// do nothing
-	}
-}
+	def on_after_termination(self, stage: AbstractStage):
+		# do nothing
+		pass
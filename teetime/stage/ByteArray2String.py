@@ -11,31 +11,32 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage
-
-import java.nio.charset.Charset
-import java.nio.charset.StandardCharsets
-
-import teetime.stage.basic.AbstractTransformation
-
-public class ByteArray2String extends AbstractTransformation<byte[], String>:
-
-	private final Charset charset
-
-	# Creates a new instance with the UTF-8 charset.
-	public ByteArray2String():
-		this(StandardCharsets.UTF_8)
-	}
-
-	public ByteArray2String(final Charset charset):
-		super()
-		self.charset = charset
-		setStateless(true)
-	}
-
-	@Override
-	protected void execute(final byte[] element):
-		self.outputPort.send(new String(element, charset))
-	}
-
-}
+from typing import Union
+
+from teetime.stage.basic.AbstractTransformation import AbstractTransformation
+from teetime.util.framework.list.SlabPool import SlabHandle
+
+# Decodes byte arrays.
+# Received:@link SlabHandle}s are decoded without copying the payload and are released afterwards.
+class ByteArray2String(AbstractTransformation[Union[bytes, SlabHandle], str]):
+
+	_charset: str
+
+	# @param charset
+	#            the charset to decode with; UTF-8 by default
+	def __init__(self, charset: str = "UTF-8"):
+		super().__init__()
+		self._charset = charset
+		self._set_stateless(True)
+
+	def _execute(self, element: Union[bytes, SlabHandle]):
+		if (isinstance(element, SlabHandle)):
+			view = element.view()
+			try:
+				string = str(view, self._charset)
+			finally:
+				view.release()
+				element.release()
+		else:
+			string = str(element, self._charset)
+		self._output_port.send(string)
@@ -11,74 +11,56 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage
+import hashlib
+from enum import Enum
 
-import java.security.InvalidKeyException
-import java.security.NoSuchAlgorithmException
-import java.security.spec.InvalidKeySpecException
-import java.security.spec.KeySpec
+try:
+	from cryptography.hazmat.primitives import padding
+	from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError as e:
+	raise ImportError("CipherStage requires the optional package 'cryptography'. "
+			+ "Install it with: pip install teetime-python[cipher]") from e
 
-import javax.crypto.*
-import javax.crypto.spec.PBEKeySpec
-import javax.crypto.spec.SecretKeySpec
+from teetime.stage.basic.AbstractFilter import AbstractFilter
+from teetime.stage.taskfarm.ITaskFarmDuplicable import ITaskFarmDuplicable
 
-import teetime.stage.basic.AbstractFilter
+# Encrypts or decrypts byte arrays with AES. Requires the optional <code>cryptography</code> package (extra <code>cipher</code>).
+class CipherStage(AbstractFilter[bytes], ITaskFarmDuplicable[bytes, bytes]):
 
-public final class CipherStage extends AbstractFilter<byte[]>:
+	class CipherMode(Enum):
+		ENCRYPT = 1
+		DECRYPT = 2
 
-	private final Cipher cipher
+	_password: str
+	_mode: "CipherStage.CipherMode"
+	_salt: bytes
+	_cipher: Cipher
 
-	public enum CipherMode:
-		ENCRYPT, DECRYPT
-	}
+	def __init__(self, password: str, mode: "CipherStage.CipherMode", salt: bytes = b"test"):
+		super().__init__()
+		self._password = password
+		self._mode = mode
+		self._salt = salt
 
-	public CipherStage(final String password, final CipherMode mode):
-		this(password, mode, new byte[]: 't', 'e', 's', 't' })
-	}
+		# like PBKDF2WithHmacSHA1 with 1024 iterations and a key length of 128 bits
+		secret_key = hashlib.pbkdf2_hmac("sha1", password.encode("utf-8"), salt, 1024, 16)
+		# like the transformation "AES", i.e., AES/ECB/PKCS5Padding
+		self._cipher = Cipher(algorithms.AES(secret_key), modes.ECB())
 
-	public CipherStage(final String password, final CipherMode mode, final byte[] salt):
-		final KeySpec keySpec = new PBEKeySpec(password.toCharArray(),
-				salt,
-				1024, 128)
+	def _execute(self, element: bytes):
+		if (self._mode == CipherStage.CipherMode.ENCRYPT):
+			padder = padding.PKCS7(algorithms.AES.block_size).padder()
+			encryptor = self._cipher.encryptor()
+			output_bytes = encryptor.update(padder.update(element) + padder.finalize()) + encryptor.finalize()
+		else:
+			decryptor = self._cipher.decryptor()
+			padded_bytes = decryptor.update(element) + decryptor.finalize()
+			unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+			try:
+				output_bytes = unpadder.update(padded_bytes) + unpadder.finalize()
+			except ValueError as e:
+				raise Exception(e) from e # IllegalStateException
+		self._output_port.send(output_bytes)
 
-		SecretKey secretKey = null
-
-		try:
-			secretKey = SecretKeyFactory.getInstance("PBKDF2WithHmacSHA1").generateSecret(keySpec)
-		} catch (final InvalidKeySpecException e1):
-			throw new IllegalStateException(e1)
-		} catch (final NoSuchAlgorithmException e1):
-			throw new IllegalStateException(e1)
-		}
-
-		final SecretKeySpec skeyspec = new SecretKeySpec(secretKey.getEncoded(), "AES")
-
-		try:
-			self.cipher = Cipher.getInstance(skeyspec.getAlgorithm())
-		} catch (final NoSuchAlgorithmException e):
-			throw new IllegalStateException(e)
-		} catch (final NoSuchPaddingException e):
-			throw new IllegalStateException(e)
-		}
-
-		final int convertedMode = (mode == CipherMode.ENCRYPT) ? Cipher.ENCRYPT_MODE : Cipher.DECRYPT_MODE
-		try:
-			self.cipher.init(convertedMode, skeyspec)
-		} catch (final InvalidKeyException e):
-			throw new IllegalStateException(e)
-		}
-	}
-
-	@Override
-	protected void execute(final byte[] element):
-		try:
-			byte[] outputBytes = self.cipher.doFinal(element)
-			self.outputPort.send(outputBytes)
-		} catch (IllegalBlockSizeException e):
-			throw new IllegalStateException(e)
-		} catch (BadPaddingException e):
-			throw new IllegalStateException(e)
-		}
-	}
-
-}
+	def duplicate(self) -> ITaskFarmDuplicable[bytes, bytes]:
+		return CipherStage(self._password, self._mode, self._salt)
@@ -11,53 +11,26 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage
+import hashlib
 
-import java.nio.charset.Charset
+from teetime.stage.basic.AbstractFilter import AbstractFilter
+from teetime.stage.taskfarm.ITaskFarmDuplicable import ITaskFarmDuplicable
 
-import com.google.common.hash.Hasher
-import com.google.common.hash.Hashing
+class MD5Stage(AbstractFilter[str], ITaskFarmDuplicable[str, str]):
 
-import teetime.stage.basic.AbstractFilter
-import teetime.stage.taskfarm.ITaskFarmDuplicable
-
-public class MD5Stage extends AbstractFilter<String>implements ITaskFarmDuplicable<String, String>:
-
-	private final Charset charset
-
-	# encoding = UTF-8
-	public MD5Stage():
-		this(Charset.forName("UTF-8"))
-	}
+	_encoding: str
 
 	# @param encoding
 	#            of the input strings for hashing algorithm
-	# @deprecated As of 3.0. Use:{@link #MD5Stage(Charset)} instead.
-	@Deprecated
-	public MD5Stage(final String encoding):
-		self.charset = Charset.forName(encoding)
-	}
-
-	# @param charset
-	#            of the input strings for hashing algorithm
-	# @see java.nio.charset.StandardCharsets Available charsets
-	public MD5Stage(final Charset charset):
-		self.charset = charset
-	}
+	def __init__(self, encoding: str = "UTF-8"):
+		super().__init__()
+		self._encoding = encoding
 
-	@Override
-	protected void execute(final String element):
-		Hasher hasher = Hashing.md5().newHasher()
-		hasher.putString(element, charset)
-		outputPort.send(hasher.hash().toString())
-	}
+	def _execute(self, element: str):
+		self._output_port.send(hashlib.md5(element.encode(self._encoding)).hexdigest())
 
-	public String getEncoding():
-		return charset.displayName()
-	}
+	def get_encoding(self) -> str:
+		return self._encoding
 
-	@Override
-	public ITaskFarmDuplicable<String, String> duplicate():
-		return new MD5Stage(charset)
-	}
-}
+	def duplicate(self) -> ITaskFarmDuplicable[str, str]:
+		return MD5Stage(self._encoding)
@@ -11,81 +11,54 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage
+import zlib
+from enum import Enum
+from typing import Union
 
-import java.io.ByteArrayOutputStream
-import java.io.IOException
-import java.util.zip.*
-
-import teetime.stage.basic.AbstractFilter
+from teetime.stage.basic.AbstractFilter import AbstractFilter
+from teetime.util.framework.list.SlabPool import SlabHandle
 
 # A stage to compress and decompress byte arrays
+# <p>
+# A received:@link SlabHandle} is processed without copying its payload.
+# The result is written into a new slab of the same pool (or sent as <code>bytes</code> if the arena is exhausted)
+# and the received handle is released.
+# </p>
 #
 # @author Nelson Tavares de Sousa
 #
-public class ZipByteArray extends AbstractFilter<byte[]>:
-
-	private final ZipMode mode
-
-	public enum ZipMode:
-		COMP, DECOMP
-	}
-
-	public ZipByteArray(final ZipMode mode):
-		self.mode = mode
-	}
-
-	@Override
-	protected void execute(final byte[] elementInBytes):
-		try:
-			byte[] processedElementInBytes = (mode == ZipMode.COMP) ? compress(elementInBytes) : decompress(elementInBytes)
-			outputPort.send(processedElementInBytes)
-		} catch (IOException e):
-			throw new IllegalStateException(e)
-		}
-	}
+class ZipByteArray(AbstractFilter[Union[bytes, SlabHandle]]):
 
-	private byte[] compress(final byte[] data) throws IOException:
-		Deflater deflater = new Deflater()
-		deflater.setInput(data)
+	class ZipMode(Enum):
+		COMP = 1
+		DECOMP = 2
 
-		ByteArrayOutputStream outputStream = new ByteArrayOutputStream(data.length)
+	_mode: "ZipByteArray.ZipMode"
 
-		deflater.finish()
-		byte[] compressedBytes = new byte[1024] // NOPMD
-		while (!deflater.finished()):
-			int count = deflater.deflate(compressedBytes) // returns the generated code... index
-			outputStream.write(compressedBytes, 0, count)
-		}
-		outputStream.close()
-		byte[] outputBytes = outputStream.toByteArray()
+	def __init__(self, mode: "ZipByteArray.ZipMode"):
+		super().__init__()
+		self._mode = mode
 
-		deflater.end()
+	def _execute(self, element_in_bytes: Union[bytes, SlabHandle]):
+		if (not isinstance(element_in_bytes, SlabHandle)):
+			self._output_port.send(self._process(element_in_bytes))
+			return
 
-		return outputBytes
-	}
-
-	private byte[] decompress(final byte[] data) throws IOException:
-		Inflater inflater = new Inflater()
-		inflater.setInput(data)
-
-		ByteArrayOutputStream outputStream = new ByteArrayOutputStream(data.length)
-		byte[] uncompressedBytes = new byte[1024] // NOPMD
-		while (!inflater.finished()):
-			int count
-			try:
-				count = inflater.inflate(uncompressedBytes)
-				outputStream.write(uncompressedBytes, 0, count)
-			} catch (DataFormatException e):
-				throw new IllegalStateException(e)
-			}
-		}
-		outputStream.close()
-		byte[] outputBytes = outputStream.toByteArray()
-
-		inflater.end()
-
-		return outputBytes
-	}
+		pool = element_in_bytes.get_pool()
+		view = pool.view(element_in_bytes)
+		try:
+			processed_element_in_bytes = self._process(view)
+		finally:
+			view.release()
+			pool.release(element_in_bytes)
+		handle = pool.write(processed_element_in_bytes)
+		self._output_port.send(processed_element_in_bytes if handle is None else handle)
+
+	def _process(self, data) -> bytes:
+		try:
+			return zlib.compress(data) if self._mode == ZipByteArray.ZipMode.COMP else zlib.decompress(data)
+		except zlib.error as e:
+			raise Exception(e) # IllegalStateException
 
-}
+	def get_mode(self) -> "ZipByteArray.ZipMode":
+		return self._mode
@@ -11,7 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic
+from typing import TypeVar
+
+E = TypeVar("E")
+
+from teetime.stage.basic.AbstractTransformation import AbstractTransformation
 
 #
 # @author Christian Wulf
@@ -20,9 +24,7 @@ package teetime.stage.basic
 #            the type of both the input port and the output port
 #
 # @since 2.0
-public abstract class AbstractFilter<E> extends AbstractTransformation<E, E>:
+class AbstractFilter(AbstractTransformation[E, E]):
 
-	protected AbstractFilter():
-		super()
-	}
-}
+	def __init__(self):
+		super().__init__()
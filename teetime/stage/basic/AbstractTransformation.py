@@ -11,10 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic
+from typing import TypeVar
 
-import teetime.framework.AbstractConsumerStage
-import teetime.framework.OutputPort
+I = TypeVar("I")
+O = TypeVar("O")
+
+from teetime.framework.AbstractConsumerStage import AbstractConsumerStage
+from teetime.framework.OutputPort import OutputPort
+from teetime.stage.basic.ITransformation import ITransformation
 
 #
 # @author Christian Wulf
@@ -25,17 +29,13 @@ import teetime.framework.OutputPort
 #            the type of the output port
 #
 # @since 2.0
-public abstract class AbstractTransformation<I, O> extends AbstractConsumerStage<I> implements ITransformation<I, O>:
-
-	protected final OutputPort<O> outputPort = createOutputPort()
+class AbstractTransformation(AbstractConsumerStage[I], ITransformation[I, O]):
 
-	protected AbstractTransformation():
-		super()
-	}
+	_output_port: OutputPort[O]
 
-	@Override
-	public final OutputPort<O> getOutputPort():
-		return outputPort
-	}
+	def __init__(self):
+		super().__init__()
+		self._output_port = self._create_output_port()
 
-}
+	def get_output_port(self) -> OutputPort[O]:
+		return self._output_port
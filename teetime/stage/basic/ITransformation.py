@@ -11,15 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
 
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
+I = TypeVar("I")
+O = TypeVar("O")
 
-public interface ITransformation<I, O>:
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
 
-	public abstract InputPort<I> getInputPort()
+class ITransformation(ABC, Generic[I, O]):
 
-	public abstract OutputPort<O> getOutputPort()
+	@abstractmethod
+	def get_input_port(self) -> InputPort[I]:
+		pass
 
-}
+	@abstractmethod
+	def get_output_port(self) -> OutputPort[O]:
+		pass
@@ -0,0 +1,78 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, TypeVar
+
+T = TypeVar("T")
+
+from teetime.stage.basic.distributor.Distributor import Distributor
+
+# A distributor which passes the incoming elements on in batches, e.g., to worker stages hosted by other processes.
+# A batch is sent as soon as it is full or the input pipe is empty, i.e., elements never wait for further elements to arrive.
+# Hence, declare this stage active so that elements can queue up in its input pipe.
+# <p>
+# Each batch is sent by:@link OutputPort#send_batch(Iterable)} to the output port with the fewest pending elements,
+# where ties are broken round-robin. It does not use a:@link IDistributorStrategy}.
+# </p>
+#
+# @param <T>
+#            the type of both the input and output ports
+#
+# @since 3.0
+class BatchingDistributor(Distributor[T]):
+
+	DEFAULT_BATCH_SIZE = 64
+
+	_batch_size: int
+	_batch: List[T]
+	_next_port_index: int
+
+	# @param batch_size
+	#            the maximum number of elements per batch
+	def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+		super().__init__()
+		if (batch_size < 1):
+			raise ValueError("The batch size must be at least 1, but was " + str(batch_size))
+		self._batch_size = batch_size
+		self._batch = []
+		self._next_port_index = 0
+
+	def _execute(self, element: T):
+		self._batch.append(element)
+		if (len(self._batch) >= self._batch_size or self.get_input_port().get_pipe().is_empty()):
+			self._send_batch()
+
+	def _send_batch(self):
+		output_ports = self.get_output_ports()
+		num_output_ports = len(output_ports)
+		selected_port = None
+		min_size = 0
+		for i in range(num_output_ports):
+			output_port = output_ports[(self._next_port_index + i) % num_output_ports]
+			size = output_port.get_pipe().size()
+			if (selected_port is None or size < min_size):
+				selected_port = output_port
+				min_size = size
+		self._next_port_index = (self._next_port_index + 1) % num_output_ports
+
+		batch = self._batch
+		self._batch = []
+		selected_port.send_batch(batch)
+
+	def _on_terminating(self):
+		if (self._batch):
+			self._send_batch()
+		super()._on_terminating()
+
+	def get_batch_size(self) -> int:
+		return self._batch_size
@@ -11,16 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic.distributor
+from typing import List, Optional, TypeVar
 
-import java.util.List
+T = TypeVar("T")
 
-import teetime.framework.AbstractConsumerStage
-import teetime.framework.OutputPort
-import teetime.stage.basic.distributor.strategy.IDistributorStrategy
-import teetime.stage.basic.distributor.strategy.NonBlockingRoundRobinStrategy
+from teetime.framework.AbstractConsumerStage import AbstractConsumerStage
+from teetime.framework.OutputPort import OutputPort
+from teetime.stage.basic.distributor.strategy.IDistributorStrategy import IDistributorStrategy
+from teetime.stage.basic.distributor.strategy.NonBlockingRoundRobinStrategy import NonBlockingRoundRobinStrategy
 
-# New output ports can be created by calling:@link #getNewOutputPort()}.
+# New output ports can be created by calling:@link #get_new_output_port()}.
 #
 # @stage.sketch
 #
@@ -50,39 +50,28 @@ import teetime.stage.basic.distributor.strategy.NonBlockingRoundRobinStrategy
 #
 # @param <T>
 #            the type of both the input and output ports
-public class Distributor<T> extends AbstractConsumerStage<T>:
+class Distributor(AbstractConsumerStage[T]):
 
-	protected IDistributorStrategy strategy
+	_strategy: IDistributorStrategy
 
-	public Distributor():
-		this(new NonBlockingRoundRobinStrategy())
-	}
+	# @param strategy
+	#            Defaults to:@link NonBlockingRoundRobinStrategy}.
+	def __init__(self, strategy: Optional[IDistributorStrategy] = None):
+		super().__init__()
+		self._strategy = strategy if strategy is not None else NonBlockingRoundRobinStrategy()
+		self._add_output_port_removed_listener(self._strategy)
 
-	public Distributor(final IDistributorStrategy strategy):
-		self.strategy = strategy
-		addOutputPortRemovedListener(strategy)
-	}
+	def _execute(self, element: T):
+		self._strategy.distribute(self.get_output_ports(), element)
 
-	@Override
-	protected void execute(final T element):
-		self.strategy.distribute(self.getOutputPorts(), element)
-	}
+	def get_new_output_port(self) -> OutputPort[T]: # make public
+		return self._create_output_port()
 
-	public OutputPort<T> getNewOutputPort(): // make public
-		return self.createOutputPort()
-	}
+	def get_strategy(self) -> IDistributorStrategy:
+		return self._strategy
 
-	public IDistributorStrategy getStrategy():
-		return self.strategy
-	}
+	def set_strategy(self, strategy: IDistributorStrategy):
+		self._strategy = strategy
 
-	public void setStrategy(final IDistributorStrategy strategy):
-		self.strategy = strategy
-	}
-
-	@Override
-	public List<OutputPort<?>> getOutputPorts(): // make public
-		return super.getOutputPorts()
-	}
-
-}
+	def get_output_ports(self) -> List[OutputPort]: # make public
+		return super().get_output_ports()
@@ -0,0 +1,64 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.InputPort import InputPort
+from teetime.framework.pipe.BoundedSynchedPipe import BoundedSynchedPipe
+from teetime.framework.signal.StartingSignal import StartingSignal
+from teetime.framework.signal.ValidatingSignal import ValidatingSignal
+from teetime.util.framework.port.PortAction import PortAction
+from teetime.util.stage.OneTimeCondition import OneTimeCondition
+
+# Connects several input ports to new output ports of a:@link DynamicDistributor} within a single port action,
+# i.e., within a single round trip to the distributor's thread.
+#
+# @since 3.0
+class CreatePortsActionDistributor(PortAction["DynamicDistributor[T]"]):
+
+	_listeners: List["PortActionListener[T]"]
+	_condition: OneTimeCondition
+
+	_input_ports: List[InputPort[T]]
+	_capacity: int
+
+	def __init__(self, input_ports: List[InputPort[T]], capacity: int):
+		super().__init__()
+		self._listeners = []
+		self._condition = OneTimeCondition()
+		self._input_ports = input_ports
+		self._capacity = capacity
+
+	def execute(self, dynamic_distributor: "DynamicDistributor[T]"):
+		for input_port in self._input_ports:
+			new_output_port = dynamic_distributor.get_new_output_port()
+
+			BoundedSynchedPipe(new_output_port, input_port, self._capacity)
+
+			new_output_port.send_signal(ValidatingSignal())
+			new_output_port.send_signal(StartingSignal())
+
+			for listener in self._listeners:
+				listener.on_output_port_created(dynamic_distributor, new_output_port)
+		self._condition.signal_all()
+
+	def get_input_ports(self) -> List[InputPort[T]]:
+		return self._input_ports
+
+	def add_port_action_listener(self, listener: "PortActionListener[T]"):
+		self._listeners.append(listener)
+
+	def wait_for_completion(self):
+		self._condition.await_()
@@ -11,68 +11,108 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic.distributor.dynamic
-
-import java.util.concurrent.BlockingQueue
-
-import teetime.framework.OutputPort
-import teetime.framework.signal.TerminatingSignal
-import teetime.stage.basic.distributor.Distributor
-import teetime.stage.basic.distributor.strategy.IDistributorStrategy
-import teetime.stage.basic.distributor.strategy.NonBlockingRoundRobinStrategy
-import teetime.util.framework.port.PortAction
-import teetime.util.framework.port.PortActionHelper
-import teetime.util.framework.port.PortRemovedListener
-
-public class DynamicDistributor<T> extends Distributor<T> implements PortRemovedListener<OutputPort<?>>:
-
-	protected final BlockingQueue<PortAction<DynamicDistributor<T>>> portActions
-
-	# Uses:@link NonBlockingRoundRobinStrategy} as default distributor strategy.
-	public DynamicDistributor():
-		this(new NonBlockingRoundRobinStrategy())
-	}
-
-	public DynamicDistributor(final IDistributorStrategy strategy):
-		super(strategy)
-		self.portActions = PortActionHelper.createPortActionQueue()
-		addOutputPortRemovedListener(this)
-	}
-
-	@Override
-	protected void execute(final T element):
-		checkForPendingPortActionRequest()
-
-		super.execute(element)
-	}
-
-	protected void checkForPendingPortActionRequest():
-		PortActionHelper.checkForPendingPortActionRequest(this, portActions)
-	}
-
-	@Override
-	public void onTerminating():
-		// foreach on portActions is not implemented, so we iterate by ourselves
-		PortAction<DynamicDistributor<T>> portAction = portActions.poll()
-		while (portAction != null):
-			portAction.execute(this)
-			portAction = portActions.poll()
-		}
-
-		super.onTerminating()
-	}
-
-	@Override
-	public void removeDynamicPort(final OutputPort<?> outputPort): // make public
-		super.removeDynamicPort(outputPort)
-	}
-
-	public boolean addPortActionRequest(final PortAction<DynamicDistributor<T>> newPortActionRequest):
-		return portActions.offer(newPortActionRequest)
-	}
-
-	@Override
-	public void onPortRemoved(final OutputPort<?> removedOutputPort):
-		removedOutputPort.sendSignal(new TerminatingSignal())
-	}
-}
+from collections import deque
+from typing import Deque, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.BoundedSynchedPipe import BoundedSynchedPipe
+from teetime.framework.signal.TerminatingSignal import TerminatingSignal
+from teetime.stage.basic.distributor.Distributor import Distributor
+from teetime.stage.basic.distributor.strategy.IDistributorStrategy import IDistributorStrategy
+from teetime.util.framework.concurrent.queue.PCBlockingQueue import PCBlockingQueue
+from teetime.util.framework.port.PortAction import PortAction
+from teetime.util.framework.port.PortActionHelper import PortActionHelper
+from teetime.util.framework.port.PortRemovedListener import PortRemovedListener
+from teetime.util.stage.OneTimeCondition import OneTimeCondition
+
+class DynamicDistributor(Distributor[T], PortRemovedListener[OutputPort]):
+
+	_port_actions: PCBlockingQueue[PortAction["DynamicDistributor[T]"]]
+	# the elements handed back by the consumers of removed output ports, see:@link #remove_dynamic_port_and_migrate(OutputPort)}
+	_migrations: List[Tuple[Deque[T], OneTimeCondition]]
+
+	# @param strategy
+	#            Defaults to:@link NonBlockingRoundRobinStrategy}.
+	def __init__(self, strategy: Optional[IDistributorStrategy] = None):
+		super().__init__(strategy)
+		self._port_actions = PortActionHelper.create_port_action_queue()
+		self._migrations = []
+		self._add_output_port_removed_listener(self)
+
+	# Handles the pending port actions and redistributes the migrated elements before receiving the next element.
+	# Since the owning thread executes this distributor even if its input pipe is empty,
+	# a removed port's elements are redistributed as soon as they have been migrated rather than with the next incoming element.
+	# This matters in particular for a scale-in, which usually happens under low load.
+	def execute_by_framework(self):
+		self._check_for_pending_port_action_request()
+
+		if (self._migrations):
+			self._redistribute_migrated_elements()
+
+		super().execute_by_framework()
+
+	def _check_for_pending_port_action_request(self):
+		PortActionHelper.check_for_pending_port_action_request(self, self._port_actions)
+
+	def _on_terminating(self):
+		# foreach on port_actions is not implemented, so we iterate by ourselves
+		port_action = self._port_actions.poll()
+		while (port_action is not None):
+			port_action.execute(self)
+			port_action = self._port_actions.poll()
+
+		# the terminate element must not overtake any migrated element
+		for _, migration_completed in self._migrations:
+			migration_completed.await_()
+		self._redistribute_migrated_elements()
+
+		super()._on_terminating()
+
+	def remove_dynamic_port(self, output_port: OutputPort): # make public
+		self._remove_dynamic_port(output_port)
+
+	# Removes the given output port like:@link #remove_dynamic_port(OutputPort)}.
+	# Additionally, the consumer of the removed port hands all elements that are still queued in the connected pipe back to this distributor
+	# instead of processing them itself. This distributor then redistributes them to the remaining output ports.
+	# <p>
+	# Ordering guarantees:
+	# <ul>
+	# <li>Each element is processed exactly once, i.e., no element is lost or duplicated.</li>
+	# <li>The element the consumer is currently processing is finished by the consumer.</li>
+	# <li>The migrated elements are redistributed in their original order and before the next incoming element,
+	# i.e., with the next execution of this distributor after they have been migrated, regardless of whether a new element has arrived.</li>
+	# <li>Since the migrated elements are appended to the other pipes, they may be processed after elements that were sent to the other ports
+	# before. As with any distribution over several ports, there is no global order between the output ports.</li>
+	# </ul>
+	# </p>
+	# If the connected pipe does not support migration, the consumer processes the remaining elements itself.
+	#
+	# @since 3.0
+	def remove_dynamic_port_and_migrate(self, output_port: OutputPort):
+		pipe = output_port.get_pipe()
+		if (isinstance(pipe, BoundedSynchedPipe)):
+			migrated_elements: Deque[T] = deque()
+			migration_completed = OneTimeCondition()
+			# must happen before the terminate element is sent by on_port_removed
+			pipe.migrate_remaining_elements(migrated_elements, migration_completed)
+			self._migrations.append((migrated_elements, migration_completed))
+		self.remove_dynamic_port(output_port)
+
+	def _redistribute_migrated_elements(self):
+		pending_migrations = []
+		for migrated_elements, migration_completed in self._migrations:
+			# read before draining: once completed, the consumer does not add any further elements
+			completed = migration_completed.is_signaled()
+			while (migrated_elements):
+				super()._execute(migrated_elements.popleft())
+			if (not completed):
+				pending_migrations.append((migrated_elements, migration_completed))
+		self._migrations = pending_migrations
+
+	def add_port_action_request(self, new_port_action_request: PortAction["DynamicDistributor[T]"]) -> bool:
+		return self._port_actions.offer(new_port_action_request)
+
+	def on_port_removed(self, removed_output_port: OutputPort):
+		removed_output_port.send_signal(TerminatingSignal())
@@ -0,0 +1,51 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.OutputPort import OutputPort
+from teetime.util.framework.port.PortAction import PortAction
+from teetime.util.stage.OneTimeCondition import OneTimeCondition
+
+# Removes several output ports of a:@link DynamicDistributor} within a single port action,
+# i.e., within a single round trip to the distributor's thread.
+#
+# @since 3.0
+class RemovePortsActionDistributor(PortAction["DynamicDistributor[T]"]):
+
+	_output_ports: List[OutputPort]
+	_migrate_remaining_elements: bool
+	_condition: OneTimeCondition
+
+	# @param migrate_remaining_elements
+	#            whether the elements still queued for the removed ports are redistributed to the remaining ports,
+	#            see:@link DynamicDistributor#remove_dynamic_port_and_migrate(OutputPort)}
+	def __init__(self, output_ports: List[OutputPort], migrate_remaining_elements: bool = False):
+		if (not output_ports or None in output_ports):
+			raise ValueError("output_ports may neither be empty nor contain None")
+		self._output_ports = output_ports
+		self._migrate_remaining_elements = migrate_remaining_elements
+		self._condition = OneTimeCondition()
+
+	def execute(self, dynamic_distributor: "DynamicDistributor[T]"):
+		for output_port in self._output_ports:
+			if (self._migrate_remaining_elements):
+				dynamic_distributor.remove_dynamic_port_and_migrate(output_port)
+			else:
+				dynamic_distributor.remove_dynamic_port(output_port)
+		self._condition.signal_all()
+
+	def wait_for_completion(self):
+		self._condition.await_()
@@ -0,0 +1,91 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from typing import List, Set, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.CreditBasedPipe import CreditBasedPipe
+from teetime.stage.basic.distributor.strategy.IDistributorStrategy import IDistributorStrategy
+
+# Distributes the elements in round-robin order, but skips each output port without credits.
+# Hence, a slow consumer does not stall the distributor as long as any other consumer has credits left.
+# Only if no output port has credits, the distributor waits until any consumer grants credits again.
+# <p>
+# Use it together with:@link CreditBasedPipe}s, e.g., created by the:@link CreditBasedPipeFactory}.
+# Output ports connected by any other pipe are tried in a non-blocking way instead.
+# </p>
+#
+# @since 3.0
+class CreditBasedDistributorStrategy(IDistributorStrategy):
+
+	# only a safety net against a missed notification; regular wake-ups are triggered by the consumers
+	DEFAULT_WAIT_TIMEOUT_IN_S = 0.001
+
+	_index: int = 0
+	_num_waits: int = 0
+	_wait_timeout_in_s: float
+	_credits_granted: threading.Event
+	_observed_pipes: Set[CreditBasedPipe]
+
+	def __init__(self, wait_timeout_in_s: float = DEFAULT_WAIT_TIMEOUT_IN_S):
+		if (wait_timeout_in_s <= 0):
+			raise ValueError("wait_timeout_in_s must be positive, but was " + str(wait_timeout_in_s))
+		self._wait_timeout_in_s = wait_timeout_in_s
+		self._credits_granted = threading.Event()
+		self._observed_pipes = set()
+
+	def distribute(self, output_ports: List[OutputPort], element: T) -> OutputPort:
+		while (True):
+			# clear before trying so that credits granted in the meantime are not missed
+			self._credits_granted.clear()
+			output_port = self._send_to_next_port_with_credits(output_ports, element)
+			if (output_port is not None):
+				return output_port
+			self._num_waits += 1
+			self._credits_granted.wait(self._wait_timeout_in_s)
+
+	def _send_to_next_port_with_credits(self, output_ports: List[OutputPort], element: T) -> OutputPort:
+		num_output_ports = len(output_ports)
+		for _ in range(num_output_ports):
+			output_port = output_ports[self._index]
+			self._index = (self._index + 1) % num_output_ports
+
+			pipe = output_port.get_pipe()
+			if (isinstance(pipe, CreditBasedPipe)):
+				self._observe(pipe)
+				if (not pipe.has_credits()):
+					continue
+			if (output_port.send_non_blocking(element)):
+				return output_port
+		return None
+
+	def _observe(self, pipe: CreditBasedPipe):
+		if (pipe not in self._observed_pipes):
+			self._observed_pipes.add(pipe)
+			pipe.add_credit_listener(self._on_credits_granted)
+
+	def _on_credits_granted(self, pipe: CreditBasedPipe):
+		self._credits_granted.set()
+
+	# @return the number of times all output ports were out of credits
+	def get_num_waits(self) -> int:
+		return self._num_waits
+
+	def on_port_removed(self, removed_output_port: OutputPort):
+		distributor = removed_output_port.get_owning_stage()
+		# correct the index if it is out-of-bounds
+		num_output_ports = len(distributor.get_output_ports())
+		self._index = self._index % num_output_ports if num_output_ports > 0 else 0
@@ -11,18 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic.distributor.strategy
+from typing import List, TypeVar
 
-import java.util.List
+T = TypeVar("T")
 
-import teetime.framework.OutputPort
-import teetime.util.framework.port.PortRemovedListener
+from teetime.framework.OutputPort import OutputPort
+from teetime.util.framework.port.PortRemovedListener import PortRemovedListener
 
 # @author Nils Christian Ehmke, Christian Wulf
 #
 # @since 1.0
-public interface IDistributorStrategy extends PortRemovedListener<OutputPort<?>>:
+class IDistributorStrategy(PortRemovedListener[OutputPort]):
 
-	public <T> OutputPort<?> distribute(final List<OutputPort<?>> outputPorts, final T element)
-
-}
+	# @return the (last) output port to which the element has been sent
+	def distribute(self, output_ports: List[OutputPort], element: T) -> OutputPort:
+		pass
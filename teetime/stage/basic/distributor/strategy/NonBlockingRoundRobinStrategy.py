@@ -11,76 +11,61 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.basic.distributor.strategy
+import time
+from typing import List, TypeVar
 
-import java.util.List
+T = TypeVar("T")
 
-import teetime.framework.OutputPort
-import teetime.framework.StateStatisticsUtils
-import teetime.stage.basic.distributor.Distributor
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.StateStatisticsUtils import StateStatisticsUtils
+from teetime.stage.basic.distributor.strategy.IDistributorStrategy import IDistributorStrategy
 
 # Backoff strategy
 #
 # @author Christian Wulf
 #
 # @since 1.1
-public class NonBlockingRoundRobinStrategy implements IDistributorStrategy:
+class NonBlockingRoundRobinStrategy(IDistributorStrategy):
 
-	private int index
-	private int numWaits
+	_index: int = 0
+	_num_waits: int = 0
 
-	@SuppressWarnings("unchecked")
-	@Override
-	public <T> OutputPort<T> distribute(final List<OutputPort<?>> outputPorts, final T element):
-		final int numOutputPorts = outputPorts.size()
-		int numLoops = numOutputPorts
+	def distribute(self, output_ports: List[OutputPort], element: T) -> OutputPort:
+		num_output_ports = len(output_ports)
+		num_loops = num_output_ports
 
-		boolean success
-		OutputPort<T> outputPort
-		do:
-			outputPort = (OutputPort<T>) getNextPortInRoundRobinOrder(outputPorts)
-			success = outputPort.sendNonBlocking(element)
-			if (0 == numLoops):
-				StateStatisticsUtils.sendingFailed(outputPort.getOwningStage())
-				numWaits++
-				backoff()
-				numLoops = numOutputPorts
-			}
-			numLoops--
-		} while (!success)
+		while (True):
+			output_port = self._get_next_port_in_round_robin_order(output_ports)
+			success = output_port.send_non_blocking(element)
+			if (0 == num_loops):
+				StateStatisticsUtils.sending_failed(output_port.get_owning_stage())
+				self._num_waits += 1
+				self._backoff()
+				num_loops = num_output_ports
+			num_loops -= 1
+			if (success):
+				break
 
-		StateStatisticsUtils.sendingSucceeded(outputPort.getOwningStage())
+		StateStatisticsUtils.sending_succeeded(output_port.get_owning_stage())
 
-		return outputPort
-	}
+		return output_port
 
-	private void backoff():
-		try:
-			Thread.sleep(1)
-		} catch (InterruptedException e):
-			throw new IllegalStateException(e)
-		}
-		// Thread.yield()
-	}
+	def _backoff(self):
+		time.sleep(0.001)
+		# time.sleep(0)
 
-	private OutputPort<?> getNextPortInRoundRobinOrder(final List<OutputPort<?>> outputPorts):
-		final OutputPort<?> outputPort = outputPorts.get(self.index)
+	def _get_next_port_in_round_robin_order(self, output_ports: List[OutputPort]) -> OutputPort:
+		output_port = output_ports[self._index]
 
-		self.index = (self.index + 1) % outputPorts.size()
+		self._index = (self._index + 1) % len(output_ports)
 
-		return outputPort
-	}
+		return output_port
 
-	public int getNumWaits():
-		return numWaits
-	}
+	def get_num_waits(self) -> int:
+		return self._num_waits
 
-	@Override
-	public void onPortRemoved(final OutputPort<?> removedOutputPort):
-		Distributor<?> distributor = (Distributor<?>) removedOutputPort.getOwningStage()
-		// correct the index if it is out-of-bounds
-		List<OutputPort<?>> outputPorts = distributor.getOutputPorts()
-		self.index = self.index % outputPorts.size()
-	}
-
-}
+	def on_port_removed(self, removed_output_port: OutputPort):
+		distributor = removed_output_port.get_owning_stage()
+		# correct the index if it is out-of-bounds
+		output_ports = distributor.get_output_ports()
+		self._index = self._index % len(output_ports)
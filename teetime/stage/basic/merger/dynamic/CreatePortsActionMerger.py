@@ -0,0 +1,49 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.BoundedSynchedPipe import BoundedSynchedPipe
+from teetime.util.framework.port.PortAction import PortAction
+from teetime.util.stage.OneTimeCondition import OneTimeCondition
+
+# Connects several output ports to new input ports of a:@link DynamicMerger} within a single port action,
+# i.e., within a single round trip to the merger's thread.
+#
+# @since 3.0
+class CreatePortsActionMerger(PortAction["DynamicMerger[T]"]):
+
+	_condition: OneTimeCondition
+
+	_output_ports: List[OutputPort]
+	_capacity: int
+
+	def __init__(self, output_ports: List[OutputPort], capacity: int):
+		super().__init__()
+		self._condition = OneTimeCondition()
+		self._output_ports = output_ports
+		self._capacity = capacity
+
+	def execute(self, dynamic_merger: "DynamicMerger[T]"):
+		for output_port in self._output_ports:
+			new_input_port = dynamic_merger.get_new_input_port()
+
+			BoundedSynchedPipe(output_port, new_input_port, self._capacity)
+
+		self._condition.signal_all()
+
+	def wait_for_completion(self):
+		self._condition.await_()
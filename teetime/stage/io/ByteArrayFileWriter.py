@@ -11,45 +11,49 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.io
+import asyncio
+from typing import BinaryIO, Union
 
-import java.io.File
-import java.io.FileOutputStream
-import java.io.IOException
+from teetime.framework.AbstractConsumerStage import AbstractConsumerStage
+from teetime.util.framework.list.SlabPool import SlabHandle
 
-import com.google.common.io.Files
+# Writes each byte array to the given file.
+# Received:@link SlabHandle}s are written without copying the payload and are released afterwards.
+class ByteArrayFileWriter(AbstractConsumerStage[Union[bytes, SlabHandle]]):
 
-import teetime.framework.AbstractConsumerStage
+	_file_output: BinaryIO
 
-public final class ByteArrayFileWriter extends AbstractConsumerStage<byte[]>:
+	def __init__(self, file: str):
+		super().__init__()
+		try:
+			self._file_output = open(file, "wb")
+		except OSError as e:
+			raise Exception(e) # IllegalStateException
 
-	private FileOutputStream fileOutput
+	def _execute(self, element: Union[bytes, SlabHandle]):
+		self._write(element)
 
-	public ByteArrayFileWriter(final File file):
-		try:
-			Files.touch(file)
-			fileOutput = new FileOutputStream(file)
-		} catch (IOException e):
-			throw new IllegalStateException(e)
-		}
-	}
-
-	@Override
-	protected void execute(final byte[] element):
+	# Writes the element by the executor of the event loop.
+	async def _execute_async(self, element: Union[bytes, SlabHandle]):
+		await asyncio.get_running_loop().run_in_executor(None, self._write, element)
+
+	def _write(self, element: Union[bytes, SlabHandle]):
 		try:
-			fileOutput.write(element)
-		} catch (IOException e):
-			throw new IllegalStateException(e)
-		}
-	}
-
-	@Override
-	public void onTerminating():
+			if (isinstance(element, SlabHandle)):
+				view = element.view()
+				try:
+					self._file_output.write(view)
+				finally:
+					view.release()
+					element.release()
+			else:
+				self._file_output.write(element)
+		except OSError as e:
+			raise Exception(e) # IllegalStateException
+
+	def _on_terminating(self):
 		try:
-			fileOutput.close()
-		} catch (IOException e):
-			throw new IllegalStateException(e)
-		}
-		super.onTerminating()
-	}
-}
+			self._file_output.close()
+		except OSError as e:
+			raise Exception(e) # IllegalStateException
+		super()._on_terminating()
@@ -11,25 +11,71 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.io
+import asyncio
+import os
+from typing import Optional, Union
 
-import java.io.File
-import java.io.IOException
+from teetime.stage.basic.AbstractTransformation import AbstractTransformation
+from teetime.util.framework.list.SlabPool import SlabHandle, SlabPool
 
-import com.google.common.io.Files
+# Reads a file as a whole.
+# <p>
+# If a:@link SlabPool} is given, the file is read directly into a slab of the pool
+# and only its:@link SlabHandle} is sent (falling back to <code>bytes</code> if the arena is exhausted
+# or if the file grows while it is read).
+# The receiver is responsible for releasing the handle.
+# </p>
+class File2ByteArray(AbstractTransformation[str, Union[bytes, SlabHandle]]):
 
-import teetime.stage.basic.AbstractTransformation
+	_slab_pool: Optional[SlabPool]
 
-public final class File2ByteArray extends AbstractTransformation<File, byte[]>:
+	# @param slab_pool
+	#            the pool to read the files into, or <code>None</code> to send <code>bytes</code>
+	def __init__(self, slab_pool: Optional[SlabPool] = None):
+		super().__init__()
+		self._slab_pool = slab_pool
 
-	@Override
-	protected void execute(final File element):
+	def _execute(self, element: str):
+		self._output_port.send(self._read(element))
+
+	# Reads the file by the executor of the event loop and awaits free capacity before sending its content.
+	async def _execute_async(self, element: str):
+		content = await asyncio.get_running_loop().run_in_executor(None, self._read, element)
+		await self._output_port.send_async(content)
+
+	def _read(self, element: str) -> Union[bytes, SlabHandle]:
+		slab_pool = self._slab_pool
 		try:
-			byte[] fileBytes = Files.toByteArray(element)
-			self.outputPort.send(fileBytes)
-		} catch (IOException e):
-			throw new IllegalStateException(e)
-		}
-	}
-
-}
+			with open(element, "rb") as file:
+				handle = None
+				if (slab_pool is not None):
+					handle = slab_pool.allocate(os.fstat(file.fileno()).st_size)
+				if (handle is None):
+					return file.read()
+				content = None
+				try:
+					content = self._read_into_slab(file, handle)
+				finally:
+					if (content is not handle):
+						slab_pool.release(handle)
+				return content
+		except OSError as e:
+			raise Exception(e) # IllegalStateException
+
+	# @return the handle, or the whole content as <code>bytes</code> if the file has grown since its size was determined
+	def _read_into_slab(self, file, handle: SlabHandle) -> Union[bytes, SlabHandle]:
+		view = self._slab_pool.view(handle)
+		try:
+			num_read = file.readinto(view)
+			remainder = file.read()
+			if (remainder):
+				return bytes(view[:num_read]) + remainder
+		finally:
+			view.release()
+		if (num_read != handle.length):
+			# the file has shrunk in the meantime
+			handle.length = num_read
+		return handle
+
+	def get_slab_pool(self) -> Optional[SlabPool]:
+		return self._slab_pool
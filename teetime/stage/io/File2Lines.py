@@ -11,70 +11,65 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.io
+import asyncio
+from itertools import islice
+from typing import List, TextIO
 
-import java.io.BufferedReader
-import java.io.File
-import java.io.FileNotFoundException
-import java.io.IOException
-import java.nio.charset.Charset
-import java.nio.file.Files
-
-import teetime.stage.basic.AbstractTransformation
+from teetime.stage.basic.AbstractTransformation import AbstractTransformation
 
 # @author Christian Wulf
 #
 # @since 1.1
 #
-public final class File2Lines extends AbstractTransformation<File, String>:
+class File2Lines(AbstractTransformation[str, str]):
 
-	private final String charset
+	# number of lines which are sent as one batch
+	BATCH_SIZE = 256
 
-	# <ol>
-	# <li>charset = UTF-8
-	# </ol>
-	public File2Lines():
-		this("UTF-8")
-	}
+	_charset: str
 
 	#
 	# @param charset
 	#            to be used when interpreting text files
-	public File2Lines(final String charset):
-		super()
-		self.charset = charset
-	}
+	def __init__(self, charset: str = "UTF-8"):
+		super().__init__()
+		self._charset = charset
 
-	@SuppressWarnings("PMD.DataflowAnomalyAnalysis")
-	@Override
-	protected void execute(final File textFile):
-		BufferedReader reader = null
+	def _execute(self, text_file: str):
+		lines: List[str] = []
 		try:
-			reader = Files.newBufferedReader(textFile.toPath(), Charset.forName(self.charset))
-			String line
-			while ((line = reader.readLine()) != null): // NOPMD
-				line = line.trim()
-				if (line.length() != 0):
-					self.outputPort.send(line)
-				} // else: ignore empty line
-			}
-		} catch (final FileNotFoundException e):
-			self.logger.error("", e)
-		} catch (final IOException e):
-			self.logger.error("", e)
-		} finally:
-			try:
-				if (reader != null):
-					reader.close()
-				}
-			} catch (final IOException e):
-				self.logger.warn("", e)
-			}
-		}
-	}
+			with open(text_file, "r", encoding=self._charset) as reader:
+				for line in reader:
+					line = line.strip()
+					if (len(line) != 0):
+						lines.append(line)
+						if (len(lines) >= self.BATCH_SIZE):
+							self._output_port.send_batch(lines)
+							lines = []
+					# else: ignore empty line
+		except OSError as e:
+			self._logger.error("", exc_info=e)
+		finally:
+			if (lines):
+				self._output_port.send_batch(lines)
 
-	public String getCharset():
-		return self.charset
-	}
+	# Reads the lines batch-wise by the executor of the event loop and awaits free capacity before sending each batch.
+	async def _execute_async(self, text_file: str):
+		loop = asyncio.get_running_loop()
+		try:
+			reader: TextIO = await loop.run_in_executor(None, lambda: open(text_file, "r", encoding=self._charset))
+			try:
+				while (True):
+					read_lines = await loop.run_in_executor(None, lambda: list(islice(reader, self.BATCH_SIZE)))
+					if (not read_lines):
+						break
+					lines = [line for line in (read_line.strip() for read_line in read_lines) if len(line) != 0]
+					if (lines):
+						await self._output_port.send_batch_async(lines)
+			finally:
+				reader.close()
+		except OSError as e:
+			self._logger.error("", exc_info=e)
 
-}
+	def get_charset(self) -> str:
+		return self._charset
@@ -11,22 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.string
-
-import java.util.Locale
-
-import teetime.stage.basic.AbstractFilter
+from teetime.stage.basic.AbstractFilter import AbstractFilter
 
 # Receives a string and passes it on to the next stage only with lower case letters.
 #
 # @since 1.1
 #
 # @author Nelson Tavares de Sousa
-public final class ToLowerCase extends AbstractFilter<String>:
-
-	@Override
-	protected void execute(final String element):
-		self.outputPort.send(element.toLowerCase(Locale.ENGLISH))
-	}
+class ToLowerCase(AbstractFilter[str]):
 
-}
+	def _execute(self, element: str):
+		self._output_port.send(element.lower())
@@ -11,33 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.string
+import re
+from typing import Pattern
 
-import teetime.stage.basic.AbstractFilter
+from teetime.stage.basic.AbstractFilter import AbstractFilter
 
-public final class Tokenizer extends AbstractFilter<String>:
+class Tokenizer(AbstractFilter[str]):
 
-	private final String regex
-	// private final Pattern pattern
+	_regex: str
+	_pattern: Pattern
 
-	public Tokenizer(final String regex):
-		self.regex = regex
-		// pattern = Pattern.compile(regex)
-	}
+	def __init__(self, regex: str):
+		super().__init__()
+		self._regex = regex
+		self._pattern = re.compile(regex)
 
-	@Override
-	protected void execute(final String element):
-		// Matcher matcher = pattern.matcher(element)
-		// while (matcher.find()):
-		// String token = element.substring(matcher.start(), matcher.end())
-		// self.outputPort.send(token)
-		// }
-		String[] tokens = element.split(regex)
-		for (String token : tokens):
-			self.outputPort.send(token)
-		}
-		// Scanner is much slower
-		// Pattern is equally fast
-	}
-
-}
+	def _execute(self, element: str):
+		tokens = self._pattern.split(element)
+		# like Java's String.split, drop trailing empty tokens
+		while (tokens and not tokens[-1]):
+			tokens.pop()
+		# all tokens of a line are handed over as one batch
+		self._output_port.send_batch(tokens)
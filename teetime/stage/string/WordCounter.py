@@ -11,16 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.string
-
-import teetime.framework.CompositeStage
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.framework.performancelogging.ActivationStateLogger
-import teetime.framework.performancelogging.CompositeStateLoggable
-import teetime.stage.MappingCounter
-import teetime.stage.taskfarm.ITaskFarmDuplicable
-import teetime.stage.util.CountingMap
+from teetime.framework.CompositeStage import CompositeStage
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.performancelogging.ActivationStateLogger import ActivationStateLogger
+from teetime.framework.performancelogging.CompositeStateLoggable import CompositeStateLoggable
+from teetime.stage.MappingCounter import MappingCounter
+from teetime.stage.string.ToLowerCase import ToLowerCase
+from teetime.stage.string.Tokenizer import Tokenizer
+from teetime.stage.taskfarm.ITaskFarmDuplicable import ITaskFarmDuplicable
+from teetime.stage.util.CountingMap import CountingMap
 
 # Intermediate stage, which receives texts and counts the occurring words.
 # The result (a:@link CountingMap}) is passed on upon termination.
@@ -29,39 +29,30 @@ import teetime.stage.util.CountingMap
 #
 # @author Nelson Tavares de Sousa
 #
-public class WordCounter extends CompositeStage implements ITaskFarmDuplicable<String, CountingMap<String>>, CompositeStateLoggable:
+class WordCounter(CompositeStage, ITaskFarmDuplicable[str, CountingMap[str]], CompositeStateLoggable):
 
-	private final Tokenizer tokenizer
-	private final MappingCounter<String> mapCounter
+	_tokenizer: Tokenizer
+	_map_counter: MappingCounter[str]
 
-	public WordCounter():
-		self.tokenizer = new Tokenizer("\\s")
-		final ToLowerCase toLowerCase = new ToLowerCase()
-		self.mapCounter = new MappingCounter<String>()
+	def __init__(self):
+		super().__init__()
+		self._tokenizer = Tokenizer("\\s")
+		to_lower_case = ToLowerCase()
+		self._map_counter = MappingCounter()
 
-		connectPorts(self.tokenizer.getOutputPort(), toLowerCase.getInputPort())
-		connectPorts(toLowerCase.getOutputPort(), self.mapCounter.getInputPort())
-	}
+		self._connect_ports(self._tokenizer.get_output_port(), to_lower_case.get_input_port())
+		self._connect_ports(to_lower_case.get_output_port(), self._map_counter.get_input_port())
 
-	@Override
-	public InputPort<String> getInputPort():
-		return self.tokenizer.getInputPort()
-	}
+	def get_input_port(self) -> InputPort[str]:
+		return self._tokenizer.get_input_port()
 
-	@Override
-	public OutputPort<CountingMap<String>> getOutputPort():
-		return self.mapCounter.getOutputPort()
-	}
+	def get_output_port(self) -> OutputPort[CountingMap[str]]:
+		return self._map_counter.get_output_port()
 
-	@Override
-	public ITaskFarmDuplicable<String, CountingMap<String>> duplicate():
-		return new WordCounter()
-	}
+	def duplicate(self) -> ITaskFarmDuplicable[str, CountingMap[str]]:
+		return WordCounter()
 
-	@Override
-	public void registerStatebles():
-		ActivationStateLogger.getInstance().register(tokenizer)
-		ActivationStateLogger.getInstance().register(tokenizer.getOutputPort().getPipe().getTargetPort().getOwningStage())
-		ActivationStateLogger.getInstance().register(mapCounter)
-	}
-}
+	def register_statebles(self):
+		ActivationStateLogger.get_instance().register(self._tokenizer)
+		ActivationStateLogger.get_instance().register(self._tokenizer.get_output_port().get_pipe().get_target_port().get_owning_stage())
+		ActivationStateLogger.get_instance().register(self._map_counter)
@@ -11,24 +11,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm
-
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
-
-import teetime.framework.AbstractStage
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.framework.RuntimeServiceFacade
-import teetime.framework.pipe.IMonitorablePipe
-import teetime.framework.pipe.IPipe
-import teetime.stage.basic.distributor.dynamic.CreatePortActionDistributor
-import teetime.stage.basic.distributor.dynamic.DynamicDistributor
-import teetime.stage.basic.distributor.dynamic.RemovePortActionDistributor
-import teetime.stage.basic.merger.dynamic.CreatePortActionMerger
-import teetime.stage.basic.merger.dynamic.DynamicMerger
-import teetime.stage.basic.merger.strategy.NonBlockingFiniteRoundRobinStrategy
-import teetime.stage.taskfarm.exception.TaskFarmInvalidPipeException
+import logging
+from typing import List, TypeVar
+
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.RuntimeServiceFacade import RuntimeServiceFacade
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.stage.basic.distributor.dynamic.CreatePortsActionDistributor import CreatePortsActionDistributor
+from teetime.stage.basic.distributor.dynamic.DynamicDistributor import DynamicDistributor
+from teetime.stage.basic.distributor.dynamic.RemovePortsActionDistributor import RemovePortsActionDistributor
+from teetime.stage.basic.merger.dynamic.CreatePortsActionMerger import CreatePortsActionMerger
+from teetime.stage.basic.merger.dynamic.DynamicMerger import DynamicMerger
+from teetime.stage.basic.merger.strategy.NonBlockingFiniteRoundRobinStrategy import NonBlockingFiniteRoundRobinStrategy
+from teetime.stage.taskfarm.ITaskFarmDuplicable import ITaskFarmDuplicable
+from teetime.stage.taskfarm.StaticTaskFarmStage import StaticTaskFarmStage
+from teetime.stage.taskfarm.TaskFarmConfiguration import TaskFarmConfiguration
+from teetime.stage.taskfarm.exception.TaskFarmInvalidPipeException import TaskFarmInvalidPipeException
+
+LOGGER = logging.getLogger("DynamicTaskFarmStage")
 
 # Represents the self-adaptive task farm parallelization pattern in
 # TeeTime. It dynamically adds CPU resources at runtime depending on
@@ -42,191 +46,147 @@ import teetime.stage.taskfarm.exception.TaskFarmInvalidPipeException
 #            Output type of task Farm
 # @param <T>
 #            Type of the parallelized stage
-public class DynamicTaskFarmStage<I, O, T extends ITaskFarmDuplicable<I, O>> extends StaticTaskFarmStage<I, O, T>:
+class DynamicTaskFarmStage(StaticTaskFarmStage[I, O, T]):
 
-	private static final Logger LOGGER = LoggerFactory.getLogger(DynamicTaskFarmStage.class)
-
-	private final TaskFarmConfiguration<I, O, T> configuration = new TaskFarmConfiguration<I, O, T>()
-
-	# Creates a task farm using <i>n</i> worker stages with a pipe capacity of 100, where <i>n</i> is
-	#
-	# <pre>
-	# Runtime.getRuntime().availableProcessors()
-	# </pre>
-	#
-	# @param workerStage
-	#            stage to be parallelized by the task farm
-	// public DynamicTaskFarmStage(final T workerStage):
-	// this(workerStage, Runtime.getRuntime().availableProcessors(), 100)
-	// }
-
-	# Creates a task farm using a worker stage with a pipe capacity of 100.
-	#
-	# @param workerStage
-	#            stage to be parallelized by the task farm
-	# @param initialNumOfStages
-	#            the initial number of stages used by the task farm
-	public DynamicTaskFarmStage(final T workerStage, final int initialNumOfStages):
-		this(workerStage, initialNumOfStages, 100)
-	}
+	_configuration: TaskFarmConfiguration[I, O, T]
 
 	# Creates a task farm using a worker stage with a given pipe capacity.
 	#
-	# @param workerStage
+	# @param worker_stage
 	#            stage to be parallelized by the task farm
-	# @param pipeCapacity
-	#            pipe capacity to be used
-	# @param initialNumOfStages
+	# @param initial_num_of_stages
 	#            the initial number of stages used by the task farm
-	public DynamicTaskFarmStage(final T workerStage, final int initialNumOfStages, final int pipeCapacity):
-		super(workerStage, initialNumOfStages, pipeCapacity, new DynamicDistributor<I>(), new DynamicMerger<O>(new NonBlockingFiniteRoundRobinStrategy()))
-
-		// for (ITaskFarmDuplicable<I, O> workerStage : getWorkerStages()):
-		// includedStage.setTaskFarmStage(this)
-		// }
+	# @param pipe_capacity
+	#            pipe capacity to be used
+	def __init__(self, worker_stage: T, initial_num_of_stages: int, pipe_capacity: int = 100):
+		self._configuration = TaskFarmConfiguration()
+		super().__init__(worker_stage, initial_num_of_stages, pipe_capacity, DynamicDistributor(), DynamicMerger(NonBlockingFiniteRoundRobinStrategy()))
 
-		self.configuration.setPipeCapacity(pipeCapacity)
-	}
+		self._configuration.set_pipe_capacity(pipe_capacity)
 
 	# Adds a new enclosed stage at Runtime
 	#
 	# @return new created Stage
-	# @throws InterruptedException
 	#
 	# @author Christian Claus Wiechmann, Christoph Dornieden (code moved from TaskFarmController)
-	public ITaskFarmDuplicable<I, O> addStageAtRuntime() throws InterruptedException:
-		if (LOGGER.isDebugEnabled()):
-			LOGGER.debug("Adding stage (current amount of stages::})", getWorkerStages().size())
-		}
-
-		if (!getMerger().isActive()):
-			getMerger().declareActive()
-		}
+	def add_stage_at_runtime(self) -> ITaskFarmDuplicable[I, O]:
+		return self.add_stages_at_runtime(1)[0]
 
-		AbstractStage basicEnclosedStage = getBasicEnclosedStage().getInputPort().getOwningStage()
-		if (!basicEnclosedStage.isActive()):
-			basicEnclosedStage.declareActive()
-		}
+	# Adds <code>num_stages</code> new enclosed stages at runtime.
+	# The distributor and the merger each connect all new stages within a single port action.
+	# Afterwards, the threads of all new stages are started together.
+	#
+	# @return the new created stages
+	#
+	# @since 3.0
+	def add_stages_at_runtime(self, num_stages: int) -> List[ITaskFarmDuplicable[I, O]]:
+		if (num_stages < 1):
+			return []
 
-		final ITaskFarmDuplicable<I, O> newStage = getBasicEnclosedStage().duplicate()
-		// newStage.setTaskFarmStage(this)
+		LOGGER.debug("Adding %d stage(s) (current amount of stages: %d)", num_stages, len(self.get_worker_stages()))
 
-		final CreatePortActionDistributor<I> distributorPortAction = new CreatePortActionDistributor<I>(newStage.getInputPort(),
-				getPipeCapacity())
-		getDistributor().addPortActionRequest(distributorPortAction)
+		if (not self.get_merger().is_active()):
+			self.get_merger().declare_active()
 
-		distributorPortAction.waitForCompletion()
+		basic_enclosed_stage = self.get_basic_enclosed_stage().get_input_port().get_owning_stage()
+		if (not basic_enclosed_stage.is_active()):
+			basic_enclosed_stage.declare_active()
 
-		final CreatePortActionMerger<O> mergerPortAction = new CreatePortActionMerger<O>(newStage.getOutputPort(),
-				getPipeCapacity())
-		getMerger().addPortActionRequest(mergerPortAction)
+		new_stages = [self.get_basic_enclosed_stage().duplicate() for _ in range(num_stages)]
 
-		mergerPortAction.waitForCompletion()
+		distributor_port_action = CreatePortsActionDistributor([new_stage.get_input_port() for new_stage in new_stages], self._get_pipe_capacity())
+		merger_port_action = CreatePortsActionMerger([new_stage.get_output_port() for new_stage in new_stages], self._get_pipe_capacity())
+		# both stages connect their ports concurrently
+		self.get_distributor().add_port_action_request(distributor_port_action)
+		self.get_merger().add_port_action_request(merger_port_action)
 
-		// the validating and the starting signal is sent by the create action
-		RuntimeServiceFacade.INSTANCE.startWithinNewThread(getDistributor(), newStage.getInputPort().getOwningStage())
+		distributor_port_action.wait_for_completion()
+		merger_port_action.wait_for_completion()
 
-		getWorkerStages().add(newStage)
+		# the validating and the starting signal is sent by the create action
+		RuntimeServiceFacade.INSTANCE.start_within_new_threads(self.get_distributor(),
+				[new_stage.get_input_port().get_owning_stage() for new_stage in new_stages])
 
-		// TODO add event "new stage added" to enable monitoring of the new pipe (see #addNewPipeToMonitoring)
+		self.get_worker_stages().extend(new_stages)
 
-		return newStage
-	}
+		# TODO add event "new stage added" to enable monitoring of the new pipe (see #addNewPipeToMonitoring)
 
-	// private void addNewPipeToMonitoring(final ITaskFarmDuplicable<I, O> newStage):
-	// if (self.taskFarmStage.getConfiguration().isMonitoringEnabled()):
-	// try:
-	// self.taskFarmStage.getPipeMonitoringService().addMonitoredItem((IMonitorablePipe) newStage.getInputPort().getPipe())
-	// } catch (ClassCastException e):
-	// throw new TaskFarmControllerException("A generated pipe is not monitorable.", e)
-	// }
-	// }
-	// }
+		return new_stages
 
 	# Dynamically removes a stage from the controlled task farm.
 	#
-	# @throws InterruptedException
+	# @return the removed stage, or <code>None</code> if only the basic stage is left
 	#
 	# @author Christian Claus Wiechmann, Christoph Dornieden (code moved from TaskFarmController)
-	public ITaskFarmDuplicable<I, O> removeStageAtRuntime() throws InterruptedException:
-		if (getWorkerStages().size() == 1):
-			return null
-		}
-
-		if (LOGGER.isDebugEnabled()):
-			LOGGER.debug("Removing stage (current amount of stages::})", getWorkerStages().size())
-		}
-
-		ITaskFarmDuplicable<I, O> stageToBeRemoved = getWorkerStages().get(getStageIndexWithLeastRemainingInput())
-		OutputPort<? extends I> distributorOutputPort = self.getRemoveableDistributorOutputPort(stageToBeRemoved)
-
-		final RemovePortActionDistributor<I> distributorPortAction = new RemovePortActionDistributor<I>(distributorOutputPort)
-		getDistributor().addPortActionRequest(distributorPortAction)
-		getWorkerStages().remove(stageToBeRemoved)
-
-		distributorPortAction.waitForCompletion()
-
-		return stageToBeRemoved
-	}
-
-	// FIXME the task farm itself should not choose which stage to remove.
-	// Instead, a strategy from outside the task farm should determine.
-	private int getStageIndexWithLeastRemainingInput():
-		int currentMinimum = Integer.MAX_VALUE // NOPMD (DU: caused by loop)
-		int currentMinumumStageIndex = getWorkerStages().size() - 1// NOPMD (DU: caused by loop)
-
-		// do not remove basic stage
-		for (int i = 1 i < getWorkerStages().size() i++):
-			final ITaskFarmDuplicable<I, O> instance = getWorkerStages().get(i)
-			InputPort<I> port = instance.getInputPort()
-			IMonitorablePipe monitorablePipe = null
-
-			try:
-				monitorablePipe = (IMonitorablePipe) port.getPipe()
-			} catch (ClassCastException e):
-				throw new TaskFarmInvalidPipeException(
+	def remove_stage_at_runtime(self) -> ITaskFarmDuplicable[I, O]:
+		removed_stages = self.remove_stages_at_runtime(1)
+		return removed_stages[0] if removed_stages else None
+
+	# Dynamically removes up to <code>num_stages</code> stages from the controlled task farm, preferring the ones with the least remaining input.
+	# The basic stage is never removed. The distributor removes all corresponding output ports within a single port action.
+	# If:@link TaskFarmConfiguration#is_migrating_scale_in()} is set, the removed stages hand their queued elements back to the distributor,
+	# which redistributes them to the remaining stages. Then, each removed stage terminates right after its current element.
+	#
+	# @return the removed stages
+	#
+	# @since 3.0
+	def remove_stages_at_runtime(self, num_stages: int) -> List[ITaskFarmDuplicable[I, O]]:
+		num_stages = min(num_stages, len(self.get_worker_stages()) - 1)
+		if (num_stages < 1):
+			return []
+
+		LOGGER.debug("Removing %d stage(s) (current amount of stages: %d)", num_stages, len(self.get_worker_stages()))
+
+		stages_to_be_removed = [self.get_worker_stages()[index] for index in self._get_stage_indices_with_least_remaining_input(num_stages)]
+		distributor_output_ports = [self._get_removeable_distributor_output_port(stage) for stage in stages_to_be_removed]
+
+		distributor_port_action = RemovePortsActionDistributor(distributor_output_ports, self._configuration.is_migrating_scale_in())
+		self.get_distributor().add_port_action_request(distributor_port_action)
+		for stage in stages_to_be_removed:
+			self.get_worker_stages().remove(stage)
+
+		distributor_port_action.wait_for_completion()
+
+		return stages_to_be_removed
+
+	# FIXME the task farm itself should not choose which stage to remove.
+	# Instead, a strategy from outside the task farm should determine.
+	def _get_stage_indices_with_least_remaining_input(self, num_stages: int) -> List[int]:
+		sizes_by_index = []
+		worker_stages = self.get_worker_stages()
+		# do not remove basic stage
+		for i in range(1, len(worker_stages)):
+			port = worker_stages[i].get_input_port()
+			monitorable_pipe = port.get_pipe()
+			if (not isinstance(monitorable_pipe, IMonitorablePipe)):
+				raise TaskFarmInvalidPipeException(
 						"The input pipe of an enclosed stage instance inside a Task Farm"
-								+ " does not implement IMonitorablePipe, which is required. Instead, the type is "
-								+ port.getPipe().getClass().getSimpleName() + ".",
-						e)
-			}
-
-			if (monitorablePipe != null && monitorablePipe.size() < currentMinimum):
-				currentMinimum = monitorablePipe.size()
-				currentMinumumStageIndex = i
-			}
-		}
-
-		return currentMinumumStageIndex
-	}
-
-	private OutputPort<I> getRemoveableDistributorOutputPort(final ITaskFarmDuplicable<I, O> stageToBeRemoved):
-		final InputPort<I> inputPortOfStage = stageToBeRemoved.getInputPort()
-		final IPipe<?> pipeInBetween = inputPortOfStage.getPipe()
-		@SuppressWarnings("unchecked")
-		final OutputPort<I> distributorOutputPort = (OutputPort<I>) pipeInBetween.getSourcePort()
-		return distributorOutputPort // NOPMD (UnnecessaryLocalBeforeReturn: annotation should be declared at the trigger)
-	}
+						+ " does not implement IMonitorablePipe, which is required. Instead, the type is "
+						+ type(monitorable_pipe).__name__ + ".")
+			sizes_by_index.append((monitorable_pipe.size(), i))
+
+		# prefer the most recently added stages on ties
+		sizes_by_index.sort(key=lambda size_and_index: (size_and_index[0], -size_and_index[1]))
+		return [index for _, index in sizes_by_index[:num_stages]]
+
+	def _get_removeable_distributor_output_port(self, stage_to_be_removed: ITaskFarmDuplicable[I, O]) -> OutputPort[I]:
+		input_port_of_stage = stage_to_be_removed.get_input_port()
+		pipe_in_between = input_port_of_stage.get_pipe()
+		return pipe_in_between.get_source_port()
 
 	# Returns the first instance of the worker stages enclosed in the task farm.
 	#
 	# @return first instance of the worker stages
-	public ITaskFarmDuplicable<I, O> getBasicEnclosedStage():
-		return self.getWorkerStages().get(0)
-	}
+	def get_basic_enclosed_stage(self) -> ITaskFarmDuplicable[I, O]:
+		return self.get_worker_stages()[0]
 
 	# @return the distributor instance of this task farm.
-	@Override
-		return (DynamicDistributor<I>) super.getDistributor()
-	}
+	def get_distributor(self) -> DynamicDistributor[I]:
+		return super().get_distributor()
 
 	# @return the merger instance of this task farm.
-	@Override
-		return (DynamicMerger<O>) super.getMerger()
-	}
-
-	public TaskFarmConfiguration<I, O, T> getConfiguration():
-		return configuration
-	}
+	def get_merger(self) -> DynamicMerger[O]:
+		return super().get_merger()
 
-}
+	def get_configuration(self) -> TaskFarmConfiguration[I, O, T]:
+		return self._configuration
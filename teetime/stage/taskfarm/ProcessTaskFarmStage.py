@@ -0,0 +1,84 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Optional, TypeVar
+
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.framework.CompositeStage import CompositeStage
+from teetime.stage.basic.distributor.BatchingDistributor import BatchingDistributor
+from teetime.stage.taskfarm.ITaskFarmDuplicable import ITaskFarmDuplicable
+from teetime.stage.taskfarm.StaticTaskFarmStage import StaticTaskFarmStage
+from teetime.stage.taskfarm.TaskFarmConfiguration import TaskFarmConfiguration
+
+# Represents a task farm whose worker stages are executed by own worker processes instead of threads.
+# Thus, worker stages which perform CPU-bound work in Python, e.g., the:@link teetime.stage.MD5Stage MD5Stage},
+# are not bound by the GIL.
+# <p>
+# Each worker stage is declared to be process-hosted (see:@link AbstractStage#declare_active(bool)}).
+# Hence, the scheduler connects it to the distributor and to the merger by:@link teetime.framework.pipe.InterProcessPipe InterProcessPipe}s,
+# whose capacity is given in bytes and thus independent of <code>pipe_capacity</code>.
+# The:@link BatchingDistributor} feeds the worker processes with batches of elements
+# and the merger passes the results on within the parent process.
+# Any other state of a worker stage stays in its worker process.
+# The worker processes are forked when the execution starts, so worker stages cannot be added or removed at runtime.
+# </p>
+#
+# @param <I>
+#            Input type of Task Farm
+# @param <O>
+#            Output type of Task Farm
+# @param <T>
+#            Type of the parallelized stage
+#
+# @since 3.0
+class ProcessTaskFarmStage(StaticTaskFarmStage[I, O, T]):
+
+	_configuration: TaskFarmConfiguration[I, O, T]
+
+	# @param worker_stage
+	#            stage to be parallelized by the task farm
+	# @param number_of_processes
+	#            the number of worker processes, which is limited by:@link TaskFarmConfiguration#get_max_number_of_cores()}.
+	#            Defaults to this limit.
+	# @param pipe_capacity
+	#            the capacity of the pipes within the parent process
+	# @param batch_size
+	#            the maximum number of elements sent to a worker process at once
+	# @param configuration
+	#            Defaults to a new:@link TaskFarmConfiguration}.
+	def __init__(self, worker_stage: T, number_of_processes: Optional[int] = None, pipe_capacity: int = CompositeStage.DEFAULT_PIPE_CAPACITY,
+			batch_size: int = BatchingDistributor.DEFAULT_BATCH_SIZE, configuration: Optional[TaskFarmConfiguration[I, O, T]] = None):
+		self._configuration = configuration if configuration is not None else TaskFarmConfiguration()
+		max_number_of_processes = max(1, self._configuration.get_max_number_of_cores())
+		if (number_of_processes is None):
+			number_of_processes = max_number_of_processes
+		super().__init__(worker_stage, min(number_of_processes, max_number_of_processes), pipe_capacity, BatchingDistributor(batch_size))
+
+		self._configuration.set_pipe_capacity(pipe_capacity)
+		# batches can only be built from the elements queued in the input pipe of an active distributor
+		self.get_distributor().declare_active()
+		# the merger must run within the parent process, even if there is only a single worker process
+		if (not self.get_merger().is_active()):
+			self.get_merger().declare_active()
+
+	def _declare_worker_stage_active(self, worker_stage: ITaskFarmDuplicable[I, O]):
+		worker_stage.get_input_port().get_owning_stage().declare_active(True)
+
+	def get_distributor(self) -> BatchingDistributor[I]:
+		return super().get_distributor()
+
+	def get_configuration(self) -> TaskFarmConfiguration[I, O, T]:
+		return self._configuration
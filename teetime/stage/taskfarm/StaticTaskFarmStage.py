@@ -11,17 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm
-
-import java.util.ArrayList
-import java.util.List
-
-import teetime.framework.CompositeStage
-import teetime.framework.InputPort
-import teetime.framework.OutputPort
-import teetime.stage.basic.ITransformation
-import teetime.stage.basic.distributor.Distributor
-import teetime.stage.basic.merger.Merger
+import os
+from typing import Generic, List, Optional, TypeVar
+
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.framework.CompositeStage import CompositeStage
+from teetime.framework.InputPort import InputPort
+from teetime.framework.OutputPort import OutputPort
+from teetime.framework.pipe.IPipeFactory import IPipeFactory
+from teetime.stage.basic.ITransformation import ITransformation
+from teetime.stage.basic.distributor.Distributor import Distributor
+from teetime.stage.basic.merger.Merger import Merger
+from teetime.stage.taskfarm.ITaskFarmDuplicable import ITaskFarmDuplicable
 
 # Represents the task farm parallelization pattern in TeeTime.
 #
@@ -33,125 +37,110 @@ import teetime.stage.basic.merger.Merger
 #            Output type of Task Farm
 # @param <T>
 #            Type of the parallelized stage
-public class StaticTaskFarmStage<I, O, T extends ITaskFarmDuplicable<I, O>> extends CompositeStage implements ITransformation<I, O>:
+class StaticTaskFarmStage(CompositeStage, ITransformation[I, O], Generic[I, O, T]):
 
-	private static final int MAX_NUMBER_OF_STAGES = Runtime.getRuntime().availableProcessors()
+	MAX_NUMBER_OF_STAGES = os.cpu_count() or 1
 
-	private final Distributor<I> distributor
-	private final Merger<O> merger
-	private final List<ITaskFarmDuplicable<I, O>> workerStages
+	_distributor: Distributor[I]
+	_merger: Merger[O]
+	_worker_stages: List[ITaskFarmDuplicable[I, O]]
 
-	private InputPort<I> inputPort
-	private OutputPort<O> outputPort
+	_input_port: InputPort[I]
+	_output_port: OutputPort[O]
 
 	# Creates a task farm stage with <i>n</i> worker stages and a pipe capacity of:@value #DEFAULT_PIPE_CAPACITY}, where <i>n</i>
 	# is
 	#
 	# <pre>
-	# Runtime.getRuntime().availableProcessors()
+	# os.cpu_count()
 	# </pre>
 	#
-	# @param workerStage
-	public StaticTaskFarmStage(final T workerStage):
-		this(workerStage, MAX_NUMBER_OF_STAGES, DEFAULT_PIPE_CAPACITY)
-	}
-
-	public StaticTaskFarmStage(final T workerStage, final int numberStages):
-		this(workerStage, numberStages, DEFAULT_PIPE_CAPACITY)
-	}
-
-	public StaticTaskFarmStage(final T workerStage, final int numberStages, final int pipeCapacity):
-		this(workerStage, numberStages, pipeCapacity, new Distributor<I>(), new Merger<O>())
-	}
-
-	protected StaticTaskFarmStage(final T workerStage, final int numberStages, final int pipeCapacity, final Distributor<I> distributor, final Merger<O> merger):
-		super()
-		if (null == workerStage):
-			throw new IllegalArgumentException("The constructor of a Task Farm may not be called with null as the worker stage.")
-		}
-		if (numberStages < 1):
-			throw new IllegalArgumentException("The number of worker stages must be at least 1.")
-		}
-		if (pipeCapacity < 1):
-			throw new IllegalArgumentException("The capacity of the pipe(s) must be at least 1.")
-		}
-		self.distributor = distributor
-		self.merger = merger
-		self.workerStages = new ArrayList<ITaskFarmDuplicable<I, O>>()
-
-		self.init(workerStage, numberStages, pipeCapacity)
-	}
-
-	private void init(final T workerStage, final int numberStages, final int pipeCapacity):
-		connectWorkerStage(workerStage, pipeCapacity)
-		workerStage.getInputPort().getOwningStage().declareActive()
-
-		for (int i = 1 i < numberStages i++):
-			ITaskFarmDuplicable<I, O> duplicatedWorkerStage = workerStage.duplicate()
-
-			connectWorkerStage(duplicatedWorkerStage, pipeCapacity)
-			duplicatedWorkerStage.getInputPort().getOwningStage().declareActive()
-		}
-
-		if (numberStages > 1):
-			self.merger.declareActive()
-		}
-
-		// map outer ports to inner ports
-		inputPort = createInputPort(self.distributor.getInputPort())
-		outputPort = createOutputPort(self.merger.getOutputPort())
-	}
-
-	private void connectWorkerStage(final ITaskFarmDuplicable<I, O> workerStage, final int pipeCapacity):
-		final InputPort<I> stageInputPort = workerStage.getInputPort()
-		connectPorts(self.distributor.getNewOutputPort(), stageInputPort, pipeCapacity)
-
-		final OutputPort<O> stageOutputPort = workerStage.getOutputPort()
-		connectPorts(stageOutputPort, self.merger.getNewInputPort(), pipeCapacity)
-
-		self.workerStages.add(workerStage)
-	}
+	# @param worker_stage
+	# @param number_stages
+	# @param pipe_capacity
+	# @param distributor
+	#            Defaults to a:@link Distributor}.
+	# @param merger
+	#            Defaults to a:@link Merger}.
+	# @param distributor_pipe_factory
+	#            creates the pipes between the distributor and the worker stages.
+	#            Defaults to <code>None</code>, i.e., the scheduler chooses the pipes.
+	def __init__(self, worker_stage: T, number_stages: int = MAX_NUMBER_OF_STAGES, pipe_capacity: int = CompositeStage.DEFAULT_PIPE_CAPACITY,
+			distributor: Optional[Distributor[I]] = None, merger: Optional[Merger[O]] = None, distributor_pipe_factory: Optional[IPipeFactory] = None):
+		super().__init__()
+		if (worker_stage is None):
+			raise ValueError("The constructor of a Task Farm may not be called with None as the worker stage.")
+		if (number_stages < 1):
+			raise ValueError("The number of worker stages must be at least 1.")
+		if (pipe_capacity < 1):
+			raise ValueError("The capacity of the pipe(s) must be at least 1.")
+		self._distributor = distributor if distributor is not None else Distributor()
+		self._merger = merger if merger is not None else Merger()
+		self._worker_stages = []
+
+		self._init(worker_stage, number_stages, pipe_capacity, distributor_pipe_factory)
+
+	def _init(self, worker_stage: T, number_stages: int, pipe_capacity: int, distributor_pipe_factory: Optional[IPipeFactory]):
+		self._connect_worker_stage(worker_stage, pipe_capacity, distributor_pipe_factory)
+		self._declare_worker_stage_active(worker_stage)
+
+		for _ in range(1, number_stages):
+			duplicated_worker_stage = worker_stage.duplicate()
+
+			self._connect_worker_stage(duplicated_worker_stage, pipe_capacity, distributor_pipe_factory)
+			self._declare_worker_stage_active(duplicated_worker_stage)
+
+		if (number_stages > 1):
+			self._merger.declare_active()
+
+		# map outer ports to inner ports
+		self._input_port = self._create_input_port(self._distributor.get_input_port())
+		self._output_port = self._create_output_port(self._merger.get_output_port())
+
+	def _connect_worker_stage(self, worker_stage: ITaskFarmDuplicable[I, O], pipe_capacity: int, distributor_pipe_factory: Optional[IPipeFactory]):
+		stage_input_port = worker_stage.get_input_port()
+		if (distributor_pipe_factory is None):
+			self._connect_ports(self._distributor.get_new_output_port(), stage_input_port, pipe_capacity)
+		else:
+			distributor_pipe_factory.new_pipe(self._distributor.get_new_output_port(), stage_input_port, pipe_capacity)
+
+		stage_output_port = worker_stage.get_output_port()
+		self._connect_ports(stage_output_port, self._merger.get_new_input_port(), pipe_capacity)
+
+		self._worker_stages.append(worker_stage)
+
+	# Lets the given worker stage be executed by an own thread.
+	def _declare_worker_stage_active(self, worker_stage: ITaskFarmDuplicable[I, O]):
+		worker_stage.get_input_port().get_owning_stage().declare_active()
 
 	# Returns the input port of the task farm/distributor of the task farm.
 	#
 	# @return input port of the task farm
-	@Override
-	public InputPort<I> getInputPort():
-		return inputPort
-	}
+	def get_input_port(self) -> InputPort[I]:
+		return self._input_port
 
 	# Returns the output port of the task farm/merger of the task farm.
 	#
 	# @return output port of the task farm
-	@Override
-	public OutputPort<O> getOutputPort():
-		return outputPort
-	}
-
-	//# Declares the internal distributor to be executed by an own thread.
-	// @Override
-	// public void declareActive():
-	// distributor.declareActive()
-	// }
-	//
-	// @Override
-	// public StageState getCurrentState():
-	// return distributor.getCurrentState()
-	// }
-
-		return distributor
-	}
-
-		return merger
-	}
-
-	protected int getPipeCapacity():
-		return distributor.getOutputPorts().get(0).getPipe().capacity()
-	}
+	def get_output_port(self) -> OutputPort[O]:
+		return self._output_port
 
-	# @return a list of all currently existing worker stages
-	public List<ITaskFarmDuplicable<I, O>> getWorkerStages():
-		return workerStages
-	}
+	# # Declares the internal distributor to be executed by an own thread.
+	# def declare_active(self):
+	# 	self._distributor.declare_active()
+	#
+	# def get_current_state(self) -> StageState:
+	# 	return self._distributor.get_current_state()
 
-}
+	def get_distributor(self) -> Distributor[I]:
+		return self._distributor
+
+	def get_merger(self) -> Merger[O]:
+		return self._merger
+
+	def _get_pipe_capacity(self) -> int:
+		return self._distributor.get_output_ports()[0].get_pipe().capacity()
+
+	# @return a list of all currently existing worker stages
+	def get_worker_stages(self) -> List[ITaskFarmDuplicable[I, O]]:
+		return self._worker_stages
@@ -11,9 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm
+import os
+from typing import Generic, Optional, TypeVar
 
-import teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm.WeightMethod
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm import WeightedAlgorithm
+from teetime.stage.taskfarm.adaptation.reconfiguration.IScalingPolicy import IScalingPolicy
 
 # Represents the configuration of a single Task Farm.
 #
@@ -25,152 +31,166 @@ import teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm.We
 #            Output type of Task Farm
 # @param <T>
 #            Type of enclosed stage
-public class TaskFarmConfiguration<I, O, T extends ITaskFarmDuplicable<I, O>>:
+class TaskFarmConfiguration(Generic[I, O, T]):
 
 	# represents an initial value for the samples until remove for TaskFarmReconfigurationCommandService
-	public static final int INIT_SAMPLES_UNTIL_REMOVE = -1
+	INIT_SAMPLES_UNTIL_REMOVE = -1
 
-	private volatile boolean monitoringEnabled// = false
+	_monitoring_enabled: bool = False
 
-	private volatile int adaptationWaitingTimeMillis = 50
+	_adaptation_waiting_time_millis: int = 50
 
-	private volatile int analysisWindow = 5
-	private volatile String throughputAlgorithm = "RegressionAlgorithm"
+	_analysis_window: int = 5
+	_throughput_algorithm: str = "RegressionAlgorithm"
 	# if the:@link teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm WeightedAlgorithm} is used as the throughput algorithm, this
 	#:@link teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm.WeightMethod WeightMethod} is used
-	private volatile WeightMethod weightedAlgorithmMethod = WeightMethod.EXPONENTIAL
+	_weighted_algorithm_method: "WeightedAlgorithm.WeightMethod" = WeightedAlgorithm.WeightMethod.EXPONENTIAL
 	# the:@link teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmReconfigurationCommandService
 	# TaskFarmReconfigurationCommandService} waits this amount of adaptation thread iterations for performance improvements after a new worker stage is added
-	private volatile int maxSamplesUntilRemove = 5
-	private volatile double throughputScoreBoundary = 0.2d // NOPMD error in PMD
+	_max_samples_until_remove: int = 5
+	_throughput_score_boundary: float = 0.2
+
+	_pipe_capacity: int = 100
+
+	_max_number_of_cores: int = (os.cpu_count() or 1) - 2
 
-	private volatile int pipeCapacity = 100
+	# the scaling policy of the adaptation thread; <code>None</code> for the:@link ThroughputScalingPolicy}
+	_scaling_policy: Optional[IScalingPolicy] = None
 
-	private volatile int maxNumberOfCores = Runtime.getRuntime().availableProcessors() - 2
+	# whether a removed worker stage hands its queued elements back to the distributor instead of processing them
+	_migrating_scale_in: bool = False
 
-	TaskFarmConfiguration():
-		// non-instantiable from outside
-	}
+	def __init__(self):
+		# non-instantiable from outside
+		pass
 
 	#
 	# @return the amount of previous measurements used by the throughput algorithm
-	public int getAnalysisWindow():
-		return self.analysisWindow
-	}
+	def get_analysis_window(self) -> int:
+		return self._analysis_window
 
 	#
-	# @param analysisWindow
+	# @param analysis_window
 	#            the amount of previous measurements used by the throughput algorithm
-	public void setAnalysisWindow(final int analysisWindow):
-		self.analysisWindow = analysisWindow
-	}
+	def set_analysis_window(self, analysis_window: int):
+		self._analysis_window = analysis_window
 
 	#
 	# @return used throughput algorithm (has to exist in the package <code>teetime.stage.taskfarm.adaptation.analysis.algorithm</code>)
-	public String getThroughputAlgorithm():
-		return self.throughputAlgorithm
-	}
+	def get_throughput_algorithm(self) -> str:
+		return self._throughput_algorithm
 
 	#
-	# @param throughputAlgorithm
+	# @param throughput_algorithm
 	#            used throughput algorithm (has to exist in the package <code>teetime.stage.taskfarm.adaptation.analysis.algorithm</code>)
-	public void setThroughputAlgorithm(final String throughputAlgorithm):
-		self.throughputAlgorithm = throughputAlgorithm
-	}
+	def set_throughput_algorithm(self, throughput_algorithm: str):
+		self._throughput_algorithm = throughput_algorithm
 
 	#
 	# @return if the:@link teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm WeightedAlgorithm} is used as the throughput algorithm, this
 	#        :@link teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm.WeightMethod WeightMethod} is used
-	public WeightMethod getWeightedAlgorithmMethod():
-		return self.weightedAlgorithmMethod
-	}
+	def get_weighted_algorithm_method(self) -> "WeightedAlgorithm.WeightMethod":
+		return self._weighted_algorithm_method
 
 	#
-	# @param weightedAlgorithmMethod
+	# @param weighted_algorithm_method
 	#            if the:@link teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm WeightedAlgorithm} is used as the throughput algorithm, this
 	#           :@link teetime.stage.taskfarm.adaptation.analysis.algorithm.WeightedAlgorithm.WeightMethod WeightMethod} is used
-	public void setWeightedAlgorithmMethod(final WeightMethod weightedAlgorithmMethod):
-		self.weightedAlgorithmMethod = weightedAlgorithmMethod
-	}
+	def set_weighted_algorithm_method(self, weighted_algorithm_method: "WeightedAlgorithm.WeightMethod"):
+		self._weighted_algorithm_method = weighted_algorithm_method
 
 	#
 	# @return the TaskFarmReconfigurationCommandService waits this amount of adaptation thread iterations for performance improvements after a new worker stage is
 	#         added
-	public int getMaxSamplesUntilRemove():
-		return self.maxSamplesUntilRemove
-	}
+	def get_max_samples_until_remove(self) -> int:
+		return self._max_samples_until_remove
 
 	#
-	# @param maxSamplesUntilRemove
+	# @param max_samples_until_remove
 	#            the TaskFarmReconfigurationCommandService waits this amount of adaptation thread iterations for performance improvements after a new worker stage
 	#            is
 	#            added
-	public void setMaxSamplesUntilRemove(final int maxSamplesUntilRemove):
-		self.maxSamplesUntilRemove = maxSamplesUntilRemove
-	}
+	def set_max_samples_until_remove(self, max_samples_until_remove: int):
+		self._max_samples_until_remove = max_samples_until_remove
 
 	#
 	# @return throughput boundary of this task farm
-	public double getThroughputScoreBoundary():
-		return self.throughputScoreBoundary
-	}
+	def get_throughput_score_boundary(self) -> float:
+		return self._throughput_score_boundary
 
 	#
-	# @param throughputScoreBoundary
+	# @param throughput_score_boundary
 	#            throughput boundary of this task farm
-	public void setThroughputScoreBoundary(final double throughputScoreBoundary):
-		self.throughputScoreBoundary = throughputScoreBoundary
-	}
+	def set_throughput_score_boundary(self, throughput_score_boundary: float):
+		self._throughput_score_boundary = throughput_score_boundary
 
 	#
 	# @return should the monitoring services be activated (does not affect the adaptation thread!)?
-	public boolean isMonitoringEnabled():
-		return self.monitoringEnabled
-	}
+	def is_monitoring_enabled(self) -> bool:
+		return self._monitoring_enabled
 
 	#
-	# @param monitoringEnabled
+	# @param monitoring_enabled
 	#            should the monitoring services be activated (does not affect the adaptation thread!)?
-	public void setMonitoringEnabled(final boolean monitoringEnabled):
-		self.monitoringEnabled = monitoringEnabled
-	}
+	def set_monitoring_enabled(self, monitoring_enabled: bool):
+		self._monitoring_enabled = monitoring_enabled
 
 	#
 	# @return the waiting time between each iteration of the adaptation thread
-	public int getAdaptationWaitingTimeMillis():
-		return self.adaptationWaitingTimeMillis
-	}
+	def get_adaptation_waiting_time_millis(self) -> int:
+		return self._adaptation_waiting_time_millis
 
 	#
-	# @param adaptationWaitingTimeMillis
+	# @param adaptation_waiting_time_millis
 	#            the waiting time between each iteration of the adaptation thread
-	public void setAdaptationWaitingTimeMillis(final int adaptationWaitingTimeMillis):
-		self.adaptationWaitingTimeMillis = adaptationWaitingTimeMillis
-	}
+	def set_adaptation_waiting_time_millis(self, adaptation_waiting_time_millis: int):
+		self._adaptation_waiting_time_millis = adaptation_waiting_time_millis
 
 	#
 	# @return pipe capacity of all pipes inside the task farm
-	public int getPipeCapacity():
-		return self.pipeCapacity
-	}
+	def get_pipe_capacity(self) -> int:
+		return self._pipe_capacity
 
 	#
-	# @param pipeCapacity
+	# @param pipe_capacity
 	#            pipe capacity of all pipes inside the task farm
-	public void setPipeCapacity(final int pipeCapacity):
-		self.pipeCapacity = pipeCapacity
-	}
+	def set_pipe_capacity(self, pipe_capacity: int):
+		self._pipe_capacity = pipe_capacity
+
+	#
+	# @return the maximum number of worker stages the task farm may have.
+	#         For a:@link ProcessTaskFarmStage}, it is the maximum number of worker processes.
+	def get_max_number_of_cores(self) -> int:
+		return self._max_number_of_cores
+
+	#
+	# @param max_number_of_cores
+	#            the maximum number of worker stages the task farm may have.
+	#            For a:@link ProcessTaskFarmStage}, it is the maximum number of worker processes.
+	def set_max_number_of_cores(self, max_number_of_cores: int):
+		self._max_number_of_cores = max_number_of_cores
+
+	#
+	# @return the scaling policy of the adaptation thread, or <code>None</code> if the:@link ThroughputScalingPolicy} is used
+	def get_scaling_policy(self) -> Optional[IScalingPolicy]:
+		return self._scaling_policy
+
+	#
+	# @param scaling_policy
+	#            decides how many worker stages the adaptation thread adds or removes, e.g., a:@link QueueLatencyScalingPolicy}.
+	#            <code>None</code> for the:@link ThroughputScalingPolicy}.
+	def set_scaling_policy(self, scaling_policy: Optional[IScalingPolicy]):
+		self._scaling_policy = scaling_policy
 
 	#
-	# @return the maximum number of worker stages the task farm may have
-	public int getMaxNumberOfCores():
-		return self.maxNumberOfCores
-	}
+	# @return whether a removed worker stage hands its queued elements back to the distributor instead of processing them
+	def is_migrating_scale_in(self) -> bool:
+		return self._migrating_scale_in
 
 	#
-	# @param maxNumberOfCores
-	#            the maximum number of worker stages the task farm may have
-	public void setMaxNumberOfCores(final int maxNumberOfCores):
-		self.maxNumberOfCores = maxNumberOfCores
-	}
-}
+	# @param migrating_scale_in
+	#            whether a removed worker stage hands its queued elements back to the distributor instead of processing them.
+	#            Then, scaling in does not wait for the backlog of the removed worker stage.
+	#            See:@link teetime.stage.basic.distributor.dynamic.DynamicDistributor#remove_dynamic_port_and_migrate(OutputPort)} for the ordering guarantees.
+	def set_migrating_scale_in(self, migrating_scale_in: bool):
+		self._migrating_scale_in = migrating_scale_in
@@ -0,0 +1,46 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar
+
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.framework.CompositeStage import CompositeStage
+from teetime.framework.pipe.WorkSharingPipeFactory import WorkSharingPipeFactory
+from teetime.stage.taskfarm.StaticTaskFarmStage import StaticTaskFarmStage
+
+# Represents a task farm whose worker stages share a single input queue.
+# The distributor still sends each element to one of the worker stages,
+# but it is processed by the next worker stage that becomes idle (see:@link teetime.framework.pipe.WorkSharingPipe WorkSharingPipe}).
+# Thus, use this task farm instead of the:@link StaticTaskFarmStage} if the processing time of the elements varies a lot.
+# <p>
+# The worker stages are connected to the distributor via:@link teetime.framework.pipe.WorkSharingPipe WorkSharingPipe}s,
+# which implement:@link teetime.framework.pipe.IMonitorablePipe IMonitorablePipe}.
+# Their capacity sums up to <code>number_stages * pipe_capacity</code>.
+# The worker stages must not be removed at runtime.
+# </p>
+#
+# @param <I>
+#            Input type of Task Farm
+# @param <O>
+#            Output type of Task Farm
+# @param <T>
+#            Type of the parallelized stage
+#
+# @since 3.0
+class WorkSharingTaskFarmStage(StaticTaskFarmStage[I, O, T]):
+
+	def __init__(self, worker_stage: T, number_stages: int = StaticTaskFarmStage.MAX_NUMBER_OF_STAGES, pipe_capacity: int = CompositeStage.DEFAULT_PIPE_CAPACITY):
+		super().__init__(worker_stage, number_stages, pipe_capacity, distributor_pipe_factory=WorkSharingPipeFactory())
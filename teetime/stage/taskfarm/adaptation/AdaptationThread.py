@@ -11,17 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm.adaptation
+import logging
+import threading
+from typing import Generic, TypeVar
 
-import org.slf4j.Logger
-import org.slf4j.LoggerFactory
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
 
-import teetime.stage.taskfarm.*
-import teetime.stage.taskfarm.adaptation.analysis.TaskFarmAnalysisService
-import teetime.stage.taskfarm.adaptation.history.TaskFarmHistoryService
-import teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmReconfigurationService
-import teetime.stage.taskfarm.monitoring.PipeMonitoringService
-import teetime.stage.taskfarm.monitoring.SingleTaskFarmMonitoringService
+from teetime.stage.taskfarm.adaptation.analysis.TaskFarmAnalysisService import TaskFarmAnalysisService
+from teetime.stage.taskfarm.adaptation.history.TaskFarmHistoryService import TaskFarmHistoryService
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmReconfigurationService import TaskFarmReconfigurationService
+from teetime.stage.taskfarm.monitoring.PipeMonitoringService import PipeMonitoringService
+from teetime.stage.taskfarm.monitoring.SingleTaskFarmMonitoringService import SingleTaskFarmMonitoringService
+
+LOGGER = logging.getLogger("AdaptationThread")
 
 # Represents the adaptation thread used implement the self-adaptive behavior of the task farm.
 #
@@ -33,90 +37,66 @@ import teetime.stage.taskfarm.monitoring.SingleTaskFarmMonitoringService
 #            Output type of Task Farm
 # @param <T>
 #            Type of the parallelized stage
-public class AdaptationThread<I, O, T extends ITaskFarmDuplicable<I, O>> extends Thread:
-
-	private static final Logger LOGGER = LoggerFactory.getLogger(AdaptationThread.class)
-
-	private volatile boolean shouldTerminate
-
-	private final TaskFarmConfiguration<I, O, T> taskFarmStageConfiguration
-
-	// services of this adaptation thread (history, analysis, reconfiguration)
-	private final TaskFarmHistoryService<I, O, T> historyService
-	private final TaskFarmAnalysisService<I, O, T> analysisService
-	private final TaskFarmReconfigurationService<I, O, T> reconfigurationService
+class AdaptationThread(threading.Thread, Generic[I, O, T]):
 
-	private final SingleTaskFarmMonitoringService taskFarmMonitoringService
-	private final PipeMonitoringService pipeMonitoringService
+	_should_terminate: threading.Event
 
 	# Creates an adaptation thread for the given task farm.
 	#
-	# @param taskFarmStage
+	# @param task_farm_stage
 	#            given task farm instance
-	public AdaptationThread(final DynamicTaskFarmStage<I, O, T> taskFarmStage):
-		self.historyService = new TaskFarmHistoryService<I, O, T>(taskFarmStage)
-		self.analysisService = new TaskFarmAnalysisService<I, O, T>(taskFarmStage.getConfiguration())
-		self.reconfigurationService = new TaskFarmReconfigurationService<I, O, T>(taskFarmStage)
-		self.taskFarmStageConfiguration = taskFarmStage.getConfiguration()
+	def __init__(self, task_farm_stage: "DynamicTaskFarmStage[I, O, T]"):
+		super().__init__(name="AdaptationThread", daemon=True)
+		self._should_terminate = threading.Event()
 
-		self.taskFarmMonitoringService = new SingleTaskFarmMonitoringService(taskFarmStage, historyService)
-		self.pipeMonitoringService = new PipeMonitoringService(historyService)
+		# services of this adaptation thread (history, analysis, reconfiguration)
+		self._history_service = TaskFarmHistoryService(task_farm_stage)
+		self._analysis_service = TaskFarmAnalysisService(task_farm_stage.get_configuration())
+		self._reconfiguration_service = TaskFarmReconfigurationService(task_farm_stage, self._history_service)
+		self._task_farm_stage_configuration = task_farm_stage.get_configuration()
 
-		self.setPriority(MAX_PRIORITY)
-	}
+		self._task_farm_monitoring_service = SingleTaskFarmMonitoringService(task_farm_stage, self._history_service)
+		self._pipe_monitoring_service = PipeMonitoringService(self._history_service)
 
 	# Start the execution of the adaptation thread. The execution should happen after
 	# the start of the merger of the corresponding task farm.
-	@Override
-	public void run():
+	def run(self):
 		LOGGER.debug("Adaptation thread started")
-		while (!self.shouldTerminate):
-			try:
-				executeServices()
-				doMonitoring()
-
-				Thread.sleep(taskFarmStageConfiguration.getAdaptationWaitingTimeMillis())
-			} catch (InterruptedException e):
-				self.shouldTerminate = true
-			}
-		}
+		while (not self._should_terminate.is_set()):
+			self._execute_services()
+			self._do_monitoring()
+
+			self._should_terminate.wait(self._task_farm_stage_configuration.get_adaptation_waiting_time_millis() / 1000)
 		LOGGER.debug("Adaptation thread stopped")
-	}
 
-	private void doMonitoring():
-		if (self.taskFarmStageConfiguration.isMonitoringEnabled()):
-			self.pipeMonitoringService.doMeasurement()
-			self.taskFarmMonitoringService.doMeasurement()
-		}
-	}
+	def _do_monitoring(self):
+		if (self._task_farm_stage_configuration.is_monitoring_enabled()):
+			self._pipe_monitoring_service.do_measurement()
+			self._task_farm_monitoring_service.do_measurement()
 
-	private void executeServices() throws InterruptedException:
-		self.historyService.monitorPipes()
-		self.analysisService.analyze(self.historyService.getHistory())
-		self.reconfigurationService.reconfigure(self.analysisService.getThroughputScore())
-	}
+	def _execute_services(self):
+		self._history_service.monitor_pipes()
+		self._analysis_service.analyze(self._history_service.get_history())
+		self._reconfiguration_service.reconfigure(self._analysis_service.get_throughput_score())
 
 	# Terminate the adaptation thread. The termination should happen after
 	# the termination of the merger of the corresponding task farm.
-	public void stopAdaptationThread():
-		self.shouldTerminate = true
-		interrupt()
+	def stop_adaptation_thread(self):
+		self._should_terminate.set()
 		LOGGER.debug("Adaptation thread stop signal sent")
-	}
 
 	# Returns the:@link teetime.stage.taskfarm.adaptation.history.TaskFarmHistoryService TaskFarmHistoryService} of this adaptation thread, containing pipe
 	# throughput measurements.
 	#
 	# @return:@link teetime.stage.taskfarm.adaptation.history.TaskFarmHistoryService TaskFarmHistoryService} of this adaptation thread
-	public TaskFarmHistoryService<I, O, T> getHistoryService():
-		return self.historyService
-	}
-
-	public PipeMonitoringService getPipeMonitoringService():
-		return pipeMonitoringService
-	}
-
-	public SingleTaskFarmMonitoringService getTaskFarmMonitoringService():
-		return taskFarmMonitoringService
-	}
-}
+	def get_history_service(self) -> TaskFarmHistoryService:
+		return self._history_service
+
+	def get_pipe_monitoring_service(self) -> PipeMonitoringService:
+		return self._pipe_monitoring_service
+
+	def get_task_farm_monitoring_service(self) -> SingleTaskFarmMonitoringService:
+		return self._task_farm_monitoring_service
+
+	def get_reconfiguration_service(self) -> TaskFarmReconfigurationService:
+		return self._reconfiguration_service
@@ -0,0 +1,28 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmScalingMetrics import TaskFarmScalingMetrics
+
+# Represents a policy which decides how many worker stages to add to or to remove from a:@link DynamicTaskFarmStage}.
+# It is called by the:@link TaskFarmReconfigurationService} once per iteration of the:@link AdaptationThread}.
+# A policy may keep state across iterations, e.g., for hysteresis. Hence, each task farm requires its own instance.
+#
+# @since 3.0
+class IScalingPolicy:
+
+	# @param metrics
+	#            the measurements of the current iteration
+	# @return the number of worker stages to add (if positive) or to remove (if negative).
+	#         The task farm clamps the result to its bounds, i.e., to at least one and at most:@link TaskFarmConfiguration#get_max_number_of_cores()} workers.
+	def decide(self, metrics: TaskFarmScalingMetrics) -> int:
+		pass
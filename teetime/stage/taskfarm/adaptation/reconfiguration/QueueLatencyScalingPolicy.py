@@ -0,0 +1,119 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+
+from teetime.stage.taskfarm.adaptation.reconfiguration.IScalingPolicy import IScalingPolicy
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmScalingMetrics import TaskFarmScalingMetrics
+
+# Scales the task farm such that the latency of an element stays below a service level objective (SLO).
+# <p>
+# The latency of a newly arriving element is estimated by the queued elements per worker times the mean service time.
+# If it exceeds <code>scale_out_threshold * latency_slo_in_s</code>, the policy adds as many workers as required at once (at most <code>max_step</code>)
+# to both keep up with the arrival rate at <code>target_utilization</code> and to process the backlog within the SLO.
+# Workers are only removed after the estimated latency has stayed below <code>scale_in_threshold * latency_slo_in_s</code>
+# for <code>scale_in_samples</code> consecutive iterations, and if fewer workers suffice.
+# After each change, the policy waits <code>cooldown_samples</code> iterations so that the new workers can take effect.
+# The gap between both thresholds and the cooldown prevent flapping.
+# </p>
+#
+# @since 3.0
+class QueueLatencyScalingPolicy(IScalingPolicy):
+
+	DEFAULT_MAX_STEP = 4
+	DEFAULT_SCALE_OUT_THRESHOLD = 1.0
+	DEFAULT_SCALE_IN_THRESHOLD = 0.5
+	DEFAULT_SCALE_IN_SAMPLES = 3
+	DEFAULT_COOLDOWN_SAMPLES = 2
+	DEFAULT_TARGET_UTILIZATION = 0.8
+
+	_latency_slo_in_s: float
+	_max_step: int
+	_scale_out_threshold: float
+	_scale_in_threshold: float
+	_scale_in_samples: int
+	_cooldown_samples: int
+	_target_utilization: float
+
+	_num_low_latency_samples: int = 0
+	_remaining_cooldown_samples: int = 0
+	_estimated_latency_in_s: float = 0.0
+
+	# @param latency_slo_in_s
+	#            the maximum latency an element should experience within the task farm
+	def __init__(self, latency_slo_in_s: float, max_step: int = DEFAULT_MAX_STEP,
+			scale_out_threshold: float = DEFAULT_SCALE_OUT_THRESHOLD, scale_in_threshold: float = DEFAULT_SCALE_IN_THRESHOLD,
+			scale_in_samples: int = DEFAULT_SCALE_IN_SAMPLES, cooldown_samples: int = DEFAULT_COOLDOWN_SAMPLES,
+			target_utilization: float = DEFAULT_TARGET_UTILIZATION):
+		if (latency_slo_in_s <= 0):
+			raise ValueError("latency_slo_in_s must be positive, but was " + str(latency_slo_in_s))
+		if (max_step < 1):
+			raise ValueError("max_step must be positive, but was " + str(max_step))
+		if (not 0 <= scale_in_threshold < scale_out_threshold):
+			raise ValueError("scale_in_threshold must be less than scale_out_threshold (hysteresis)")
+		if (not 0 < target_utilization <= 1):
+			raise ValueError("target_utilization must be in (0, 1], but was " + str(target_utilization))
+		self._latency_slo_in_s = latency_slo_in_s
+		self._max_step = max_step
+		self._scale_out_threshold = scale_out_threshold
+		self._scale_in_threshold = scale_in_threshold
+		self._scale_in_samples = scale_in_samples
+		self._cooldown_samples = cooldown_samples
+		self._target_utilization = target_utilization
+
+	def decide(self, metrics: TaskFarmScalingMetrics) -> int:
+		service_time_in_ns = metrics.get_mean_service_time_in_ns()
+		if (service_time_in_ns is None): # no worker has been busy so far
+			return 0
+
+		service_time_in_s = service_time_in_ns / 1e9
+		num_workers = metrics.get_num_workers()
+		num_queued_elements = metrics.get_num_queued_elements()
+		self._estimated_latency_in_s = (num_queued_elements / num_workers + 1) * service_time_in_s
+
+		if (self._remaining_cooldown_samples > 0):
+			self._remaining_cooldown_samples -= 1
+			return 0
+
+		required_num_workers = self._get_required_num_workers(metrics.get_arrival_rate_per_s(), num_queued_elements, service_time_in_s)
+
+		if (self._estimated_latency_in_s > self._scale_out_threshold * self._latency_slo_in_s):
+			self._num_low_latency_samples = 0
+			return self._change_by(max(1, min(self._max_step, required_num_workers - num_workers)))
+
+		if (self._estimated_latency_in_s < self._scale_in_threshold * self._latency_slo_in_s and required_num_workers < num_workers):
+			self._num_low_latency_samples += 1
+			if (self._num_low_latency_samples >= self._scale_in_samples):
+				self._num_low_latency_samples = 0
+				return self._change_by(-min(self._max_step, num_workers - required_num_workers))
+		else:
+			self._num_low_latency_samples = 0
+
+		return 0
+
+	# @return the number of workers required to keep up with the arrival rate and to process the backlog within the SLO
+	def _get_required_num_workers(self, arrival_rate_per_s: float, num_queued_elements: int, service_time_in_s: float) -> int:
+		num_workers_for_arrivals = arrival_rate_per_s * service_time_in_s / self._target_utilization
+		num_workers_for_backlog = num_queued_elements * service_time_in_s / self._latency_slo_in_s
+		return max(1, math.ceil(num_workers_for_arrivals + num_workers_for_backlog))
+
+	def _change_by(self, num_workers: int) -> int:
+		self._remaining_cooldown_samples = self._cooldown_samples
+		return num_workers
+
+	# @return the latency estimated in the last iteration
+	def get_estimated_latency_in_s(self) -> float:
+		return self._estimated_latency_in_s
+
+	def get_latency_slo_in_s(self) -> float:
+		return self._latency_slo_in_s
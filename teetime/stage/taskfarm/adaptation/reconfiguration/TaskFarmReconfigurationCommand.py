@@ -11,15 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm.adaptation.reconfiguration
+from enum import Enum
 
 # Represents the current plan of the task farm reconfiguration service.
 # Possible values are addition or removal of a stage. Furthermore, no
 # action at all can be taken.
 #
 # @author Christian Claus Wiechmann
-enum TaskFarmReconfigurationCommand:
-	ADD,
-	REMOVE,
-	NONE
-}
+class TaskFarmReconfigurationCommand(Enum):
+
+	ADD = 1
+	REMOVE = 2
+	NONE = 3
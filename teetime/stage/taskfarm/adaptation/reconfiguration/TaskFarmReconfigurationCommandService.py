@@ -11,11 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm.adaptation.reconfiguration
+from enum import Enum
+from typing import Generic, TypeVar
 
-import teetime.framework.pipe.IMonitorablePipe
-import teetime.stage.taskfarm.*
-import teetime.stage.taskfarm.adaptation.analysis.AbstractThroughputAlgorithm
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.stage.taskfarm.TaskFarmConfiguration import TaskFarmConfiguration
+from teetime.stage.taskfarm.adaptation.analysis.AbstractThroughputAlgorithm import AbstractThroughputAlgorithm
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmReconfigurationCommand import TaskFarmReconfigurationCommand
 
 # Represents the decision tree which decides if a worker stage is to be
 # added to or removed from a task farm.
@@ -28,103 +33,85 @@ import teetime.stage.taskfarm.adaptation.analysis.AbstractThroughputAlgorithm
 #            Output type of Task Farm
 # @param <T>
 #            Type of the parallelized stage
-class TaskFarmReconfigurationCommandService<I, O, T extends ITaskFarmDuplicable<I, O>>:
+class TaskFarmReconfigurationCommandService(Generic[I, O, T]):
+
+	class ReconfigurationMode(Enum):
+		ADDING = 1
+		REMOVING = 2
 
-	private final DynamicTaskFarmStage<I, O, T> taskFarmStage
-	private int samplesUntilRemove
-	private ReconfigurationMode currentMode = ReconfigurationMode.ADDING
+	_task_farm_stage: "DynamicTaskFarmStage[I, O, T]"
+	_samples_until_remove: int
+	_current_mode: ReconfigurationMode = ReconfigurationMode.ADDING
 
 	# Creates a task farm reconfiguration command service for the specified task farm.
 	#
-	# @param taskFarmStage
+	# @param task_farm_stage
 	#            specified task farm
-	TaskFarmReconfigurationCommandService(final DynamicTaskFarmStage<I, O, T> taskFarmStage):
-		self.taskFarmStage = taskFarmStage
-		self.samplesUntilRemove = TaskFarmConfiguration.INIT_SAMPLES_UNTIL_REMOVE
-	}
+	def __init__(self, task_farm_stage: "DynamicTaskFarmStage[I, O, T]"):
+		self._task_farm_stage = task_farm_stage
+		self._samples_until_remove = TaskFarmConfiguration.INIT_SAMPLES_UNTIL_REMOVE
 
 	# Decides if we want to add or remove a stage using a specified throughput score.
 	#
-	# @param throughputScore
+	# @param throughput_score
 	#            specified throughput score
 	# @return:@link TaskFarmReconfigurationCommand} showing if we want to add or remove a stage
-	public TaskFarmReconfigurationCommand decideExecutionPlan(final double throughputScore):
-		TaskFarmReconfigurationCommand command = TaskFarmReconfigurationCommand.NONE // NOPMD
-
-		if (self.currentMode == ReconfigurationMode.ADDING):
-			command = decideForAddingMode(throughputScore)
-		} else:
-			command = decideForRemovingMode(throughputScore)
-		}
+	def decide_execution_plan(self, throughput_score: float) -> TaskFarmReconfigurationCommand:
+		if (self._current_mode == TaskFarmReconfigurationCommandService.ReconfigurationMode.ADDING):
+			command = self._decide_for_adding_mode(throughput_score)
+		else:
+			command = self._decide_for_removing_mode(throughput_score)
 
 		return command
-	}
 
-	private TaskFarmReconfigurationCommand decideForAddingMode(final double throughputScore):
-		TaskFarmReconfigurationCommand command = TaskFarmReconfigurationCommand.NONE // NOPMD
+	def _decide_for_adding_mode(self, throughput_score: float) -> TaskFarmReconfigurationCommand:
+		command = TaskFarmReconfigurationCommand.NONE # NOPMD
+		configuration = self._task_farm_stage.get_configuration()
 
-		if (self.taskFarmStage.getWorkerStages().size() >= self.taskFarmStage.getConfiguration().getMaxNumberOfCores()):
-			// we do not want to parallelize more than we have (virtual) processors
-			self.currentMode = ReconfigurationMode.REMOVING
+		if (len(self._task_farm_stage.get_worker_stages()) >= configuration.get_max_number_of_cores()):
+			# we do not want to parallelize more than we have (virtual) processors
+			self._current_mode = TaskFarmReconfigurationCommandService.ReconfigurationMode.REMOVING
 			command = TaskFarmReconfigurationCommand.NONE
-		} else:
-			if (throughputScore != AbstractThroughputAlgorithm.INVALID_SCORE):
-				if (self.samplesUntilRemove == TaskFarmConfiguration.INIT_SAMPLES_UNTIL_REMOVE):
-					// new execution, start adding stages
-					self.samplesUntilRemove = taskFarmStage.getConfiguration().getMaxSamplesUntilRemove()
+		elif (throughput_score != AbstractThroughputAlgorithm.INVALID_SCORE):
+			if (self._samples_until_remove == TaskFarmConfiguration.INIT_SAMPLES_UNTIL_REMOVE):
+				# new execution, start adding stages
+				self._samples_until_remove = configuration.get_max_samples_until_remove()
+				command = TaskFarmReconfigurationCommand.ADD
+			elif (self._samples_until_remove > 0):
+				# we still have to wait before removing a new stage again
+				if (throughput_score > configuration.get_throughput_score_boundary()):
+					# we could find a performance increase, add another stage
+					self._samples_until_remove = configuration.get_max_samples_until_remove()
 					command = TaskFarmReconfigurationCommand.ADD
-				} else:
-					if (self.samplesUntilRemove > 0):
-						// we still have to wait before removing a new stage again
-
-						if (throughputScore > self.taskFarmStage.getConfiguration().getThroughputScoreBoundary()):
-							// we could find a performance increase, add another stage
-							samplesUntilRemove = self.taskFarmStage.getConfiguration().getMaxSamplesUntilRemove()
-							command = TaskFarmReconfigurationCommand.ADD
-						} else:
-							// we did not find a performance increase, wait a bit longer
-							self.samplesUntilRemove--
-							command = TaskFarmReconfigurationCommand.NONE
-						}
-					} else:
-						// we found a boundary where new stages will not increase performance
-						self.currentMode = ReconfigurationMode.REMOVING
-						command = TaskFarmReconfigurationCommand.REMOVE
-					}
-				}
-			}
-		}
+				else:
+					# we did not find a performance increase, wait a bit longer
+					self._samples_until_remove -= 1
+					command = TaskFarmReconfigurationCommand.NONE
+			else:
+				# we found a boundary where new stages will not increase performance
+				self._current_mode = TaskFarmReconfigurationCommandService.ReconfigurationMode.REMOVING
+				command = TaskFarmReconfigurationCommand.REMOVE
 
 		return command
-	}
 
-	private TaskFarmReconfigurationCommand decideForRemovingMode(final double throughputScore):
-		TaskFarmReconfigurationCommand command = TaskFarmReconfigurationCommand.NONE // NOPMD
+	def _decide_for_removing_mode(self, throughput_score: float) -> TaskFarmReconfigurationCommand:
+		command = TaskFarmReconfigurationCommand.NONE # NOPMD
 
-		// we never want to remove the basic stage since it would destroy the pipeline
-		for (int i = 1 i < self.taskFarmStage.getWorkerStages().size() - 1 i++):
-			ITaskFarmDuplicable<?, ?> stage = self.taskFarmStage.getWorkerStages().get(i)
+		# we never want to remove the basic stage since it would destroy the pipeline
+		worker_stages = self._task_farm_stage.get_worker_stages()
+		for i in range(1, len(worker_stages) - 1):
+			stage = worker_stages[i]
 
-			IMonitorablePipe monitorableInputPipe = (IMonitorablePipe) stage.getInputPort().getPipe()
-			int sizeOfInputQueue = monitorableInputPipe.size()
+			monitorable_input_pipe = stage.get_input_port().get_pipe()
+			size_of_input_queue = monitorable_input_pipe.size()
 
-			if (sizeOfInputQueue == 0):
-				// there is still a stage which is currently unused can be safely removed
+			if (size_of_input_queue == 0):
+				# there is still a stage which is currently unused can be safely removed
 				command = TaskFarmReconfigurationCommand.REMOVE
 				break
-			}
-		}
 
-		if (throughputScore > self.taskFarmStage.getConfiguration().getThroughputScoreBoundary()):
-			// performance need has risen again, so we are parallelizing more
-			self.currentMode = ReconfigurationMode.ADDING
-		}
+		if (throughput_score > self._task_farm_stage.get_configuration().get_throughput_score_boundary()):
+			# performance need has risen again, so we are parallelizing more
+			self._current_mode = TaskFarmReconfigurationCommandService.ReconfigurationMode.ADDING
 
 		return command
-	}
-
-	private enum ReconfigurationMode:
-		ADDING,
-		REMOVING
-	}
-}
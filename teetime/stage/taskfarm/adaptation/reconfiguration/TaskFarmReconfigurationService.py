@@ -11,14 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm.adaptation.reconfiguration
+import time
+from typing import Dict, Generic, List, Optional, TypeVar
 
-import teetime.stage.taskfarm.DynamicTaskFarmStage
-import teetime.stage.taskfarm.ITaskFarmDuplicable
-import teetime.stage.taskfarm.adaptation.analysis.TaskFarmAnalysisService
+I = TypeVar("I")
+O = TypeVar("O")
+T = TypeVar("T")
+
+from teetime.framework.pipe.IMonitorablePipe import IMonitorablePipe
+from teetime.stage.taskfarm.adaptation.history.TaskFarmHistoryService import TaskFarmHistoryService
+from teetime.stage.taskfarm.adaptation.reconfiguration.IScalingPolicy import IScalingPolicy
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmScalingMetrics import TaskFarmScalingMetrics
+from teetime.stage.taskfarm.adaptation.reconfiguration.ThroughputScalingPolicy import ThroughputScalingPolicy
 
 # Represents a service to start the reconfiguration process for the task farm
 # using a particular throughput score. Should be called after the:@link TaskFarmAnalysisService}.
+# It collects the:@link TaskFarmScalingMetrics} and lets the configured:@link IScalingPolicy} decide.
 #
 # @author Christian Claus Wiechmann
 #
@@ -28,39 +36,83 @@ import teetime.stage.taskfarm.adaptation.analysis.TaskFarmAnalysisService
 #            Output type of Task Farm
 # @param <T>
 #            Type of the parallelized stage
-public class TaskFarmReconfigurationService<I, O, T extends ITaskFarmDuplicable<I, O>>:
+class TaskFarmReconfigurationService(Generic[I, O, T]):
+
+	_task_farm_stage: "DynamicTaskFarmStage[I, O, T]"
+	_history_service: TaskFarmHistoryService
+	_scaling_policy: IScalingPolicy
 
-	private final DynamicTaskFarmStage<I, O, T> taskFarmStage
-	private final TaskFarmReconfigurationCommandService<I, O, T> reconfigurationCommandService
+	_last_timestamp_in_ns: int
+	_last_num_input_pushes: int = 0
+	_mean_service_time_in_ns: Optional[float] = None
 
 	# Create a task farm reconfiguration service for a specified task farm.
 	#
-	# @param taskFarmStage
+	# @param task_farm_stage
 	#            specified task farm
-	public TaskFarmReconfigurationService(final DynamicTaskFarmStage<I, O, T> taskFarmStage):
-		self.taskFarmStage = taskFarmStage
-		self.reconfigurationCommandService = new TaskFarmReconfigurationCommandService<I, O, T>(taskFarmStage)
-	}
+	# @param history_service
+	#            provides the throughput of each worker's input pipe measured in the current iteration
+	def __init__(self, task_farm_stage: "DynamicTaskFarmStage[I, O, T]", history_service: TaskFarmHistoryService):
+		self._task_farm_stage = task_farm_stage
+		self._history_service = history_service
+		scaling_policy = task_farm_stage.get_configuration().get_scaling_policy()
+		self._scaling_policy = scaling_policy if scaling_policy is not None else ThroughputScalingPolicy(task_farm_stage)
+		self._last_timestamp_in_ns = time.perf_counter_ns()
 
 	# Starts the reconfiguration process of the corresponding task farm for the specified throughput score.
 	#
-	# @param throughputScore
+	# @param throughput_score
 	#            specified throughput score
-	# @throws InterruptedException
-	public void reconfigure(final double throughputScore) throws InterruptedException:
-		TaskFarmReconfigurationCommand command = self.reconfigurationCommandService.decideExecutionPlan(throughputScore)
+	def reconfigure(self, throughput_score: float):
+		metrics = self._collect_metrics(throughput_score)
+		num_workers = metrics.get_num_workers()
+		delta = self._scaling_policy.decide(metrics)
+		# keep at least the basic stage and at most one worker per core
+		delta = max(1 - num_workers, min(delta, metrics.get_max_num_workers() - num_workers))
+
+		if (delta > 0):
+			self._task_farm_stage.add_stages_at_runtime(delta)
+		elif (delta < 0):
+			self._task_farm_stage.remove_stages_at_runtime(-delta)
+
+	def _collect_metrics(self, throughput_score: float) -> TaskFarmScalingMetrics:
+		timestamp_in_ns = time.perf_counter_ns()
+		interval_in_ns = max(1, timestamp_in_ns - self._last_timestamp_in_ns)
+		self._last_timestamp_in_ns = timestamp_in_ns
+
+		worker_queue_sizes: List[int] = []
+		num_busy_pulls = 0
+		num_busy_workers = 0
+		for worker_stage in self._task_farm_stage.get_worker_stages():
+			pipe = worker_stage.get_input_port().get_pipe()
+			if (not isinstance(pipe, IMonitorablePipe)):
+				continue
+			size = pipe.size()
+			worker_queue_sizes.append(size)
+			num_pulls = self._history_service.get_last_pull_throughput_of_pipe(pipe)
+			if (size > 0 and num_pulls > 0):
+				# the worker had work to do during the whole interval, so its pulls reflect its service time
+				num_busy_pulls += num_pulls
+				num_busy_workers += 1
+
+		if (num_busy_pulls > 0):
+			self._mean_service_time_in_ns = interval_in_ns * num_busy_workers / num_busy_pulls
+
+		# Under back-pressure, the pushes into the worker pipes are capped at the service rate.
+		# Hence, the arrival rate is measured in front of the distributor.
+		input_pipe = self._task_farm_stage.get_distributor().get_input_port().get_pipe()
+		input_queue_size = 0
+		num_arrivals = 0
+		if (isinstance(input_pipe, IMonitorablePipe)):
+			input_queue_size = input_pipe.size()
+			# not get_push_throughput() since it resets the pipe's counter for any other observer
+			num_input_pushes = input_pipe.get_num_pushes_since_app_start()
+			num_arrivals = num_input_pushes - self._last_num_input_pushes
+			self._last_num_input_pushes = num_input_pushes
 
-		switch (command):
-		case ADD:
-			taskFarmStage.addStageAtRuntime()
-			break
-		case REMOVE:
-			taskFarmStage.removeStageAtRuntime()
-			break
-		case NONE:
-		default:
-			break
-		}
-	}
+		configuration = self._task_farm_stage.get_configuration()
+		return TaskFarmScalingMetrics(len(self._task_farm_stage.get_worker_stages()), configuration.get_max_number_of_cores(), throughput_score,
+				input_queue_size, worker_queue_sizes, num_arrivals * 1e9 / interval_in_ns, self._mean_service_time_in_ns, interval_in_ns)
 
-}
+	def get_scaling_policy(self) -> IScalingPolicy:
+		return self._scaling_policy
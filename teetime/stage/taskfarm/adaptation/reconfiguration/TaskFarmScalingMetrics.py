@@ -0,0 +1,79 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional
+
+# Represents the measurements of a single iteration of the:@link AdaptationThread} passed to an:@link IScalingPolicy}.
+#
+# @since 3.0
+class TaskFarmScalingMetrics:
+
+	_num_workers: int
+	_max_num_workers: int
+	_throughput_score: float
+	_input_queue_size: int
+	_worker_queue_sizes: List[int]
+	_arrival_rate_per_s: float
+	_mean_service_time_in_ns: Optional[float]
+	_interval_in_ns: int
+
+	# @param throughput_score
+	#            see:@link TaskFarmAnalysisService#get_throughput_score()}
+	# @param input_queue_size
+	#            the number of elements queued in front of the distributor
+	# @param worker_queue_sizes
+	#            the number of elements queued in front of each worker stage
+	# @param arrival_rate_per_s
+	#            the number of elements which arrived at the task farm per second during the last interval
+	# @param mean_service_time_in_ns
+	#            the mean time a worker stage needs per element, or <code>None</code> if not yet known
+	# @param interval_in_ns
+	#            the duration of the last interval
+	def __init__(self, num_workers: int, max_num_workers: int, throughput_score: float, input_queue_size: int, worker_queue_sizes: List[int],
+			arrival_rate_per_s: float, mean_service_time_in_ns: Optional[float], interval_in_ns: int):
+		self._num_workers = num_workers
+		self._max_num_workers = max_num_workers
+		self._throughput_score = throughput_score
+		self._input_queue_size = input_queue_size
+		self._worker_queue_sizes = worker_queue_sizes
+		self._arrival_rate_per_s = arrival_rate_per_s
+		self._mean_service_time_in_ns = mean_service_time_in_ns
+		self._interval_in_ns = interval_in_ns
+
+	def get_num_workers(self) -> int:
+		return self._num_workers
+
+	def get_max_num_workers(self) -> int:
+		return self._max_num_workers
+
+	def get_throughput_score(self) -> float:
+		return self._throughput_score
+
+	def get_input_queue_size(self) -> int:
+		return self._input_queue_size
+
+	def get_worker_queue_sizes(self) -> List[int]:
+		return self._worker_queue_sizes
+
+	# @return the number of all elements queued within the task farm
+	def get_num_queued_elements(self) -> int:
+		return self._input_queue_size + sum(self._worker_queue_sizes)
+
+	def get_arrival_rate_per_s(self) -> float:
+		return self._arrival_rate_per_s
+
+	def get_mean_service_time_in_ns(self) -> Optional[float]:
+		return self._mean_service_time_in_ns
+
+	def get_interval_in_ns(self) -> int:
+		return self._interval_in_ns
@@ -0,0 +1,36 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from teetime.stage.taskfarm.adaptation.reconfiguration.IScalingPolicy import IScalingPolicy
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmReconfigurationCommand import TaskFarmReconfigurationCommand
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmReconfigurationCommandService import TaskFarmReconfigurationCommandService
+from teetime.stage.taskfarm.adaptation.reconfiguration.TaskFarmScalingMetrics import TaskFarmScalingMetrics
+
+# The default scaling policy: adds or removes a single worker stage depending on the throughput score only
+# (see:@link TaskFarmReconfigurationCommandService}).
+#
+# @since 3.0
+class ThroughputScalingPolicy(IScalingPolicy):
+
+	_command_service: TaskFarmReconfigurationCommandService
+
+	def __init__(self, task_farm_stage: "DynamicTaskFarmStage"):
+		self._command_service = TaskFarmReconfigurationCommandService(task_farm_stage)
+
+	def decide(self, metrics: TaskFarmScalingMetrics) -> int:
+		command = self._command_service.decide_execution_plan(metrics.get_throughput_score())
+		if (command == TaskFarmReconfigurationCommand.ADD):
+			return 1
+		if (command == TaskFarmReconfigurationCommand.REMOVE):
+			return -1
+		return 0
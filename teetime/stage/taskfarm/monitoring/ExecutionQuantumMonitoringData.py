@@ -0,0 +1,60 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from teetime.stage.taskfarm.monitoring.IMonitoringData import IMonitoringData
+
+# Represents all parameters that are recorded per measurement for the execution quantum of one stage.
+class ExecutionQuantumMonitoringData(IMonitoringData):
+
+	_time: int
+	_num_of_executions: int
+	_mean_execution_time_in_ns: float
+	_total_num_of_executions: int
+	_stage_id: str
+
+	# @param time
+	#            time of measurement in ms since the first measurement
+	# @param num_of_executions
+	#            current number of executions per task
+	# @param mean_execution_time_in_ns
+	#            moving average of the execution time per call
+	# @param total_num_of_executions
+	#            number of executions so far
+	# @param stage_id
+	#            id of the corresponding measured stage
+	def __init__(self, time: int, num_of_executions: int, mean_execution_time_in_ns: float, total_num_of_executions: int, stage_id: str):
+		self._time = time
+		self._num_of_executions = num_of_executions
+		self._mean_execution_time_in_ns = mean_execution_time_in_ns
+		self._total_num_of_executions = total_num_of_executions
+		self._stage_id = stage_id
+
+	# @return time of measurement in ms since the first measurement
+	def get_time(self) -> int:
+		return self._time
+
+	# @return current number of executions per task
+	def get_num_of_executions(self) -> int:
+		return self._num_of_executions
+
+	# @return moving average of the execution time per call
+	def get_mean_execution_time_in_ns(self) -> float:
+		return self._mean_execution_time_in_ns
+
+	# @return number of executions so far
+	def get_total_num_of_executions(self) -> int:
+		return self._total_num_of_executions
+
+	# @return id of the corresponding measured stage
+	def get_stage_id(self) -> str:
+		return self._stage_id
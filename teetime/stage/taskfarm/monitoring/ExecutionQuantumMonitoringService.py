@@ -0,0 +1,62 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+from typing import List
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.framework.scheduling.globaltaskpool.ExecutionQuantum import ExecutionQuantum
+from teetime.stage.taskfarm.monitoring.ExecutionQuantumMonitoringData import ExecutionQuantumMonitoringData
+from teetime.stage.taskfarm.monitoring.IMonitoringService import IMonitoringService
+
+# Represents a monitoring service for the (adaptive) execution quantum of stages
+# scheduled by:@link GlobalTaskPoolScheduling}.
+class ExecutionQuantumMonitoringService(IMonitoringService[AbstractStage, ExecutionQuantumMonitoringData]):
+
+	_INIT = -1
+
+	_starting_timestamp: int = _INIT
+	_stages: List[AbstractStage]
+	_data: List[ExecutionQuantumMonitoringData]
+
+	# @param execution_quantum
+	#            see:@link GlobalTaskPoolScheduling#get_execution_quantum()}
+	def __init__(self, execution_quantum: ExecutionQuantum):
+		self._execution_quantum = execution_quantum
+		self._stages = []
+		self._data = []
+
+	def get_data(self) -> List[ExecutionQuantumMonitoringData]:
+		return self._data
+
+	def add_monitored_item(self, stage: AbstractStage):
+		if (stage not in self._stages):
+			self._stages.append(stage)
+
+	def do_measurement(self):
+		current_timestamp = int(time.time() * 1000)
+		if (self._starting_timestamp == self._INIT):
+			self._starting_timestamp = current_timestamp
+
+		quantum = self._execution_quantum
+		for stage in self._stages:
+			monitoring_data = ExecutionQuantumMonitoringData(current_timestamp - self._starting_timestamp,
+					quantum.get_num_of_executions(stage),
+					quantum.get_mean_execution_time_in_ns(stage),
+					quantum.get_total_num_of_executions(stage),
+					stage.get_id())
+			self._data.append(monitoring_data)
+
+	# @return a list of all monitored stages
+	def get_stages(self) -> List[AbstractStage]:
+		return self._stages
@@ -11,11 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm.monitoring
-
 # Represents a data container of a monitored object.
 #
 # @author Christian Claus Wiechmann
-public interface IMonitoringData:
-
-}
+class IMonitoringData:
+	pass
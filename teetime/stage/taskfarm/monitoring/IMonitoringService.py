@@ -11,9 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.stage.taskfarm.monitoring
+from typing import Generic, List, TypeVar
 
-import java.util.List
+K = TypeVar("K")
+V = TypeVar("V")
 
 # Represents an interface on a monitoring service used to monitor varying object, e.g. pipes.
 #
@@ -23,18 +24,19 @@ import java.util.List
 #            type of monitored item
 # @param <V>
 #            type of data container containing the monitored data
-public interface IMonitoringService<K, V extends IMonitoringData>:
+class IMonitoringService(Generic[K, V]):
 
 	# Add object to list of monitored elements.
-	# 
+	#
 	# @param item
 	#            object to be monitored
-	public void addMonitoredItem(final K item)
+	def add_monitored_item(self, item: K):
+		pass
 
 	# @return all monitored data
-	public List<?> getData()
+	def get_data(self) -> List:
+		pass
 
 	# Adds a new measurement.
-	public void doMeasurement()
-
-}
+	def do_measurement(self):
+		pass
@@ -15,5 +15,5 @@
 class StacklessException(Exception):
 
 	def __init__(self, string):
-		super(string)
+		super().__init__(string)
 
@@ -11,172 +11,99 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+from typing import List, Optional, TypeVar, Generic
 
-class PCBlockingQueue(Queue):
+E = TypeVar("E")
 
-	private final Queue<E> q
-	private final PutStrategy<E> putStrategy
-	private final TakeStrategy<E> takeStrategy
+from teetime.util.framework.concurrent.queue.putstrategy.PutStrategy import PutStrategy
+from teetime.util.framework.concurrent.queue.takestrategy.TakeStrategy import TakeStrategy
 
-	public PCBlockingQueue(final Queue<E> q, final PutStrategy<E> putStrategy, final TakeStrategy<E> takeStrategy):
-		self.q = q
-		self.putStrategy = putStrategy
-		self.takeStrategy = takeStrategy
-	}
-
-	@Override
-	public void put(final E e) throws InterruptedException:
-		putStrategy.backoffOffer(this, e) // internally calls "offer(e)"
-	}
-
-	@Override
-	public E take() throws InterruptedException:
-		return takeStrategy.waitPoll(this)
-	}
-
-	@Override
-	public boolean offer(final E e):
-		boolean offered = q.offer(e)
+# A blocking producer/consumer queue which decorates a non-blocking queue
+# (e.g.,:@link SpscArrayQueue} or:@link SpscLinkedQueue}) with pluggable put and take strategies.
+# <p>
+# Timeouts are given in seconds. A timeout of <code>None</code> means "do not wait" for:@link #offer} and:@link #poll}.
+# </p>
+#
+# @param <E>
+#            the type of the elements held by this queue
+class PCBlockingQueue(Generic[E]):
+
+	_q: object
+	_put_strategy: PutStrategy[E]
+	_take_strategy: TakeStrategy[E]
+
+	def __init__(self, q, put_strategy: PutStrategy[E], take_strategy: TakeStrategy[E]):
+		self._q = q
+		self._put_strategy = put_strategy
+		self._take_strategy = take_strategy
+
+	# Waits until <code>e</code> could be added.
+	def put(self, e: E):
+		self._put_strategy.backoff_offer(self, e) # internally calls "offer(e)"
+
+	# Waits until an element is available.
+	def take(self) -> E:
+		return self._take_strategy.wait_poll(self._q)
+
+	# @param timeout
+	#            the maximum time to wait in seconds for free capacity, or <code>None</code> to not wait at all
+	# @return <code>true</code> iff <code>e</code> was added
+	def offer(self, e: E, timeout: Optional[float] = None) -> bool:
+		if (timeout is not None):
+			return self._put_strategy.backoff_offer(self, e, timeout) # internally calls "offer(e)"
+
+		offered = self._q.offer(e)
 		if (offered):
-			takeStrategy.signal()
-		}
+			self._take_strategy.signal()
 		return offered
-	}
-
-	@Override
-	public boolean offer(final E e, final long timeout, final TimeUnit unit) throws InterruptedException:
-		throw new UnsupportedOperationException()
-	}
-
-	@Override
-	public E poll():
-		E e = q.poll()
-		if (e != null):
-			putStrategy.signal()
-		}
+
+	# @param timeout
+	#            the maximum time to wait in seconds for an element, or <code>None</code> to not wait at all
+	# @return the head of this queue, or <code>None</code> if this queue is empty (after the timeout elapsed)
+	def poll(self, timeout: Optional[float] = None) -> Optional[E]:
+		if (timeout is None):
+			e = self._q.poll()
+		else:
+			e = self._take_strategy.wait_poll(self._q, timeout)
+		if (e is not None):
+			self._put_strategy.signal()
 		return e
-	}
-
-	@Override
-	public E poll(final long timeout, final TimeUnit unit) throws InterruptedException:
-		throw new UnsupportedOperationException()
-	}
-
-	@Override
-	public int remainingCapacity():
-		throw new UnsupportedOperationException()
-	}
-
-	@Override
-	public int drainTo(final Collection<? super E> c):
-		int count = 0
-		E e
-		while ((e = poll()) != null):
-			c.add(e)
-			count++
-		}
-		return count
-	}
-
-	@Override
-	public int drainTo(final Collection<? super E> c, final int maxElements):
-		int count = 0
-		E e
-		while (((e = poll()) != null) && count < maxElements):
-			c.add(e)
-			count++
-		}
+
+	# @return the number of elements which can currently be added without waiting, or <code>sys.maxsize</code> if unbounded
+	def remaining_capacity(self) -> int:
+		capacity = self._q.capacity()
+		if (capacity < 0):
+			return sys.maxsize
+		return capacity - self._q.size()
+
+	# Removes up to <code>max_elements</code> elements and appends them to <code>c</code>.
+	# The producer is signaled only once for the whole batch.
+	#
+	# @return the number of elements removed
+	def drain_to(self, c: List[E], max_elements: int = sys.maxsize) -> int:
+		count = self._q.drain_to(c, max_elements)
+		if (count > 0):
+			self._put_strategy.signal()
 		return count
-	}
-
-	@Override
-	public boolean add(final E e):
-		return q.add(e)
-	}
-
-	@Override
-	public int size():
-		return q.size()
-	}
-
-	@Override
-	public boolean isEmpty():
-		return q.isEmpty()
-	}
-
-	@Override
-	public boolean contains(final Object o):
-		return q.contains(o)
-	}
-
-	@Override
-	public Iterator<E> iterator():
-		return q.iterator()
-	}
-
-	@Override
-	public boolean remove(final Object o):
-		return q.remove(o)
-	}
-
-	@Override
-	public E remove():
-		return q.remove()
-	}
-
-	@Override
-	public <T> T[] toArray(final T[] a):
-		return q.toArray(a)
-	}
-
-	@Override
-	public Object[] toArray():
-		return q.toArray()
-	}
-
-	@Override
-	public E element():
-		return q.element()
-	}
-
-	@Override
-	public E peek():
-		return q.peek()
-	}
-
-	@Override
-	public boolean containsAll(final Collection<?> c):
-		return q.containsAll(c)
-	}
-
-	@Override
-	public boolean addAll(final Collection<? extends E> c):
-		return q.addAll(c)
-	}
-
-	@Override
-	public boolean removeAll(final Collection<?> c):
-		return q.removeAll(c)
-	}
-
-	@Override
-	public boolean retainAll(final Collection<?> c):
-		return q.retainAll(c)
-	}
-
-	@Override
-	public void clear():
-		q.clear()
-	}
-
-	@Override
-	public boolean equals(final Object o):
-		return q.equals(o)
-	}
-
-	@Override
-	public int hashCode():
-		return q.hashCode()
-	}
-
-}
+
+	# @raise ValueError if this queue is full
+	def add(self, e: E) -> bool:
+		if (not self.offer(e)):
+			raise ValueError("Queue full")
+		return True
+
+	def size(self) -> int:
+		return self._q.size()
+
+	def is_empty(self) -> bool:
+		return self._q.is_empty()
+
+	def peek(self) -> Optional[E]:
+		return self._q.peek()
+
+	def clear(self):
+		self.drain_to([])
+
+	def __len__(self) -> int:
+		return self._q.size()
@@ -0,0 +1,206 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import struct
+import weakref
+from multiprocessing import shared_memory
+from typing import Optional, Sequence, Union
+
+from teetime.util.framework.concurrent.queue.SpscArrayQueue import round_to_power_of_two
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# A bounded single-producer/single-consumer ring buffer of variable-length byte records
+# which lives in a <code>multiprocessing.shared_memory</code> segment and can thus be shared between processes.
+# <p>
+# Layout: a 64 byte header followed by a power-of-two data region.
+# The header holds the producer index, the consumer index, the number of counted records pushed and pulled,
+# the capacity, and the consumer-terminated flag, each as an 8 byte aligned unsigned integer.
+# Each record starts with an 8 byte record header (payload length and flags) at an 8 byte aligned offset,
+# followed by its payload which may wrap around the end of the data region.
+# </p>
+# <p>
+# Like:@link SpscArrayQueue}, the payload is written <i>before</i> the producer index is published,
+# and the consumer index is published only after the record has been consumed.
+# An aligned 8 byte store is a single store on all mainstream 64-bit platforms,
+# so no lock is required as long as there is at most one producer and at most one consumer.
+# </p>
+class SharedMemoryRingBuffer:
+
+	HEADER_SIZE = 64
+	RECORD_HEADER = struct.Struct("<II") # payload length, flags
+	FLAG_COUNTED = 1
+
+	_INDEX = struct.Struct("<Q")
+	_PRODUCER_INDEX_OFFSET = 0
+	_CONSUMER_INDEX_OFFSET = 8
+	_NUM_PUSHES_OFFSET = 16
+	_NUM_PULLS_OFFSET = 24
+	_CAPACITY_OFFSET = 32
+	_CONSUMER_TERMINATED_OFFSET = 40
+
+	_shm: shared_memory.SharedMemory
+	_header: memoryview
+	_data: memoryview
+	_capacity: int
+	_mask: int
+	# size of the record returned by the last peek(), or 0
+	_peeked_record_size: int
+	_peeked_record_counted: bool
+
+	# Either creates a new segment (if <code>name</code> is <code>None</code>) or attaches to an existing one.
+	#
+	# @param capacity_in_bytes
+	#            the requested size of the data region. Is rounded up to the next power of 2 (at least 64).
+	# @param name
+	#            the name of an existing segment to attach to
+	def __init__(self, capacity_in_bytes: int = 1 << 20, name: Optional[str] = None):
+		if (name is None):
+			capacity = round_to_power_of_two(max(capacity_in_bytes, 64))
+			self._shm = shared_memory.SharedMemory(create=True, size=self.HEADER_SIZE + capacity)
+			self._shm.buf[:self.HEADER_SIZE] = bytes(self.HEADER_SIZE)
+			self._INDEX.pack_into(self._shm.buf, self._CAPACITY_OFFSET, capacity)
+			owner_pid = os.getpid()
+		else:
+			self._shm = shared_memory.SharedMemory(name=name)
+			capacity = self._INDEX.unpack_from(self._shm.buf, self._CAPACITY_OFFSET)[0]
+			owner_pid = None
+		self._header = self._shm.buf[:self.HEADER_SIZE]
+		self._data = self._shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + capacity]
+		self._capacity = capacity
+		self._mask = capacity - 1
+		self._peeked_record_size = 0
+		self._peeked_record_counted = False
+		self._finalizer = weakref.finalize(self, SharedMemoryRingBuffer._release, self._shm, self._header, self._data, owner_pid)
+
+	@staticmethod
+	def _release(shm: shared_memory.SharedMemory, header: memoryview, data: memoryview, owner_pid: Optional[int]):
+		header.release()
+		data.release()
+		try:
+			shm.close()
+		except BufferError:
+			pass # a consumer still holds a view returned by peek(); the mapping is freed together with that view
+		# only the creating process removes the segment; forked children merely detach
+		if (owner_pid == os.getpid()):
+			shm.unlink()
+
+	# Detaches from the segment, and removes it if it was created by the current process.
+	def release(self):
+		self._finalizer()
+
+	def get_name(self) -> str:
+		return self._shm.name
+
+	def _get(self, offset: int) -> int:
+		return self._INDEX.unpack_from(self._header, offset)[0]
+
+	def _set(self, offset: int, value: int):
+		self._INDEX.pack_into(self._header, offset, value)
+
+	# Appends one record consisting of the concatenation of <code>parts</code>.
+	# May only be invoked by the producer.
+	#
+	# @param size
+	#            the total number of bytes of all parts
+	# @param counted
+	#            whether the record is counted by:@link #size()} and the push/pull counters
+	# @return <code>true</code> iff the record has been appended, <code>false</code> if there is currently not enough free space
+	def offer(self, parts: Sequence[BytesLike], size: int, counted: bool = True) -> bool:
+		record_size = self.RECORD_HEADER.size + ((size + 7) & ~7)
+		if (record_size > self._capacity):
+			raise ValueError("Record of %d bytes exceeds the capacity of %d bytes" % (size, self._capacity))
+
+		producer_index = self._get(self._PRODUCER_INDEX_OFFSET)
+		if (producer_index + record_size - self._get(self._CONSUMER_INDEX_OFFSET) > self._capacity):
+			return False
+
+		data = self._data
+		capacity = self._capacity
+		offset = producer_index & self._mask
+		self.RECORD_HEADER.pack_into(data, offset, size, self.FLAG_COUNTED if counted else 0)
+		offset = (offset + self.RECORD_HEADER.size) & self._mask
+		for part in parts:
+			part_size = len(part) if isinstance(part, (bytes, bytearray)) else part.nbytes
+			first = min(part_size, capacity - offset)
+			data[offset:offset + first] = part[:first]
+			if (first < part_size):
+				data[0:part_size - first] = part[first:]
+			offset = (offset + part_size) & self._mask
+
+		if (counted):
+			self._set(self._NUM_PUSHES_OFFSET, self._get(self._NUM_PUSHES_OFFSET) + 1)
+		self._set(self._PRODUCER_INDEX_OFFSET, producer_index + record_size) # publish
+		return True
+
+	# Returns the payload of the oldest record without removing it.
+	# The returned view is only valid until:@link #advance()} is invoked and should be released by the caller then.
+	# May only be invoked by the consumer.
+	#
+	# @return the payload (a view into the shared memory if it does not wrap around, a copy otherwise),
+	#         or <code>None</code> if the buffer is currently empty
+	def peek(self) -> Optional[BytesLike]:
+		consumer_index = self._get(self._CONSUMER_INDEX_OFFSET)
+		if (consumer_index >= self._get(self._PRODUCER_INDEX_OFFSET)):
+			return None
+
+		data = self._data
+		offset = consumer_index & self._mask
+		size, flags = self.RECORD_HEADER.unpack_from(data, offset)
+		self._peeked_record_size = self.RECORD_HEADER.size + ((size + 7) & ~7)
+		self._peeked_record_counted = bool(flags & self.FLAG_COUNTED)
+
+		start = (offset + self.RECORD_HEADER.size) & self._mask
+		end = start + size
+		if (end <= self._capacity):
+			return data[start:end]
+		copy = bytearray(data[start:])
+		copy += data[:end - self._capacity]
+		return copy
+
+	# Removes the record returned by the last:@link #peek()}.
+	# May only be invoked by the consumer.
+	def advance(self):
+		if (self._peeked_record_size == 0):
+			raise Exception("advance() requires a preceding successful peek()") # IllegalStateException
+		if (self._peeked_record_counted):
+			self._set(self._NUM_PULLS_OFFSET, self._get(self._NUM_PULLS_OFFSET) + 1)
+		self._set(self._CONSUMER_INDEX_OFFSET, self._get(self._CONSUMER_INDEX_OFFSET) + self._peeked_record_size) # publish
+		self._peeked_record_size = 0
+
+	def is_empty(self) -> bool:
+		return self._get(self._CONSUMER_INDEX_OFFSET) >= self._get(self._PRODUCER_INDEX_OFFSET)
+
+	# @return the number of counted records which have been pushed, but not yet pulled
+	def size(self) -> int:
+		num_pulls = self._get(self._NUM_PULLS_OFFSET)
+		return self._get(self._NUM_PUSHES_OFFSET) - num_pulls
+
+	# @return the size of the data region in bytes
+	def capacity(self) -> int:
+		return self._capacity
+
+	# Announces that the consumer will never consume again, e.g., because its process has terminated.
+	# May be invoked by any process.
+	def mark_consumer_terminated(self):
+		self._set(self._CONSUMER_TERMINATED_OFFSET, 1)
+
+	def is_consumer_terminated(self) -> bool:
+		return self._get(self._CONSUMER_TERMINATED_OFFSET) != 0
+
+	def get_num_pushes(self) -> int:
+		return self._get(self._NUM_PUSHES_OFFSET)
+
+	def get_num_pulls(self) -> int:
+		return self._get(self._NUM_PULLS_OFFSET)
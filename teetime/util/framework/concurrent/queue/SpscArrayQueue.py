@@ -0,0 +1,165 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Sequence, TypeVar, Generic
+
+T = TypeVar("T")
+
+# Rounds the given value up to the next power of two, i.e., <code>1,2,4,8,...</code>
+def round_to_power_of_two(value: int) -> int:
+	if (value < 1):
+		raise ValueError("value must be positive, but was " + str(value))
+	return 1 << (value - 1).bit_length()
+
+# A bounded, lock-free single-producer/single-consumer ring buffer.
+# It replaces JCTools' <code>SpscArrayQueue</code>.
+# <p>
+# The buffer is preallocated with a power-of-two capacity so that the slot of an index is computed by masking.
+# The producer only writes <code>_producer_index</code> and the consumer only writes <code>_consumer_index</code>.
+# Both indices grow monotonically and are never wrapped,
+# so they also count the number of elements ever offered and polled.
+# </p>
+# <p>
+# An element is written into its slot <i>before</i> the producer index is published,
+# and a slot is cleared <i>before</i> the consumer index is published.
+# Hence, neither side needs a lock as long as there is at most one producer thread and at most one consumer thread.
+# Under the GIL, each attribute store and each list item store is atomic.
+# </p>
+#
+# @param <T>
+#            the type of the elements held by this queue
+class SpscArrayQueue(Generic[T]):
+
+	__slots__ = ("_buffer", "_mask", "_capacity", "_producer_index", "_consumer_index", "_producer_limit")
+
+	_buffer: List[Optional[T]]
+	_mask: int
+	_capacity: int
+	_producer_index: int
+	_consumer_index: int
+	# producer-local cache: all indices below this limit are known to refer to free slots
+	_producer_limit: int
+
+	# @param capacity
+	#            the requested capacity. Is rounded up to the next power of 2.
+	def __init__(self, capacity: int):
+		actual_capacity = round_to_power_of_two(capacity)
+		self._buffer = [None] * actual_capacity
+		self._mask = actual_capacity - 1
+		self._capacity = actual_capacity
+		self._producer_index = 0
+		self._consumer_index = 0
+		self._producer_limit = actual_capacity
+
+	# May only be invoked by the producer thread.
+	#
+	# @return <code>true</code> if the element could be added, <code>false</code> if the queue is full
+	def offer(self, element: T) -> bool:
+		if (element is None):
+			raise ValueError("Parameter 'element' is None, but must be non-None.")
+		index = self._producer_index
+		if (index >= self._producer_limit):
+			# only read the consumer's index when the cached limit is exhausted
+			self._producer_limit = self._consumer_index + self._capacity
+			if (index >= self._producer_limit):
+				return False
+		self._buffer[index & self._mask] = element
+		self._producer_index = index + 1 # publish
+		return True
+
+	# May only be invoked by the consumer thread.
+	#
+	# @return the head of the queue, or <code>None</code> if the queue is currently empty.
+	def poll(self) -> Optional[T]:
+		index = self._consumer_index
+		if (index >= self._producer_index):
+			return None
+		offset = index & self._mask
+		element = self._buffer[offset]
+		self._buffer[offset] = None # NOPMD help the gc
+		self._consumer_index = index + 1 # publish
+		return element
+
+	# Offers as many elements of <code>elements[offset:]</code> as currently fit.
+	# The producer index is published only once for the whole batch.
+	# May only be invoked by the producer thread.
+	#
+	# @return the number of elements offered
+	def offer_all(self, elements: Sequence[T], offset: int = 0) -> int:
+		index = self._producer_index
+		limit = self._consumer_index + self._capacity
+		self._producer_limit = limit
+		count = min(len(elements) - offset, limit - index)
+		if (count <= 0):
+			return 0
+		buffer = self._buffer
+		mask = self._mask
+		for i in range(offset, offset + count):
+			element = elements[i]
+			if (element is None):
+				raise ValueError("Parameter 'elements' contains None, but must only contain non-None elements.")
+			buffer[index & mask] = element
+			index += 1
+		self._producer_index = index # publish
+		return count
+
+	# Polls up to <code>max_elements</code> elements and appends them to <code>target</code>.
+	# The consumer index is published only once for the whole batch.
+	# May only be invoked by the consumer thread.
+	#
+	# @return the number of elements polled
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		index = self._consumer_index
+		count = min(self._producer_index - index, max_elements)
+		if (count <= 0):
+			return 0
+		buffer = self._buffer
+		mask = self._mask
+		for _ in range(count):
+			offset = index & mask
+			target.append(buffer[offset])
+			buffer[offset] = None # NOPMD help the gc
+			index += 1
+		self._consumer_index = index # publish
+		return count
+
+	# May only be invoked by the consumer thread.
+	#
+	# @return the head of the queue without removing it, or <code>None</code> if the queue is currently empty.
+	def peek(self) -> Optional[T]:
+		index = self._consumer_index
+		if (index >= self._producer_index):
+			return None
+		return self._buffer[index & self._mask]
+
+	def is_empty(self) -> bool:
+		return self._consumer_index >= self._producer_index
+
+	def size(self) -> int:
+		# read the consumer index first so that the result is never negative
+		consumer_index = self._consumer_index
+		return self._producer_index - consumer_index
+
+	def capacity(self) -> int:
+		return self._capacity
+
+	# @return the number of elements offered since the creation of this queue
+	def current_producer_index(self) -> int:
+		return self._producer_index
+
+	# @return the number of elements polled since the creation of this queue
+	def current_consumer_index(self) -> int:
+		return self._consumer_index
+
+	def __len__(self) -> int:
+		return self.size()
@@ -0,0 +1,74 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import deque
+from typing import Deque, List, Optional, TypeVar, Generic
+
+T = TypeVar("T")
+
+# An unbounded single-producer/single-consumer queue.
+# It replaces the unbounded queues created by JCTools' <code>QueueFactory</code>
+# and offers the same interface as:@link SpscArrayQueue}.
+# A deque's <code>append</code> and <code>popleft</code> are atomic, so no lock is required.
+#
+# @param <T>
+#            the type of the elements held by this queue
+class SpscLinkedQueue(Generic[T]):
+
+	__slots__ = ("_deque",)
+
+	_deque: Deque[T]
+
+	def __init__(self):
+		self._deque = deque()
+
+	def offer(self, element: T) -> bool:
+		if (element is None):
+			raise ValueError("Parameter 'element' is None, but must be non-None.")
+		self._deque.append(element)
+		return True
+
+	def poll(self) -> Optional[T]:
+		try:
+			return self._deque.popleft()
+		except IndexError:
+			return None
+
+	def drain_to(self, target: List[T], max_elements: int) -> int:
+		popleft = self._deque.popleft
+		count = min(len(self._deque), max_elements)
+		for _ in range(count):
+			target.append(popleft())
+		return count
+
+	def peek(self) -> Optional[T]:
+		try:
+			return self._deque[0]
+		except IndexError:
+			return None
+
+	def is_empty(self) -> bool:
+		return not self._deque
+
+	def size(self) -> int:
+		return len(self._deque)
+
+	# @return <code>-1</code> since the queue is unbounded
+	def capacity(self) -> int:
+		return -1
+
+	def clear(self):
+		self._deque.clear()
+
+	def __len__(self) -> int:
+		return len(self._deque)
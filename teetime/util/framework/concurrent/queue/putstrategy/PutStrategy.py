@@ -11,13 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.concurrent.queue.putstrategy
+from typing import Optional, TypeVar, Generic
 
-import java.util.Queue
+E = TypeVar("E")
 
-public interface PutStrategy<E>
-{
-	void backoffOffer(Queue<E> q, E e)
+class PutStrategy(Generic[E]):
 
-	void signal()
-}
+	# Offers <code>e</code> to <code>q</code> and backs off while <code>q</code> is full.
+	#
+	# @param timeout
+	#            the maximum time to wait in seconds, or <code>None</code> to wait until <code>e</code> has been offered
+	# @return <code>true</code> iff <code>e</code> has been offered
+	def backoff_offer(self, q, e: E, timeout: Optional[float] = None) -> bool:
+		pass
+
+	# Invoked by the consumer after it has removed elements from the queue.
+	def signal(self):
+		pass
@@ -11,21 +11,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.concurrent.queue.putstrategy
+import time
+from typing import Optional, TypeVar
 
-import java.util.Queue
+E = TypeVar("E")
 
-public class YieldPutStrategy<E> implements PutStrategy<E>:
+from teetime.util.framework.concurrent.queue.putstrategy.PutStrategy import PutStrategy
 
-	@Override
-	public void backoffOffer(final Queue<E> q, final E e):
-		while (!q.offer(e)):
-			Thread.yield()
-		}
-	}
+class YieldPutStrategy(PutStrategy[E]):
 
-	@Override
-	public void signal():
-		// Nothing
-	}
-}
+	def backoff_offer(self, q, e: E, timeout: Optional[float] = None) -> bool:
+		if (timeout is None):
+			while (not q.offer(e)):
+				time.sleep(0) # yield
+			return True
+
+		deadline = time.monotonic() + timeout
+		while (not q.offer(e)):
+			if (time.monotonic() >= deadline):
+				return False
+			time.sleep(0) # yield
+		return True
+
+	def signal(self):
+		# Nothing
+		pass
@@ -11,46 +11,53 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.concurrent.queue.takestrategy
+import threading
+import time
+from typing import Optional, TypeVar
 
-import java.util.Queue
-import java.util.concurrent.atomic.AtomicReference
-import java.util.concurrent.locks.LockSupport
+E = TypeVar("E")
 
-public final class SCParkTakeStrategy<E> implements TakeStrategy<E>:
+from teetime.util.framework.concurrent.queue.takestrategy.TakeStrategy import TakeStrategy
 
-	public volatile int storeFence = 0 // NOCS
+# A take strategy for a single consumer which parks on a condition while the queue is empty.
+# The producer only acquires the condition's lock if the consumer is actually parked,
+# so offering stays lock-free in the common case.
+class SCParkTakeStrategy(TakeStrategy[E]):
 
-	private final AtomicReference<Thread> t = new AtomicReference<Thread>(null)
+	_condition: threading.Condition
+	_parked: bool
 
-	@Override
-	// Make sure the offer is visible before unpark
-	public void signal():
-		storeFence = 1 // store barrier
+	def __init__(self):
+		self._condition = threading.Condition(threading.Lock())
+		self._parked = False
 
-		LockSupport.unpark(t.get()) // t.get() load barrier
-	}
+	# Must be invoked after the element has been offered, i.e., is visible to the consumer.
+	def signal(self):
+		if (self._parked):
+			with self._condition:
+				self._condition.notify()
 
-	@Override
-	public E waitPoll(final Queue<E> q) throws InterruptedException:
-		E e = q.poll()
-		if (e != null):
+	def wait_poll(self, q, timeout: Optional[float] = None) -> Optional[E]:
+		e = q.poll()
+		if (e is not None):
 			return e
-		}
 
-		t.set(Thread.currentThread())
-
-		try:
-			while ((e = q.poll()) == null):
-				LockSupport.park()
-				if (Thread.currentThread().isInterrupted()):
-					throw new InterruptedException("Interrupted while waiting for the queue to become non-empty.")
-				}
-			}
-		} finally:
-			t.lazySet(null)
-		}
+		deadline = None if timeout is None else time.monotonic() + timeout
+		with self._condition:
+			self._parked = True
+			try:
+				# polling after announcing the park guarantees that no signal is missed
+				e = q.poll()
+				while (e is None):
+					if (deadline is None):
+						self._condition.wait()
+					else:
+						remaining = deadline - time.monotonic()
+						if (remaining <= 0):
+							return None
+						self._condition.wait(remaining)
+					e = q.poll()
+			finally:
+				self._parked = False
 
 		return e
-	}
-}
@@ -11,13 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.concurrent.queue.takestrategy
+from typing import Optional, TypeVar, Generic
 
-import java.util.Queue
+E = TypeVar("E")
 
-public interface TakeStrategy<E>
-{
-	void signal()
+class TakeStrategy(Generic[E]):
 
-	E waitPoll(Queue<E> q) throws InterruptedException
-}
+	# Invoked by the producer after it has offered an element to the queue.
+	def signal(self):
+		pass
+
+	# Polls <code>q</code> and waits while <code>q</code> is empty.
+	#
+	# @param timeout
+	#            the maximum time to wait in seconds, or <code>None</code> to wait until an element is available
+	# @return the head of <code>q</code>, or <code>None</code> if the timeout elapsed
+	def wait_poll(self, q, timeout: Optional[float] = None) -> Optional[E]:
+		pass
@@ -11,26 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.concurrent.queue.takestrategy
+import time
+from typing import Optional, TypeVar
 
-import java.util.Queue
+E = TypeVar("E")
 
-public final class YieldTakeStrategy<E> implements TakeStrategy<E>
-{
-	@Override
-	public void signal()
-	{
-		// Nothing to do
-	}
+from teetime.util.framework.concurrent.queue.takestrategy.TakeStrategy import TakeStrategy
 
-	@Override
-	public E waitPoll(final Queue<E> q) throws InterruptedException
-	{
-		E e
-		while ((e = q.poll()) == null)
-		{
-			Thread.yield()
-		}
+class YieldTakeStrategy(TakeStrategy[E]):
+
+	def signal(self):
+		# Nothing to do
+		pass
+
+	def wait_poll(self, q, timeout: Optional[float] = None) -> Optional[E]:
+		deadline = None if timeout is None else time.monotonic() + timeout
+		e = q.poll()
+		while (e is None):
+			if (deadline is not None and time.monotonic() >= deadline):
+				return None
+			time.sleep(0) # yield
+			e = q.poll()
 		return e
-	}
-}
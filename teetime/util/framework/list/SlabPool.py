@@ -0,0 +1,215 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import os
+import struct
+import weakref
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Union
+
+# A slab allocator for byte payloads in a shared memory arena.
+# Like:@link ArrayPool}, it caches released storage by (power-of-two) size class and hands it out again on the next request.
+# <p>
+# A payload is written into a slab once and is then passed between stages (and processes) as a small:@link SlabHandle},
+# i.e., as <code>(offset, length)</code>, instead of being copied or pickled.
+# Each slab carries a reference count: it is 1 after:@link #allocate(int)},
+# can be increased by:@link #retain(SlabHandle)} (e.g., before sending the same handle to several consumers),
+# and the slab returns to its free list as soon as:@link #release(SlabHandle)} drops the count to zero.
+# </p>
+# <p>
+# The free lists and reference counts live in the shared memory as well and are guarded by one process-shared lock.
+# Hence, any process forked after the creation of the pool may allocate, retain, and release slabs.
+# Views returned by:@link #view(SlabHandle)} must not be used after the handle has been released.
+# </p>
+class SlabPool:
+
+	MIN_SLAB_SHIFT = 6 # 64 bytes
+	NUM_SIZE_CLASSES = 32
+
+	# arena header: bump offset, arena size, and one free list head per size class
+	_U64 = struct.Struct("<Q")
+	_BUMP_OFFSET = 0
+	_SIZE_OFFSET = 8
+	_FREE_LIST_HEADS_OFFSET = 64
+	_ARENA_HEADER_SIZE = _FREE_LIST_HEADS_OFFSET + 8 * NUM_SIZE_CLASSES
+
+	# slab header: reference count, size class, and the next free slab (if free)
+	_SLAB_HEADER = struct.Struct("<IBxxxQ")
+	_SLAB_HEADER_SIZE = 16
+
+	# pools created in this process (or inherited via fork), by name
+	_POOLS: Dict[str, "SlabPool"] = dict()
+
+	_shm: shared_memory.SharedMemory
+	_buf: memoryview
+
+	# @param arena_size_in_bytes
+	#            the size of the shared memory arena
+	def __init__(self, arena_size_in_bytes: int):
+		if (arena_size_in_bytes <= self._ARENA_HEADER_SIZE):
+			raise ValueError("arena_size_in_bytes is too small: " + str(arena_size_in_bytes))
+		self._shm = shared_memory.SharedMemory(create=True, size=arena_size_in_bytes)
+		self._buf = self._shm.buf
+		self._buf[:self._ARENA_HEADER_SIZE] = bytes(self._ARENA_HEADER_SIZE)
+		self._U64.pack_into(self._buf, self._BUMP_OFFSET, self._ARENA_HEADER_SIZE)
+		self._U64.pack_into(self._buf, self._SIZE_OFFSET, arena_size_in_bytes)
+		# raises a ValueError on platforms without fork()
+		self._lock = multiprocessing.get_context("fork").Lock()
+		self._name = self._shm.name
+		SlabPool._POOLS[self._name] = self
+		self._finalizer = weakref.finalize(self, SlabPool._release_arena, self._shm, self._buf, os.getpid())
+
+	@staticmethod
+	def _release_arena(shm: shared_memory.SharedMemory, buf: memoryview, owner_pid: int):
+		buf.release()
+		try:
+			shm.close()
+		except BufferError:
+			pass # some view is still alive; the mapping is freed together with it
+		if (owner_pid == os.getpid()):
+			shm.unlink()
+
+	# @return the pool with the given name which has been created in this process or in one of its forking ancestors
+	@staticmethod
+	def for_name(name: str) -> "SlabPool":
+		return SlabPool._POOLS[name]
+
+	def get_name(self) -> str:
+		return self._name
+
+	# Removes the arena, and frees it if invoked by the creating process.
+	def close(self):
+		SlabPool._POOLS.pop(self._name, None)
+		self._finalizer()
+
+	@staticmethod
+	def _size_class_of(length: int) -> int:
+		return max(0, (length - 1).bit_length() - SlabPool.MIN_SLAB_SHIFT)
+
+	@staticmethod
+	def get_slab_size(size_class: int) -> int:
+		return 1 << (size_class + SlabPool.MIN_SLAB_SHIFT)
+
+	# Acquires a slab which can hold at least <code>length</code> bytes. Its reference count is 1.
+	#
+	# @return a handle to the slab, or <code>None</code> if the arena is exhausted
+	def allocate(self, length: int) -> Optional["SlabHandle"]:
+		size_class = self._size_class_of(length)
+		if (size_class >= self.NUM_SIZE_CLASSES):
+			return None
+		buf = self._buf
+		head_offset = self._FREE_LIST_HEADS_OFFSET + 8 * size_class
+		with self._lock:
+			slab = self._U64.unpack_from(buf, head_offset)[0]
+			if (slab != 0):
+				# pop from the free list
+				next_free = self._SLAB_HEADER.unpack_from(buf, slab)[2]
+				self._U64.pack_into(buf, head_offset, next_free)
+			else:
+				# carve a new slab
+				slab = self._U64.unpack_from(buf, self._BUMP_OFFSET)[0]
+				end = slab + self._SLAB_HEADER_SIZE + self.get_slab_size(size_class)
+				if (end > len(buf)):
+					return None
+				self._U64.pack_into(buf, self._BUMP_OFFSET, end)
+			self._SLAB_HEADER.pack_into(buf, slab, 1, size_class, 0)
+		return SlabHandle(self._name, slab + self._SLAB_HEADER_SIZE, length)
+
+	# Copies <code>data</code> into a new slab.
+	#
+	# @return a handle to the slab, or <code>None</code> if the arena is exhausted
+	def write(self, data: Union[bytes, bytearray, memoryview]) -> Optional["SlabHandle"]:
+		length = len(data) if isinstance(data, (bytes, bytearray)) else data.nbytes
+		handle = self.allocate(length)
+		if (handle is not None):
+			self._buf[handle.offset:handle.offset + length] = data
+		return handle
+
+	# @return a zero-copy view of the payload of the given slab
+	def view(self, handle: "SlabHandle") -> memoryview:
+		return self._buf[handle.offset:handle.offset + handle.length]
+
+	# Increases the reference count of the given slab by one.
+	def retain(self, handle: "SlabHandle"):
+		slab = handle.offset - self._SLAB_HEADER_SIZE
+		with self._lock:
+			ref_count, size_class, next_free = self._SLAB_HEADER.unpack_from(self._buf, slab)
+			if (ref_count == 0):
+				raise Exception("Slab at offset " + str(handle.offset) + " has already been released") # IllegalStateException
+			self._SLAB_HEADER.pack_into(self._buf, slab, ref_count + 1, size_class, next_free)
+
+	# Decreases the reference count of the given slab by one and returns it to its free list if the count becomes zero.
+	def release(self, handle: "SlabHandle"):
+		buf = self._buf
+		slab = handle.offset - self._SLAB_HEADER_SIZE
+		with self._lock:
+			ref_count, size_class, _ = self._SLAB_HEADER.unpack_from(buf, slab)
+			if (ref_count == 0):
+				raise Exception("Slab at offset " + str(handle.offset) + " has already been released") # IllegalStateException
+			if (ref_count > 1):
+				self._SLAB_HEADER.pack_into(buf, slab, ref_count - 1, size_class, 0)
+				return
+			head_offset = self._FREE_LIST_HEADS_OFFSET + 8 * size_class
+			head = self._U64.unpack_from(buf, head_offset)[0]
+			self._SLAB_HEADER.pack_into(buf, slab, 0, size_class, head)
+			self._U64.pack_into(buf, head_offset, slab)
+
+	def get_ref_count(self, handle: "SlabHandle") -> int:
+		return self._SLAB_HEADER.unpack_from(self._buf, handle.offset - self._SLAB_HEADER_SIZE)[0]
+
+	# @return the number of bytes of the arena which have been carved into slabs so far
+	def get_used_arena_size(self) -> int:
+		return self._U64.unpack_from(self._buf, self._BUMP_OFFSET)[0]
+
+	def get_arena_size(self) -> int:
+		return len(self._buf)
+
+# A reference to a payload in a:@link SlabPool}.
+# It is small and cheap to pickle, so it can be passed through any pipe instead of the payload itself.
+class SlabHandle:
+
+	__slots__ = ("pool_name", "offset", "length")
+
+	pool_name: str
+	offset: int
+	length: int
+
+	def __init__(self, pool_name: str, offset: int, length: int):
+		self.pool_name = pool_name
+		self.offset = offset
+		self.length = length
+
+	def __reduce__(self):
+		return (SlabHandle, (self.pool_name, self.offset, self.length))
+
+	def get_pool(self) -> SlabPool:
+		return SlabPool.for_name(self.pool_name)
+
+	def view(self) -> memoryview:
+		return self.get_pool().view(self)
+
+	def tobytes(self) -> bytes:
+		return bytes(self.view())
+
+	def retain(self):
+		self.get_pool().retain(self)
+
+	def release(self):
+		self.get_pool().release(self)
+
+	def __len__(self) -> int:
+		return self.length
+
+	def __repr__(self) -> str:
+		return "SlabHandle(%s, offset=%d, length=%d)" % (self.pool_name, self.offset, self.length)
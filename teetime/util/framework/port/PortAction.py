@@ -11,12 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.port
+from typing import Generic, TypeVar
 
-import teetime.framework.AbstractStage
+T = TypeVar("T") # extends AbstractStage
 
-public interface PortAction<T extends AbstractStage>:
+class PortAction(Generic[T]):
 
-	public abstract void execute(final T stage)
-
-}
+	def execute(self, stage: T):
+		pass
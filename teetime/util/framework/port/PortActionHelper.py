@@ -11,47 +11,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.framework.port
-
-import java.util.Queue
-import java.util.concurrent.BlockingQueue
-
-import org.jctools.queues.QueueFactory
-import org.jctools.queues.spec.*
-
-import teetime.framework.AbstractStage
-import teetime.util.framework.concurrent.queue.PCBlockingQueue
-import teetime.util.framework.concurrent.queue.putstrategy.PutStrategy
-import teetime.util.framework.concurrent.queue.putstrategy.YieldPutStrategy
-import teetime.util.framework.concurrent.queue.takestrategy.SCParkTakeStrategy
-import teetime.util.framework.concurrent.queue.takestrategy.TakeStrategy
-
-public final class PortActionHelper:
-
-	private PortActionHelper():
-		// utility class
-	}
-
-	public static <T> BlockingQueue<T> createPortActionQueue():
-		final Queue<T> localQueue = QueueFactory.newQueue(new ConcurrentQueueSpec(1, 1, 0, Ordering.FIFO, Preference.THROUGHPUT))
-		final PutStrategy<T> putStrategy = new YieldPutStrategy<T>()
-		final TakeStrategy<T> takeStrategy = new SCParkTakeStrategy<T>()
-		PCBlockingQueue<T> portActions = new PCBlockingQueue<T>(localQueue, putStrategy, takeStrategy)
-		return portActions
-	}
-
-	public static <T extends AbstractStage> PortAction<T> checkForPendingPortActionRequest(final T stage, final BlockingQueue<PortAction<T>> portActions):
-		PortAction<T> dynamicPortAction = portActions.poll()
-		if (null != dynamicPortAction):
-			dynamicPortAction.execute(stage)
-		}
-		return dynamicPortAction
-	}
-
-	public static <T extends AbstractStage> void checkBlockingForPendingPortActionRequest(final T stage, final BlockingQueue<PortAction<T>> portActions)
-			throws InterruptedException:
-		PortAction<T> dynamicPortAction = portActions.take()
-		dynamicPortAction.execute(stage)
-	}
-
-}
+from typing import TypeVar
+
+T = TypeVar("T")
+
+from teetime.framework.AbstractStage import AbstractStage
+from teetime.util.framework.concurrent.queue.PCBlockingQueue import PCBlockingQueue
+from teetime.util.framework.concurrent.queue.SpscLinkedQueue import SpscLinkedQueue
+from teetime.util.framework.concurrent.queue.putstrategy.YieldPutStrategy import YieldPutStrategy
+from teetime.util.framework.concurrent.queue.takestrategy.SCParkTakeStrategy import SCParkTakeStrategy
+from teetime.util.framework.port.PortAction import PortAction
+
+class PortActionHelper:
+
+	def __init__(self):
+		# utility class
+		raise Exception("utility class") # UnsupportedOperationException
+
+	@staticmethod
+	def create_port_action_queue() -> PCBlockingQueue:
+		return PCBlockingQueue(SpscLinkedQueue(), YieldPutStrategy(), SCParkTakeStrategy())
+
+	@staticmethod
+	def check_for_pending_port_action_request(stage: AbstractStage, port_actions: PCBlockingQueue) -> PortAction:
+		dynamic_port_action = port_actions.poll()
+		if (dynamic_port_action is not None):
+			dynamic_port_action.execute(stage)
+		return dynamic_port_action
+
+	@staticmethod
+	def check_blocking_for_pending_port_action_request(stage: AbstractStage, port_actions: PCBlockingQueue):
+		dynamic_port_action = port_actions.take()
+		dynamic_port_action.execute(stage)
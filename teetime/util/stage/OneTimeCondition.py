@@ -11,27 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-package teetime.util.stage
+import threading
+from typing import Optional
 
-public class OneTimeCondition:
+class OneTimeCondition:
 
-	private final Object syncObj = new Object()
-	private volatile boolean conditionMet
+	_condition_met: threading.Event
 
-	public void signalAll():
-		synchronized (syncObj):
-			conditionMet = true
-			syncObj.notifyAll()
-		}
-	}
+	def __init__(self):
+		self._condition_met = threading.Event()
 
-	public void await() throws InterruptedException:
-		if (!conditionMet):
-			synchronized (syncObj):
-				while (!conditionMet):
-					syncObj.wait()
-				}
-			}
-		}
-	}
-}
+	def signal_all(self):
+		self._condition_met.set()
+
+	def is_signaled(self) -> bool:
+		return self._condition_met.is_set()
+
+	# @return <code>true</code> iff the condition has been met (before the timeout, if any)
+	def await_(self, timeout: Optional[float] = None) -> bool:
+		return self._condition_met.wait(timeout)
@@ -0,0 +1,235 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import os
+import pickle
+import sys
+import types
+from typing import Generic, TypeVar
+
+import pytest
+
+from teetime.util.framework.list.SlabPool import SlabHandle, SlabPool
+
+ARENA_SIZE = 4096
+
+@pytest.fixture
+def pool():
+	pool = SlabPool(ARENA_SIZE)
+	yield pool
+	pool.close()
+
+def test_allocate_returns_a_handle_with_ref_count_one(pool):
+	handle = pool.allocate(100)
+	assert handle.pool_name == pool.get_name()
+	assert handle.length == 100
+	assert pool.get_ref_count(handle) == 1
+	assert SlabPool.for_name(pool.get_name()) is pool
+
+def test_released_slab_is_reused_by_the_same_size_class(pool):
+	first = pool.allocate(100) # size class of 128 bytes
+	other = pool.allocate(10) # size class of 64 bytes
+	used_arena_size = pool.get_used_arena_size()
+
+	first.release()
+	assert pool.get_ref_count(first) == 0
+
+	# another size class is not served from the free list
+	assert pool.allocate(64).offset != first.offset
+	reused = pool.allocate(128)
+	assert reused.offset == first.offset
+	assert reused.length == 128
+	assert pool.get_ref_count(reused) == 1
+	assert pool.get_used_arena_size() == used_arena_size + SlabPool._SLAB_HEADER_SIZE + 64
+	assert other.offset != reused.offset
+
+def test_free_list_is_last_in_first_out(pool):
+	handles = [pool.allocate(50) for _ in range(3)]
+	for handle in handles:
+		handle.release()
+	used_arena_size = pool.get_used_arena_size()
+
+	assert [pool.allocate(50).offset for _ in range(3)] == [handle.offset for handle in reversed(handles)]
+	assert pool.get_used_arena_size() == used_arena_size
+
+def test_slab_is_returned_only_when_the_last_reference_is_released(pool):
+	handle = pool.allocate(64)
+	handle.retain()
+	pool.retain(handle)
+	assert pool.get_ref_count(handle) == 3
+
+	handle.release()
+	handle.release()
+	assert pool.get_ref_count(handle) == 1
+	# still in use, so a new slab is carved
+	assert pool.allocate(64).offset != handle.offset
+
+	handle.release()
+	assert pool.get_ref_count(handle) == 0
+	assert pool.allocate(64).offset == handle.offset
+
+def test_released_slab_can_neither_be_released_nor_retained(pool):
+	handle = pool.allocate(64)
+	handle.release()
+	with pytest.raises(Exception, match="already been released"):
+		handle.release()
+	with pytest.raises(Exception, match="already been released"):
+		handle.retain()
+
+def test_write_and_view(pool):
+	handle = pool.write(b"teetime")
+	assert handle.length == 7
+	assert handle.tobytes() == b"teetime"
+	assert len(handle) == 7
+
+	view = handle.view()
+	view[0:3] = b"TEE"
+	view.release()
+	assert pool.view(handle).tobytes() == b"TEEtime"
+
+	assert pool.write(memoryview(b"abc")).tobytes() == b"abc"
+
+def test_exhausted_arena_returns_none(pool):
+	slab_size = SlabPool._SLAB_HEADER_SIZE + 1024
+	num_slabs = (ARENA_SIZE - SlabPool._ARENA_HEADER_SIZE) // slab_size
+	handles = [pool.allocate(1024) for _ in range(num_slabs)]
+	assert None not in handles
+
+	assert pool.allocate(1024) is None
+	assert pool.write(bytes(1024)) is None
+	assert pool.get_used_arena_size() <= pool.get_arena_size()
+
+	# a released slab makes room again
+	handles[0].release()
+	assert pool.allocate(1024).offset == handles[0].offset
+
+def test_too_large_slab_returns_none(pool):
+	assert pool.allocate(ARENA_SIZE) is None
+	assert pool.allocate(1 << (SlabPool.NUM_SIZE_CLASSES + SlabPool.MIN_SLAB_SHIFT)) is None
+	assert pool.get_used_arena_size() == SlabPool._ARENA_HEADER_SIZE
+
+def test_too_small_arena_is_rejected():
+	with pytest.raises(ValueError):
+		SlabPool(SlabPool._ARENA_HEADER_SIZE)
+
+def test_handle_is_picklable(pool):
+	handle = pool.write(b"payload")
+	copy = pickle.loads(pickle.dumps(handle))
+	assert (copy.pool_name, copy.offset, copy.length) == (handle.pool_name, handle.offset, handle.length)
+	assert copy.tobytes() == b"payload"
+
+# File2ByteArray
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+class _OutputPort:
+
+	def __init__(self):
+		self.elements = []
+
+	def send(self, element):
+		self.elements.append(element)
+
+class _AbstractTransformation(Generic[T, U]):
+
+	def __init__(self):
+		self._output_port = _OutputPort()
+
+@pytest.fixture
+def file2bytearray_class(monkeypatch):
+	# AbstractTransformation depends on the whole stage hierarchy, so File2ByteArray is loaded on top of a minimal base class
+	module = types.ModuleType("teetime.stage.basic.AbstractTransformation")
+	module.AbstractTransformation = _AbstractTransformation
+	monkeypatch.setitem(sys.modules, module.__name__, module)
+	path = os.path.join(os.path.dirname(__file__), os.pardir, "teetime", "stage", "io", "File2ByteArray.py")
+	spec = importlib.util.spec_from_file_location("_File2ByteArray_under_test", path)
+	file2bytearray = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(file2bytearray)
+	return file2bytearray.File2ByteArray
+
+def test_file2bytearray_reads_into_a_slab(pool, file2bytearray_class, tmp_path):
+	path = tmp_path / "file.bin"
+	path.write_bytes(b"x" * 100)
+	stage = file2bytearray_class(pool)
+
+	stage._execute(str(path))
+
+	handle, = stage._output_port.elements
+	assert isinstance(handle, SlabHandle)
+	assert handle.tobytes() == b"x" * 100
+	assert pool.get_ref_count(handle) == 1
+
+def test_file2bytearray_releases_the_slab_if_reading_fails(pool, file2bytearray_class, tmp_path, monkeypatch):
+	path = tmp_path / "file.bin"
+	path.write_bytes(b"x" * 100)
+	stage = file2bytearray_class(pool)
+	allocated = []
+	allocate = pool.allocate
+
+	def allocate_and_record(length):
+		handle = allocate(length)
+		allocated.append(handle)
+		return handle
+
+	def fail(file, handle):
+		raise OSError("disk failure")
+
+	monkeypatch.setattr(pool, "allocate", allocate_and_record)
+	monkeypatch.setattr(stage, "_read_into_slab", fail)
+
+	with pytest.raises(Exception, match="disk failure"):
+		stage._execute(str(path))
+
+	handle, = allocated
+	assert pool.get_ref_count(handle) == 0
+	assert stage._output_port.elements == []
+	monkeypatch.undo()
+	# the slab is back on its free list
+	used_arena_size = pool.get_used_arena_size()
+	assert pool.allocate(100).offset == handle.offset
+	assert pool.get_used_arena_size() == used_arena_size
+
+def test_file2bytearray_releases_the_slab_if_the_file_has_grown(pool, file2bytearray_class, tmp_path, monkeypatch):
+	path = tmp_path / "file.bin"
+	path.write_bytes(b"x" * 100)
+	stage = file2bytearray_class(pool)
+	allocate = pool.allocate
+
+	def allocate_and_grow_file(length):
+		handle = allocate(length)
+		with open(path, "ab") as file:
+			file.write(b"y" * 10)
+		return handle
+
+	monkeypatch.setattr(pool, "allocate", allocate_and_grow_file)
+
+	stage._execute(str(path))
+
+	content, = stage._output_port.elements
+	assert content == b"x" * 100 + b"y" * 10
+	monkeypatch.undo()
+	used_arena_size = pool.get_used_arena_size()
+	assert pool.get_ref_count(pool.allocate(100)) == 1
+	assert pool.get_used_arena_size() == used_arena_size
+
+def test_file2bytearray_falls_back_to_bytes_if_the_arena_is_exhausted(pool, file2bytearray_class, tmp_path):
+	path = tmp_path / "file.bin"
+	path.write_bytes(b"z" * ARENA_SIZE)
+	stage = file2bytearray_class(pool)
+
+	stage._execute(str(path))
+
+	assert stage._output_port.elements == [b"z" * ARENA_SIZE]
+	assert pool.get_used_arena_size() == SlabPool._ARENA_HEADER_SIZE
@@ -0,0 +1,171 @@
+# Copyright © 2015 Christian Wulf, Nelson Tavares de Sousa (http://teetime-framework.github.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pytest
+
+from teetime.util.framework.concurrent.queue.SpscArrayQueue import SpscArrayQueue, round_to_power_of_two
+
+def test_round_to_power_of_two():
+	assert [round_to_power_of_two(value) for value in (1, 2, 3, 4, 5, 1000, 1024, 1025)] == [1, 2, 4, 4, 8, 1024, 1024, 2048]
+	with pytest.raises(ValueError):
+		round_to_power_of_two(0)
+
+def test_capacity_is_rounded_up_to_power_of_two():
+	assert SpscArrayQueue(1).capacity() == 1
+	assert SpscArrayQueue(5).capacity() == 8
+	assert SpscArrayQueue(16).capacity() == 16
+
+	queue = SpscArrayQueue(5)
+	assert all(queue.offer(i) for i in range(8))
+	assert not queue.offer(8)
+
+def test_offer_and_poll_in_fifo_order():
+	queue = SpscArrayQueue(4)
+	assert queue.is_empty()
+	assert queue.poll() is None
+	assert queue.peek() is None
+
+	for i in range(4):
+		assert queue.offer(i)
+	assert not queue.offer(4)
+	assert queue.size() == 4
+	assert queue.peek() == 0
+
+	assert [queue.poll() for _ in range(4)] == [0, 1, 2, 3]
+	assert queue.is_empty()
+	assert queue.poll() is None
+
+def test_wrap_around():
+	queue = SpscArrayQueue(4)
+	received = []
+	# the indices pass the capacity many times while the queue is never more than 3/4 full
+	for i in range(0, 300, 3):
+		for element in range(i, i + 3):
+			assert queue.offer(element)
+		received.append(queue.poll())
+		received.append(queue.poll())
+		queue.drain_to(received, 1)
+	assert received == list(range(300))
+	assert queue.is_empty()
+
+def test_full_queue_accepts_again_after_poll():
+	queue = SpscArrayQueue(2)
+	assert queue.offer("a")
+	assert queue.offer("b")
+	assert not queue.offer("c")
+	assert queue.poll() == "a"
+	assert queue.offer("c")
+	assert [queue.poll(), queue.poll()] == ["b", "c"]
+
+def test_none_is_rejected():
+	queue = SpscArrayQueue(4)
+	with pytest.raises(ValueError):
+		queue.offer(None)
+	with pytest.raises(ValueError):
+		queue.offer_all([1, None])
+
+def test_offer_all_with_offset():
+	queue = SpscArrayQueue(4)
+	elements = list(range(10))
+
+	assert queue.offer_all(elements, 2) == 4 # only 4 elements fit
+	assert queue.offer_all(elements, 6) == 0
+
+	target = []
+	assert queue.drain_to(target, 2) == 2
+	assert queue.offer_all(elements, 6) == 2
+	assert queue.drain_to(target, 10) == 4
+	assert target == [2, 3, 4, 5, 6, 7]
+	assert queue.offer_all(elements, 10) == 0
+
+def test_offer_all_and_drain_to_across_the_end_of_the_buffer():
+	queue = SpscArrayQueue(8)
+	target = []
+	assert queue.offer_all(list(range(6))) == 6
+	assert queue.drain_to(target, 5) == 5
+
+	# occupies the slots 6, 7, 0, 1, 2, 3, 4
+	assert queue.offer_all(list(range(6, 20))) == 7
+	assert queue.drain_to(target, 100) == 8
+	assert target == list(range(13))
+	assert queue.drain_to(target, 100) == 0
+
+def test_drain_to_respects_max_elements():
+	queue = SpscArrayQueue(8)
+	queue.offer_all(list(range(8)))
+	target = []
+	assert queue.drain_to(target, 0) == 0
+	assert queue.drain_to(target, 3) == 3
+	assert target == [0, 1, 2]
+	assert queue.size() == 5
+
+def test_index_counters():
+	queue = SpscArrayQueue(4)
+	assert queue.current_producer_index() == 0
+	assert queue.current_consumer_index() == 0
+
+	for round_index in range(1, 6):
+		queue.offer_all(["x"] * 3)
+		queue.offer("y")
+		queue.drain_to([], 2)
+		queue.poll()
+		queue.poll()
+		# the indices are never wrapped, so they count all elements ever offered and polled
+		assert queue.current_producer_index() == 4 * round_index
+		assert queue.current_consumer_index() == 4 * round_index
+
+	# a rejected element is not counted
+	queue.offer_all(["x"] * 4)
+	assert not queue.offer("z")
+	assert queue.offer_all(["z"]) == 0
+	assert queue.current_producer_index() == 24
+	assert queue.size() == len(queue) == 4
+
+def test_one_producer_and_one_consumer_thread():
+	queue = SpscArrayQueue(64)
+	num_elements = 20000
+	received = []
+
+	def produce():
+		i = 0
+		while (i < num_elements):
+			if (i % 3 == 0):
+				num_offered = queue.offer_all(range(i, min(i + 5, num_elements)))
+				i += num_offered
+			else:
+				num_offered = 1 if queue.offer(i) else 0
+				i += num_offered
+			if (num_offered == 0):
+				time.sleep(0) # let the consumer run
+
+	def consume():
+		while (len(received) < num_elements):
+			if (queue.drain_to(received, 7) == 0):
+				element = queue.poll()
+				if (element is not None):
+					received.append(element)
+				else:
+					time.sleep(0) # let the producer run
+
+	producer = threading.Thread(target=produce)
+	consumer = threading.Thread(target=consume)
+	producer.start()
+	consumer.start()
+	producer.join(30)
+	consumer.join(30)
+
+	assert received == list(range(num_elements))
+	assert queue.current_producer_index() == queue.current_consumer_index() == num_elements